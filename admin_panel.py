@@ -12,7 +12,7 @@ from telegram.ext import (
     ConversationHandler, ContextTypes, filters
 )
 # DJANGO MIGRATION: Using SheetsCompatAPI for backward compatibility
-from sheets_compat import SheetsCompatAPI
+from sheets_compat import AsyncSheetsCompatAPI
 from dotenv import load_dotenv
 import spin_bot as spin_bot_module
 
@@ -25,7 +25,7 @@ ADMIN_USER_ID = int(os.getenv('ADMIN_USER_ID'))
 TIMEZONE = os.getenv('TIMEZONE', 'Indian/Maldives')
 DJANGO_API_URL = os.getenv('DJANGO_API_URL', 'http://localhost:8000/api')
 
-api = SheetsCompatAPI(DJANGO_API_URL)
+api = AsyncSheetsCompatAPI(DJANGO_API_URL)
 
 # Conversation states
 ADMIN_NOTES, UPDATE_ACCOUNT_NUMBER = range(2)
@@ -52,19 +52,19 @@ def escape_markdown(text: str) -> str:
     return text
 
 
-def is_admin(user_id: int) -> bool:
+async def is_admin(user_id: int) -> bool:
     """Check if user is admin (super admin or regular admin)"""
-    return api.is_admin(user_id)
+    return await api.is_admin(user_id)
 
 
 async def admin_panel(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Display admin panel"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ You don't have admin access.")
         return
 
     # Get current counter status
-    counter_status = api.get_counter_status()
+    counter_status = await api.get_counter_status()
     is_open = counter_status.get('is_open', True)  # Django API returns {'is_open': True/False}
     counter_button_text = "🔴 Close Counter" if is_open else "🟢 Open Counter"
     counter_callback = "admin_close_counter" if is_open else "admin_open_counter"
@@ -107,7 +107,7 @@ async def admin_view_deposits(update: Update, context: ContextTypes.DEFAULT_TYPE
         edit_func = update.message.reply_text
 
     # Get pending deposits from Django API
-    pending_deposits = api.get_pending_deposits()
+    pending_deposits = await api.get_pending_deposits()
 
     if not pending_deposits:
         await edit_func(
@@ -237,7 +237,7 @@ async def deposit_approve(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         logger.info(f"Admin {admin_id} approving deposit {request_id}")
 
-        deposit = api.get_deposit_request(request_id)
+        deposit = await api.get_deposit_request(request_id)
         if not deposit:
             logger.error(f"Deposit {request_id} not found")
             await query.edit_message_text(
@@ -249,7 +249,7 @@ async def deposit_approve(update: Update, context: ContextTypes.DEFAULT_TYPE):
         logger.info(f"Found deposit: {deposit}")
 
         # Update status using Django API
-        result = api.approve_deposit(request_id, admin_id)
+        result = await api.approve_deposit(request_id, admin_id)
         logger.info(f"Approve result: {result}")
 
         # Notify user with club link button
@@ -337,7 +337,7 @@ async def deposit_approve(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         # Check remaining pending deposits
         try:
-            pending_deposits = api.get_pending_deposits()
+            pending_deposits = await api.get_pending_deposits()
             remaining_msg = f"\n📊 {len(pending_deposits)} pending deposit(s) remaining." if pending_deposits else "\n✅ No more pending deposits."
         except Exception as e:
             logger.error(f"Failed to get pending deposits: {e}")
@@ -407,7 +407,7 @@ async def admin_notes_received(update: Update, context: ContextTypes.DEFAULT_TYP
         try:
             logger.info(f"Admin {admin_id} rejecting deposit {request_id} with reason: {reason}")
 
-            deposit = api.get_deposit_request(request_id)
+            deposit = await api.get_deposit_request(request_id)
             if not deposit:
                 logger.error(f"Deposit {request_id} not found")
                 await update.message.reply_text("❌ Deposit request not found.")
@@ -416,7 +416,7 @@ async def admin_notes_received(update: Update, context: ContextTypes.DEFAULT_TYP
             logger.info(f"Found deposit: {deposit}")
 
             # Reject using Django API
-            result = api.reject_deposit(request_id, admin_id, reason)
+            result = await api.reject_deposit(request_id, admin_id, reason)
             logger.info(f"Reject result: {result}")
 
             # Notify user
@@ -453,7 +453,7 @@ Please contact support if you have any questions.
 
             # Check remaining pending deposits
             try:
-                pending_deposits = api.get_pending_deposits()
+                pending_deposits = await api.get_pending_deposits()
                 remaining_msg = f"\n📊 {len(pending_deposits)} pending deposit(s) remaining." if pending_deposits else "\n✅ No more pending deposits."
             except Exception as e:
                 logger.error(f"Failed to get pending deposits: {e}")
@@ -476,7 +476,7 @@ Please contact support if you have any questions.
         try:
             logger.info(f"Admin {admin_id} rejecting withdrawal {request_id} with reason: {reason}")
 
-            withdrawal = api.get_withdrawal_request(request_id)
+            withdrawal = await api.get_withdrawal_request(request_id)
             if not withdrawal:
                 logger.error(f"Withdrawal {request_id} not found")
                 await update.message.reply_text("❌ Withdrawal request not found.")
@@ -485,7 +485,7 @@ Please contact support if you have any questions.
             logger.info(f"Found withdrawal: {withdrawal}")
 
             # Reject using Django API
-            result = api.reject_withdrawal(request_id, admin_id, reason)
+            result = await api.reject_withdrawal(request_id, admin_id, reason)
             logger.info(f"Reject result: {result}")
 
             # Notify user
@@ -522,7 +522,7 @@ Please contact support if you have any questions.
 
             # Check remaining pending withdrawals
             try:
-                pending_withdrawals = api.get_pending_withdrawals()
+                pending_withdrawals = await api.get_pending_withdrawals()
                 remaining_msg = f"\n📊 {len(pending_withdrawals)} pending withdrawal(s) remaining." if pending_withdrawals else "\n✅ No more pending withdrawals."
             except Exception as e:
                 logger.error(f"Failed to get pending withdrawals: {e}")
@@ -542,13 +542,13 @@ Please contact support if you have any questions.
             return ConversationHandler.END
 
     elif action_type == 'join':
-        join_req = api.get_join_request(request_id)
+        join_req = await api.get_join_request(request_id)
         if not join_req:
             await update.message.reply_text("❌ Join request not found.")
             return ConversationHandler.END
 
         # Update status to rejected
-        api.update_join_request_status(request_id, 'Rejected', admin_id)
+        await api.update_join_request_status(request_id, 'Rejected', admin_id)
 
         # Notify user
         user_details = join_req.get('user_details', {})
@@ -610,7 +610,7 @@ async def admin_view_withdrawals(update: Update, context: ContextTypes.DEFAULT_T
         edit_func = update.message.reply_text
 
     # Get pending withdrawals from Django API
-    pending_withdrawals = api.get_pending_withdrawals()
+    pending_withdrawals = await api.get_pending_withdrawals()
 
     if not pending_withdrawals:
         await edit_func(
@@ -727,7 +727,7 @@ async def withdrawal_approve(update: Update, context: ContextTypes.DEFAULT_TYPE)
     # Clear any cached state first
     context.user_data.clear()
 
-    withdrawal = api.get_withdrawal_request(request_id)
+    withdrawal = await api.get_withdrawal_request(request_id)
     if not withdrawal:
         await query.edit_message_text(
             text="❌ Withdrawal request not found.",
@@ -737,7 +737,7 @@ async def withdrawal_approve(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     # Update status
     try:
-        api.update_withdrawal_status(request_id, 'Completed', admin_id, 'Approved via admin panel')
+        await api.update_withdrawal_status(request_id, 'Completed', admin_id, 'Approved via admin panel')
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Failed to approve withdrawal {request_id}: {error_msg}")
@@ -785,7 +785,7 @@ async def withdrawal_approve(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     # Check remaining pending withdrawals
     try:
-        pending_withdrawals = api.get_pending_withdrawals()
+        pending_withdrawals = await api.get_pending_withdrawals()
         remaining_msg = f"\n📊 {len(pending_withdrawals)} pending withdrawal(s) remaining." if pending_withdrawals else "\n✅ No more pending withdrawals."
     except Exception as e:
         remaining_msg = ""
@@ -844,7 +844,7 @@ async def admin_view_cashback(update: Update, context: ContextTypes.DEFAULT_TYPE
         edit_func = update.message.reply_text
 
     # Get pending cashback requests
-    pending_cashback = api.get_pending_cashback_requests()
+    pending_cashback = await api.get_pending_cashback_requests()
 
     if not pending_cashback:
         await edit_func(
@@ -954,7 +954,7 @@ async def cashback_admin_approve(update: Update, context: ContextTypes.DEFAULT_T
         request_id = int(query.data.replace("cashback_admin_approve_", ""))
 
         # Approve the request using Django API
-        result = api.approve_cashback_request(request_id, approver_id)
+        result = await api.approve_cashback_request(request_id, approver_id)
 
         if result:
             # Extract details from result
@@ -1029,7 +1029,7 @@ async def cashback_admin_reject(update: Update, context: ContextTypes.DEFAULT_TY
         request_id = int(query.data.replace("cashback_admin_reject_", ""))
 
         # Reject the request using Django API
-        result = api.reject_cashback_request(request_id, rejector_id, "Rejected by admin")
+        result = await api.reject_cashback_request(request_id, rejector_id, "Rejected by admin")
 
         if result:
             # Extract details from result
@@ -1104,7 +1104,7 @@ async def admin_view_credits(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     try:
         # Get all active credits
-        credits = api.get_all_active_credits()
+        credits = await api.get_all_active_credits()
 
         # Handle paginated response
         if isinstance(credits, dict) and 'results' in credits:
@@ -1209,7 +1209,7 @@ async def admin_view_joins(update: Update, context: ContextTypes.DEFAULT_TYPE):
         edit_func = update.message.reply_text
 
     # Get pending join requests from Django API
-    pending_joins = api.get_pending_join_requests()
+    pending_joins = await api.get_pending_join_requests()
 
     if not pending_joins:
         await edit_func(
@@ -1318,7 +1318,7 @@ async def join_approve(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Clear any cached state first
     context.user_data.clear()
 
-    join_req = api.get_join_request(request_id)
+    join_req = await api.get_join_request(request_id)
     if not join_req:
         await query.edit_message_text(
             text="❌ Join request not found.",
@@ -1327,7 +1327,7 @@ async def join_approve(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
 
     # Update status
-    api.update_join_request_status(request_id, 'Approved', admin_id)
+    await api.update_join_request_status(request_id, 'Approved', admin_id)
 
     # Notify user
     user_details = join_req.get('user_details', {})
@@ -1360,7 +1360,7 @@ async def join_approve(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Check remaining pending join requests
     try:
-        pending_join_requests = api.get_pending_join_requests()
+        pending_join_requests = await api.get_pending_join_requests()
         remaining_msg = f"\n📊 {len(pending_join_requests)} pending join request(s) remaining." if pending_join_requests else "\n✅ No more pending join requests."
     except Exception as e:
         remaining_msg = ""
@@ -1421,7 +1421,7 @@ async def admin_view_accounts(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     # Get all payment accounts from Django API
     try:
-        accounts_response = api.get_all_payment_accounts()
+        accounts_response = await api.get_all_payment_accounts()
         logger.info(f"📋 Payment accounts response type: {type(accounts_response)}")
         logger.info(f"📋 Payment accounts response: {accounts_response}")
 
@@ -1521,7 +1521,7 @@ async def account_delete_confirm(update: Update, context: ContextTypes.DEFAULT_T
     # Get account details
     try:
         logger.info(f"🗑️ Fetching account details for ID {account_id}")
-        account = api.get_payment_account(account_id)
+        account = await api.get_payment_account(account_id)
         logger.info(f"🗑️ Account fetched: {account}")
 
         if not account:
@@ -1575,7 +1575,7 @@ async def account_delete_execute(update: Update, context: ContextTypes.DEFAULT_T
 
     try:
         # Delete via Django API
-        api.delete_payment_account(account_id)
+        await api.delete_payment_account(account_id)
 
         await query.answer("✅ Payment account deleted!", show_alert=True)
         # Return to accounts view
@@ -1599,7 +1599,7 @@ async def account_activate(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     try:
         # Activate via Django API
-        api.update_payment_account(account_id, is_active=True)
+        await api.update_payment_account(account_id, is_active=True)
 
         await query.answer("✅ Payment account activated!", show_alert=True)
         # Return to accounts view
@@ -1647,10 +1647,10 @@ async def admin_view_promotions(update: Update, context: ContextTypes.DEFAULT_TY
     query = update.callback_query
     await query.answer()
 
-    active_promo = api.get_active_promotion()
-    active_cashback_promo = api.get_active_cashback_promotion()
-    all_promos = api.get_all_promotions()
-    all_cashback_promos = api.get_all_cashback_promotions()
+    active_promo = await api.get_active_promotion()
+    active_cashback_promo = await api.get_active_cashback_promotion()
+    all_promos = await api.get_all_promotions()
+    all_cashback_promos = await api.get_all_cashback_promotions()
 
     message = "🎁 <b>Promotions Management</b>\n\n"
 
@@ -1701,7 +1701,7 @@ async def admin_view_all_promotions(update: Update, context: ContextTypes.DEFAUL
     query = update.callback_query
     await query.answer()
 
-    all_promos = api.get_all_promotions()
+    all_promos = await api.get_all_promotions()
 
     if not all_promos:
         await query.edit_message_text(
@@ -1729,7 +1729,7 @@ async def admin_view_all_cashback_promotions(update: Update, context: ContextTyp
     query = update.callback_query
     await query.answer()
 
-    all_cashback_promos = api.get_all_cashback_promotions()
+    all_cashback_promos = await api.get_all_cashback_promotions()
 
     if not all_cashback_promos:
         await query.edit_message_text(
@@ -1759,7 +1759,7 @@ async def promo_deactivate(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     promotion_id = query.data.split('_')[-1]
 
-    if api.deactivate_promotion(promotion_id):
+    if await api.deactivate_promotion(promotion_id):
         await query.edit_message_text(
             f"✅ Bonus promotion {promotion_id} has been deactivated.",
             reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("« Back", callback_data="admin_view_promotions")]])
@@ -1778,7 +1778,7 @@ async def cashback_promo_deactivate(update: Update, context: ContextTypes.DEFAUL
 
     promotion_id = query.data.split('_')[-1]
 
-    if api.deactivate_cashback_promotion(promotion_id):
+    if await api.deactivate_cashback_promotion(promotion_id):
         await query.edit_message_text(
             f"✅ Recovery promotion {promotion_id} has been deactivated.",
             reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("« Back", callback_data="admin_view_promotions")]])
@@ -1802,7 +1802,7 @@ async def admin_counter_status(update: Update, context: ContextTypes.DEFAULT_TYP
     await query.answer()
 
     try:
-        status = api.get_counter_status()
+        status = await api.get_counter_status()
         is_open = status.get('is_open', True)
 
         status_emoji = "🟢" if is_open else "🔴"
@@ -1864,7 +1864,7 @@ async def admin_close_counter(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     try:
         # Check if already closed
-        if not api.is_counter_open():
+        if not await api.is_counter_open():
             await query.edit_message_text(
                 "⚠️ <b>Counter is already CLOSED</b>\n\n"
                 "The counter is currently not accepting new requests.",
@@ -1873,7 +1873,7 @@ async def admin_close_counter(update: Update, context: ContextTypes.DEFAULT_TYPE
             )
             return
 
-        api.set_counter_status('CLOSED', query.from_user.id, announcement_sent=False)
+        await api.set_counter_status('CLOSED', query.from_user.id, announcement_sent=False)
 
         await query.edit_message_text(
             "✅ <b>Counter CLOSED</b>",
@@ -1897,7 +1897,7 @@ async def admin_open_counter(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     try:
         # Check if already open
-        if api.is_counter_open():
+        if await api.is_counter_open():
             await query.edit_message_text(
                 "⚠️ <b>Counter is already OPEN</b>\n\n"
                 "The counter is currently accepting requests.",
@@ -1906,7 +1906,7 @@ async def admin_open_counter(update: Update, context: ContextTypes.DEFAULT_TYPE)
             )
             return
 
-        api.set_counter_status('OPEN', query.from_user.id, announcement_sent=False)
+        await api.set_counter_status('OPEN', query.from_user.id, announcement_sent=False)
 
         await query.edit_message_text(
             "✅ <b>Counter OPEN</b>",
@@ -1953,7 +1953,7 @@ async def investment_view_active(update: Update, context: ContextTypes.DEFAULT_T
 
     try:
         # Get active investments from Django API
-        active_investments = api.get_active_investments()
+        active_investments = await api.get_active_investments()
 
         # Handle paginated response
         if isinstance(active_investments, dict) and 'results' in active_investments:
@@ -2017,7 +2017,7 @@ async def investment_view_completed(update: Update, context: ContextTypes.DEFAUL
 
     try:
         # Get all investments and filter completed
-        all_investments = api.get_all_investments()
+        all_investments = await api.get_all_investments()
 
         # Handle paginated response
         if isinstance(all_investments, dict) and 'results' in all_investments:
@@ -2158,7 +2158,7 @@ async def investment_notes_received(update: Update, context: ContextTypes.DEFAUL
         today = datetime.now().strftime('%Y-%m-%d')
         logger.info(f"💎 Creating investment: pppoker_id={pppoker_id}, amount={amount}, notes={notes}")
 
-        investment = api.create_investment(
+        investment = await api.create_investment(
             pppoker_id=pppoker_id,
             investment_amount=amount,
             start_date=today,
@@ -2205,7 +2205,7 @@ async def investment_return_start(update: Update, context: ContextTypes.DEFAULT_
 
     # Get active investments
     try:
-        active_investments = api.get_active_investments()
+        active_investments = await api.get_active_investments()
 
         if not active_investments:
             await query.edit_message_text(
@@ -2267,7 +2267,7 @@ async def investment_return_user_selected(update: Update, context: ContextTypes.
 
     # Get this user's active investments
     try:
-        all_active = api.get_active_investments()
+        all_active = await api.get_active_investments()
         user_investments = [inv for inv in all_active if inv.get('user') == user_id]
 
         if not user_investments:
@@ -2340,7 +2340,7 @@ async def investment_return_amount_received(update: Update, context: ContextType
         for inv in investments:
             inv_id = inv.get('id')
             # Update investment
-            api._put(f"investments/{inv_id}/", {
+            await api._put(f"investments/{inv_id}/", {
                 'status': 'Completed',
                 'profit_share': float(player_share / len(investments)),  # Split evenly across all investments
                 'loss_share': 0,
@@ -2421,7 +2421,7 @@ async def investment_check_expired(update: Update, context: ContextTypes.DEFAULT
         )
 
         # Call API to mark expired investments
-        marked_count = api.mark_expired_investments_as_lost()
+        marked_count = await api.mark_expired_investments_as_lost()
 
         # Show result
         if marked_count > 0:
@@ -2460,7 +2460,7 @@ async def admin_club_balances(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     try:
         # Check if balances are initialized
-        initialized = api.is_balances_initialized()
+        initialized = await api.is_balances_initialized()
 
         if not initialized:
             keyboard = [
@@ -2478,7 +2478,7 @@ async def admin_club_balances(update: Update, context: ContextTypes.DEFAULT_TYPE
             return
 
         # Show current balances
-        balances = api.get_club_balances()
+        balances = await api.get_club_balances()
 
         # Handle paginated/dict response
         if isinstance(balances, dict) and 'results' in balances:
@@ -2547,7 +2547,7 @@ async def balances_history(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
 
-    transactions = api.get_inventory_transactions(limit=10)
+    transactions = await api.get_inventory_transactions(limit=10)
 
     if not transactions:
         await query.edit_message_text(
@@ -2668,7 +2668,7 @@ async def account_add_holder_received(update: Update, context: ContextTypes.DEFA
             # Reactivate existing inactive account
             logger.info(f"Reactivating inactive account: {existing_account}")
             account_id = existing_account['id']
-            api.update_payment_account(
+            await api.update_payment_account(
                 account_id,
                 account_number=account_number,
                 account_name=holder,
@@ -2677,7 +2677,7 @@ async def account_add_holder_received(update: Update, context: ContextTypes.DEFA
             action = "Reactivated"
         else:
             # Create new account
-            api.create_payment_account(
+            await api.create_payment_account(
                 method=method,
                 account_number=account_number,
                 account_name=holder
@@ -2717,7 +2717,7 @@ async def account_edit_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
     context.user_data['edit_account_id'] = account_id
 
     try:
-        account = api.get_payment_account(account_id)
+        account = await api.get_payment_account(account_id)
 
         if not account:
             logger.error(f"Account {account_id} not found or returned None")
@@ -2794,7 +2794,7 @@ async def account_edit_holder_received(update: Update, context: ContextTypes.DEF
             update_data['account_name'] = new_holder
 
         if update_data:
-            api.update_payment_account(account_id, **update_data)
+            await api.update_payment_account(account_id, **update_data)
 
             await update.message.reply_text(
                 f"✅ <b>Payment Account Updated!</b>\n\n"
@@ -2831,7 +2831,7 @@ async def admin_exchange_rates(update: Update, context: ContextTypes.DEFAULT_TYP
 
     try:
         # Get all active exchange rates
-        rates = api.get_active_exchange_rates()
+        rates = await api.get_active_exchange_rates()
 
         # Build message showing current rates
         import datetime
@@ -2877,7 +2877,7 @@ async def set_usd_rate_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
     await query.answer()
 
     # Get current USD rate
-    current_rate = api.get_exchange_rate('USD', 'MVR') or 15.42
+    current_rate = await api.get_exchange_rate('USD', 'MVR') or 15.42
 
     await query.edit_message_text(
         f"💵 <b>Set USD Exchange Rate</b>\n\n"
@@ -2900,7 +2900,7 @@ async def set_usd_rate_received(update: Update, context: ContextTypes.DEFAULT_TY
             return SET_USD_RATE
 
         # Create or update the exchange rate
-        api.set_exchange_rate('USD', 'MVR', rate)
+        await api.set_exchange_rate('USD', 'MVR', rate)
         await update.message.reply_text(
             f"✅ <b>USD Exchange Rate Updated!</b>\n\n"
             f"<b>USD → MVR:</b> {rate:.2f}\n\n"
@@ -2927,7 +2927,7 @@ async def set_usdt_rate_start(update: Update, context: ContextTypes.DEFAULT_TYPE
     await query.answer()
 
     # Get current USDT rate
-    current_rate = api.get_exchange_rate('USDT', 'MVR') or 15.42
+    current_rate = await api.get_exchange_rate('USDT', 'MVR') or 15.42
 
     await query.edit_message_text(
         f"💎 <b>Set USDT Exchange Rate</b>\n\n"
@@ -2950,7 +2950,7 @@ async def set_usdt_rate_received(update: Update, context: ContextTypes.DEFAULT_T
             return SET_USDT_RATE
 
         # Create or update the exchange rate
-        api.set_exchange_rate('USDT', 'MVR', rate)
+        await api.set_exchange_rate('USDT', 'MVR', rate)
         await update.message.reply_text(
             f"✅ <b>USDT Exchange Rate Updated!</b>\n\n"
             f"<b>USDT → MVR:</b> {rate:.2f}\n\n"
@@ -0,0 +1,37 @@
+# Generated migration
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_add_language_to_user'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='deposit',
+            index=models.Index(fields=['created_at'], name='deposits_created_3e8490_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='withdrawal',
+            index=models.Index(fields=['created_at'], name='withdrawals_created_03b47f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='spinhistory',
+            index=models.Index(fields=['created_at'], name='spin_histor_created_6b47aa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cashbackrequest',
+            index=models.Index(fields=['created_at'], name='cashback_re_created_8a45b7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usercredit',
+            index=models.Index(fields=['created_at'], name='user_credit_created_b19021_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fiftyfiftyinvestment',
+            index=models.Index(fields=['created_at'], name='fifty_fifty_created_de3dd4_idx'),
+        ),
+    ]
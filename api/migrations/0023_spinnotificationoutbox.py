@@ -0,0 +1,31 @@
+# Generated migration
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_add_user_created_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpinNotificationOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('spin_ids', models.JSONField(default=list)),
+                ('spin_count', models.IntegerField()),
+                ('total_chips', models.IntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('delivered_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='spin_notifications', to='api.user')),
+            ],
+            options={
+                'db_table': 'spin_notification_outbox',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['delivered_at', 'created_at'], name='spin_notifi_deliver_d04272_idx')],
+            },
+        ),
+    ]
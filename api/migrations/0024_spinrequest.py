@@ -0,0 +1,28 @@
+# Generated migration
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_spinnotificationoutbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpinRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(max_length=64, unique=True)),
+                ('response', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='spin_requests', to='api.user')),
+            ],
+            options={
+                'db_table': 'spin_requests',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated migration
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_spinrequest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReceiptReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reference_number', models.CharField(max_length=100, unique=True)),
+                ('bank', models.CharField(blank=True, default='', max_length=20)),
+                ('content_hash', models.CharField(blank=True, db_index=True, default='', max_length=64)),
+                ('source', models.CharField(choices=[('deposit', 'Deposit'), ('seat', 'Seat Request')], max_length=20)),
+                ('source_id', models.BigIntegerField(blank=True, null=True)),
+                ('seen_count', models.IntegerField(default=1)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_seen_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='receipt_references', to='api.user')),
+            ],
+            options={
+                'db_table': 'receipt_references',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated migration
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_receiptreference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BroadcastJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('message_type', models.CharField(choices=[('text', 'Text'), ('photo', 'Photo')], max_length=10)),
+                ('content', models.JSONField()),
+                ('recipient_ids', models.JSONField(default=list)),
+                ('next_index', models.IntegerField(default=0)),
+                ('success_count', models.IntegerField(default=0)),
+                ('blocked_count', models.IntegerField(default=0)),
+                ('failed_count', models.IntegerField(default=0)),
+                ('status', models.CharField(choices=[('Running', 'Running'), ('Completed', 'Completed')], default='Running', max_length=20)),
+                ('admin_chat_id', models.BigIntegerField(blank=True, null=True)),
+                ('progress_message_id', models.BigIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'broadcast_jobs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='broadcast_j_status_1b9a6a_idx')],
+            },
+        ),
+    ]
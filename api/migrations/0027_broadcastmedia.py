@@ -0,0 +1,27 @@
+# Generated migration
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_broadcastjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BroadcastMedia',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('file_id', models.CharField(max_length=255)),
+                ('media_type', models.CharField(default='photo', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'broadcast_media',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
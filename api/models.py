@@ -24,6 +24,7 @@ class User(models.Model):
         indexes = [
             models.Index(fields=['telegram_id']),
             models.Index(fields=['synced_to_sheets']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
@@ -57,6 +58,7 @@ class Deposit(models.Model):
             models.Index(fields=['user', 'status']),
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['synced_to_sheets']),
+            models.Index(fields=['created_at']),
         ]
         ordering = ['-created_at']
 
@@ -91,6 +93,7 @@ class Withdrawal(models.Model):
             models.Index(fields=['user', 'status']),
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['synced_to_sheets']),
+            models.Index(fields=['created_at']),
         ]
         ordering = ['-created_at']
 
@@ -200,6 +203,7 @@ class SpinHistory(models.Model):
             models.Index(fields=['user', 'status']),
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['synced_to_sheets']),
+            models.Index(fields=['created_at']),
         ]
         ordering = ['-created_at']
 
@@ -302,6 +306,7 @@ class CashbackRequest(models.Model):
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['week_start', 'week_end']),
             models.Index(fields=['synced_to_sheets']),
+            models.Index(fields=['created_at']),
         ]
         ordering = ['-created_at']
 
@@ -458,6 +463,7 @@ class UserCredit(models.Model):
         indexes = [
             models.Index(fields=['user', 'created_at']),
             models.Index(fields=['synced_to_sheets']),
+            models.Index(fields=['created_at']),
         ]
         ordering = ['-created_at']
 
@@ -517,6 +523,7 @@ class FiftyFiftyInvestment(models.Model):
             models.Index(fields=['start_date', 'end_date']),
             models.Index(fields=['status']),
             models.Index(fields=['synced_to_sheets']),
+            models.Index(fields=['created_at']),
         ]
         ordering = ['-created_at']
 
@@ -649,3 +656,114 @@ class NotificationMessage(models.Model):
 
     def __str__(self):
         return f"{self.notification_type} - {self.notification_key} - Admin {self.admin_telegram_id} - Msg {self.message_id}"
+
+
+class SpinNotificationOutbox(models.Model):
+    """Spin Notification Outbox - one row per process_spin batch with chips, consumed by the bot"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='spin_notifications')
+    spin_ids = models.JSONField(default=list)  # SpinHistory IDs announced by this notification
+    spin_count = models.IntegerField()
+    total_chips = models.IntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    delivered_at = models.DateTimeField(null=True, blank=True)  # Set when the bot has sent it
+
+    class Meta:
+        db_table = 'spin_notification_outbox'
+        indexes = [
+            models.Index(fields=['delivered_at', 'created_at']),
+        ]
+        ordering = ['created_at']
+
+    def __str__(self):
+        return f"Spin notification {self.id} - {self.user.username} - {self.total_chips} chips"
+
+
+class SpinRequest(models.Model):
+    """Spin Request - idempotency record for process_spin, replayed when a client retries the same key"""
+    idempotency_key = models.CharField(max_length=64, unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='spin_requests')
+    response = models.JSONField()  # process_spin response body returned on replay
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'spin_requests'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Spin request {self.idempotency_key} - {self.user.username}"
+
+
+class ReceiptReference(models.Model):
+    """Receipt Reference - every bank reference number seen on an uploaded receipt, for instant duplicate checks"""
+    SOURCE_CHOICES = [
+        ('deposit', 'Deposit'),
+        ('seat', 'Seat Request'),
+    ]
+
+    reference_number = models.CharField(max_length=100, unique=True)
+    bank = models.CharField(max_length=20, blank=True, default='')
+    content_hash = models.CharField(max_length=64, blank=True, default='', db_index=True)  # SHA-256 of the image
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='receipt_references')  # First uploader
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES)
+    source_id = models.BigIntegerField(null=True, blank=True)  # Deposit / SeatRequest ID of the first upload
+    seen_count = models.IntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_seen_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'receipt_references'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.reference_number} - {self.user.username} ({self.source}) x{self.seen_count}"
+
+
+class BroadcastJob(models.Model):
+    """Broadcast Job - an admin broadcast and its send progress, so the bot can resume it after a restart"""
+    MESSAGE_TYPE_CHOICES = [
+        ('text', 'Text'),
+        ('photo', 'Photo'),
+    ]
+    STATUS_CHOICES = [
+        ('Running', 'Running'),
+        ('Completed', 'Completed'),
+    ]
+
+    message_type = models.CharField(max_length=10, choices=MESSAGE_TYPE_CHOICES)
+    content = models.JSONField()  # text/photo, caption, parse_mode, reply_markup (as a dict)
+    recipient_ids = models.JSONField(default=list)  # Telegram IDs, snapshot taken when the broadcast started
+    next_index = models.IntegerField(default=0)  # Every recipient before this index has been handled
+    success_count = models.IntegerField(default=0)
+    blocked_count = models.IntegerField(default=0)
+    failed_count = models.IntegerField(default=0)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Running')
+    admin_chat_id = models.BigIntegerField(null=True, blank=True)  # Where progress is reported
+    progress_message_id = models.BigIntegerField(null=True, blank=True)  # Message edited with live progress
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'broadcast_jobs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Broadcast {self.id} - {self.message_type} - {self.next_index}/{len(self.recipient_ids)} ({self.status})"
+
+
+class BroadcastMedia(models.Model):
+    """Broadcast Media - Telegram file_id of media the bot already uploaded, keyed by content hash"""
+    content_hash = models.CharField(max_length=64, unique=True)  # SHA-256 of the file (or of the URL)
+    file_id = models.CharField(max_length=255)
+    media_type = models.CharField(max_length=10, default='photo')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'broadcast_media'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.media_type} {self.content_hash[:12]} -> {self.file_id[:20]}"
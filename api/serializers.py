@@ -9,7 +9,8 @@ from .models import (
     JoinRequest, SeatRequest, CashbackRequest, PaymentAccount,
     Admin, CounterStatus, PromoCode, PromotionEligibility, CashbackEligibility,
     SupportMessage, UserCredit, ExchangeRate, FiftyFiftyInvestment,
-    ClubBalance, InventoryTransaction, NotificationMessage
+    ClubBalance, InventoryTransaction, NotificationMessage, SpinNotificationOutbox,
+    ReceiptReference, BroadcastJob, BroadcastMedia
 )
 
 
@@ -25,6 +26,15 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class UserSummarySerializer(serializers.ModelSerializer):
+    """Minimal User representation nested in slim list responses"""
+
+    class Meta:
+        model = User
+        fields = ['id', 'telegram_id', 'username', 'pppoker_id']
+        read_only_fields = fields
+
+
 class DepositSerializer(serializers.ModelSerializer):
     """Serializer for Deposit model"""
     user_details = UserSerializer(source='user', read_only=True)
@@ -64,6 +74,16 @@ class WithdrawalSerializer(serializers.ModelSerializer):
         return value
 
 
+class DepositListSerializer(DepositSerializer):
+    """Slim Deposit serializer for list responses (?slim=true)"""
+    user_details = UserSummarySerializer(source='user', read_only=True)
+
+
+class WithdrawalListSerializer(WithdrawalSerializer):
+    """Slim Withdrawal serializer for list responses (?slim=true)"""
+    user_details = UserSummarySerializer(source='user', read_only=True)
+
+
 class SpinUserSerializer(serializers.ModelSerializer):
     """Serializer for SpinUser model"""
     user_details = UserSerializer(source='user', read_only=True)
@@ -120,6 +140,11 @@ class SpinHistorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'approved_at']
 
 
+class SpinHistoryListSerializer(SpinHistorySerializer):
+    """Slim SpinHistory serializer for list responses (?slim=true)"""
+    user_details = UserSummarySerializer(source='user', read_only=True)
+
+
 class JoinRequestSerializer(serializers.ModelSerializer):
     """Serializer for JoinRequest model"""
     user_details = UserSerializer(source='user', read_only=True)
@@ -162,6 +187,11 @@ class CashbackRequestSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'approved_at']
 
 
+class CashbackRequestListSerializer(CashbackRequestSerializer):
+    """Slim CashbackRequest serializer for list responses (?slim=true)"""
+    user_details = UserSummarySerializer(source='user', read_only=True)
+
+
 class CashbackEligibilitySerializer(serializers.ModelSerializer):
     """Serializer for CashbackEligibility model"""
     user_telegram_id = serializers.IntegerField(source='user.telegram_id', read_only=True)
@@ -261,6 +291,11 @@ class UserCreditSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class UserCreditListSerializer(UserCreditSerializer):
+    """Slim UserCredit serializer for list responses (?slim=true)"""
+    user_details = UserSummarySerializer(source='user', read_only=True)
+
+
 class ExchangeRateSerializer(serializers.ModelSerializer):
     """Serializer for ExchangeRate model"""
 
@@ -287,6 +322,11 @@ class FiftyFiftyInvestmentSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class FiftyFiftyInvestmentListSerializer(FiftyFiftyInvestmentSerializer):
+    """Slim FiftyFiftyInvestment serializer for list responses (?slim=true)"""
+    user_details = UserSummarySerializer(source='user', read_only=True, allow_null=True)
+
+
 class ClubBalanceSerializer(serializers.ModelSerializer):
     """Serializer for ClubBalance model"""
     user_details = UserSerializer(source='user', read_only=True)
@@ -323,3 +363,58 @@ class NotificationMessageSerializer(serializers.ModelSerializer):
             'admin_telegram_id', 'message_id', 'created_at'
         ]
         read_only_fields = ['id', 'created_at']
+
+
+class SpinNotificationOutboxSerializer(serializers.ModelSerializer):
+    """Serializer for SpinNotificationOutbox model"""
+    user_telegram_id = serializers.IntegerField(source='user.telegram_id', read_only=True)
+    username = serializers.CharField(source='user.username', read_only=True)
+    pppoker_id = serializers.CharField(source='user.pppoker_id', read_only=True)
+
+    class Meta:
+        model = SpinNotificationOutbox
+        fields = [
+            'id', 'user', 'user_telegram_id', 'username', 'pppoker_id',
+            'spin_ids', 'spin_count', 'total_chips', 'created_at', 'delivered_at'
+        ]
+        read_only_fields = ['id', 'created_at']
+
+
+class ReceiptReferenceSerializer(serializers.ModelSerializer):
+    """Serializer for ReceiptReference model"""
+    user_telegram_id = serializers.IntegerField(source='user.telegram_id', read_only=True)
+    username = serializers.CharField(source='user.username', read_only=True)
+
+    class Meta:
+        model = ReceiptReference
+        fields = [
+            'id', 'reference_number', 'bank', 'content_hash', 'user', 'user_telegram_id',
+            'username', 'source', 'source_id', 'seen_count', 'created_at', 'last_seen_at'
+        ]
+        read_only_fields = ['id', 'seen_count', 'created_at', 'last_seen_at']
+
+
+class BroadcastJobSerializer(serializers.ModelSerializer):
+    """Serializer for BroadcastJob model"""
+    total_recipients = serializers.SerializerMethodField()
+
+    class Meta:
+        model = BroadcastJob
+        fields = [
+            'id', 'message_type', 'content', 'recipient_ids', 'total_recipients',
+            'next_index', 'success_count', 'blocked_count', 'failed_count', 'status',
+            'admin_chat_id', 'progress_message_id', 'created_at', 'updated_at', 'completed_at'
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at', 'completed_at']
+
+    def get_total_recipients(self, obj):
+        return len(obj.recipient_ids)
+
+
+class BroadcastMediaSerializer(serializers.ModelSerializer):
+    """Serializer for BroadcastMedia model"""
+
+    class Meta:
+        model = BroadcastMedia
+        fields = ['id', 'content_hash', 'file_id', 'media_type', 'created_at']
+        read_only_fields = ['id', 'created_at']
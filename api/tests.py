@@ -1,3 +1,171 @@
+"""
+Query-count budgets for the REST API.
+Seeds a few rows for every model and serializer relation, calls each list endpoint
+and custom action, and fails if any of them issues more queries than its budget
+(catches N+1 regressions when a serializer starts reading a relation the viewset
+does not select_related).
+
+Run with: python manage.py test api
+"""
+import hashlib
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .models import (
+    User, Deposit, Withdrawal, SpinUser, SpinAward, SpinUsage, SpinHistory,
+    JoinRequest, SeatRequest, CashbackRequest, PaymentAccount, Admin, PromoCode,
+    PromotionEligibility, CashbackEligibility, SupportMessage, UserCredit,
+    ExchangeRate, FiftyFiftyInvestment, ClubBalance, InventoryTransaction,
+    NotificationMessage, SpinNotificationOutbox, ReceiptReference, BroadcastJob,
+    BroadcastMedia
+)
+
+# Paginated list = COUNT + SELECT, plain action = SELECT.
+# These budgets hold no matter how many rows each page contains.
+LIST_QUERIES = 2
+ACTION_QUERIES = 1
+
+# Rows seeded per model - more than one, so a per-row relation lookup shows up
+SEED_ROWS = 3
+
+
+class QueryCountTests(TestCase):
+    """Every endpoint that serializes a queryset stays within its query budget"""
+
+    @classmethod
+    def setUpTestData(cls):
+        today = timezone.now().date()
+
+        for i in range(SEED_ROWS):
+            telegram_id = 1000 + i
+            pppoker_id = f'QC{i}'
+            user = User.objects.create(telegram_id=telegram_id, username=f'query_check_{i}', pppoker_id=pppoker_id)
+            deposit = Deposit.objects.create(
+                user=user, amount=Decimal('100'), method='BML', account_name='Query Check', pppoker_id=pppoker_id
+            )
+            Withdrawal.objects.create(
+                user=user, amount=Decimal('50'), method='BML', account_name='Query Check',
+                account_number='7700000000000', pppoker_id=pppoker_id
+            )
+            SpinUser.objects.create(user=user, available_spins=5)
+            award = SpinAward.objects.create(
+                user=user, deposit=deposit, spins_awarded=5, amount_mvr=Decimal('100')
+            )
+            SpinUsage.objects.create(
+                user=user, spin_award=award, prize_name='10 Chips', chips_won=10, pppoker_id=pppoker_id
+            )
+            spin = SpinHistory.objects.create(user=user, prize='10 Chips', chips=10, pppoker_id=pppoker_id)
+            JoinRequest.objects.create(user=user, pppoker_id=pppoker_id)
+            SeatRequest.objects.create(user=user, amount=Decimal('100'), pppoker_id=pppoker_id)
+
+            promotion = PromoCode.objects.create(
+                code=f'QUERYCHECK{i}', percentage=Decimal('10'),
+                start_date=today - timedelta(days=1), end_date=today + timedelta(days=1)
+            )
+            cashback_request = CashbackRequest.objects.create(
+                user=user, promotion=promotion, week_start=today - timedelta(days=7), week_end=today,
+                investment_amount=Decimal('100'), cashback_amount=Decimal('10'),
+                cashback_percentage=Decimal('10'), pppoker_id=pppoker_id
+            )
+            CashbackEligibility.objects.create(
+                user=user, promotion=promotion, cashback_request=cashback_request,
+                loss_amount=Decimal('100'), cashback_amount=Decimal('10')
+            )
+            PromotionEligibility.objects.create(
+                user=user, promotion=promotion, deposit=deposit,
+                deposit_amount=Decimal('100'), bonus_amount=Decimal('10')
+            )
+
+            Admin.objects.create(telegram_id=telegram_id, username=f'query_check_{i}')
+            SupportMessage.objects.create(user=user, message='Query check')
+            UserCredit.objects.create(
+                user=user, amount=Decimal('10'), credit_type='Bonus', description='Query check', created_by=telegram_id
+            )
+            FiftyFiftyInvestment.objects.create(
+                user=user, pppoker_id=pppoker_id, investment_amount=Decimal('100'), start_date=today
+            )
+            ClubBalance.objects.create(user=user, balance=Decimal('100'))
+            InventoryTransaction.objects.create(
+                item_name='Chips', quantity=1, transaction_type='Add',
+                price_per_unit=Decimal('1'), total_amount=Decimal('1'), created_by=telegram_id
+            )
+            NotificationMessage.objects.create(
+                notification_type='spin_reward', notification_key=f'spin_reward_{telegram_id}',
+                admin_telegram_id=telegram_id, message_id=i + 1
+            )
+            SpinNotificationOutbox.objects.create(user=user, spin_ids=[spin.id], spin_count=1, total_chips=10)
+            ReceiptReference.objects.create(
+                reference_number=f'QUERYCHECK{i}', user=user, source='deposit', source_id=deposit.id
+            )
+            BroadcastJob.objects.create(message_type='text', content={'text': 'Query check'}, recipient_ids=[telegram_id])
+            BroadcastMedia.objects.create(
+                content_hash=hashlib.sha256(f'query_check_{i}'.encode()).hexdigest(), file_id=f'query_check_{i}'
+            )
+
+            if i == 0:
+                cls.user, cls.deposit, cls.award = user, deposit, award
+
+        # Unique per currency pair / method, so one row each
+        for currency in ['USD', 'USDT', 'BTC'][:SEED_ROWS]:
+            ExchangeRate.objects.create(currency_from=currency, currency_to='MVR', rate=Decimal('15.42'))
+        for method, _ in PaymentAccount.METHOD_CHOICES[:SEED_ROWS]:
+            PaymentAccount.objects.create(method=method, account_number='7700000000000')
+
+    def endpoint_budgets(self):
+        """Return [(path, max_queries)] for every endpoint that serializes a queryset"""
+        budgets = [
+            (f'/api/{prefix}/', LIST_QUERIES)
+            for prefix in [
+                'users', 'deposits', 'withdrawals', 'spin-users', 'spin-awards',
+                'spin-usages', 'spin-history', 'join-requests', 'seat-requests',
+                'cashback-requests', 'cashback-eligibility', 'payment-accounts',
+                'admins', 'promo-codes', 'promotion-eligibility', 'support-messages',
+                'user-credits', 'exchange-rates', 'investments', 'club-balances',
+                'inventory-transactions', 'notification-messages', 'spin-notifications',
+                'receipt-references', 'broadcasts', 'broadcast-media',
+            ]
+        ]
+        budgets += [
+            (f'/api/{prefix}/pending/', ACTION_QUERIES)
+            for prefix in [
+                'deposits', 'withdrawals', 'spin-history', 'join-requests',
+                'seat-requests', 'cashback-requests',
+            ]
+        ]
+        budgets += [
+            ('/api/payment-accounts/active/', ACTION_QUERIES),
+            ('/api/exchange-rates/active/', ACTION_QUERIES),
+            ('/api/promo-codes/active/', ACTION_QUERIES),
+            ('/api/investments/active/', ACTION_QUERIES),
+            ('/api/broadcasts/running/', ACTION_QUERIES),
+        ]
+
+        # The by_user lookups resolve the telegram_id first, which adds one query
+        budgets += [
+            (f'/api/spin-awards/by_user/?telegram_id={self.user.telegram_id}', ACTION_QUERIES + 1),
+            (f'/api/spin-usages/by_user/?telegram_id={self.user.telegram_id}', ACTION_QUERIES + 1),
+            (f'/api/spin-awards/by_deposit/?deposit_id={self.deposit.id}', ACTION_QUERIES),
+            (f'/api/spin-usages/by_award/?award_id={self.award.id}', ACTION_QUERIES),
+        ]
+
+        return budgets
+
+    def test_endpoints_within_query_budget(self):
+        client = APIClient()
+
+        for path, max_queries in self.endpoint_budgets():
+            with self.subTest(path=path):
+                with CaptureQueriesContext(connection) as queries:
+                    response = client.get(path)
 
-# Create your tests here.
+                self.assertEqual(response.status_code, 200)
+                self.assertLessEqual(
+                    len(queries), max_queries,
+                    f"{path} ran {len(queries)} queries (budget {max_queries})"
+                )
@@ -33,10 +33,15 @@ router.register(r'investments', views.FiftyFiftyInvestmentViewSet, basename='inv
 router.register(r'club-balances', views.ClubBalanceViewSet, basename='clubbalance')
 router.register(r'inventory-transactions', views.InventoryTransactionViewSet, basename='inventorytransaction')
 router.register(r'notification-messages', views.NotificationMessageViewSet, basename='notificationmessage')
+router.register(r'spin-notifications', views.SpinNotificationOutboxViewSet, basename='spinnotification')
+router.register(r'receipt-references', views.ReceiptReferenceViewSet, basename='receiptreference')
+router.register(r'broadcasts', views.BroadcastJobViewSet, basename='broadcastjob')
+router.register(r'broadcast-media', views.BroadcastMediaViewSet, basename='broadcastmedia')
 
 urlpatterns = [
     path('', include(router.urls)),
     path('health/', views.health_check, name='health_check'),
     path('reports/financial/', views.financial_report, name='financial_report'),
+    path('reports/pnl/', views.pnl_report, name='pnl_report'),
     path('reports/dashboard/', views.financial_report_dashboard, name='financial_report_dashboard'),
 ]
@@ -6,19 +6,27 @@ All API endpoints for Billionaires PPPoker Bot
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.serializers import BaseSerializer
+from datetime import timezone as dt_timezone
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.db import transaction, IntegrityError
+from django.db.models import Q, F, Case, When, Value
 from django.http import JsonResponse
 from django.shortcuts import render
 from django.contrib.admin.views.decorators import staff_member_required
+from django.conf import settings
 
 from .models import (
     User, Deposit, Withdrawal, SpinUser, SpinAward, SpinUsage, SpinHistory,
     JoinRequest, SeatRequest, CashbackRequest, PaymentAccount,
     Admin, CounterStatus, PromoCode, PromotionEligibility, CashbackEligibility,
     SupportMessage, UserCredit, ExchangeRate, FiftyFiftyInvestment,
-    ClubBalance, InventoryTransaction, NotificationMessage
+    ClubBalance, InventoryTransaction, NotificationMessage, SpinNotificationOutbox, SpinRequest,
+    ReceiptReference, BroadcastJob, BroadcastMedia
 )
 from .serializers import (
     UserSerializer, DepositSerializer, WithdrawalSerializer,
@@ -28,7 +36,11 @@ from .serializers import (
     PromotionEligibilitySerializer, CashbackEligibilitySerializer,
     SupportMessageSerializer, UserCreditSerializer, ExchangeRateSerializer,
     FiftyFiftyInvestmentSerializer, ClubBalanceSerializer,
-    InventoryTransactionSerializer, NotificationMessageSerializer
+    InventoryTransactionSerializer, NotificationMessageSerializer,
+    DepositListSerializer, WithdrawalListSerializer, SpinHistoryListSerializer,
+    CashbackRequestListSerializer, UserCreditListSerializer, FiftyFiftyInvestmentListSerializer,
+    SpinNotificationOutboxSerializer, ReceiptReferenceSerializer, BroadcastJobSerializer,
+    BroadcastMediaSerializer
 )
 
 
@@ -37,7 +49,120 @@ def health_check(request):
     return JsonResponse({'status': 'healthy', 'service': 'billionaires-api'})
 
 
-class UserViewSet(viewsets.ModelViewSet):
+def parse_created_bound(value, param_name):
+    """Parse an ISO datetime query parameter (naive values are treated as UTC)"""
+    # An unencoded '+' in the UTC offset arrives as a space
+    parsed = parse_datetime(value.replace(' ', '+')) if value else None
+    if parsed is None:
+        raise ValidationError({param_name: f'Invalid datetime: {value}'})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
+
+
+class CreatedAtRangeMixin:
+    """
+    Adds ?created_after= and ?created_before= filtering on created_at
+    (both bounds inclusive, ISO 8601 datetimes)
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        created_after = self.request.query_params.get('created_after')
+        created_before = self.request.query_params.get('created_before')
+        if created_after:
+            queryset = queryset.filter(created_at__gte=parse_created_bound(created_after, 'created_after'))
+        if created_before:
+            queryset = queryset.filter(created_at__lte=parse_created_bound(created_before, 'created_before'))
+        return queryset
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """Keyset pagination on (created_at, id), newest first - every page costs the same"""
+    ordering = ('-created_at', '-id')
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
+
+class CursorPaginationMixin:
+    """
+    Opt-in keyset pagination for large tables:
+    ?pagination=cursor (and the ?cursor= links it returns) switch the list endpoint
+    from page numbers to CreatedAtCursorPagination
+    """
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            params = self.request.query_params
+            if 'cursor' in params or params.get('pagination') == 'cursor':
+                self._paginator = CreatedAtCursorPagination()
+        return super().paginator
+
+
+def prune_serializer_fields(serializer, requested):
+    """Drop serializer fields not named in requested (dotted names reach into nested serializers)"""
+    wanted = {}
+    for name in requested:
+        head, _, rest = name.partition('.')
+        wanted.setdefault(head, [])
+        if rest:
+            wanted[head].append(rest)
+
+    for name in list(serializer.fields):
+        if name not in wanted:
+            serializer.fields.pop(name)
+        elif wanted[name]:
+            nested = serializer.fields[name]
+            if isinstance(nested, BaseSerializer):
+                prune_serializer_fields(getattr(nested, 'child', nested), wanted[name])
+
+
+class SparseFieldsMixin:
+    """
+    Lets GET callers trim responses:
+    ?fields=id,amount,status,user_details.telegram_id returns only those fields
+    ?slim=true switches to slim_serializer_class (user_details reduced to a summary)
+    """
+    slim_serializer_class = None
+
+    def get_serializer_class(self):
+        slim = self.request.query_params.get('slim', '').lower() in ('true', '1', 'yes')
+        if self.slim_serializer_class and self.request.method == 'GET' and slim:
+            return self.slim_serializer_class
+        return super().get_serializer_class()
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields_param = self.request.query_params.get('fields')
+        if fields_param and self.request.method == 'GET':
+            requested = [name.strip() for name in fields_param.split(',') if name.strip()]
+            prune_serializer_fields(getattr(serializer, 'child', serializer), requested)
+        return serializer
+
+
+_redis_client = None
+
+
+def wake_spin_notifier():
+    """Publish a wakeup so the bot delivers outbox notifications now (no-op without REDIS_URL)"""
+    global _redis_client
+    if not settings.REDIS_URL:
+        return
+    import logging
+    logger = logging.getLogger(__name__)
+    try:
+        if _redis_client is None:
+            import redis
+            _redis_client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=2)
+        _redis_client.publish(settings.SPIN_NOTIFY_CHANNEL, '1')
+    except Exception as e:
+        # The bot's fallback sweep still delivers the notification
+        logger.warning(f"⚠️ Failed to publish spin notification wakeup: {e}")
+
+
+class UserViewSet(SparseFieldsMixin, CursorPaginationMixin, viewsets.ModelViewSet):
     """
     API endpoint for Users
 
@@ -120,7 +245,7 @@ class UserViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class DepositViewSet(viewsets.ModelViewSet):
+class DepositViewSet(SparseFieldsMixin, CursorPaginationMixin, CreatedAtRangeMixin, viewsets.ModelViewSet):
     """
     API endpoint for Deposits
 
@@ -129,8 +254,9 @@ class DepositViewSet(viewsets.ModelViewSet):
     approve: Approve deposit (admin)
     reject: Reject deposit (admin)
     """
-    queryset = Deposit.objects.all()
+    queryset = Deposit.objects.select_related('user')
     serializer_class = DepositSerializer
+    slim_serializer_class = DepositListSerializer
 
     def get_queryset(self):
         """Filter deposits by user telegram_id if provided"""
@@ -143,7 +269,7 @@ class DepositViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def pending(self, request):
         """Get all pending deposits"""
-        deposits = Deposit.objects.filter(status='Pending')
+        deposits = self.queryset.filter(status='Pending')
         serializer = self.get_serializer(deposits, many=True)
         return Response(serializer.data)
 
@@ -160,17 +286,24 @@ class DepositViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        deposit.status = 'Approved'
-        deposit.approved_at = timezone.now()
-        deposit.approved_by = admin_id
-        deposit.synced_to_sheets = False  # Mark for sync
-        deposit.save()
-
-        # Update user balance (skip if add_balance is False, e.g., for credit payment tracking)
-        if add_balance:
-            deposit.user.balance += deposit.amount
-            deposit.user.synced_to_sheets = False
-            deposit.user.save()
+        with transaction.atomic():
+            # Lock the deposit so concurrent approvals only credit the balance once
+            deposit = Deposit.objects.select_for_update().get(pk=deposit.pk)
+            already_approved = deposit.status == 'Approved'
+
+            deposit.status = 'Approved'
+            deposit.approved_at = timezone.now()
+            deposit.approved_by = admin_id
+            deposit.synced_to_sheets = False  # Mark for sync
+            deposit.save()
+
+            # Update user balance (skip if add_balance is False, e.g., for credit payment tracking)
+            if add_balance and not already_approved:
+                User.objects.filter(pk=deposit.user_id).update(
+                    balance=F('balance') + deposit.amount,
+                    synced_to_sheets=False,
+                    updated_at=timezone.now()
+                )
 
         serializer = self.get_serializer(deposit)
         return Response(serializer.data)
@@ -199,15 +332,16 @@ class DepositViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class WithdrawalViewSet(viewsets.ModelViewSet):
+class WithdrawalViewSet(SparseFieldsMixin, CursorPaginationMixin, CreatedAtRangeMixin, viewsets.ModelViewSet):
     """API endpoint for Withdrawals"""
-    queryset = Withdrawal.objects.all()
+    queryset = Withdrawal.objects.select_related('user')
     serializer_class = WithdrawalSerializer
+    slim_serializer_class = WithdrawalListSerializer
 
     @action(detail=False, methods=['get'])
     def pending(self, request):
         """Get all pending withdrawals"""
-        withdrawals = Withdrawal.objects.filter(status='Pending')
+        withdrawals = self.queryset.filter(status='Pending')
         serializer = self.get_serializer(withdrawals, many=True)
         return Response(serializer.data)
 
@@ -264,9 +398,9 @@ class WithdrawalViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class SpinUserViewSet(viewsets.ModelViewSet):
+class SpinUserViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Spin Users"""
-    queryset = SpinUser.objects.all()
+    queryset = SpinUser.objects.select_related('user')
     serializer_class = SpinUserSerializer
 
     @action(detail=False, methods=['get', 'post'])
@@ -305,9 +439,13 @@ class SpinUserViewSet(viewsets.ModelViewSet):
         spin_user = self.get_object()
         spins_to_add = request.data.get('spins', 0)
 
-        spin_user.available_spins += spins_to_add
-        spin_user.synced_to_sheets = False
-        spin_user.save()
+        # Increment in the database so concurrent awards are not lost
+        SpinUser.objects.filter(pk=spin_user.pk).update(
+            available_spins=F('available_spins') + spins_to_add,
+            synced_to_sheets=False,
+            updated_at=timezone.now()
+        )
+        spin_user.refresh_from_db()
 
         serializer = self.get_serializer(spin_user)
         return Response(serializer.data)
@@ -338,7 +476,7 @@ class SpinUserViewSet(viewsets.ModelViewSet):
             approved_rewards = SpinHistory.objects.filter(status='Approved').count()
 
             # Top 5 users by total spins used
-            top_users = SpinUser.objects.order_by('-total_spins_used')[:5]
+            top_users = self.queryset.order_by('-total_spins_used')[:5]
             top_users_data = []
             for spin_user in top_users:
                 top_users_data.append({
@@ -363,9 +501,9 @@ class SpinUserViewSet(viewsets.ModelViewSet):
             )
 
 
-class SpinAwardViewSet(viewsets.ModelViewSet):
+class SpinAwardViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Spin Awards - tracks when spins are given"""
-    queryset = SpinAward.objects.all()
+    queryset = SpinAward.objects.select_related('user', 'deposit__user')
     serializer_class = SpinAwardSerializer
 
     @action(detail=False, methods=['get'])
@@ -381,7 +519,7 @@ class SpinAwardViewSet(viewsets.ModelViewSet):
 
         try:
             user = User.objects.get(telegram_id=telegram_id)
-            awards = SpinAward.objects.filter(user=user)
+            awards = self.queryset.filter(user=user)
             serializer = self.get_serializer(awards, many=True)
             return Response(serializer.data)
         except User.DoesNotExist:
@@ -401,14 +539,14 @@ class SpinAwardViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        awards = SpinAward.objects.filter(deposit_id=deposit_id)
+        awards = self.queryset.filter(deposit_id=deposit_id)
         serializer = self.get_serializer(awards, many=True)
         return Response(serializer.data)
 
 
-class SpinUsageViewSet(viewsets.ModelViewSet):
+class SpinUsageViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Spin Usages - tracks when spins are played"""
-    queryset = SpinUsage.objects.all()
+    queryset = SpinUsage.objects.select_related('user', 'spin_award__user', 'spin_award__deposit__user')
     serializer_class = SpinUsageSerializer
 
     @action(detail=False, methods=['get'])
@@ -424,7 +562,7 @@ class SpinUsageViewSet(viewsets.ModelViewSet):
 
         try:
             user = User.objects.get(telegram_id=telegram_id)
-            usages = SpinUsage.objects.filter(user=user)
+            usages = self.queryset.filter(user=user)
             serializer = self.get_serializer(usages, many=True)
             return Response(serializer.data)
         except User.DoesNotExist:
@@ -444,20 +582,25 @@ class SpinUsageViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        usages = SpinUsage.objects.filter(spin_award_id=award_id)
+        usages = self.queryset.filter(spin_award_id=award_id)
         serializer = self.get_serializer(usages, many=True)
         return Response(serializer.data)
 
 
-class SpinHistoryViewSet(viewsets.ModelViewSet):
+class SpinHistoryViewSet(SparseFieldsMixin, CursorPaginationMixin, CreatedAtRangeMixin, viewsets.ModelViewSet):
     """API endpoint for Spin History (LEGACY - kept for backward compatibility)"""
-    queryset = SpinHistory.objects.all()
+    queryset = SpinHistory.objects.select_related('user')
     serializer_class = SpinHistorySerializer
+    slim_serializer_class = SpinHistoryListSerializer
     filterset_fields = ['status', 'notified_at']  # Enable filtering by status and notified_at
 
+    # Largest batch process_spin accepts in one request - Spin All callers split bigger
+    # batches into several requests (django_api.PROCESS_SPIN_MAX_BATCH)
+    MAX_SPINS_PER_REQUEST = 100
+
     def get_queryset(self):
         """Override to support query parameter filtering"""
-        queryset = SpinHistory.objects.all()
+        queryset = super().get_queryset()
 
         # Filter by status if provided
         status_param = self.request.query_params.get('status')
@@ -476,7 +619,7 @@ class SpinHistoryViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def pending(self, request):
         """Get all pending spin rewards"""
-        spins = SpinHistory.objects.filter(status='Pending')
+        spins = self.queryset.filter(status='Pending')
         serializer = self.get_serializer(spins, many=True)
         return Response(serializer.data)
 
@@ -544,6 +687,7 @@ class SpinHistoryViewSet(viewsets.ModelViewSet):
         spin_count = request.data.get('spin_count', 1)
         results = request.data.get('results', [])
         username = request.data.get('username')  # Get username from request
+        idempotency_key = request.data.get('idempotency_key')  # Optional: makes retries safe
 
         logger.info(f"🎰 process_spin called: telegram_id={telegram_id}, username={username}, spin_count={spin_count}")
 
@@ -553,6 +697,33 @@ class SpinHistoryViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        if not isinstance(results, list) or len(results) > self.MAX_SPINS_PER_REQUEST:
+            return Response(
+                {'error': f'results must be a list of at most {self.MAX_SPINS_PER_REQUEST} spins'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            spin_count = int(spin_count)
+        except (TypeError, ValueError):
+            spin_count = 0
+        if not 1 <= spin_count <= self.MAX_SPINS_PER_REQUEST:
+            return Response(
+                {'error': f'spin_count must be between 1 and {self.MAX_SPINS_PER_REQUEST}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if idempotency_key is not None:
+            if not isinstance(idempotency_key, str) or not 1 <= len(idempotency_key) <= 64:
+                return Response(
+                    {'error': 'idempotency_key must be a string of at most 64 characters'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # Retry of a batch we already recorded - return the original result
+            replay = self._replay_spin_request(idempotency_key, telegram_id)
+            if replay is not None:
+                return replay
+
         try:
             user = User.objects.get(telegram_id=telegram_id)
             spin_user = SpinUser.objects.get(user=user)
@@ -582,37 +753,83 @@ class SpinHistoryViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Check if user has enough spins
-        if spin_user.available_spins < spin_count:
-            return Response(
-                {'error': 'Not enough spins available'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        try:
+            with transaction.atomic():
+                # Deduct spins only if enough remain, so concurrent requests cannot overdraw
+                updated = SpinUser.objects.filter(
+                    pk=spin_user.pk,
+                    available_spins__gte=spin_count
+                ).update(
+                    available_spins=F('available_spins') - spin_count,
+                    total_spins_used=F('total_spins_used') + spin_count,
+                    synced_to_sheets=False,
+                    updated_at=timezone.now()
+                )
+                if not updated:
+                    return Response(
+                        {'error': 'Not enough spins available'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+                # Create all spin history records with a single INSERT
+                spin_records = SpinHistory.objects.bulk_create([
+                    SpinHistory(
+                        user=user,
+                        prize=result['prize'],
+                        chips=result['chips'],
+                        pppoker_id=user.pppoker_id,
+                        status='Auto' if result['chips'] == 0 else 'Pending',
+                        synced_to_sheets=False
+                    )
+                    for result in results
+                ])
+
+                # Queue one outbox notification for the chips that need admin approval
+                pending_spins = [spin for spin in spin_records if spin.status == 'Pending']
+                if pending_spins:
+                    SpinNotificationOutbox.objects.create(
+                        user=user,
+                        spin_ids=[spin.id for spin in pending_spins if spin.id],
+                        spin_count=len(pending_spins),
+                        total_chips=sum(spin.chips for spin in pending_spins)
+                    )
+                    transaction.on_commit(wake_spin_notifier)
+
+                spin_user.refresh_from_db(fields=['available_spins'])
+
+                # Compact results - the caller already has the user and created_at is "now"
+                payload = {
+                    'spins': [
+                        {'id': spin.id, 'prize': spin.prize, 'chips': spin.chips, 'status': spin.status}
+                        for spin in spin_records
+                    ],
+                    'available_spins': spin_user.available_spins
+                }
 
-        # Create spin history records
-        spin_records = []
-        for result in results:
-            spin_record = SpinHistory.objects.create(
-                user=user,
-                prize=result['prize'],
-                chips=result['chips'],
-                pppoker_id=user.pppoker_id,
-                status='Auto' if result['chips'] == 0 else 'Pending',
-                synced_to_sheets=False
+                # Inserted last: a duplicate key rolls back this whole batch
+                if idempotency_key:
+                    SpinRequest.objects.create(idempotency_key=idempotency_key, user=user, response=payload)
+        except IntegrityError:
+            # A concurrent request with the same key committed first
+            replay = self._replay_spin_request(idempotency_key, telegram_id) if idempotency_key else None
+            if replay is None:
+                raise
+            return replay
+
+        return Response(payload)
+
+    @staticmethod
+    def _replay_spin_request(idempotency_key, telegram_id):
+        """Return the stored process_spin response for this key, or None if the key is new"""
+        spin_request = SpinRequest.objects.select_related('user').filter(idempotency_key=idempotency_key).first()
+        if spin_request is None:
+            return None
+        if str(spin_request.user.telegram_id) != str(telegram_id):
+            return Response(
+                {'error': 'idempotency_key was already used by another user'},
+                status=status.HTTP_409_CONFLICT
             )
-            spin_records.append(spin_record)
-
-        # Update spin user
-        spin_user.available_spins -= spin_count
-        spin_user.total_spins_used += spin_count
-        spin_user.synced_to_sheets = False
-        spin_user.save()
-
-        serializer = self.get_serializer(spin_records, many=True)
-        return Response({
-            'spins': serializer.data,
-            'available_spins': spin_user.available_spins
-        })
+        return Response({**spin_request.response, 'replayed': True})
 
     @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
@@ -626,44 +843,142 @@ class SpinHistoryViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        spin.status = 'Approved'
-        spin.approved_at = timezone.now()
-        spin.approved_by = admin_id
-        spin.synced_to_sheets = False
-        spin.save()
-
-        # Update user's spin earnings
-        spin_user = SpinUser.objects.get(user=spin.user)
-        spin_user.total_chips_earned += spin.chips
-        spin_user.synced_to_sheets = False
-        spin_user.save()
+        with transaction.atomic():
+            # Lock the spin so concurrent approvals only count the chips once
+            spin = SpinHistory.objects.select_for_update().get(pk=spin.pk)
+            already_approved = spin.status == 'Approved'
+
+            spin.status = 'Approved'
+            spin.approved_at = timezone.now()
+            spin.approved_by = admin_id
+            spin.synced_to_sheets = False
+            spin.save()
+
+            # Update user's spin earnings
+            if not already_approved:
+                SpinUser.objects.filter(user_id=spin.user_id).update(
+                    total_chips_earned=F('total_chips_earned') + spin.chips,
+                    synced_to_sheets=False,
+                    updated_at=timezone.now()
+                )
 
         serializer = self.get_serializer(spin)
         return Response(serializer.data)
 
+    @staticmethod
+    def _parse_spin_ids(request):
+        """Return the validated ids list from the request body, or None"""
+        ids = request.data.get('ids')
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            return None
+        return ids
+
+    @action(detail=False, methods=['post'])
+    def bulk_mark_notified(self, request):
+        """
+        Mark several spins as notified in one UPDATE
+        Body: {"ids": [1, 2, 3], "notified_at": "2025-01-01T00:00:00Z"} (notified_at optional)
+        Like mark_notified, only still-pending spins are marked
+        """
+        ids = self._parse_spin_ids(request)
+        if ids is None:
+            return Response(
+                {'error': 'ids must be a list of spin IDs'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        notified_at = request.data.get('notified_at')
+        notified_at = parse_created_bound(notified_at, 'notified_at') if notified_at else timezone.now()
+        marked_count = SpinHistory.objects.filter(
+            id__in=ids,
+            status='Pending',
+            notified_at__isnull=True
+        ).update(notified_at=notified_at)
+
+        return Response({'marked_count': marked_count})
+
+    @action(detail=False, methods=['post'])
+    def bulk_approve(self, request):
+        """
+        Approve several spin rewards at once
+        Body: {"ids": [1, 2, 3], "admin_id": 123456}
+        Only pending spins are approved; each user's total_chips_earned is
+        bumped once by the sum of their newly approved chips
+        """
+        ids = self._parse_spin_ids(request)
+        admin_id = request.data.get('admin_id')
+
+        if ids is None:
+            return Response(
+                {'error': 'ids must be a list of spin IDs'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not admin_id:
+            return Response(
+                {'error': 'admin_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        now = timezone.now()
+        with transaction.atomic():
+            # Lock the pending rows so a concurrent approval can't count them twice
+            spins = list(
+                SpinHistory.objects.select_for_update()
+                .filter(id__in=ids, status='Pending')
+                .values_list('id', 'user_id', 'chips')
+            )
+            approved_ids = [spin_id for spin_id, _, _ in spins]
+
+            SpinHistory.objects.filter(id__in=approved_ids).update(
+                status='Approved',
+                approved_at=now,
+                approved_by=admin_id,
+                synced_to_sheets=False
+            )
+
+            chips_by_user = {}
+            for _, user_id, chips in spins:
+                chips_by_user[user_id] = chips_by_user.get(user_id, 0) + chips
+
+            if chips_by_user:
+                SpinUser.objects.filter(user_id__in=chips_by_user).update(
+                    total_chips_earned=F('total_chips_earned') + Case(
+                        *[When(user_id=user_id, then=Value(chips)) for user_id, chips in chips_by_user.items()],
+                        default=Value(0)
+                    ),
+                    synced_to_sheets=False,
+                    updated_at=now
+                )
 
-class JoinRequestViewSet(viewsets.ModelViewSet):
+        return Response({
+            'approved_count': len(approved_ids),
+            'approved_ids': approved_ids,
+            'total_chips': sum(chips_by_user.values())
+        })
+
+
+class JoinRequestViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Join Requests"""
-    queryset = JoinRequest.objects.all()
+    queryset = JoinRequest.objects.select_related('user')
     serializer_class = JoinRequestSerializer
 
     @action(detail=False, methods=['get'])
     def pending(self, request):
         """Get all pending join requests"""
-        joins = JoinRequest.objects.filter(status='Pending')
+        joins = self.queryset.filter(status='Pending')
         serializer = self.get_serializer(joins, many=True)
         return Response(serializer.data)
 
 
-class SeatRequestViewSet(viewsets.ModelViewSet):
+class SeatRequestViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Seat Requests"""
-    queryset = SeatRequest.objects.all()
+    queryset = SeatRequest.objects.select_related('user')
     serializer_class = SeatRequestSerializer
 
     @action(detail=False, methods=['get'])
     def pending(self, request):
         """Get all pending seat requests"""
-        seats = SeatRequest.objects.filter(status='Pending')
+        seats = self.queryset.filter(status='Pending')
         serializer = self.get_serializer(seats, many=True)
         return Response(serializer.data)
 
@@ -771,15 +1086,16 @@ class SeatRequestViewSet(viewsets.ModelViewSet):
         })
 
 
-class CashbackRequestViewSet(viewsets.ModelViewSet):
+class CashbackRequestViewSet(SparseFieldsMixin, CursorPaginationMixin, CreatedAtRangeMixin, viewsets.ModelViewSet):
     """API endpoint for Cashback Requests"""
-    queryset = CashbackRequest.objects.all()
+    queryset = CashbackRequest.objects.select_related('user')
     serializer_class = CashbackRequestSerializer
+    slim_serializer_class = CashbackRequestListSerializer
 
     @action(detail=False, methods=['get'])
     def pending(self, request):
         """Get all pending cashback requests"""
-        cashbacks = CashbackRequest.objects.filter(status='Pending')
+        cashbacks = self.queryset.filter(status='Pending')
         serializer = self.get_serializer(cashbacks, many=True)
         return Response(serializer.data)
 
@@ -969,13 +1285,13 @@ class CashbackRequestViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class CashbackEligibilityViewSet(viewsets.ModelViewSet):
+class CashbackEligibilityViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Cashback Eligibility"""
-    queryset = CashbackEligibility.objects.all()
+    queryset = CashbackEligibility.objects.select_related('user', 'promotion')
     serializer_class = CashbackEligibilitySerializer
 
 
-class PaymentAccountViewSet(viewsets.ModelViewSet):
+class PaymentAccountViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Payment Accounts"""
     queryset = PaymentAccount.objects.all()
     serializer_class = PaymentAccountSerializer
@@ -988,7 +1304,7 @@ class PaymentAccountViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class AdminViewSet(viewsets.ModelViewSet):
+class AdminViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Admins"""
     queryset = Admin.objects.all()
     serializer_class = AdminSerializer
@@ -1012,17 +1328,24 @@ class AdminViewSet(viewsets.ModelViewSet):
         return Response({'is_admin': is_admin})
 
 
-class CounterStatusViewSet(viewsets.ModelViewSet):
+class CounterStatusViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Counter Status"""
     queryset = CounterStatus.objects.all()
     serializer_class = CounterStatusSerializer
 
     @action(detail=False, methods=['get'])
     def current(self, request):
-        """Get current counter status"""
+        """
+        Get current counter status
+        Sends an ETag; a matching If-None-Match gets 304 so pollers skip the body
+        """
         counter = CounterStatus.load()
+        etag = f'"{counter.updated_at.timestamp()}-{int(counter.is_open)}"'
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
         serializer = self.get_serializer(counter)
-        return Response(serializer.data)
+        return Response(serializer.data, headers={'ETag': etag})
 
     @action(detail=False, methods=['post'])
     def toggle(self, request):
@@ -1046,7 +1369,7 @@ class CounterStatusViewSet(viewsets.ModelViewSet):
             )
 
 
-class PromoCodeViewSet(viewsets.ModelViewSet):
+class PromoCodeViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Promo Codes"""
     queryset = PromoCode.objects.all()
     serializer_class = PromoCodeSerializer
@@ -1070,9 +1393,9 @@ class PromoCodeViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class PromotionEligibilityViewSet(viewsets.ModelViewSet):
+class PromotionEligibilityViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Promotion Eligibility"""
-    queryset = PromotionEligibility.objects.all()
+    queryset = PromotionEligibility.objects.select_related('user', 'promotion')
     serializer_class = PromotionEligibilitySerializer
 
     @action(detail=False, methods=['get'])
@@ -1102,27 +1425,28 @@ class PromotionEligibilityViewSet(viewsets.ModelViewSet):
             )
 
 
-class SupportMessageViewSet(viewsets.ModelViewSet):
+class SupportMessageViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Support Messages"""
-    queryset = SupportMessage.objects.all()
+    queryset = SupportMessage.objects.select_related('user')
     serializer_class = SupportMessageSerializer
 
 
-class UserCreditViewSet(viewsets.ModelViewSet):
+class UserCreditViewSet(SparseFieldsMixin, CursorPaginationMixin, CreatedAtRangeMixin, viewsets.ModelViewSet):
     """API endpoint for User Credits"""
-    queryset = UserCredit.objects.all()
+    queryset = UserCredit.objects.select_related('user')
     serializer_class = UserCreditSerializer
+    slim_serializer_class = UserCreditListSerializer
 
     def get_queryset(self):
         """Filter credits by user telegram_id if provided"""
-        queryset = UserCredit.objects.all()
+        queryset = super().get_queryset()
         user_telegram_id = self.request.query_params.get('user', None)
         if user_telegram_id is not None:
             queryset = queryset.filter(user__telegram_id=user_telegram_id)
         return queryset
 
 
-class ExchangeRateViewSet(viewsets.ModelViewSet):
+class ExchangeRateViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Exchange Rates"""
     queryset = ExchangeRate.objects.all()
     serializer_class = ExchangeRateSerializer
@@ -1135,15 +1459,16 @@ class ExchangeRateViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class FiftyFiftyInvestmentViewSet(viewsets.ModelViewSet):
+class FiftyFiftyInvestmentViewSet(SparseFieldsMixin, CursorPaginationMixin, CreatedAtRangeMixin, viewsets.ModelViewSet):
     """API endpoint for 50-50 Investments"""
-    queryset = FiftyFiftyInvestment.objects.all()
+    queryset = FiftyFiftyInvestment.objects.select_related('user')
     serializer_class = FiftyFiftyInvestmentSerializer
+    slim_serializer_class = FiftyFiftyInvestmentListSerializer
 
     @action(detail=False, methods=['get'])
     def active(self, request):
         """Get all active investments"""
-        investments = FiftyFiftyInvestment.objects.filter(status='Active')
+        investments = self.queryset.filter(status='Active')
         serializer = self.get_serializer(investments, many=True)
         return Response(serializer.data)
 
@@ -1189,13 +1514,13 @@ class FiftyFiftyInvestmentViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class ClubBalanceViewSet(viewsets.ModelViewSet):
+class ClubBalanceViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Club Balances"""
-    queryset = ClubBalance.objects.all()
+    queryset = ClubBalance.objects.select_related('user')
     serializer_class = ClubBalanceSerializer
 
 
-class InventoryTransactionViewSet(viewsets.ModelViewSet):
+class InventoryTransactionViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """API endpoint for Inventory Transactions"""
     queryset = InventoryTransaction.objects.all()
     serializer_class = InventoryTransactionSerializer
@@ -1431,6 +1756,112 @@ def financial_report(request):
     return Response(report)
 
 
+# Payment methods grouped by currency for the P&L report (amounts are stored in MVR)
+PNL_METHOD_GROUPS = {
+    'mvr': ['BML', 'MIB'],
+    'usd': ['USD'],
+    'usdt': ['USDT'],
+}
+
+
+def aggregate_by_period(queryset, date_field, periods, metrics):
+    """
+    Run one aggregate query over all periods using conditional Sum/Count
+
+    metrics maps a key to (aggregate class, field, extra Q filter).
+    Returns {period_name: {key: value}} with Decimals converted to float.
+    """
+    expressions = {}
+    for index, (name, start, end) in enumerate(periods):
+        in_period = Q(**{f'{date_field}__gte': start, f'{date_field}__lte': end})
+        for key, (aggregate, field, extra) in metrics.items():
+            expressions[f'p{index}_{key}'] = aggregate(field, filter=in_period & extra)
+
+    earliest = min(start for _, start, _ in periods)
+    latest = max(end for _, _, end in periods)
+    row = queryset.filter(**{
+        f'{date_field}__gte': earliest,
+        f'{date_field}__lte': latest
+    }).aggregate(**expressions)
+
+    return {
+        name: {key: float(row[f'p{index}_{key}'] or 0) for key in metrics}
+        for index, (name, _, _) in enumerate(periods)
+    }
+
+
+@api_view(['POST'])
+def pnl_report(request):
+    """
+    Aggregated profit/loss totals for several periods in one call
+    Body:
+        - periods: [{"name": "today", "start": ISO datetime, "end": ISO datetime}, ...]
+    Returns {period_name: {deposits, withdrawals, spin_rewards, spin_count, cashback, investments, credits}}
+    """
+    from django.db.models import Sum, Count
+
+    raw_periods = request.data.get('periods')
+    if not isinstance(raw_periods, list) or not raw_periods:
+        return Response(
+            {'error': 'periods must be a non-empty list'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    periods = []
+    for period in raw_periods:
+        if not isinstance(period, dict) or not period.get('name'):
+            return Response(
+                {'error': 'each period needs name, start and end'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        periods.append((
+            period['name'],
+            parse_created_bound(period.get('start'), 'start'),
+            parse_created_bound(period.get('end'), 'end')
+        ))
+
+    money_metrics = {'total': (Sum, 'amount', Q()), 'count': (Count, 'id', Q())}
+    for currency, methods in PNL_METHOD_GROUPS.items():
+        money_metrics[currency] = (Sum, 'amount', Q(method__in=methods))
+
+    deposits = aggregate_by_period(Deposit.objects.all(), 'created_at', periods, money_metrics)
+    withdrawals = aggregate_by_period(Withdrawal.objects.all(), 'created_at', periods, money_metrics)
+    spins = aggregate_by_period(SpinHistory.objects.all(), 'created_at', periods, {
+        'chips': (Sum, 'chips', Q()),
+        'count': (Count, 'id', Q()),
+    })
+    cashback = aggregate_by_period(CashbackRequest.objects.all(), 'created_at', periods, {
+        'total': (Sum, 'cashback_amount', Q()),
+    })
+    investments = aggregate_by_period(FiftyFiftyInvestment.objects.all(), 'created_at', periods, {
+        'active_count': (Count, 'id', Q(status='Active')),
+        'active_amount': (Sum, 'investment_amount', Q(status='Active')),
+        'completed_count': (Count, 'id', Q(status='Completed')),
+        'completed_amount': (Sum, 'investment_amount', Q(status='Completed')),
+        'completed_profit_share': (Sum, 'profit_share', Q(status='Completed')),
+        'lost_count': (Count, 'id', Q(status='Lost')),
+        'lost_amount': (Sum, 'investment_amount', Q(status='Lost')),
+    })
+    credits = aggregate_by_period(UserCredit.objects.all(), 'created_at', periods, {
+        'total': (Sum, 'amount', Q()),
+        'count': (Count, 'id', Q()),
+    })
+
+    report = {}
+    for name, _, _ in periods:
+        report[name] = {
+            'deposits': deposits[name],
+            'withdrawals': withdrawals[name],
+            'spin_rewards': spins[name]['chips'],
+            'spin_count': int(spins[name]['count']),
+            'cashback': cashback[name]['total'],
+            'investments': investments[name],
+            'credits': credits[name],
+        }
+
+    return Response(report)
+
+
 @api_view(['GET'])
 def financial_report_dashboard(request):
     """
@@ -1662,7 +2093,7 @@ def financial_report_dashboard(request):
     return render(request, 'reports/financial_dashboard.html', context)
 
 
-class NotificationMessageViewSet(viewsets.ModelViewSet):
+class NotificationMessageViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """
     API endpoint for Notification Messages (Telegram message IDs for button removal)
 
@@ -1700,3 +2131,219 @@ class NotificationMessageViewSet(viewsets.ModelViewSet):
             'deleted_count': deleted_count,
             'notification_key': notification_key
         })
+
+
+class SpinNotificationOutboxViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    """
+    API endpoint for the spin notification outbox
+
+    pending: Undelivered notifications, oldest first (consumed by the bot)
+    ack: Mark notifications delivered and their spins notified in one call
+    """
+    queryset = SpinNotificationOutbox.objects.select_related('user')
+    serializer_class = SpinNotificationOutboxSerializer
+
+    # Most notifications handed to the bot per pending call
+    MAX_BATCH = 200
+
+    @action(detail=False, methods=['get'])
+    def pending(self, request):
+        """Get undelivered spin notifications"""
+        notifications = self.queryset.filter(delivered_at__isnull=True)[:self.MAX_BATCH]
+        serializer = self.get_serializer(notifications, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['post'])
+    def ack(self, request):
+        """
+        Mark notifications as delivered
+        Body: {"ids": [1, 2, 3]}
+        Also stamps notified_at on their still-pending spins
+        """
+        ids = request.data.get('ids')
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            return Response(
+                {'error': 'ids must be a list of notification IDs'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        now = timezone.now()
+        with transaction.atomic():
+            notifications = list(
+                SpinNotificationOutbox.objects.select_for_update()
+                .filter(id__in=ids, delivered_at__isnull=True)
+                .only('id', 'spin_ids')
+            )
+            spin_ids = [spin_id for notification in notifications for spin_id in notification.spin_ids]
+
+            SpinNotificationOutbox.objects.filter(
+                id__in=[notification.id for notification in notifications]
+            ).update(delivered_at=now)
+            marked_spins = SpinHistory.objects.filter(
+                id__in=spin_ids,
+                status='Pending',
+                notified_at__isnull=True
+            ).update(notified_at=now)
+
+        return Response({
+            'delivered_count': len(notifications),
+            'marked_spins': marked_spins
+        })
+
+
+class ReceiptReferenceViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    """
+    API endpoint for Receipt References (duplicate receipt index)
+
+    check_in: Record a receipt's reference number and report whether it was seen before
+    """
+    queryset = ReceiptReference.objects.select_related('user')
+    serializer_class = ReceiptReferenceSerializer
+
+    @action(detail=False, methods=['post'])
+    def check_in(self, request):
+        """
+        Record a receipt reference (one indexed lookup, no Deposit scan)
+        Body: {"reference_number": "BLAZ1333", "telegram_id": 123, "source": "deposit",
+               "source_id": 45, "bank": "BML", "content_hash": "..."}
+        Returns {"duplicate": false} for a new reference, otherwise
+        {"duplicate": true, "first_seen": {...}} with the original upload
+        """
+        reference_number = (request.data.get('reference_number') or '').strip().upper()
+        telegram_id = request.data.get('telegram_id')
+        source = request.data.get('source')
+
+        if not reference_number or not telegram_id:
+            return Response(
+                {'error': 'reference_number and telegram_id are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if source not in dict(ReceiptReference.SOURCE_CHOICES):
+            return Response(
+                {'error': f'source must be one of {list(dict(ReceiptReference.SOURCE_CHOICES))}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        user = get_object_or_404(User, telegram_id=telegram_id)
+
+        try:
+            with transaction.atomic():
+                ReceiptReference.objects.create(
+                    reference_number=reference_number,
+                    bank=request.data.get('bank') or '',
+                    content_hash=request.data.get('content_hash') or '',
+                    user=user,
+                    source=source,
+                    source_id=request.data.get('source_id')
+                )
+            return Response({'duplicate': False})
+        except IntegrityError:
+            pass
+
+        # Seen before - count the repeat and report the first upload
+        ReceiptReference.objects.filter(reference_number=reference_number).update(
+            seen_count=F('seen_count') + 1,
+            last_seen_at=timezone.now()
+        )
+        first_seen = self.queryset.get(reference_number=reference_number)
+        return Response({
+            'duplicate': True,
+            'first_seen': self.get_serializer(first_seen).data
+        })
+
+
+class BroadcastJobViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    """
+    API endpoint for admin broadcasts (send progress persisted by the bot)
+
+    running: Broadcasts that have not finished, oldest first (resumed by the bot on startup)
+    progress: Save a broadcast's cursor and counts, optionally marking it completed
+    """
+    queryset = BroadcastJob.objects.all()
+    serializer_class = BroadcastJobSerializer
+
+    PROGRESS_FIELDS = ['next_index', 'success_count', 'blocked_count', 'failed_count']
+
+    @action(detail=False, methods=['get'])
+    def running(self, request):
+        """Get unfinished broadcasts"""
+        jobs = self.queryset.filter(status='Running').order_by('created_at')
+        serializer = self.get_serializer(jobs, many=True)
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['post'])
+    def progress(self, request, pk=None):
+        """
+        Save send progress
+        Body: {"next_index": 1200, "success_count": 1150, "blocked_count": 40,
+               "failed_count": 10, "completed": false}
+        """
+        job = self.get_object()
+
+        updates = {}
+        for field in self.PROGRESS_FIELDS:
+            value = request.data.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, int) or value < 0:
+                return Response(
+                    {'error': f'{field} must be a non-negative integer'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            updates[field] = value
+
+        if request.data.get('progress_message_id') is not None:
+            updates['progress_message_id'] = request.data.get('progress_message_id')
+        if request.data.get('completed'):
+            updates['status'] = 'Completed'
+            updates['completed_at'] = timezone.now()
+
+        for field, value in updates.items():
+            setattr(job, field, value)
+        job.save(update_fields=list(updates) + ['updated_at'])
+
+        # Slim response - the bot saves progress every few seconds, no need to echo the recipient list
+        return Response({'id': job.id, 'next_index': job.next_index, 'status': job.status})
+
+
+class BroadcastMediaViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
+    """
+    API endpoint for the broadcast media cache (uploaded once, reused by file_id)
+
+    by_hash: Get the cached file_id for a content hash
+    remember: Store (or replace) the file_id for a content hash
+    """
+    queryset = BroadcastMedia.objects.all()
+    serializer_class = BroadcastMediaSerializer
+
+    @action(detail=False, methods=['get'])
+    def by_hash(self, request):
+        """Get cached media by content_hash (404 if it was never uploaded)"""
+        content_hash = request.query_params.get('content_hash')
+        if not content_hash:
+            return Response({'error': 'content_hash parameter required'}, status=status.HTTP_400_BAD_REQUEST)
+
+        media = get_object_or_404(BroadcastMedia, content_hash=content_hash)
+        serializer = self.get_serializer(media)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['post'])
+    def remember(self, request):
+        """
+        Store the file_id for uploaded media
+        Body: {"content_hash": "...", "file_id": "AgACAgQAAx...", "media_type": "photo"}
+        """
+        content_hash = request.data.get('content_hash')
+        file_id = request.data.get('file_id')
+        if not content_hash or not file_id:
+            return Response(
+                {'error': 'content_hash and file_id are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        media, _ = BroadcastMedia.objects.update_or_create(
+            content_hash=content_hash,
+            defaults={'file_id': file_id, 'media_type': request.data.get('media_type') or 'photo'}
+        )
+        serializer = self.get_serializer(media)
+        return Response(serializer.data)
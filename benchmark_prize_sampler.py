@@ -0,0 +1,48 @@
+"""
+Microbenchmark for the mini app prize sampler.
+Compares the old per-spin draw (rebuild weight lists, random.choices(k=1),
+scan the wheel for matching segments) with PrizeTable.draw.
+
+Usage: python benchmark_prize_sampler.py [rounds]
+"""
+import random
+import sys
+import timeit
+
+from spin_prizes import PRIZE_TABLE, PRIZE_WEIGHTS, WHEEL_PRIZES
+
+SPIN_COUNTS = [1, 10, 50, 100]
+
+
+def per_spin_draw(spin_count):
+    """The pre-PrizeTable loop from mini_app_server.spin (without logging)"""
+    results = []
+    for _ in range(spin_count):
+        prize = random.choices(
+            list(PRIZE_WEIGHTS.keys()),
+            weights=list(PRIZE_WEIGHTS.values()),
+            k=1
+        )[0]
+        matching_indices = [i for i, p in enumerate(WHEEL_PRIZES) if p == prize]
+        segment_index = random.choice(matching_indices)
+        if prize == "Try Again!":
+            prize_display, chips = "Try Again!", 0
+        else:
+            prize_display, chips = f"{prize} Chips", int(prize)
+        results.append({'prize': prize_display, 'segment_index': segment_index, 'chips': chips})
+    return results
+
+
+def benchmark(rounds=2000):
+    """Print microseconds per request for both samplers"""
+    print(f"Prize sampler benchmark ({rounds} requests per size)")
+    print(f"{'spins':>6} {'per-spin us':>12} {'table us':>10} {'speedup':>8}")
+
+    for spin_count in SPIN_COUNTS:
+        old = timeit.timeit(lambda: per_spin_draw(spin_count), number=rounds) / rounds * 1e6
+        new = timeit.timeit(lambda: PRIZE_TABLE.draw(spin_count), number=rounds) / rounds * 1e6
+        print(f"{spin_count:>6} {old:>12.1f} {new:>10.1f} {old / new:>7.1f}x")
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
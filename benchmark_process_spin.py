@@ -0,0 +1,88 @@
+"""
+Benchmark for the process_spin endpoint.
+Times 1/10/50/100-spin batches against the configured database.
+Everything runs inside a transaction that is rolled back, so no data is kept.
+
+Usage: python benchmark_process_spin.py [rounds]
+"""
+import os
+import sys
+import time
+import statistics
+import django
+
+# Setup Django
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'billionaires_backend.settings')
+django.setup()
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from api.models import User, SpinUser
+from api.views import SpinHistoryViewSet
+
+BATCH_SIZES = [1, 10, 50, 100]
+BENCHMARK_TELEGRAM_ID = 999000999
+
+
+class Rollback(Exception):
+    """Raised to roll back the benchmark transaction"""
+
+
+def run_batch(view, factory, spin_count):
+    """Run one process_spin request and return (seconds, query count)"""
+    results = [
+        {'prize': '10 Chips' if i % 5 == 0 else 'Try Again', 'chips': 10 if i % 5 == 0 else 0}
+        for i in range(spin_count)
+    ]
+    request = factory.post('/api/spin-history/process_spin/', {
+        'telegram_id': BENCHMARK_TELEGRAM_ID,
+        'spin_count': spin_count,
+        'results': results,
+        'username': 'benchmark'
+    }, format='json')
+
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        response = view(request)
+        elapsed = time.perf_counter() - start
+
+    if response.status_code != 200:
+        raise RuntimeError(f"process_spin returned {response.status_code}: {response.data}")
+    return elapsed, len(queries)
+
+
+def benchmark(rounds=20):
+    """Print median/p95 latency and query count per batch size"""
+    factory = APIRequestFactory()
+    view = SpinHistoryViewSet.as_view({'post': 'process_spin'})
+
+    print(f"process_spin benchmark ({connection.vendor}, {rounds} rounds per batch)")
+    print(f"{'spins':>6} {'median ms':>10} {'p95 ms':>10} {'queries':>8}")
+
+    try:
+        with transaction.atomic():
+            user = User.objects.create(telegram_id=BENCHMARK_TELEGRAM_ID, username='benchmark')
+            spin_user = SpinUser.objects.create(user=user)
+
+            for spin_count in BATCH_SIZES:
+                timings = []
+                query_count = 0
+                for _ in range(rounds):
+                    SpinUser.objects.filter(pk=spin_user.pk).update(available_spins=spin_count)
+                    elapsed, query_count = run_batch(view, factory, spin_count)
+                    timings.append(elapsed * 1000)
+
+                timings.sort()
+                p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+                print(f"{spin_count:>6} {statistics.median(timings):>10.2f} {p95:>10.2f} {query_count:>8}")
+
+            raise Rollback()
+    except Rollback:
+        pass
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
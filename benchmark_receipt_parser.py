@@ -0,0 +1,43 @@
+"""
+Benchmark for vision_api.parse_payment_details.
+Times the parser on each fixture in receipt_fixtures.py, then on the fixtures
+concatenated into ever longer texts, and reports the cost per line so a
+pattern that backtracks or a lookup that rescans the text (non-linear cost)
+shows up as a growing us/line column.
+
+Usage: python benchmark_receipt_parser.py [rounds]
+"""
+import sys
+import timeit
+
+from receipt_fixtures import RECEIPT_FIXTURES
+from vision_api import parse_payment_details
+
+SIZE_MULTIPLIERS = [1, 10, 100, 1000]
+
+
+def time_parse(text, rounds):
+    """Best-of-5 microseconds per parse"""
+    return min(timeit.repeat(lambda: parse_payment_details(text), number=rounds, repeat=5)) / rounds * 1e6
+
+
+def benchmark(rounds=2000):
+    """Print per-fixture latency and the scaling with text length"""
+    print(f"Receipt parser benchmark ({rounds} rounds, best of 5)")
+    print(f"{'fixture':<28} {'bank':<6} {'lines':>6} {'us/parse':>10}")
+    for fixture in RECEIPT_FIXTURES:
+        text = fixture['text']
+        print(f"{fixture['name']:<28} {fixture['bank'] or '-':<6} {len(text.splitlines()):>6} "
+              f"{time_parse(text, rounds):>10.1f}")
+
+    base_text = '\n'.join(fixture['text'] for fixture in RECEIPT_FIXTURES if fixture['text'])
+    print(f"\n{'copies':>8} {'lines':>8} {'us/parse':>12} {'us/line':>8}")
+    for multiplier in SIZE_MULTIPLIERS:
+        text = '\n'.join([base_text] * multiplier)
+        line_count = len(text.splitlines())
+        elapsed = time_parse(text, max(1, rounds // multiplier))
+        print(f"{multiplier:>8} {line_count:>8} {elapsed:>12.1f} {elapsed / line_count:>8.3f}")
+
+
+if __name__ == '__main__':
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,89 @@
+"""
+Benchmark for receipt preprocessing before OCR.
+For every image in a directory of sample receipts, reports upload bytes
+(raw and as OCR.space base64) and preprocessing time; with --ocr it also
+times Google Vision on the original and the preprocessed image and checks
+that the parsed details still match.
+
+Usage: python benchmark_receipt_preprocessing.py <receipts_dir> [--ocr]
+"""
+import base64
+import os
+import statistics
+import sys
+import time
+
+import vision_api
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+PARSED_FIELDS = ['reference_number', 'amount', 'bank', 'sender_name', 'receiver_name', 'receiver_account_number']
+
+
+def timed(func, *args):
+    """Return (result, milliseconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def benchmark(receipts_dir, run_ocr=False):
+    """Print per-image and total bytes/latency before and after preprocessing"""
+    paths = sorted(
+        os.path.join(receipts_dir, name) for name in os.listdir(receipts_dir)
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+    if not paths:
+        print(f"No receipt images found in {receipts_dir}")
+        return
+
+    print(f"Receipt preprocessing benchmark ({len(paths)} images, max {vision_api.OCR_MAX_DIMENSION}px, "
+          f"quality {vision_api.OCR_JPEG_QUALITY})")
+    header = f"{'image':<30} {'bytes':>10} {'-> bytes':>10} {'b64 -> b64':>21} {'prep ms':>8}"
+    if run_ocr:
+        header += f" {'ocr ms':>8} {'-> ocr ms':>9} {'same':>5}"
+    print(header)
+
+    totals = {'before': 0, 'after': 0}
+    prep_times, ocr_before, ocr_after = [], [], []
+    mismatches = 0
+
+    for path in paths:
+        with open(path, 'rb') as f:
+            original = f.read()
+
+        processed, prep_ms = timed(vision_api.preprocess_receipt_image, original)
+        totals['before'] += len(original)
+        totals['after'] += len(processed)
+        prep_times.append(prep_ms)
+
+        b64_before = len(base64.b64encode(original))
+        b64_after = len(base64.b64encode(processed))
+        line = (f"{os.path.basename(path)[:30]:<30} {len(original):>10,} {len(processed):>10,} "
+                f"{b64_before:>10,} {b64_after:>10,} {prep_ms:>8.1f}")
+
+        if run_ocr:
+            text_before, ms_before = timed(vision_api.extract_text_with_google_vision, original)
+            text_after, ms_after = timed(vision_api.extract_text_with_google_vision, processed)
+            details_before = vision_api.parse_payment_details(text_before or '')
+            details_after = vision_api.parse_payment_details(text_after or '')
+            same = all(details_before[field] == details_after[field] for field in PARSED_FIELDS)
+            mismatches += not same
+            ocr_before.append(ms_before)
+            ocr_after.append(ms_after)
+            line += f" {ms_before:>8.0f} {ms_after:>9.0f} {'yes' if same else 'NO':>5}"
+
+        print(line)
+
+    saved = 1 - totals['after'] / totals['before']
+    print(f"\nTotal bytes: {totals['before']:,} -> {totals['after']:,} ({saved:.0%} smaller)")
+    print(f"Preprocessing: median {statistics.median(prep_times):.1f} ms, max {max(prep_times):.1f} ms")
+    if run_ocr:
+        print(f"Google Vision: median {statistics.median(ocr_before):.0f} ms -> {statistics.median(ocr_after):.0f} ms")
+        print(f"Parsed details changed on {mismatches}/{len(paths)} receipts")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    benchmark(sys.argv[1], run_ocr='--ocr' in sys.argv[2:])
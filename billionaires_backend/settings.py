@@ -227,3 +227,8 @@ SHEETS_SYNC_ENABLED = False  # Google Sheets sync is disabled - using Django dat
 # SHEETS_SYNC_INTERVAL = int(os.getenv('SHEETS_SYNC_INTERVAL', '30'))  # seconds
 # SPREADSHEET_NAME = os.getenv('SPREADSHEET_NAME', 'Billionaires_PPPoker_Bot')
 # GOOGLE_SHEETS_CREDENTIALS_FILE = os.getenv('GOOGLE_SHEETS_CREDENTIALS_FILE', 'credentials.json')
+
+# Spin notification wakeups - process_spin publishes on this Redis channel so the bot
+# delivers outbox notifications immediately (unset = bot polls the outbox instead)
+REDIS_URL = os.getenv('REDIS_URL')
+SPIN_NOTIFY_CHANNEL = os.getenv('SPIN_NOTIFY_CHANNEL', 'spin_notifications')
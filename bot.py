@@ -12,7 +12,6 @@ from typing import Dict
 from datetime import datetime, timedelta
 import pytz
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton, WebAppInfo
-import telegram
 from telegram.ext import (
     Application, CommandHandler, MessageHandler, CallbackQueryHandler,
     ConversationHandler, ContextTypes, filters
@@ -21,9 +20,10 @@ from dotenv import load_dotenv
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 # Using Django API with backward compatibility layer (migrated from Google Sheets)
-from sheets_compat import SheetsCompatAPI
+from sheets_compat import AsyncSheetsCompatAPI
 import admin_panel
 import vision_api
+import broadcast_engine
 from spin_bot import SpinBot
 import spin_bot as spin_bot_module
 
@@ -71,17 +71,17 @@ def clean_pppoker_id(raw_input: str) -> str:
     cleaned = ''.join(char for char in raw_input if char.isdigit())
     return cleaned
 
-def is_counter_closed() -> bool:
+async def is_counter_closed() -> bool:
     """Check if counter is currently closed"""
-    return not api.is_counter_open()
+    return not await api.is_counter_open()
 
 async def send_counter_closed_message(update: Update) -> bool:
     """
     Send counter closed message to user.
     Returns True if counter is closed, False if open.
     """
-    if is_counter_closed():
-        lang = get_user_language(update.effective_user.id)
+    if await is_counter_closed():
+        lang = await get_user_language(update.effective_user.id)
         await update.message.reply_text(
             get_message('counter_closed', lang),
             parse_mode='HTML'
@@ -90,13 +90,14 @@ async def send_counter_closed_message(update: Update) -> bool:
     return False
 TIMEZONE = os.getenv('TIMEZONE', 'Indian/Maldives')
 DJANGO_API_URL = os.getenv('DJANGO_API_URL', 'http://localhost:8000/api')
+REDIS_URL = os.getenv('REDIS_URL')  # Optional: push delivery of spin notifications
 
 # Log the Django API URL for debugging
 logger.info(f"🔗 Django API URL: {DJANGO_API_URL}")
 logger.info(f"🌍 Timezone: {TIMEZONE}")
 
 # Initialize Django API with backward compatibility (migrated from Google Sheets)
-api = SheetsCompatAPI(DJANGO_API_URL)
+api = AsyncSheetsCompatAPI(DJANGO_API_URL)
 
 # Initialize Spin Bot with Django API
 spin_bot = SpinBot(api, ADMIN_USER_ID, pytz.timezone(TIMEZONE))
@@ -148,7 +149,7 @@ MENU_BUTTON_FILTER = filters.Regex(f"^({'|'.join(re.escape(t) for t in ALL_MENU_
 # Local cache for user languages (faster than API calls)
 user_language_cache: Dict[int, str] = {}
 
-def get_user_language(user_id: int) -> str:
+async def get_user_language(user_id: int) -> str:
     """Get user's language preference. Returns 'en' as default."""
     # Check local cache first
     if user_id in user_language_cache:
@@ -156,7 +157,7 @@ def get_user_language(user_id: int) -> str:
 
     # Then check API
     try:
-        user_data = api.get_user(user_id)
+        user_data = await api.get_user(user_id)
         lang = user_data.get('language', 'en') if user_data else 'en'
         user_language_cache[user_id] = lang  # Cache it
         return lang
@@ -164,11 +165,11 @@ def get_user_language(user_id: int) -> str:
         logger.error(f"Failed to get language for user {user_id}: {e}")
         return 'en'
 
-def set_user_language(user_id: int, language: str):
+async def set_user_language(user_id: int, language: str):
     """Set user's language preference in cache and database."""
     user_language_cache[user_id] = language
     try:
-        api.update_user_language(user_id, language)
+        await api.update_user_language(user_id, language)
     except Exception as e:
         logger.error(f"Failed to save language to DB for user {user_id}: {e}")
 
@@ -906,20 +907,20 @@ seat_reminder_jobs: Dict[int, object] = {}  # user_id: job (tracks seat reminder
 
 
 # Helper Functions
-def is_admin(user_id: int) -> bool:
+async def is_admin(user_id: int) -> bool:
     """Check if user is admin (super admin or regular admin)"""
-    return api.is_admin(user_id)
+    return await api.is_admin(user_id)
 
 
 # Spin Bot Wrapper Functions
 async def freespins_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Open Mini App for spinning wheel"""
     user = update.effective_user
-    lang = get_user_language(user.id)
+    lang = await get_user_language(user.id)
 
     try:
         # Check if counter is open
-        counter_status = api.get_counter_status()
+        counter_status = await api.get_counter_status()
         if not counter_status.get('is_open', True):
             await update.message.reply_text(
                 get_message('counter_closed_spins', lang),
@@ -928,7 +929,7 @@ async def freespins_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
 
         # Get user's spin data (creates user if doesn't exist)
-        user_data = spin_bot.api.get_or_create_spin_user(user.id)
+        user_data = await spin_bot.api.get_or_create_spin_user(user.id)
 
         if not user_data or user_data.get('available_spins', 0) == 0:
             # Create deposit button
@@ -1037,7 +1038,7 @@ async def send_admin_notification(context: ContextTypes.DEFAULT_TYPE, message: s
 
     # Send to all regular admins (skip already notified)
     try:
-        admins_response = api.get_all_admins()
+        admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(admins_response, dict) and 'results' in admins_response:
@@ -1065,7 +1066,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Create or update user in database
     try:
         logger.info(f"Creating/updating user: {user.id} ({user.username})")
-        user_data = api.create_or_update_user(
+        user_data = await api.create_or_update_user(
             user.id,
             user.username,
             user.first_name,
@@ -1096,7 +1097,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # Help Command
 async def test_admin_notification(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Test admin notification - Admin only"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ Admin only command.")
         return
 
@@ -1139,13 +1140,13 @@ async def test_button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /help command and Help button"""
-    lang = get_user_language(update.effective_user.id)
+    lang = await get_user_language(update.effective_user.id)
 
     # Get help text in user's language
     help_text = get_message('help_text', lang)
 
     # Add admin commands only if user is admin (admin section stays in English)
-    if is_admin(update.effective_user.id):
+    if await is_admin(update.effective_user.id):
         admin_help = """
 ━━━━━━━━━━━━━━━━━━
 
@@ -1218,7 +1219,7 @@ async def language_selected(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
 
     # Update user's language in cache and database
-    set_user_language(user_id, lang_code)
+    await set_user_language(user_id, lang_code)
     logger.info(f"User {user_id} changed language to {lang_code}")
 
     # Show confirmation and then menu
@@ -1233,10 +1234,10 @@ async def language_selected(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def show_main_menu(user, context: ContextTypes.DEFAULT_TYPE, lang: str = None):
     """Show main menu with buttons in user's language"""
     if lang is None:
-        user_data = api.get_user(user.id)
+        user_data = await api.get_user(user.id)
         lang = user_data.get('language', 'en') if user_data else 'en'
 
-    if is_admin(user.id):
+    if await is_admin(user.id):
         # Admin menu - stays in English
         keyboard = [
             [KeyboardButton("📋 Admin Panel"), KeyboardButton("🎰 Spin Management")],
@@ -1310,11 +1311,11 @@ async def deposit_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
 
     user_id = update.effective_user.id
-    lang = get_user_language(user_id)
+    lang = await get_user_language(user_id)
 
     # Check for pending deposit
     try:
-        pending = api.get_pending_deposits()
+        pending = await api.get_pending_deposits()
         user_pending = [d for d in pending if d.get('user_details', {}).get('telegram_id') == user_id]
         if user_pending:
             await update.message.reply_text(
@@ -1330,10 +1331,10 @@ async def deposit_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return ConversationHandler.END
 
-    user_data = api.get_user(user_id)
+    user_data = await api.get_user(user_id)
 
     # Get all configured payment accounts
-    payment_accounts = api.get_all_payment_accounts()
+    payment_accounts = await api.get_all_payment_accounts()
     logger.info(f"Payment accounts for deposit: {payment_accounts}")
 
     # Build keyboard with only configured payment methods
@@ -1380,12 +1381,12 @@ async def deposit_method_selected(update: Update, context: ContextTypes.DEFAULT_
     context.user_data['deposit_method'] = method
 
     # Get user language
-    lang = get_user_language(update.effective_user.id)
+    lang = await get_user_language(update.effective_user.id)
     context.user_data['lang'] = lang
 
     # Get payment account details
-    account = api.get_payment_account_details(method)
-    account_holder = api.get_payment_account_holder(method)
+    account = await api.get_payment_account_details(method)
+    account_holder = await api.get_payment_account_holder(method)
 
     if not account:
         await query.edit_message_text(
@@ -1400,7 +1401,7 @@ async def deposit_method_selected(update: Update, context: ContextTypes.DEFAULT_
         message = get_message('deposit_via', lang, method=method_names[method]) + "\n\n"
 
         # Show exchange rate for USDT
-        usdt_rate = api.get_exchange_rate('USDT', 'MVR')
+        usdt_rate = await api.get_exchange_rate('USDT', 'MVR')
         if usdt_rate:
             message += get_message('deposit_rate', lang, currency='USDT', rate=float(usdt_rate)) + "\n\n"
 
@@ -1413,7 +1414,7 @@ async def deposit_method_selected(update: Update, context: ContextTypes.DEFAULT_
         message = get_message('deposit_via', lang, method=method_names[method]) + "\n\n"
 
         # Show exchange rate for USD
-        usd_rate = api.get_exchange_rate('USD', 'MVR')
+        usd_rate = await api.get_exchange_rate('USD', 'MVR')
         if usd_rate:
             message += get_message('deposit_rate', lang, currency='USD', rate=float(usd_rate)) + "\n\n"
 
@@ -1444,7 +1445,7 @@ async def deposit_method_selected(update: Update, context: ContextTypes.DEFAULT_
 
 async def deposit_amount_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle deposit amount input"""
-    lang = context.user_data.get('lang', get_user_language(update.effective_user.id))
+    lang = context.user_data.get('lang', await get_user_language(update.effective_user.id))
     try:
         amount = float(update.message.text.replace(',', ''))
         if amount <= 0:
@@ -1466,11 +1467,41 @@ async def deposit_amount_received(update: Update, context: ContextTypes.DEFAULT_
         return DEPOSIT_AMOUNT
 
 
+async def get_duplicate_receipt_warning(extracted_details, telegram_id: int, source: str, source_id) -> str:
+    """Record the receipt's reference number and return an admin warning if it was used before"""
+    if not extracted_details or not extracted_details.get('reference_number'):
+        return ""
+
+    try:
+        check = await api.check_receipt_reference(
+            extracted_details['reference_number'],
+            telegram_id,
+            source,
+            source_id=source_id,
+            bank=extracted_details.get('bank'),
+            content_hash=extracted_details.get('content_hash')
+        )
+    except Exception as e:
+        logger.error(f"Failed to check receipt reference: {e}")
+        return ""
+
+    if not check.get('duplicate'):
+        return ""
+
+    from html import escape
+    first_seen = check.get('first_seen', {})
+    logger.warning(f"🚨 Duplicate receipt {extracted_details['reference_number']} from user {telegram_id}")
+    return f"\n\n🚨 <b>DUPLICATE RECEIPT</b>\n" \
+           f"Reference {escape(extracted_details['reference_number'])} was already used by " \
+           f"{escape(str(first_seen.get('username', 'Unknown')))} (<code>{first_seen.get('user_telegram_id')}</code>) " \
+           f"for a {first_seen.get('source', 'request')} on {str(first_seen.get('created_at', ''))[:10]}"
+
+
 async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle PPPoker ID input - final step, creates deposit request and sends to admin"""
     user = update.effective_user
     raw_input = update.message.text.strip()
-    lang = context.user_data.get('lang', get_user_language(user.id))
+    lang = context.user_data.get('lang', await get_user_language(user.id))
 
     # Clean PPPoker ID (remove spaces, letters, special characters)
     pppoker_id = clean_pppoker_id(raw_input)
@@ -1484,7 +1515,7 @@ async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFA
         return DEPOSIT_PPPOKER_ID
 
     # Update user's PPPoker ID
-    api.update_user_pppoker_id(user.id, pppoker_id)
+    await api.update_user_pppoker_id(user.id, pppoker_id)
 
     # Get stored data from context
     method = context.user_data['deposit_method']
@@ -1503,7 +1534,7 @@ async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFA
     elif method == 'USD':
         # For USD, convert to MVR
         usd_amount = extracted_details['amount'] if extracted_details and extracted_details['amount'] else 0
-        usd_rate = api.get_exchange_rate('USD', 'MVR') or 15.42
+        usd_rate = await api.get_exchange_rate('USD', 'MVR') or 15.42
         usd_rate = float(usd_rate)
         amount = usd_amount * usd_rate  # Convert to MVR
         account_name = extracted_details['sender_name'] if extracted_details and extracted_details['sender_name'] else "Not extracted"
@@ -1513,10 +1544,10 @@ async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFA
 
     # Update user's account name if we extracted it
     if extracted_details and extracted_details['sender_name']:
-        api.update_user_account_name(user.id, extracted_details['sender_name'])
+        await api.update_user_account_name(user.id, extracted_details['sender_name'])
 
     # Create deposit request
-    deposit_response = api.create_deposit_request(
+    deposit_response = await api.create_deposit_request(
         telegram_id=user.id,
         amount=amount,
         method=method,
@@ -1579,7 +1610,7 @@ async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFA
     name_validation_warning = ""
     if extracted_details and extracted_details['receiver_name']:
         # Get stored account holder name for this payment method
-        stored_holder_name = api.get_payment_account_holder(verified_bank)
+        stored_holder_name = await api.get_payment_account_holder(verified_bank)
 
         if stored_holder_name:
             # Normalize names for comparison (case-insensitive, remove extra spaces)
@@ -1596,7 +1627,7 @@ async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFA
     account_validation_warning = ""
     if extracted_details and extracted_details.get('receiver_account_number'):
         # Get stored account number for this payment method
-        stored_account_number = api.get_payment_account_details(verified_bank)
+        stored_account_number = await api.get_payment_account_details(verified_bank)
 
         if stored_account_number:
             # Normalize account numbers (remove spaces, dashes)
@@ -1609,8 +1640,11 @@ async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFA
                                             f"Slip receiver account: {extracted_details['receiver_account_number']}\n" \
                                             f"Expected: {stored_account_number}"
 
+    # Flag receipts whose reference number was already used
+    duplicate_warning = await get_duplicate_receipt_warning(extracted_details, user.id, 'deposit', request_id)
+
     # Combine warnings
-    validation_warnings = name_validation_warning + account_validation_warning
+    validation_warnings = name_validation_warning + account_validation_warning + duplicate_warning
 
     # Currency and USDT/USD display
     if method == 'USDT' and usdt_amount:
@@ -1625,7 +1659,7 @@ async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFA
         usd_amount = extracted_details['amount'] if extracted_details and extracted_details['amount'] else 0
         amount_display = f"<b>{usd_amount} USD</b> (≈ {verified_amount:,.2f} MVR)"
         # Get the USD rate that was used for conversion
-        display_usd_rate = api.get_exchange_rate('USD', 'MVR') or 15.42
+        display_usd_rate = await api.get_exchange_rate('USD', 'MVR') or 15.42
         amount_display += f"\n💱 Exchange Rate: 1 USD = {float(display_usd_rate):.2f} MVR"
         currency = 'MVR'  # Use MVR for bonus calculations
     else:
@@ -1636,7 +1670,7 @@ async def deposit_pppoker_id_received(update: Update, context: ContextTypes.DEFA
     # Check for active promotion and user eligibility
     promotion_info = ""
     promotion_bonus = 0
-    active_promotion = api.get_active_promotion()
+    active_promotion = await api.get_active_promotion()
 
     if active_promotion and verified_amount > 0:
         # Calculate bonus for every deposit during promotion period
@@ -1719,7 +1753,7 @@ Player ID: <code>{pppoker_id}</code>
     # Get all admin IDs (avoid duplicates)
     all_admin_ids = [ADMIN_USER_ID]
     try:
-        regular_admins_response = api.get_all_admins()
+        regular_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(regular_admins_response, dict) and 'results' in regular_admins_response:
@@ -1788,7 +1822,7 @@ async def deposit_account_name_received(update: Update, context: ContextTypes.DE
     context.user_data['deposit_account_name'] = account_name
 
     # Update user's account name
-    api.update_user_account_name(update.effective_user.id, account_name)
+    await api.update_user_account_name(update.effective_user.id, account_name)
 
     method = context.user_data['deposit_method']
 
@@ -1808,7 +1842,7 @@ async def deposit_proof_received(update: Update, context: ContextTypes.DEFAULT_T
     """Handle deposit proof upload with Vision API OCR - extracts details and asks for PPPoker ID"""
     user = update.effective_user
     method = context.user_data['deposit_method']
-    lang = context.user_data.get('lang', get_user_language(user.id))
+    lang = context.user_data.get('lang', await get_user_language(user.id))
 
     # Variables for extracted details
     extracted_details = None
@@ -1950,7 +1984,7 @@ async def deposit_proof_received(update: Update, context: ContextTypes.DEFAULT_T
             context.user_data['transaction_ref'] = transaction_ref
 
             # Ask for amount next
-            usdt_rate = api.get_exchange_rate('USDT', 'MVR') or 15.42  # Fallback to standard MVR rate
+            usdt_rate = await api.get_exchange_rate('USDT', 'MVR') or 15.42  # Fallback to standard MVR rate
             rate_msg = f"\n\n💱 {'މިހާރު ރޭޓް' if lang == 'dv' else 'Current Rate'}: 1 USDT = {float(usdt_rate):.2f} MVR"
 
             if lang == 'dv':
@@ -2005,7 +2039,7 @@ async def deposit_proof_received(update: Update, context: ContextTypes.DEFAULT_T
 
 async def deposit_usdt_amount_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle USDT amount input"""
-    lang = context.user_data.get('lang', get_user_language(update.effective_user.id))
+    lang = context.user_data.get('lang', await get_user_language(update.effective_user.id))
     try:
         usdt_amount = float(update.message.text.replace(',', '').strip())
         if usdt_amount <= 0:
@@ -2015,7 +2049,7 @@ async def deposit_usdt_amount_received(update: Update, context: ContextTypes.DEF
         context.user_data['usdt_amount'] = usdt_amount
 
         # Get exchange rate and convert to MVR
-        usdt_rate = api.get_exchange_rate('USDT', 'MVR') or 15.42  # Fallback to standard MVR rate
+        usdt_rate = await api.get_exchange_rate('USDT', 'MVR') or 15.42  # Fallback to standard MVR rate
         usdt_rate = float(usdt_rate)  # Convert to float for calculations
         mvr_amount = usdt_amount * usdt_rate
         context.user_data['deposit_amount'] = mvr_amount  # Store MVR amount for deposit creation
@@ -2046,11 +2080,11 @@ async def withdrawal_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
 
     user_id = update.effective_user.id
-    lang = get_user_language(user_id)
+    lang = await get_user_language(user_id)
 
     # Check for pending withdrawal
     try:
-        pending = api.get_pending_withdrawals()
+        pending = await api.get_pending_withdrawals()
         user_pending = [w for w in pending if w.get('user_details', {}).get('telegram_id') == user_id]
         if user_pending:
             await update.message.reply_text(
@@ -2067,7 +2101,7 @@ async def withdrawal_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
 
     # Check if user has outstanding credit
-    user_credit = api.get_user_credit(user_id)
+    user_credit = await api.get_user_credit(user_id)
     if user_credit and float(user_credit.get('amount', 0)) > 0:
         await update.message.reply_text(
             get_message('withdrawal_outstanding_credit', lang,
@@ -2077,11 +2111,11 @@ async def withdrawal_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return ConversationHandler.END
 
-    user_data = api.get_user(user_id)
+    user_data = await api.get_user(user_id)
 
     # Check if user has ever made a deposit
     try:
-        deposits = api.get_user_deposits(user_id)
+        deposits = await api.get_user_deposits(user_id)
         # Handle paginated response
         if isinstance(deposits, dict) and 'results' in deposits:
             deposits = deposits['results']
@@ -2104,7 +2138,7 @@ async def withdrawal_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
 
     # Get all configured payment accounts
-    payment_accounts = api.get_all_payment_accounts()
+    payment_accounts = await api.get_all_payment_accounts()
 
     # Build keyboard with only configured payment methods
     keyboard = []
@@ -2153,7 +2187,7 @@ async def withdrawal_method_selected(update: Update, context: ContextTypes.DEFAU
     context.user_data['withdrawal_method'] = method
 
     # Get user language
-    lang = get_user_language(update.effective_user.id)
+    lang = await get_user_language(update.effective_user.id)
     context.user_data['lang'] = lang
 
     method_names = {'BML': 'Bank of Maldives', 'MIB': 'Maldives Islamic Bank', 'USD': 'USD Bank Transfer', 'USDT': 'USDT (BEP20)'}
@@ -2162,11 +2196,11 @@ async def withdrawal_method_selected(update: Update, context: ContextTypes.DEFAU
 
     # Show exchange rate for USD/USDT
     if method == 'USD':
-        usd_rate = api.get_exchange_rate('USD', 'MVR')
+        usd_rate = await api.get_exchange_rate('USD', 'MVR')
         if usd_rate:
             message += get_message('deposit_rate', lang, currency='USD', rate=float(usd_rate)) + "\n\n"
     elif method == 'USDT':
-        usdt_rate = api.get_exchange_rate('USDT', 'MVR')
+        usdt_rate = await api.get_exchange_rate('USDT', 'MVR')
         if usdt_rate:
             message += get_message('deposit_rate', lang, currency='USDT', rate=float(usdt_rate)) + "\n\n"
 
@@ -2184,7 +2218,7 @@ async def withdrawal_method_selected(update: Update, context: ContextTypes.DEFAU
 
 async def withdrawal_amount_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle withdrawal amount input"""
-    lang = context.user_data.get('lang', get_user_language(update.effective_user.id))
+    lang = context.user_data.get('lang', await get_user_language(update.effective_user.id))
     try:
         amount = float(update.message.text.replace(',', ''))
         if amount <= 0:
@@ -2218,7 +2252,7 @@ async def withdrawal_amount_received(update: Update, context: ContextTypes.DEFAU
 async def withdrawal_pppoker_id_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle PPPoker ID input for withdrawal"""
     raw_input = update.message.text.strip()
-    lang = context.user_data.get('lang', get_user_language(update.effective_user.id))
+    lang = context.user_data.get('lang', await get_user_language(update.effective_user.id))
 
     # Clean PPPoker ID (remove spaces, letters, special characters)
     pppoker_id = clean_pppoker_id(raw_input)
@@ -2262,8 +2296,8 @@ async def withdrawal_pppoker_id_received(update: Update, context: ContextTypes.D
 async def withdrawal_account_number_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle withdrawal account number input"""
     user = update.effective_user
-    lang = context.user_data.get('lang', get_user_language(user.id))
-    user_data = api.get_user(user.id)
+    lang = context.user_data.get('lang', await get_user_language(user.id))
+    user_data = await api.get_user(user.id)
 
     account_number = update.message.text.strip()
     method = context.user_data['withdrawal_method']
@@ -2272,7 +2306,7 @@ async def withdrawal_account_number_received(update: Update, context: ContextTyp
 
     # Get account name from most recent deposit (including seat deposits now)
     try:
-        deposits = api.get_user_deposits(user.id)
+        deposits = await api.get_user_deposits(user.id)
         # Get deposits with valid account names (seat deposits now have extracted sender names)
         valid_deposits = [d for d in deposits if d.get('account_name') and d.get('account_name') not in ['Seat Payment', '']]
         if valid_deposits:
@@ -2287,7 +2321,7 @@ async def withdrawal_account_number_received(update: Update, context: ContextTyp
         account_name = user_data.get('account_name') or user_data.get('username', 'User')
 
     # Create withdrawal request
-    withdrawal_response = api.create_withdrawal_request(
+    withdrawal_response = await api.create_withdrawal_request(
         telegram_id=user.id,
         amount=amount,
         method=method,
@@ -2334,7 +2368,7 @@ async def withdrawal_account_number_received(update: Update, context: ContextTyp
     # Send notification to all admins
     all_admin_ids = [ADMIN_USER_ID]
     try:
-        regular_admins_response = api.get_all_admins()
+        regular_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(regular_admins_response, dict) and 'results' in regular_admins_response:
@@ -2387,12 +2421,12 @@ async def join_club_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
 
     user_id = update.effective_user.id
-    lang = get_user_language(user_id)
+    lang = await get_user_language(user_id)
     context.user_data['lang'] = lang
 
     # Check for pending join request
     try:
-        pending = api.get_pending_join_requests()
+        pending = await api.get_pending_join_requests()
         user_pending = [j for j in pending if j.get('user_details', {}).get('telegram_id') == user_id]
         if user_pending:
             await update.message.reply_text(
@@ -2427,7 +2461,7 @@ async def join_pppoker_id_received(update: Update, context: ContextTypes.DEFAULT
     """Handle PPPoker ID input for join request"""
     user = update.effective_user
     raw_input = update.message.text.strip()
-    lang = context.user_data.get('lang', get_user_language(user.id))
+    lang = context.user_data.get('lang', await get_user_language(user.id))
 
     # Clean PPPoker ID (remove spaces, letters, special characters)
     pppoker_id = clean_pppoker_id(raw_input)
@@ -2441,18 +2475,18 @@ async def join_pppoker_id_received(update: Update, context: ContextTypes.DEFAULT
         return JOIN_PPPOKER_ID
 
     # Get or create user in database to get their database ID
-    user_data = api.get_or_create_user(user.id, user.username or user.first_name or str(user.id))
+    user_data = await api.get_or_create_user(user.id, user.username or user.first_name or str(user.id))
     db_user_id = user_data.get('id')
 
     # Create join request
-    join_response = api.create_join_request(
+    join_response = await api.create_join_request(
         user_id=db_user_id,
         pppoker_id=pppoker_id
     )
     request_id = join_response.get('id') if isinstance(join_response, dict) else join_response
 
     # Update user's PPPoker ID
-    api.update_user_pppoker_id(user.id, pppoker_id)
+    await api.update_user_pppoker_id(user.id, pppoker_id)
 
     # Send confirmation to user
     await update.message.reply_text(
@@ -2485,7 +2519,7 @@ async def join_pppoker_id_received(update: Update, context: ContextTypes.DEFAULT
     # Send notification to all admins
     all_admin_ids = [ADMIN_USER_ID]
     try:
-        regular_admins_response = api.get_all_admins()
+        regular_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(regular_admins_response, dict) and 'results' in regular_admins_response:
@@ -2537,13 +2571,13 @@ async def cashback_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
 
     user = update.effective_user
-    lang = get_user_language(user.id)
+    lang = await get_user_language(user.id)
     context.user_data['lang'] = lang
     logger.info(f"Cashback button clicked by user {user.id} ({user.username or user.first_name})")
 
     # Check if user has outstanding credit
     try:
-        user_credit = api.get_user_credit(user.id)
+        user_credit = await api.get_user_credit(user.id)
         if user_credit and float(user_credit.get('amount', 0)) > 0:
             credit_amount = float(user_credit['amount'])
             await update.message.reply_text(
@@ -2558,7 +2592,7 @@ async def cashback_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     try:
         # Check if there's an active CASHBACK promotion (separate from bonus)
-        cashback_promo = api.get_active_cashback_promotion()
+        cashback_promo = await api.get_active_cashback_promotion()
     except Exception as e:
         logger.error(f"Error getting active cashback promotion: {e}")
         await update.message.reply_text(
@@ -2579,7 +2613,7 @@ async def cashback_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     try:
         # Check if user already has a pending cashback request for this promotion
-        pending_requests = api.get_user_pending_cashback(user.id)
+        pending_requests = await api.get_user_pending_cashback(user.id)
         pending_for_promo = [r for r in pending_requests if r.get('promotion') == promotion_id or r.get('promotion_id') == promotion_id]
     except Exception as e:
         logger.error(f"Error getting pending cashback requests: {e}")
@@ -2600,7 +2634,7 @@ async def cashback_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     try:
         # Check eligibility (both loss requirement and if already claimed)
-        eligibility = api.check_cashback_eligibility(user.id, promotion_id, min_deposit=500)
+        eligibility = await api.check_cashback_eligibility(user.id, promotion_id, min_deposit=500)
     except Exception as e:
         import traceback
         logger.error(f"Error checking cashback eligibility: {e}")
@@ -2663,7 +2697,7 @@ async def cashback_pppoker_id_received(update: Update, context: ContextTypes.DEF
     pppoker_id = clean_pppoker_id(raw_input)
 
     # Validate PPPoker ID (basic validation)
-    lang = context.user_data.get('lang', get_user_language(user.id))
+    lang = context.user_data.get('lang', await get_user_language(user.id))
     if not pppoker_id or len(pppoker_id) < 3:
         await update.message.reply_text(
             get_message('cashback_invalid_pppoker', lang),
@@ -2678,7 +2712,7 @@ async def cashback_pppoker_id_received(update: Update, context: ContextTypes.DEF
     promotion_id = context.user_data.get('cashback_promotion_id')
 
     # Create cashback request
-    request_data = api.create_cashback_request(
+    request_data = await api.create_cashback_request(
         user_id=user.id,
         username=user.username or user.first_name,
         pppoker_id=pppoker_id,
@@ -2763,7 +2797,7 @@ async def notify_admins_cashback_request(context, user_id: int, username: str, r
 
         # Send to all regular admins (skip super admin to avoid duplicate)
         try:
-            admins_response = api.get_all_admins()
+            admins_response = await api.get_all_admins()
 
             # Handle paginated response from Django API
             if isinstance(admins_response, dict) and 'results' in admins_response:
@@ -2797,7 +2831,7 @@ async def notify_admins_cashback_request(context, user_id: int, username: str, r
 async def my_info(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Display user information"""
     user = update.effective_user
-    user_data = api.get_user(user.id)
+    user_data = await api.get_user(user.id)
 
     if not user_data:
         await update.message.reply_text("❌ No user data found. Please use /start first.")
@@ -2826,12 +2860,12 @@ async def seat_request_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return ConversationHandler.END
 
     user = update.effective_user
-    lang = get_user_language(user.id)
+    lang = await get_user_language(user.id)
     context.user_data['lang'] = lang
 
     # Check for pending seat request
     try:
-        pending = api.get_pending_seat_requests()
+        pending = await api.get_pending_seat_requests()
         user_pending = [s for s in pending if s.get('user_details', {}).get('telegram_id') == user.id]
         if user_pending:
             await update.message.reply_text(
@@ -2848,7 +2882,7 @@ async def seat_request_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return ConversationHandler.END
 
     # Check if user has active credit
-    existing_credit = api.get_user_credit(user.id)
+    existing_credit = await api.get_user_credit(user.id)
     if existing_credit:
         await update.message.reply_text(
             get_message('withdrawal_outstanding_credit', lang,
@@ -2861,7 +2895,7 @@ async def seat_request_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
     # Get user's PPPoker ID from last deposit
     pppoker_id = None
     try:
-        deposits = api.get_all_deposits()
+        deposits = await api.get_all_deposits(fields='status,pppoker_id,user_details.telegram_id')
         if isinstance(deposits, dict) and 'results' in deposits:
             deposits = deposits['results']
 
@@ -2895,7 +2929,7 @@ async def seat_request_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def seat_amount_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle seat amount input"""
     user = update.effective_user
-    lang = context.user_data.get('lang', get_user_language(user.id))
+    lang = context.user_data.get('lang', await get_user_language(user.id))
 
     try:
         amount = float(update.message.text.strip())
@@ -2911,7 +2945,7 @@ async def seat_amount_received(update: Update, context: ContextTypes.DEFAULT_TYP
         pppoker_id = context.user_data.get('seat_pppoker_id', '')
 
         # Get database user ID
-        user_data = api.get_user_by_telegram_id(user.id)
+        user_data = await api.get_user_by_telegram_id(user.id)
         if not user_data:
             await update.message.reply_text(
                 get_message('user_not_found', lang),
@@ -2922,7 +2956,7 @@ async def seat_amount_received(update: Update, context: ContextTypes.DEFAULT_TYP
         db_user_id = user_data.get('id')
 
         # Create seat request
-        seat_response = api.create_seat_request(
+        seat_response = await api.create_seat_request(
             user_id=db_user_id,
             amount=amount,
             slip_image_path='',  # Seat requests don't have slip initially
@@ -2966,7 +3000,7 @@ async def seat_amount_received(update: Update, context: ContextTypes.DEFAULT_TYP
         # Send to all admins (avoid duplicates)
         all_admin_ids = [ADMIN_USER_ID]
         try:
-            regular_admins_response = api.get_all_admins()
+            regular_admins_response = await api.get_all_admins()
 
             # Handle paginated response from Django API
             if isinstance(regular_admins_response, dict) and 'results' in regular_admins_response:
@@ -3020,10 +3054,10 @@ async def seat_amount_received(update: Update, context: ContextTypes.DEFAULT_TYP
 async def live_support_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Start live support session"""
     user = update.effective_user
-    lang = get_user_language(user.id)
+    lang = await get_user_language(user.id)
 
     # Check if counter is open
-    counter_status = api.get_counter_status()
+    counter_status = await api.get_counter_status()
     if not counter_status.get('is_open', True):
         await update.message.reply_text(
             get_message('counter_closed', lang),
@@ -3066,7 +3100,7 @@ async def live_support_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
     user_support_message_ids[user.id] = [msg.message_id]
 
     # Notify ALL admins
-    all_admins_response = api.get_all_admins()
+    all_admins_response = await api.get_all_admins()
 
     # Handle paginated response from Django API
     if isinstance(all_admins_response, dict) and 'results' in all_admins_response:
@@ -3151,7 +3185,7 @@ async def live_support_message(update: Update, context: ContextTypes.DEFAULT_TYP
         reply_markup = InlineKeyboardMarkup(keyboard)
 
         # Send to all admins and track message IDs
-        all_admins_response = api.get_all_admins()
+        all_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(all_admins_response, dict) and 'results' in all_admins_response:
@@ -3251,7 +3285,7 @@ async def live_support_photo(update: Update, context: ContextTypes.DEFAULT_TYPE)
         reply_markup = InlineKeyboardMarkup(keyboard)
 
         # Send to all admins and track message IDs
-        all_admins_response = api.get_all_admins()
+        all_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(all_admins_response, dict) and 'results' in all_admins_response:
@@ -3290,7 +3324,7 @@ async def live_support_photo(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def end_support(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """End live support session"""
     user = update.effective_user
-    lang = get_user_language(user.id)
+    lang = await get_user_language(user.id)
 
     if user.id in support_mode_users:
         support_mode_users.remove(user.id)
@@ -3302,7 +3336,7 @@ async def end_support(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(get_message('support_ended', lang))
 
         # Notify ALL admins
-        all_admins_response = api.get_all_admins()
+        all_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(all_admins_response, dict) and 'results' in all_admins_response:
@@ -3333,7 +3367,7 @@ async def admin_reply_button_clicked(update: Update, context: ContextTypes.DEFAU
     """Handle admin clicking Reply button - ANY admin can reply, first one locks the session"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("⛔ Access denied.", show_alert=True)
         return
 
@@ -3345,7 +3379,7 @@ async def admin_reply_button_clicked(update: Update, context: ContextTypes.DEFAU
         handling_admin = active_support_handlers[user_id]
         if handling_admin != query.from_user.id:
             # Get admin info for better messaging
-            handling_admin_info_response = api.get_all_admins()
+            handling_admin_info_response = await api.get_all_admins()
 
             # Handle paginated response from Django API
             if isinstance(handling_admin_info_response, dict) and 'results' in handling_admin_info_response:
@@ -3387,7 +3421,7 @@ async def admin_reply_button_clicked(update: Update, context: ContextTypes.DEFAU
     logger.info(f"Admin {query.from_user.id} ({query.from_user.first_name}) locked support session with user {user_id}")
 
     # Notify other admins that this session is now locked
-    all_admins_response = api.get_all_admins()
+    all_admins_response = await api.get_all_admins()
 
     # Handle paginated response from Django API
     if isinstance(all_admins_response, dict) and 'results' in all_admins_response:
@@ -3435,7 +3469,7 @@ async def admin_reply_button_clicked(update: Update, context: ContextTypes.DEFAU
 
 async def admin_reply_message_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle admin's reply message"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         return
 
     admin_id = update.effective_user.id
@@ -3454,7 +3488,7 @@ async def admin_reply_message_received(update: Update, context: ContextTypes.DEF
 
     try:
         # Get user's language for translated button
-        user_lang = get_user_language(user_id)
+        user_lang = await get_user_language(user_id)
 
         # Show End Support button to user with the reply
         keyboard = [[InlineKeyboardButton(get_message('end_support_button', user_lang), callback_data="user_end_support")]]
@@ -3500,7 +3534,7 @@ async def admin_reply_message_received(update: Update, context: ContextTypes.DEF
 
 async def admin_reply_photo_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle admin's reply photo message"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         return
 
     admin_id = update.effective_user.id
@@ -3522,7 +3556,7 @@ async def admin_reply_photo_received(update: Update, context: ContextTypes.DEFAU
 
     try:
         # Get user's language for translated button
-        user_lang = get_user_language(user_id)
+        user_lang = await get_user_language(user_id)
 
         # Show End Support button to user with the reply
         keyboard = [[InlineKeyboardButton(get_message('end_support_button', user_lang), callback_data="user_end_support")]]
@@ -3576,7 +3610,7 @@ async def admin_end_support_button(update: Update, context: ContextTypes.DEFAULT
     """Handle admin clicking End Chat button - ANY admin can end if not locked, or handling admin can end"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("⛔ Access denied.", show_alert=True)
         return
 
@@ -3587,7 +3621,7 @@ async def admin_end_support_button(update: Update, context: ContextTypes.DEFAULT
         handling_admin = active_support_handlers[user_id]
         if handling_admin != query.from_user.id:
             # Get admin info for better messaging
-            handling_admin_info_response = api.get_all_admins()
+            handling_admin_info_response = await api.get_all_admins()
 
             # Handle paginated response from Django API
             if isinstance(handling_admin_info_response, dict) and 'results' in handling_admin_info_response:
@@ -3734,7 +3768,7 @@ async def user_end_support_button(update: Update, context: ContextTypes.DEFAULT_
             del user_support_message_ids[user.id]
 
         # Edit the clicked message to show session ended
-        lang = get_user_language(user.id)
+        lang = await get_user_language(user.id)
         # Check if it's a photo message or text message
         if query.message.photo:
             await query.edit_message_caption(
@@ -3748,7 +3782,7 @@ async def user_end_support_button(update: Update, context: ContextTypes.DEFAULT_
             )
 
         # Notify ALL admins
-        all_admins_response = api.get_all_admins()
+        all_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(all_admins_response, dict) and 'results' in all_admins_response:
@@ -3851,7 +3885,7 @@ async def auto_close_support(context: ContextTypes.DEFAULT_TYPE):
 
 async def admin_end_inactive_support(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Admin command to manually end any support session: /endsupport_user <user_id>"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ Admin access required.")
         return
 
@@ -3913,7 +3947,7 @@ async def admin_end_inactive_support(update: Update, context: ContextTypes.DEFAU
             logger.error(f"Failed to notify user {user_id}: {e}")
 
         # Notify all admins
-        all_admins_response = api.get_all_admins()
+        all_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(all_admins_response, dict) and 'results' in all_admins_response:
@@ -3954,7 +3988,59 @@ async def admin_end_inactive_support(update: Update, context: ContextTypes.DEFAU
 
 
 # Statistics and Reports
-def generate_daily_stats_report(timezone_str='Indian/Maldives'):
+def summarize_pnl_period(totals):
+    """Derive the profit/loss figures shown in reports from one period of /reports/pnl/ totals"""
+    deposits = totals['deposits']
+    withdrawals = totals['withdrawals']
+    investments = totals['investments']
+    credits = totals['credits']
+
+    # Bonuses are given during deposit approval and already included in the deposit amounts
+    total_bonuses = 0.0
+
+    # Completed = profit_share - investment (club got money back)
+    # Lost = -investment (club lost the investment)
+    fiftyfifty_profit = investments['completed_profit_share'] - investments['completed_amount']
+    fiftyfifty_loss = investments['lost_amount']
+    fiftyfifty_net = fiftyfifty_profit - fiftyfifty_loss
+
+    # All deposits/withdrawals are stored in MVR (USD/USDT are converted at deposit time)
+    total_deposits = deposits['total']
+    total_withdrawals = withdrawals['total']
+    total_spin_rewards = totals['spin_rewards']
+    total_cashback = totals['cashback']
+
+    return {
+        'total_deposits': total_deposits,
+        'total_withdrawals': total_withdrawals,
+        'mvr_deposits': deposits['mvr'],
+        'usd_deposits_mvr': deposits['usd'],
+        'usdt_deposits_mvr': deposits['usdt'],
+        'mvr_withdrawals': withdrawals['mvr'],
+        'usd_withdrawals_mvr': withdrawals['usd'],
+        'usdt_withdrawals_mvr': withdrawals['usdt'],
+        'total_spin_rewards': total_spin_rewards,
+        'total_bonuses': total_bonuses,
+        'total_cashback': total_cashback,
+        'fiftyfifty_profit': fiftyfifty_profit,
+        'fiftyfifty_loss': fiftyfifty_loss,
+        'fiftyfifty_net': fiftyfifty_net,
+        'total_credits': credits['total'],
+        'credits_count': int(credits['count']),
+        'investment_stats': {
+            'active_count': int(investments['active_count']),
+            'active_amount': investments['active_amount'],
+            'completed_count': int(investments['completed_count']),
+            'total_club_share': investments['completed_profit_share'],
+            'lost_count': int(investments['lost_count']),
+            'lost_amount': fiftyfifty_loss
+        },
+        # Profit = Deposits + 50/50 Wins - Withdrawals - Spin Rewards - Bonuses - Cashback - 50/50 Losses
+        'total_profit': total_deposits + fiftyfifty_net - (total_withdrawals + total_spin_rewards + total_bonuses + total_cashback)
+    }
+
+
+async def generate_daily_stats_report(timezone_str='Indian/Maldives'):
     """Generate daily and monthly profit/loss statistics report for automatic notifications"""
     tz = pytz.timezone(timezone_str)
     now = datetime.now(tz)
@@ -3972,8 +4058,8 @@ def generate_daily_stats_report(timezone_str='Indian/Maldives'):
     }
 
     # Get exchange rates
-    usd_rate = api.get_exchange_rate('USD', 'MVR') or 15.40
-    usdt_rate = api.get_exchange_rate('USDT', 'MVR') or 15.40
+    usd_rate = await api.get_exchange_rate('USD', 'MVR') or 15.40
+    usdt_rate = await api.get_exchange_rate('USDT', 'MVR') or 15.40
 
     report = "📊 <b>PROFIT/LOSS REPORT</b>\n\n"
     report += f"💱 <b>Current Exchange Rates:</b>\n"
@@ -3984,83 +4070,31 @@ def generate_daily_stats_report(timezone_str='Indian/Maldives'):
     # Store data for reporting
     report_data = {}
 
-    for period_name, (start, end) in periods.items():
-        deposits = api.get_deposits_by_date_range(start, end)
-        withdrawals = api.get_withdrawals_by_date_range(start, end)
-        spins = api.get_spins_by_date_range(start, end)
-        bonuses = api.get_bonuses_by_date_range(start, end)
-        cashback = api.get_cashback_by_date_range(start, end)
-        investments = api.get_investments_by_date_range(start, end)
-        credits = api.get_credits_by_date_range(start, end)
-
-        # Handle paginated responses from Django API
-        if isinstance(deposits, dict) and 'results' in deposits:
-            deposits = deposits['results']
-        if isinstance(withdrawals, dict) and 'results' in withdrawals:
-            withdrawals = withdrawals['results']
-        if isinstance(spins, dict) and 'results' in spins:
-            spins = spins['results']
-        if isinstance(bonuses, dict) and 'results' in bonuses:
-            bonuses = bonuses['results']
-        if isinstance(cashback, dict) and 'results' in cashback:
-            cashback = cashback['results']
-        if isinstance(investments, dict) and 'results' in investments:
-            investments = investments['results']
-        if isinstance(credits, dict) and 'results' in credits:
-            credits = credits['results']
-
-        # Calculate chip costs (money given to users as chips)
-        total_spin_rewards = sum([float(s.get('chips', 0)) for s in spins if s.get('chips')])
-        total_bonuses = sum([float(b.get('bonus_amount', 0)) for b in bonuses])
-        total_cashback = sum([float(c.get('cashback_amount', 0)) for c in cashback])
-
-        # Calculate 50/50 profit/loss
-        fiftyfifty_completed = [inv for inv in investments if inv.get('status') == 'Completed']
-        fiftyfifty_lost = [inv for inv in investments if inv.get('status') == 'Lost']
-
-        fiftyfifty_profit = sum([
-            float(inv.get('profit_share', 0)) - float(inv.get('investment_amount', 0))
-            for inv in fiftyfifty_completed
-        ])
-        fiftyfifty_loss = sum([
-            float(inv.get('investment_amount', 0))
-            for inv in fiftyfifty_lost
-        ])
-        fiftyfifty_net = fiftyfifty_profit - fiftyfifty_loss
-
-        # Calculate outstanding credits (money users owe to club)
-        total_credits = sum([float(c.get('amount', 0)) for c in credits])
-        credits_count = len(credits)
-
-        # All deposits/withdrawals are stored in MVR (USD/USDT are converted at deposit time)
-        total_deposits = sum([float(d.get('amount', 0)) for d in deposits])
-        total_withdrawals = sum([float(w.get('amount', 0)) for w in withdrawals])
-
-        # Separate by method for display purposes
-        mvr_deposits = sum([float(d.get('amount', 0)) for d in deposits if d.get('method') in ['BML', 'MIB']])
-        usd_deposits_mvr = sum([float(d.get('amount', 0)) for d in deposits if d.get('method') == 'USD'])
-        usdt_deposits_mvr = sum([float(d.get('amount', 0)) for d in deposits if d.get('method') == 'USDT'])
-
-        mvr_withdrawals = sum([float(w.get('amount', 0)) for w in withdrawals if w.get('payment_method', w.get('method')) in ['BML', 'MIB']])
-        usd_withdrawals_mvr = sum([float(w.get('amount', 0)) for w in withdrawals if w.get('payment_method', w.get('method')) == 'USD'])
-        usdt_withdrawals_mvr = sum([float(w.get('amount', 0)) for w in withdrawals if w.get('payment_method', w.get('method')) == 'USDT'])
-
-        # Calculate profit for MVR only (for display)
-        mvr_profit = mvr_deposits - mvr_withdrawals - total_spin_rewards - total_bonuses - total_cashback
-
-        # Calculate total profit (everything is already in MVR)
-        total_mvr_profit = total_deposits + fiftyfifty_net - (total_withdrawals + total_spin_rewards + total_bonuses + total_cashback)
-
-        # Create investment stats dictionary for display
-        investment_stats = {
-            'active_count': len([inv for inv in investments if inv.get('status') == 'Active']),
-            'active_amount': sum([float(inv.get('investment_amount', 0)) for inv in investments if inv.get('status') == 'Active']),
-            'completed_count': len(fiftyfifty_completed),
-            'total_club_share': sum([float(inv.get('profit_share', 0)) for inv in fiftyfifty_completed]),
-            'lost_count': len(fiftyfifty_lost),
-            'lost_amount': fiftyfifty_loss
-        }
+    # One aggregated request covers every period
+    pnl = await api.get_pnl_report(periods)
+
+    for period_name in periods:
+        summary = summarize_pnl_period(pnl[period_name])
+
+        total_deposits = summary['total_deposits']
+        total_withdrawals = summary['total_withdrawals']
+        mvr_deposits = summary['mvr_deposits']
+        usd_deposits_mvr = summary['usd_deposits_mvr']
+        usdt_deposits_mvr = summary['usdt_deposits_mvr']
+        mvr_withdrawals = summary['mvr_withdrawals']
+        usd_withdrawals_mvr = summary['usd_withdrawals_mvr']
+        usdt_withdrawals_mvr = summary['usdt_withdrawals_mvr']
+        total_spin_rewards = summary['total_spin_rewards']
+        total_bonuses = summary['total_bonuses']
+        total_cashback = summary['total_cashback']
+        fiftyfifty_profit = summary['fiftyfifty_profit']
+        fiftyfifty_loss = summary['fiftyfifty_loss']
+        fiftyfifty_net = summary['fiftyfifty_net']
+        total_credits = summary['total_credits']
+        credits_count = summary['credits_count']
+        investment_stats = summary['investment_stats']
         investment_net = fiftyfifty_net
+        total_mvr_profit = summary['total_profit']
 
         # Save data for reporting
         prefix = 'today_' if period_name == 'TODAY' else 'month_'
@@ -4141,7 +4175,7 @@ def generate_daily_stats_report(timezone_str='Indian/Maldives'):
     return report, report_data
 
 
-def generate_stats_report(timezone_str='Indian/Maldives'):
+async def generate_stats_report(timezone_str='Indian/Maldives'):
     """Generate full profit/loss statistics report with all periods (for /stats command)"""
     tz = pytz.timezone(timezone_str)
     now = datetime.now(tz)
@@ -4173,8 +4207,8 @@ def generate_stats_report(timezone_str='Indian/Maldives'):
     }
 
     # Get exchange rates (for display only)
-    usd_rate = api.get_exchange_rate('USD', 'MVR') or 15.40
-    usdt_rate = api.get_exchange_rate('USDT', 'MVR') or 15.40
+    usd_rate = await api.get_exchange_rate('USD', 'MVR') or 15.40
+    usdt_rate = await api.get_exchange_rate('USDT', 'MVR') or 15.40
 
     report = "📊 <b>PROFIT/LOSS REPORT</b>\n\n"
     report += f"💱 <b>Current Exchange Rates:</b>\n"
@@ -4182,75 +4216,31 @@ def generate_stats_report(timezone_str='Indian/Maldives'):
     report += f"1 USDT = {float(usdt_rate):.2f} MVR\n\n"
     report += f"━━━━━━━━━━━━━━━━━━\n\n"
 
-    for period_name, (start, end) in periods.items():
-        deposits = api.get_deposits_by_date_range(start, end)
-        withdrawals = api.get_withdrawals_by_date_range(start, end)
-        spins = api.get_spins_by_date_range(start, end)
-        bonuses = api.get_bonuses_by_date_range(start, end)
-        cashback = api.get_cashback_by_date_range(start, end)
-        investments = api.get_investments_by_date_range(start, end)
-        credits = api.get_credits_by_date_range(start, end)
-
-        # Handle paginated responses from Django API
-        if isinstance(deposits, dict) and 'results' in deposits:
-            deposits = deposits['results']
-        if isinstance(withdrawals, dict) and 'results' in withdrawals:
-            withdrawals = withdrawals['results']
-        if isinstance(spins, dict) and 'results' in spins:
-            spins = spins['results']
-        if isinstance(bonuses, dict) and 'results' in bonuses:
-            bonuses = bonuses['results']
-        if isinstance(cashback, dict) and 'results' in cashback:
-            cashback = cashback['results']
-        if isinstance(investments, dict) and 'results' in investments:
-            investments = investments['results']
-        if isinstance(credits, dict) and 'results' in credits:
-            credits = credits['results']
-
-        # Calculate chip costs (money given to users as chips)
-        total_spin_rewards = sum([float(s.get('chips', 0)) for s in spins if s.get('chips')])
-        total_bonuses = sum([float(b.get('bonus_amount', 0)) for b in bonuses])
-        total_cashback = sum([float(c.get('cashback_amount', 0)) for c in cashback])
-
-        # Calculate 50/50 profit/loss
-        # Completed = profit_share - investment (club got money back)
-        # Lost = -investment (club lost the investment)
-        # Active/Cancelled = ignore for now
-        fiftyfifty_completed = [inv for inv in investments if inv.get('status') == 'Completed']
-        fiftyfifty_lost = [inv for inv in investments if inv.get('status') == 'Lost']
-
-        fiftyfifty_profit = sum([
-            float(inv.get('profit_share', 0)) - float(inv.get('investment_amount', 0))
-            for inv in fiftyfifty_completed
-        ])
-        fiftyfifty_loss = sum([
-            float(inv.get('investment_amount', 0))
-            for inv in fiftyfifty_lost
-        ])
-        fiftyfifty_net = fiftyfifty_profit - fiftyfifty_loss
-
-        # Calculate outstanding credits (money users owe to club)
-        # All credits in DB are outstanding (unpaid debts)
-        total_credits = sum([float(c.get('amount', 0)) for c in credits])
-        credits_count = len(credits)
-
-        # All deposits/withdrawals are stored in MVR (USD/USDT are converted at deposit time)
-        # So we just sum everything - no need to separate by currency or convert
-        total_deposits = sum([float(d.get('amount', 0)) for d in deposits])
-        total_withdrawals = sum([float(w.get('amount', 0)) for w in withdrawals])
-
-        # Separate by method for display purposes only
-        mvr_deposits = sum([float(d.get('amount', 0)) for d in deposits if d.get('method') in ['BML', 'MIB']])
-        usd_deposits_mvr = sum([float(d.get('amount', 0)) for d in deposits if d.get('method') == 'USD'])
-        usdt_deposits_mvr = sum([float(d.get('amount', 0)) for d in deposits if d.get('method') == 'USDT'])
-
-        mvr_withdrawals = sum([float(w.get('amount', 0)) for w in withdrawals if w.get('payment_method', w.get('method')) in ['BML', 'MIB']])
-        usd_withdrawals_mvr = sum([float(w.get('amount', 0)) for w in withdrawals if w.get('payment_method', w.get('method')) == 'USD'])
-        usdt_withdrawals_mvr = sum([float(w.get('amount', 0)) for w in withdrawals if w.get('payment_method', w.get('method')) == 'USDT'])
-
-        # Calculate total profit (everything is already in MVR)
-        # Profit = Deposits + 50/50 Wins - Withdrawals - Spin Rewards - Bonuses - Cashback - 50/50 Losses
-        total_mvr_profit = total_deposits + fiftyfifty_net - (total_withdrawals + total_spin_rewards + total_bonuses + total_cashback)
+    # One aggregated request covers every period
+    pnl = await api.get_pnl_report(periods)
+
+    for period_name in periods:
+        summary = summarize_pnl_period(pnl[period_name])
+
+        total_deposits = summary['total_deposits']
+        total_withdrawals = summary['total_withdrawals']
+        mvr_deposits = summary['mvr_deposits']
+        usd_deposits_mvr = summary['usd_deposits_mvr']
+        usdt_deposits_mvr = summary['usdt_deposits_mvr']
+        mvr_withdrawals = summary['mvr_withdrawals']
+        usd_withdrawals_mvr = summary['usd_withdrawals_mvr']
+        usdt_withdrawals_mvr = summary['usdt_withdrawals_mvr']
+        total_spin_rewards = summary['total_spin_rewards']
+        total_bonuses = summary['total_bonuses']
+        total_cashback = summary['total_cashback']
+        fiftyfifty_profit = summary['fiftyfifty_profit']
+        fiftyfifty_loss = summary['fiftyfifty_loss']
+        fiftyfifty_net = summary['fiftyfifty_net']
+        total_credits = summary['total_credits']
+        credits_count = summary['credits_count']
+        completed_count = summary['investment_stats']['completed_count']
+        lost_count = summary['investment_stats']['lost_count']
+        total_mvr_profit = summary['total_profit']
 
         report += f"<b>{period_name}</b>\n"
 
@@ -4292,12 +4282,12 @@ def generate_stats_report(timezone_str='Indian/Maldives'):
             report += f"<b>💸 Total Costs: {total_costs:,.2f} MVR</b>\n\n"
 
         # Show 50/50 Investment profit/loss
-        if len(fiftyfifty_completed) > 0 or len(fiftyfifty_lost) > 0:
+        if completed_count > 0 or lost_count > 0:
             report += f"🎲 <b>50/50 Investments:</b>\n"
-            if len(fiftyfifty_completed) > 0:
-                report += f"  ✅ Completed: {len(fiftyfifty_completed)} (Profit: +{fiftyfifty_profit:,.2f} MVR)\n"
-            if len(fiftyfifty_lost) > 0:
-                report += f"  ❌ Lost: {len(fiftyfifty_lost)} (Loss: -{fiftyfifty_loss:,.2f} MVR)\n"
+            if completed_count > 0:
+                report += f"  ✅ Completed: {completed_count} (Profit: +{fiftyfifty_profit:,.2f} MVR)\n"
+            if lost_count > 0:
+                report += f"  ❌ Lost: {lost_count} (Loss: -{fiftyfifty_loss:,.2f} MVR)\n"
             fiftyfifty_emoji = "📈" if fiftyfifty_net > 0 else "📉" if fiftyfifty_net < 0 else "➖"
             report += f"  {fiftyfifty_emoji} Net 50/50: {fiftyfifty_net:+,.2f} MVR\n\n"
 
@@ -4324,14 +4314,14 @@ def generate_stats_report(timezone_str='Indian/Maldives'):
 
 async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /stats command - show profit/loss report"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return
 
     await update.message.reply_text("📊 Generating statistics report...")
 
     try:
-        report = generate_stats_report()
+        report = await generate_stats_report()
         await update.message.reply_text(report, parse_mode='HTML')
     except Exception as e:
         logger.error(f"Error generating stats: {e}")
@@ -4340,11 +4330,11 @@ async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def clear_bml_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /clear_bml command - Remove BML account"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return
 
-    success = api.clear_payment_account('BML')
+    success = await api.clear_payment_account('BML')
     if success:
         await update.message.reply_text(
             "✅ BML account has been removed.\n\n"
@@ -4357,11 +4347,11 @@ async def clear_bml_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def clear_mib_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /clear_mib command - Remove MIB account"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return
 
-    success = api.clear_payment_account('MIB')
+    success = await api.clear_payment_account('MIB')
     if success:
         await update.message.reply_text(
             "✅ MIB account has been removed.\n\n"
@@ -4374,11 +4364,11 @@ async def clear_mib_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def clear_usd_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /clear_usd command - Remove USD account"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return
 
-    success = api.clear_payment_account('USD')
+    success = await api.clear_payment_account('USD')
     if success:
         await update.message.reply_text(
             "✅ USD account has been removed.\n\n"
@@ -4391,11 +4381,11 @@ async def clear_usd_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def clear_usdt_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /clear_usdt command - Remove USDT wallet"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return
 
-    success = api.clear_payment_account('USDT')
+    success = await api.clear_payment_account('USDT')
     if success:
         await update.message.reply_text(
             "✅ USDT wallet has been removed.\n\n"
@@ -4408,14 +4398,14 @@ async def clear_usdt_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def set_usd_rate_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /set_usd_rate command - Set USD to MVR exchange rate"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return
 
     # Check if rate was provided
     if len(context.args) == 0:
         # Show current rate
-        current_rate = api.get_exchange_rate('USD', 'MVR')
+        current_rate = await api.get_exchange_rate('USD', 'MVR')
         if current_rate:
             await update.message.reply_text(
                 f"💵 <b>Current USD Rate</b>\n\n"
@@ -4438,7 +4428,7 @@ async def set_usd_rate_command(update: Update, context: ContextTypes.DEFAULT_TYP
             await update.message.reply_text("❌ Rate must be a positive number.")
             return
 
-        success = api.set_exchange_rate('USD', 'MVR', rate)
+        success = await api.set_exchange_rate('USD', 'MVR', rate)
         if success:
             await update.message.reply_text(
                 f"✅ USD exchange rate updated!\n\n"
@@ -4458,14 +4448,14 @@ async def set_usd_rate_command(update: Update, context: ContextTypes.DEFAULT_TYP
 
 async def set_usdt_rate_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /set_usdt_rate command - Set USDT to MVR exchange rate"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return
 
     # Check if rate was provided
     if len(context.args) == 0:
         # Show current rate
-        current_rate = api.get_exchange_rate('USDT', 'MVR')
+        current_rate = await api.get_exchange_rate('USDT', 'MVR')
         if current_rate:
             await update.message.reply_text(
                 f"💎 <b>Current USDT Rate</b>\n\n"
@@ -4488,7 +4478,7 @@ async def set_usdt_rate_command(update: Update, context: ContextTypes.DEFAULT_TY
             await update.message.reply_text("❌ Rate must be a positive number.")
             return
 
-        success = api.set_exchange_rate('USDT', 'MVR', rate)
+        success = await api.set_exchange_rate('USDT', 'MVR', rate)
         if success:
             await update.message.reply_text(
                 f"✅ USDT exchange rate updated!\n\n"
@@ -4533,7 +4523,7 @@ async def addadmin_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
 
         # Get user info from the new admin (if they've interacted with the bot)
-        new_admin_user = api.get_user(new_admin_id)
+        new_admin_user = await api.get_user(new_admin_id)
         username = new_admin_user.get('username', '') if new_admin_user else ''
         name = ''
         if new_admin_user:
@@ -4542,7 +4532,7 @@ async def addadmin_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             name = f"{first_name} {last_name}".strip()
 
         # Add admin
-        success = api.add_admin(new_admin_id, username, name, user_id)
+        success = await api.add_admin(new_admin_id, username, name, user_id)
 
         if success:
             await update.message.reply_text(
@@ -4608,7 +4598,7 @@ async def removeadmin_command(update: Update, context: ContextTypes.DEFAULT_TYPE
             return
 
         # Remove admin
-        success = api.remove_admin(admin_id_to_remove)
+        success = await api.remove_admin(admin_id_to_remove)
 
         if success:
             await update.message.reply_text(
@@ -4652,7 +4642,7 @@ async def listadmins_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
     try:
         # Get all admins
-        admins_response = api.get_all_admins()
+        admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(admins_response, dict) and 'results' in admins_response:
@@ -4692,13 +4682,13 @@ async def user_credit_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     user_id = update.effective_user.id
 
     # Only admins can view credits
-    if not is_admin(user_id):
+    if not await is_admin(user_id):
         await update.message.reply_text("❌ Admin access required.")
         return
 
     try:
         # Get all active credits
-        credits = api.get_all_active_credits()
+        credits = await api.get_all_active_credits()
 
         if not credits:
             await update.message.reply_text(
@@ -4770,7 +4760,7 @@ async def clear_user_credit_callback(update: Update, context: ContextTypes.DEFAU
     """Handle clear credit button click"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -4778,7 +4768,7 @@ async def clear_user_credit_callback(update: Update, context: ContextTypes.DEFAU
     await query.answer()
 
     # Get credit info before clearing
-    credit = api.get_user_credit(user_id)
+    credit = await api.get_user_credit(user_id)
     if not credit:
         await query.edit_message_text(
             "❌ **Credit not found**\n\n"
@@ -4793,7 +4783,7 @@ async def clear_user_credit_callback(update: Update, context: ContextTypes.DEFAU
         user_details = credit.get('user_details', {})
         pppoker_id = user_details.get('pppoker_id', 'N/A')
 
-        deposit_data = api.create_deposit(
+        deposit_data = await api.create_deposit(
             user_id=credit.get('user'),
             amount=float(credit['amount']),
             method='Credit Payment',
@@ -4805,13 +4795,13 @@ async def clear_user_credit_callback(update: Update, context: ContextTypes.DEFAU
         # Auto-approve the deposit (just for tracking, no balance added)
         if deposit_data:
             deposit_id = deposit_data.get('id')
-            api.approve_deposit(deposit_id, query.from_user.id, add_balance=False)
+            await api.approve_deposit(deposit_id, query.from_user.id, add_balance=False)
             logger.info(f"Created deposit record {deposit_id} for credit payment tracking")
     except Exception as e:
         logger.error(f"Failed to create deposit record for credit payment: {e}")
 
     # Clear the credit
-    success = api.clear_user_credit(user_id)
+    success = await api.clear_user_credit(user_id)
 
     if success:
         # Clean up tracking
@@ -4857,7 +4847,7 @@ async def clear_user_credit_callback(update: Update, context: ContextTypes.DEFAU
         )
 
 
-def calculate_all_periods_data(timezone_str='Indian/Maldives'):
+async def calculate_all_periods_data(timezone_str='Indian/Maldives'):
     """Calculate data for all periods (TODAY, WEEK, MONTH, 6 MONTHS, YEAR) for saving to Google Sheets"""
     tz = pytz.timezone(timezone_str)
     now = datetime.now(tz)
@@ -4883,43 +4873,32 @@ def calculate_all_periods_data(timezone_str='Indian/Maldives'):
         'year': (year_start, today_end)
     }
 
-    # Get exchange rates
-    usd_rate = api.get_exchange_rate('USD', 'MVR') or 15.40
-    usdt_rate = api.get_exchange_rate('USDT', 'MVR') or 15.40
+    # One aggregated request covers every period
+    pnl = await api.get_pnl_report(periods)
 
     all_data = {}
 
-    for period_name, (start, end) in periods.items():
-        deposits = api.get_deposits_by_date_range(start, end)
-        withdrawals = api.get_withdrawals_by_date_range(start, end)
-        spins = api.get_spins_by_date_range(start, end)
-        bonuses = api.get_bonuses_by_date_range(start, end)
-        cashback = api.get_cashback_by_date_range(start, end)
+    for period_name in periods:
+        summary = summarize_pnl_period(pnl[period_name])
 
-        # Calculate chip costs
-        total_spin_rewards = sum([s['amount'] for s in spins])
-        total_bonuses = sum([b['amount'] for b in bonuses])
-        total_cashback = sum([c['amount'] for c in cashback])
+        # All amounts are stored in MVR (USD/USDT are converted at deposit time)
+        mvr_deposits = summary['mvr_deposits']
+        usd_deposits = summary['usd_deposits_mvr']
+        usdt_deposits = summary['usdt_deposits_mvr']
 
-        # Separate by currency
-        mvr_deposits = sum([d['amount'] for d in deposits if d['method'] in ['BML', 'MIB']])
-        usd_deposits = sum([d['amount'] for d in deposits if d['method'] == 'USD'])
-        usdt_deposits = sum([d['amount'] for d in deposits if d['method'] == 'USDT'])
+        mvr_withdrawals = summary['mvr_withdrawals']
+        usd_withdrawals = summary['usd_withdrawals_mvr']
+        usdt_withdrawals = summary['usdt_withdrawals_mvr']
 
-        mvr_withdrawals = sum([w['amount'] for w in withdrawals if w['method'] in ['BML', 'MIB']])
-        usd_withdrawals = sum([w['amount'] for w in withdrawals if w['method'] == 'USD'])
-        usdt_withdrawals = sum([w['amount'] for w in withdrawals if w['method'] == 'USDT'])
+        total_spin_rewards = summary['total_spin_rewards']
+        total_bonuses = summary['total_bonuses']
+        total_cashback = summary['total_cashback']
 
         # Calculate COMPREHENSIVE profits
         mvr_profit = mvr_deposits - (mvr_withdrawals + total_spin_rewards + total_bonuses + total_cashback)
         usd_profit = usd_deposits - usd_withdrawals
         usdt_profit = usdt_deposits - usdt_withdrawals
 
-        # Calculate total profit in MVR
-        usd_mvr_equiv = usd_profit * usd_rate
-        usdt_mvr_equiv = usdt_profit * usdt_rate
-        total_mvr_profit = mvr_profit + usd_mvr_equiv + usdt_mvr_equiv
-
         # Store data
         all_data[f'{period_name}_mvr_deposits'] = mvr_deposits
         all_data[f'{period_name}_mvr_withdrawals'] = mvr_withdrawals
@@ -4933,7 +4912,7 @@ def calculate_all_periods_data(timezone_str='Indian/Maldives'):
         all_data[f'{period_name}_usdt_deposits'] = usdt_deposits
         all_data[f'{period_name}_usdt_withdrawals'] = usdt_withdrawals
         all_data[f'{period_name}_usdt_profit'] = usdt_profit
-        all_data[f'{period_name}_total_profit'] = total_mvr_profit
+        all_data[f'{period_name}_total_profit'] = summary['total_profit']
 
     return all_data
 
@@ -4944,11 +4923,11 @@ async def send_daily_report(application):
         report_header = "🌅 <b>DAILY PROFIT/LOSS REPORT</b>\n"
         report_header += f"<i>{datetime.now(pytz.timezone('Indian/Maldives')).strftime('%B %d, %Y')}</i>\n\n"
 
-        stats_report, report_data = generate_daily_stats_report()
+        stats_report, report_data = await generate_daily_stats_report()
         report = report_header + stats_report
 
         # Add credit summary section
-        credit_summary = api.get_daily_credit_summary()
+        credit_summary = await api.get_daily_credit_summary()
         if credit_summary['count'] > 0:
             report += "\n\n💳 <b>ACTIVE CREDITS SUMMARY</b>\n"
             report += f"━━━━━━━━━━━━━━━━━━\n\n"
@@ -4967,7 +4946,7 @@ async def send_daily_report(application):
             report += "\n\n✅ <b>No active credits - All payments received!</b>\n"
 
         # Calculate ALL period reports for saving to Google Sheets
-        all_reports_data = calculate_all_periods_data()
+        all_reports_data = await calculate_all_periods_data()
 
         # Add credit data
         all_reports_data['credits_count'] = credit_summary['count']
@@ -4975,7 +4954,7 @@ async def send_daily_report(application):
 
         # Save all reports to Google Sheets
         try:
-            api.save_all_reports(all_reports_data)
+            await api.save_all_reports(all_reports_data)
             logger.info("All period reports saved to Google Sheets successfully")
         except Exception as e:
             logger.error(f"Failed to save reports to Google Sheets: {e}")
@@ -4993,7 +4972,7 @@ async def send_daily_report(application):
             logger.error(f"Failed to send daily report to super admin: {e}")
 
         try:
-            admins_response = api.get_all_admins()
+            admins_response = await api.get_all_admins()
 
             if isinstance(admins_response, dict) and 'results' in admins_response:
                 admins = admins_response['results']
@@ -5023,7 +5002,7 @@ async def send_daily_report(application):
 # Admin Update Payment Account Handlers
 async def update_payment_account_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Start updating payment account"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return ConversationHandler.END
 
@@ -5047,7 +5026,7 @@ async def update_payment_account_start(update: Update, context: ContextTypes.DEF
         return ConversationHandler.END
 
     # Get current details
-    current_details = api.get_payment_account(context.user_data['update_method'])
+    current_details = await api.get_payment_account(context.user_data['update_method'])
 
     if current_details and current_details.get('account_number'):
         current_text = f"📋 **Current {method_name} Account:**\n"
@@ -5082,7 +5061,7 @@ async def update_account_number_received(update: Update, context: ContextTypes.D
     if method == 'USDT':
         # USDT doesn't need holder name, save directly
         try:
-            api.update_payment_account(method, account_number, None)
+            await api.update_payment_account(method, account_number, None)
 
             await update.message.reply_text(
                 f"✅ **{method} wallet updated successfully!**\n\n"
@@ -5149,7 +5128,7 @@ async def update_account_holder_received(update: Update, context: ContextTypes.D
 
     try:
         # Save to sheets
-        api.update_payment_account(method, account_number, account_holder)
+        await api.update_payment_account(method, account_number, account_holder)
 
         await update.message.reply_text(
             f"✅ **{method} account updated successfully!**\n\n"
@@ -5173,120 +5152,160 @@ async def update_account_holder_received(update: Update, context: ContextTypes.D
     return ConversationHandler.END
 
 
-# ==================== SAFE BROADCAST HELPER ====================
-# Following Telegram Bot FAQ official guidelines: https://core.telegram.org/bots/faq
+# ==================== BROADCAST ENGINE ====================
+# Broadcasts run as background tasks (broadcast_engine.BroadcastRun): concurrent
+# workers share one token bucket at BROADCAST_RATE msg/sec (Telegram FAQ:
+# ~30 msg/sec), a FloodWait (429) pauses every worker, and progress is saved
+# to the Django API so a restarted bot resumes unfinished broadcasts.
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. '12m 05s'"""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    return f"{minutes}m {seconds:02d}s"
+
+
+def format_broadcast_progress(snapshot: Dict, finished: bool = False) -> str:
+    """Admin-facing progress (or final report) for a broadcast snapshot"""
+    total = snapshot['total']
+    if finished:
+        message = f"✅ <b>Broadcast #{snapshot['job_id']} completed!</b>\n\n"
+        message += f"📤 Successfully sent: {snapshot['success']} users\n"
+        if snapshot['blocked'] > 0:
+            message += f"🚫 Users blocked bot: {snapshot['blocked']}\n"
+        if snapshot['failed'] > 0:
+            message += f"❌ Other failures: {snapshot['failed']}\n"
+        message += f"\n📊 Total recipients: {total}"
+        message += f"\n⏱ Took: {format_duration(snapshot['elapsed_seconds'])}"
+        return message
+
+    percent = snapshot['done'] * 100 // total if total else 100
+    message = f"📢 <b>Broadcast #{snapshot['job_id']} in progress...</b>\n\n"
+    message += f"📤 Handled: {snapshot['done']}/{total} ({percent}%)\n"
+    message += f"✅ Sent: {snapshot['success']}\n"
+    message += f"🚫 Blocked: {snapshot['blocked']}\n"
+    message += f"❌ Failed: {snapshot['failed']}\n"
+    message += f"\n⚡ Rate: {snapshot['rate']:.1f} msg/sec"
+    if snapshot['eta_seconds'] is not None:
+        message += f"\n⏱ Remaining: ~{format_duration(snapshot['eta_seconds'])}"
+    return message
 
-async def safe_broadcast(context: ContextTypes.DEFAULT_TYPE, user_ids: list,
-                        message_type: str, content: dict) -> dict:
-    """
-    Safely broadcast messages to users following Telegram FAQ guidelines
 
-    Args:
-        context: Telegram bot context
-        user_ids: List of telegram user IDs
-        message_type: 'text' or 'photo'
-        content: Dict with message content:
-            - For text: {'text': str, 'parse_mode': str}
-            - For photo: {'photo': str, 'caption': str, 'parse_mode': str}
+async def run_broadcast_job(application, job: Dict):
+    """Send a broadcast job to its remaining recipients, keeping the admin's progress message up to date"""
+    bot = application.bot
+    run = broadcast_engine.BroadcastRun(bot, api, job)
 
-    Returns:
-        Dict with results: {'success': int, 'blocked': int, 'failed': int}
+    async def report_progress(snapshot):
+        if run.admin_chat_id and run.progress_message_id:
+            await bot.edit_message_text(
+                chat_id=run.admin_chat_id,
+                message_id=run.progress_message_id,
+                text=format_broadcast_progress(snapshot),
+                parse_mode='HTML'
+            )
 
-    Rate limits per Telegram FAQ:
-    - Free tier: ~30 messages/second max
-    - Uses 25 msg/sec for safety margin
-    - Batch pause every 1000 messages to avoid spam detection
-    - Proper FloodWait (429) and Forbidden error handling
-    """
-    success_count = 0
-    failed_count = 0
-    blocked_count = 0
+    try:
+        snapshot = await run.run(on_progress=report_progress)
+    except asyncio.CancelledError:
+        logger.info(f"Broadcast {job['id']} interrupted at {run.next_index}/{run.total} - will resume on restart")
+        raise
+    except Exception as e:
+        logger.error(f"❌ Broadcast {job['id']} failed: {e}")
+        return
+    finally:
+        application.bot_data.get('broadcast_tasks', {}).pop(job['id'], None)
 
-    # Telegram FAQ: ~30 msg/sec allowed, we use 25 for safety
-    DELAY_BETWEEN_MESSAGES = 0.04  # 1/25 = 0.04 seconds (25 msg/sec)
-    BATCH_SIZE = 1000  # Pause every 1000 messages
-    BATCH_PAUSE = 30  # 30 second pause between batches
+    if run.admin_chat_id:
+        try:
+            await bot.send_message(
+                chat_id=run.admin_chat_id,
+                text=format_broadcast_progress(snapshot, finished=True),
+                parse_mode='HTML'
+            )
+        except Exception as e:
+            logger.error(f"Failed to send broadcast {job['id']} report: {e}")
 
-    total_users = len(user_ids)
 
-    for i, user_id in enumerate(user_ids):
-        retry_count = 0
-        max_retries = 2
+# Telegram file_ids of broadcast photos already uploaded, by content hash
+broadcast_media_cache = broadcast_engine.MediaCache(api)
 
-        while retry_count <= max_retries:
-            try:
-                # Send message based on type
-                if message_type == 'photo':
-                    await context.bot.send_photo(
-                        chat_id=user_id,
-                        photo=content['photo'],
-                        caption=content.get('caption'),
-                        parse_mode=content.get('parse_mode', 'HTML')
-                    )
-                elif message_type == 'text':
-                    await context.bot.send_message(
-                        chat_id=user_id,
-                        text=content['text'],
-                        parse_mode=content.get('parse_mode', 'HTML'),
-                        reply_markup=content.get('reply_markup')
-                    )
-                else:
-                    failed_count += 1
-                    break
-
-                success_count += 1
 
-                # Rate limiting: 25 msg/sec per Telegram FAQ guidelines
-                await asyncio.sleep(DELAY_BETWEEN_MESSAGES)
+def launch_broadcast(application, job: Dict) -> asyncio.Task:
+    """Run a broadcast job in the background (tracked so shutdown can stop it cleanly)"""
+    task = asyncio.create_task(run_broadcast_job(application, job))
+    application.bot_data.setdefault('broadcast_tasks', {})[job['id']] = task
+    return task
 
-                # Batch pause every 1000 messages to avoid spam detection
-                if (i + 1) % BATCH_SIZE == 0 and (i + 1) < total_users:
-                    logger.info(f"Broadcast: Batch pause after {i + 1} messages (30s)")
-                    await asyncio.sleep(BATCH_PAUSE)
 
-                break  # Success, exit retry loop
+async def start_broadcast(context: ContextTypes.DEFAULT_TYPE, user_ids: list, message_type: str,
+                          content: dict, admin_chat_id: int = None, progress_message_id: int = None) -> Dict:
+    """
+    Record a broadcast and start sending it in the background (returns immediately)
 
-            except telegram.error.RetryAfter as e:
-                # FloodWait - Telegram told us to slow down (429 error)
-                wait_seconds = e.retry_after
-                logger.warning(f"FloodWait: Waiting {wait_seconds}s as requested by Telegram")
-                await asyncio.sleep(wait_seconds)
-                retry_count += 1
+    Args:
+        context: Telegram bot context
+        user_ids: List of telegram user IDs
+        message_type: 'text' or 'photo'
+        content: Dict with message content:
+            - For text: {'text': str, 'parse_mode': str, 'reply_markup': InlineKeyboardMarkup}
+            - For photo: {'photo': file_id / URL / local path / bytes, 'caption': str, 'parse_mode': str}
+        admin_chat_id: Chat that receives live progress and the final report
+            (and the one-time upload of a photo that is not a file_id yet)
+        progress_message_id: Message in admin_chat_id edited with live progress
 
-                if retry_count > max_retries:
-                    logger.error(f"Failed to send to {user_id} after {max_retries} retries")
-                    failed_count += 1
+    Returns:
+        The created broadcast job
+    """
+    if message_type == 'photo' and not broadcast_engine.is_telegram_file_id(content['photo']):
+        # Local file / bytes / URL: upload once, then every recipient gets the file_id
+        if not admin_chat_id:
+            raise ValueError("admin_chat_id is required to upload broadcast media")
+        content = dict(content)
+        content['photo'] = await broadcast_engine.upload_broadcast_photo(
+            context.bot, broadcast_media_cache, content['photo'], admin_chat_id
+        )
+
+    job = await api.create_broadcast_job(
+        message_type,
+        broadcast_engine.serialize_content(content),
+        user_ids,
+        admin_chat_id=admin_chat_id,
+        progress_message_id=progress_message_id
+    )
+    launch_broadcast(context.application, job)
+    return job
 
-            except telegram.error.Forbidden:
-                # User blocked the bot
-                blocked_count += 1
-                logger.info(f"User {user_id} has blocked the bot")
-                break
 
-            except telegram.error.ChatNotFound:
-                # Chat doesn't exist anymore
-                failed_count += 1
-                logger.info(f"Chat {user_id} not found (deleted account?)")
-                break
+async def resume_broadcasts(application):
+    """Resume broadcasts that were still running when the bot stopped"""
+    try:
+        jobs = await api.get_running_broadcasts()
+    except Exception as e:
+        logger.error(f"Failed to load unfinished broadcasts: {e}")
+        return
 
+    for job in jobs:
+        logger.info(f"🔁 Resuming broadcast {job['id']} at {job['next_index']}/{job['total_recipients']}")
+        if job.get('admin_chat_id'):
+            try:
+                await application.bot.send_message(
+                    chat_id=job['admin_chat_id'],
+                    text=f"🔁 Bot restarted - resuming broadcast #{job['id']} "
+                         f"({job['next_index']}/{job['total_recipients']} already handled).",
+                )
             except Exception as e:
-                logger.error(f"Failed to send broadcast to user {user_id}: {e}")
-                failed_count += 1
-                await asyncio.sleep(DELAY_BETWEEN_MESSAGES)
-                break
-
-    return {
-        'success': success_count,
-        'blocked': blocked_count,
-        'failed': failed_count
-    }
+                logger.warning(f"Failed to notify admin about resumed broadcast {job['id']}: {e}")
+        launch_broadcast(application, job)
 
 
 # ==================== ADMIN BROADCAST SYSTEM ====================
 
 async def broadcast_start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Start broadcast - admin sends message to all users"""
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await update.message.reply_text("❌ This command is only for admins.")
         return ConversationHandler.END
 
@@ -5314,7 +5333,7 @@ async def broadcast_start_from_callback(update: Update, context: ContextTypes.DE
     query = update.callback_query
     await query.answer()
 
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         await query.edit_message_text("❌ This feature is only for admins.")
         return ConversationHandler.END
 
@@ -5353,41 +5372,16 @@ async def broadcast_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def broadcast_message_received(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
-    Receive broadcast message and send to all users
-    Uses safe_broadcast helper following Telegram FAQ guidelines
+    Receive broadcast message and start sending it to all users
+    The broadcast runs in the background (start_broadcast); the admin gets live progress
     """
-    if not is_admin(update.effective_user.id):
+    if not await is_admin(update.effective_user.id):
         return ConversationHandler.END
 
     # Get the message to broadcast
     broadcast_msg = update.message
 
-    # Get all users from Django API
-    users = api.get_all_users()
-
-    # Handle paginated response
-    if isinstance(users, dict) and 'results' in users:
-        users = users['results']
-
-    # Extract telegram IDs
-    user_ids = [user['telegram_id'] for user in users if 'telegram_id' in user]
-
-    if not user_ids:
-        await update.message.reply_text("❌ No users found in database.")
-        return ConversationHandler.END
-
-    total_users = len(user_ids)
-
-    # Confirm before sending
-    await update.message.reply_text(
-        f"📊 Found {total_users} users in database.\n\n"
-        f"🚀 Starting broadcast...\n"
-        f"⏱ Rate: 25 msg/sec (per Telegram FAQ)\n"
-        f"🔄 Batch pause: every 1000 messages",
-        parse_mode='Markdown'
-    )
-
-    # Prepare content for safe_broadcast
+    # Prepare content for the broadcast
     if broadcast_msg.photo:
         # Image with or without caption
         photo = broadcast_msg.photo[-1]  # Get highest quality
@@ -5408,23 +5402,37 @@ async def broadcast_message_received(update: Update, context: ContextTypes.DEFAU
         await update.message.reply_text("❌ Unsupported message type.")
         return ConversationHandler.END
 
-    # Use safe broadcast helper
-    results = await safe_broadcast(context, user_ids, message_type, content)
-
-    # Report results to admin
-    result_msg = f"✅ **Broadcast completed!**\n\n"
-    result_msg += f"📤 Successfully sent: {results['success']} users\n"
+    # Stream users from Django API page by page, keeping only their telegram IDs
+    user_ids = [
+        user['telegram_id']
+        async for user in api.iter_all('users/', fields='telegram_id')
+        if 'telegram_id' in user
+    ]
 
-    if results['blocked'] > 0:
-        result_msg += f"🚫 Users blocked bot: {results['blocked']}\n"
+    if not user_ids:
+        await update.message.reply_text("❌ No users found in database.")
+        return ConversationHandler.END
 
-    if results['failed'] > 0:
-        result_msg += f"❌ Other failures: {results['failed']}\n"
+    total_users = len(user_ids)
 
-    result_msg += f"\n📊 Total users in database: {total_users}"
-    result_msg += f"\n\n⚙️ Rate used: 25 msg/sec (Telegram FAQ safe limit)"
+    # This message is edited with live progress while the broadcast runs
+    progress_message = await update.message.reply_text(
+        f"📊 Found {total_users} users in database.\n\n"
+        f"🚀 Starting broadcast...\n"
+        f"⏱ Rate: {broadcast_engine.BROADCAST_RATE:g} msg/sec (per Telegram FAQ)\n"
+        f"📡 Progress updates every {broadcast_engine.BROADCAST_SAVE_INTERVAL:g}s - you can keep using the bot.",
+        parse_mode='HTML'
+    )
 
-    await update.message.reply_text(result_msg, parse_mode='Markdown')
+    try:
+        await start_broadcast(
+            context, user_ids, message_type, content,
+            admin_chat_id=update.effective_chat.id,
+            progress_message_id=progress_message.message_id
+        )
+    except Exception as e:
+        logger.error(f"Failed to start broadcast: {e}")
+        await update.message.reply_text("❌ Failed to start broadcast. Please try again.")
 
     return ConversationHandler.END
 
@@ -5505,7 +5513,7 @@ async def investment_amount_received(update: Update, context: ContextTypes.DEFAU
         start_date = datetime.now().strftime('%Y-%m-%d')
 
         # Add investment to Google Sheets
-        success = api.add_investment(telegram_id, amount, start_date, note, pppoker_id)
+        success = await api.add_investment(telegram_id, amount, start_date, note, pppoker_id)
 
         if success:
             player_display = pppoker_id
@@ -5544,7 +5552,7 @@ async def investment_return_start(update: Update, context: ContextTypes.DEFAULT_
     await query.answer()
 
     # Get all active investments from last 24 hours
-    active_investments = api.get_all_active_investments_summary()
+    active_investments = await api.get_all_active_investments_summary()
 
     if not active_investments:
         await query.edit_message_text(
@@ -5595,7 +5603,7 @@ async def return_id_selected(update: Update, context: ContextTypes.DEFAULT_TYPE)
     pppoker_id = ''.join(filter(str.isdigit, pppoker_id))
 
     # Check if this PPPoker ID has active investments
-    investments_data = api.get_active_investments_by_pppoker_id(pppoker_id)
+    investments_data = await api.get_active_investments_by_pppoker_id(pppoker_id)
 
     if investments_data['count'] == 0:
         await update.message.reply_text(
@@ -5647,7 +5655,7 @@ async def return_amount_received(update: Update, context: ContextTypes.DEFAULT_T
         total_investment = investment_data['total_amount']
 
         # Record the return
-        result = api.record_investment_return(pppoker_id, return_amount)
+        result = await api.record_investment_return(pppoker_id, return_amount)
 
         if result['success']:
             net_profit = result['net_profit']
@@ -5856,7 +5864,7 @@ async def balance_setup_usdt_received(update: Update, context: ContextTypes.DEFA
         rate = cost / chips if chips > 0 else 0
 
         # Save to sheets
-        success = api.set_starting_balances(chips, cost, mvr, usd, usdt)
+        success = await api.set_starting_balances(chips, cost, mvr, usd, usdt)
 
         if success:
             await update.message.reply_text(
@@ -5893,7 +5901,7 @@ async def balance_buy_chips_start(update: Update, context: ContextTypes.DEFAULT_
     query = update.callback_query
     await query.answer()
 
-    balances = api.get_club_balances()
+    balances = await api.get_club_balances()
 
     await query.edit_message_text(
         f"🎲 <b>Buy Chips for Club</b>\n\n"
@@ -5953,7 +5961,7 @@ async def balance_buy_cost_received(update: Update, context: ContextTypes.DEFAUL
         rate = cost / chips
 
         # Get current balances
-        current = api.get_club_balances()
+        current = await api.get_club_balances()
 
         # Check if enough MVR
         if current['mvr_balance'] < cost:
@@ -5970,7 +5978,7 @@ async def balance_buy_cost_received(update: Update, context: ContextTypes.DEFAUL
 
         # Buy chips
         admin_name = update.effective_user.username or update.effective_user.first_name or 'Admin'
-        result = api.buy_chips_for_club(chips, cost, admin_name)
+        result = await api.buy_chips_for_club(chips, cost, admin_name)
 
         if result['success']:
             rate_change = ""
@@ -6014,7 +6022,7 @@ async def balance_add_cash_start(update: Update, context: ContextTypes.DEFAULT_T
     query = update.callback_query
     await query.answer()
 
-    balances = api.get_club_balances()
+    balances = await api.get_club_balances()
 
     keyboard = [
         [InlineKeyboardButton("💰 MVR", callback_data="add_cash_mvr")],
@@ -6097,7 +6105,7 @@ async def balance_add_note_received(update: Update, context: ContextTypes.DEFAUL
 
     # Add cash
     admin_name = update.effective_user.username or update.effective_user.first_name or 'Admin'
-    result = api.add_cash_to_club(currency, amount, note, admin_name)
+    result = await api.add_cash_to_club(currency, amount, note, admin_name)
 
     if result['success']:
         await update.message.reply_text(
@@ -6128,7 +6136,7 @@ async def admin_restart_broadcast(update: Update, context: ContextTypes.DEFAULT_
     query = update.callback_query
     await query.answer()
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.edit_message_text("❌ Admin access required.")
         return
 
@@ -6137,7 +6145,7 @@ async def admin_restart_broadcast(update: Update, context: ContextTypes.DEFAULT_
         parse_mode='HTML'
     )
 
-    user_ids = api.get_all_user_ids()
+    user_ids = await api.get_all_user_ids()
 
     restart_keyboard = InlineKeyboardMarkup([
         [InlineKeyboardButton("🔄 Restart Bot / ބޮޓް ރީސްޓާޓް ކުރައްވާ", callback_data="restart_bot")]
@@ -6155,16 +6163,19 @@ async def admin_restart_broadcast(update: Update, context: ContextTypes.DEFAULT_
         'reply_markup': restart_keyboard
     }
 
-    results = await safe_broadcast(context, user_ids, 'text', content)
-
-    await query.edit_message_text(
-        f"✅ <b>Restart broadcast sent!</b>\n\n"
-        f"📤 Sent to: {results['success']} users\n"
-        f"🚫 Blocked bot: {results['blocked']}\n"
-        f"❌ Failed: {results['failed']}",
-        parse_mode='HTML',
-        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("« Back to Panel", callback_data="admin_back")]])
-    )
+    # Runs in the background; this message is edited with live progress
+    try:
+        await start_broadcast(
+            context, user_ids, 'text', content,
+            admin_chat_id=query.message.chat_id,
+            progress_message_id=query.message.message_id
+        )
+    except Exception as e:
+        logger.error(f"Failed to start restart broadcast: {e}")
+        await query.edit_message_text(
+            "❌ Failed to start restart broadcast. Please try again.",
+            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("« Back to Panel", callback_data="admin_back")]])
+        )
 
 
 async def restart_bot_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -6176,7 +6187,7 @@ async def restart_bot_callback(update: Update, context: ContextTypes.DEFAULT_TYP
 
     # Create or update user in database
     try:
-        api.create_or_update_user(
+        await api.create_or_update_user(
             user.id,
             user.username,
             user.first_name,
@@ -6191,7 +6202,7 @@ async def restart_bot_callback(update: Update, context: ContextTypes.DEFAULT_TYP
     )
 
     # Show main menu
-    user_data = api.get_user(user.id)
+    user_data = await api.get_user(user.id)
     lang = user_data.get('language', 'en') if user_data else 'en'
     await show_main_menu(user, context, lang)
 
@@ -6202,7 +6213,7 @@ async def promo_create_start(update: Update, context: ContextTypes.DEFAULT_TYPE)
     query = update.callback_query
     await query.answer()
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.edit_message_text("❌ Admin access required.")
         return ConversationHandler.END
 
@@ -6286,7 +6297,7 @@ async def promo_end_date_received(update: Update, context: ContextTypes.DEFAULT_
             return PROMO_END_DATE
 
         # Create BONUS promotion
-        promotion_id = api.create_promotion(
+        promotion_id = await api.create_promotion(
             bonus_percentage=context.user_data['promo_percentage'],
             start_date=context.user_data['promo_start_date'],
             end_date=end_date_str,
@@ -6330,7 +6341,7 @@ async def cashback_promo_create_start(update: Update, context: ContextTypes.DEFA
     query = update.callback_query
     await query.answer()
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.edit_message_text("❌ Admin access required.")
         return ConversationHandler.END
 
@@ -6414,7 +6425,7 @@ async def cashback_promo_end_date_received(update: Update, context: ContextTypes
             return CASHBACK_PROMO_END_DATE
 
         # Create CASHBACK promotion
-        promotion_id = api.create_cashback_promotion(
+        promotion_id = await api.create_cashback_promotion(
             cashback_percentage=context.user_data['cashback_promo_percentage'],
             start_date=context.user_data['cashback_promo_start_date'],
             end_date=end_date_str,
@@ -6460,7 +6471,7 @@ async def quick_approve_deposit(update: Update, context: ContextTypes.DEFAULT_TY
     try:
         logger.info(f"Admin {query.from_user.id} clicked approve button")
 
-        if not is_admin(query.from_user.id):
+        if not await is_admin(query.from_user.id):
             await query.answer("❌ Not authorized", show_alert=True)
             return
 
@@ -6477,7 +6488,7 @@ async def quick_approve_deposit(update: Update, context: ContextTypes.DEFAULT_TY
 
         logger.info(f"Approving deposit request: {request_id}")
 
-        deposit = api.get_deposit_request(request_id)
+        deposit = await api.get_deposit_request(request_id)
 
         if not deposit:
             await query.edit_message_text(
@@ -6509,7 +6520,7 @@ async def quick_approve_deposit(update: Update, context: ContextTypes.DEFAULT_TY
         username = user_details.get('username', 'User')
 
         # Update status using Django API
-        api.approve_deposit(request_id, query.from_user.id)
+        await api.approve_deposit(request_id, query.from_user.id)
         logger.info(f"Deposit {request_id} status updated to Approved")
 
         # Add free spins based on deposit amount
@@ -6534,7 +6545,7 @@ async def quick_approve_deposit(update: Update, context: ContextTypes.DEFAULT_TY
 
             if spins_added > 0:
                 # Get user's language for translated message
-                user_lang = get_user_language(user_telegram_id)
+                user_lang = await get_user_language(user_telegram_id)
                 spins_message = "\n\n" + get_message('spin_bonus', user_lang, spins=spins_added)
                 logger.info(f"🎉 User will receive spin message: {spins_added} spins")
             else:
@@ -6551,7 +6562,7 @@ async def quick_approve_deposit(update: Update, context: ContextTypes.DEFAULT_TY
 
         if promo_data:
             # Record promotion bonus
-            success = api.record_promotion_bonus(
+            success = await api.record_promotion_bonus(
                 user_id=promo_data['user_id'],
                 pppoker_id=promo_data['pppoker_id'],
                 promotion_id=promo_data['promotion_id'],
@@ -6571,7 +6582,7 @@ async def quick_approve_deposit(update: Update, context: ContextTypes.DEFAULT_TY
             del context.bot_data[f'promo_{request_id}']
 
         # Get user language for translated message
-        user_lang = get_user_language(user_telegram_id)
+        user_lang = await get_user_language(user_telegram_id)
 
         # Notify user with club link button and spins button if applicable
         club_link = "https://pppoker.club/poker/api/share.php?share_type=club&uid=9630705&lang=en&lan=en&time=1762635634&club_id=370625&club_name=%CE%B2ILLIONAIRES&type=1&id=370625_0"
@@ -6670,7 +6681,7 @@ async def quick_reject_deposit(update: Update, context: ContextTypes.DEFAULT_TYP
     """Quick reject deposit - ask for reason"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -6682,7 +6693,7 @@ async def quick_reject_deposit(update: Update, context: ContextTypes.DEFAULT_TYP
         return
 
     # Check if deposit still pending
-    deposit = api.get_deposit_request(request_id)
+    deposit = await api.get_deposit_request(request_id)
     if not deposit or deposit.get('status') != 'Pending':
         status = deposit.get('status', 'Not found') if deposit else 'Not found'
         await query.answer(f"⛔ Request already {status}", show_alert=True)
@@ -6737,7 +6748,7 @@ async def quick_approve_withdrawal(update: Update, context: ContextTypes.DEFAULT
     """Quick approve withdrawal from notification"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -6752,7 +6763,7 @@ async def quick_approve_withdrawal(update: Update, context: ContextTypes.DEFAULT
     processing_requests[request_id] = query.from_user.id
     await query.answer()
 
-    withdrawal = api.get_withdrawal_request(request_id)
+    withdrawal = await api.get_withdrawal_request(request_id)
 
     if not withdrawal:
         await query.edit_message_text(f"{query.message.text}\n\n❌ _Request not found._", parse_mode='Markdown')
@@ -6773,7 +6784,7 @@ async def quick_approve_withdrawal(update: Update, context: ContextTypes.DEFAULT
 
     # Update status using Django API
     try:
-        api.approve_withdrawal(request_id, query.from_user.id)
+        await api.approve_withdrawal(request_id, query.from_user.id)
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Failed to approve withdrawal {request_id}: {error_msg}")
@@ -6799,7 +6810,7 @@ async def quick_approve_withdrawal(update: Update, context: ContextTypes.DEFAULT
     user_telegram_id = user_details.get('telegram_id') or withdrawal.get('user')
 
     # Get user language for translated message
-    user_lang = get_user_language(user_telegram_id)
+    user_lang = await get_user_language(user_telegram_id)
 
     # Notify user with club link button
     club_link = "https://pppoker.club/poker/api/share.php?share_type=club&uid=9630705&lang=en&lan=en&time=1762635634&club_id=370625&club_name=%CE%B2ILLIONAIRES&type=1&id=370625_0"
@@ -6861,7 +6872,7 @@ async def quick_reject_withdrawal(update: Update, context: ContextTypes.DEFAULT_
     """Quick reject withdrawal - ask for reason"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -6873,7 +6884,7 @@ async def quick_reject_withdrawal(update: Update, context: ContextTypes.DEFAULT_
         return
 
     # Check if withdrawal still pending
-    withdrawal = api.get_withdrawal_request(request_id)
+    withdrawal = await api.get_withdrawal_request(request_id)
     if not withdrawal or withdrawal.get('status') != 'Pending':
         status = withdrawal.get('status', 'Not found') if withdrawal else 'Not found'
         await query.answer(f"⛔ Request already {status}", show_alert=True)
@@ -6912,7 +6923,7 @@ async def quick_approve_join(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """Quick approve join request from notification"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -6927,7 +6938,7 @@ async def quick_approve_join(update: Update, context: ContextTypes.DEFAULT_TYPE)
     processing_requests[request_id] = query.from_user.id
     await query.answer()
 
-    join_req = api.get_join_request(request_id)
+    join_req = await api.get_join_request(request_id)
 
     if not join_req:
         await query.edit_message_text(f"{query.message.text}\n\n❌ _Request not found._", parse_mode='Markdown')
@@ -6936,13 +6947,13 @@ async def quick_approve_join(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
 
     # Update status
-    api.update_join_request_status(request_id, 'Approved', query.from_user.id)
+    await api.update_join_request_status(request_id, 'Approved', query.from_user.id)
 
     # Notify user
     user_details = join_req.get('user_details', {})
     user_id = user_details.get('telegram_id') or join_req.get('user_id') or join_req.get('user')
     try:
-        user_lang = get_user_language(user_id)
+        user_lang = await get_user_language(user_id)
         join_msg = get_message('join_approved_title', user_lang) + "\n\n" + get_message('join_approved_body', user_lang)
         await context.bot.send_message(
             chat_id=user_id,
@@ -6991,7 +7002,7 @@ async def quick_reject_join(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Quick reject join request - ask for reason"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -7034,7 +7045,7 @@ async def quick_reject_join(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # Cancel handler
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Cancel current operation"""
-    lang = context.user_data.get('lang', get_user_language(update.effective_user.id))
+    lang = context.user_data.get('lang', await get_user_language(update.effective_user.id))
     if update.callback_query:
         await update.callback_query.answer()
         await update.callback_query.edit_message_text(get_message('cancel_operation', lang))
@@ -7064,7 +7075,7 @@ async def menu_button_fallback(update: Update, context: ContextTypes.DEFAULT_TYP
 async def cancel_keyword_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle cancel keywords like 'cancel', 'exit', 'stop'"""
     text = update.message.text.lower().strip()
-    lang = get_user_language(update.effective_user.id)
+    lang = await get_user_language(update.effective_user.id)
 
     if text in ['cancel', 'exit', 'stop', 'quit', 'close']:
         await update.message.reply_text(
@@ -7107,9 +7118,9 @@ async def handle_rejection_reason(update: Update, context: ContextTypes.DEFAULT_
         request_id = int(parts[2])  # Convert to int
 
     if request_type == 'deposit':
-        deposit = api.get_deposit_request(request_id)
+        deposit = await api.get_deposit_request(request_id)
         if deposit:
-            api.reject_deposit(request_id, admin_id, reason)
+            await api.reject_deposit(request_id, admin_id, reason)
 
             # Get user telegram_id from user_details
             user_details = deposit.get('user_details', {})
@@ -7120,7 +7131,7 @@ async def handle_rejection_reason(update: Update, context: ContextTypes.DEFAULT_
             currency = 'MVR' if deposit.get('method') != 'USDT' else 'USD'
 
             # Get user language for translated message
-            user_lang = get_user_language(user_telegram_id)
+            user_lang = await get_user_language(user_telegram_id)
             try:
                 reject_msg = get_message('deposit_rejected_title', user_lang) + "\n\n" + get_message(
                     'deposit_rejected_body', user_lang,
@@ -7140,7 +7151,7 @@ async def handle_rejection_reason(update: Update, context: ContextTypes.DEFAULT_
             # Notify other admins
             admin_name = update.effective_user.first_name or update.effective_user.username or "Admin"
             try:
-                admins_response = api.get_all_admins()
+                admins_response = await api.get_all_admins()
                 if isinstance(admins_response, dict) and 'results' in admins_response:
                     admins = admins_response['results']
                 else:
@@ -7163,9 +7174,9 @@ async def handle_rejection_reason(update: Update, context: ContextTypes.DEFAULT_
                 logger.error(f"Failed to get admin list: {e}")
 
     elif request_type == 'withdrawal':
-        withdrawal = api.get_withdrawal_request(request_id)
+        withdrawal = await api.get_withdrawal_request(request_id)
         if withdrawal:
-            api.reject_withdrawal(request_id, admin_id, reason)
+            await api.reject_withdrawal(request_id, admin_id, reason)
 
             # Get user telegram_id from user_details
             user_details = withdrawal.get('user_details', {})
@@ -7176,7 +7187,7 @@ async def handle_rejection_reason(update: Update, context: ContextTypes.DEFAULT_
             currency = 'MVR' if withdrawal.get('payment_method') != 'USDT' else 'USD'
 
             # Get user language for translated message
-            user_lang = get_user_language(user_telegram_id)
+            user_lang = await get_user_language(user_telegram_id)
             try:
                 reject_msg = get_message('withdrawal_rejected_title', user_lang) + "\n\n" + get_message(
                     'withdrawal_rejected_body', user_lang,
@@ -7196,7 +7207,7 @@ async def handle_rejection_reason(update: Update, context: ContextTypes.DEFAULT_
             # Notify other admins
             admin_name = update.effective_user.first_name or update.effective_user.username or "Admin"
             try:
-                admins_response = api.get_all_admins()
+                admins_response = await api.get_all_admins()
                 if isinstance(admins_response, dict) and 'results' in admins_response:
                     admins = admins_response['results']
                 else:
@@ -7219,9 +7230,9 @@ async def handle_rejection_reason(update: Update, context: ContextTypes.DEFAULT_
                 logger.error(f"Failed to get admin list: {e}")
 
     elif request_type == 'join':
-        join_req = api.get_join_request(request_id)
+        join_req = await api.get_join_request(request_id)
         if join_req:
-            api.update_join_request_status(request_id, 'Rejected', admin_id)
+            await api.update_join_request_status(request_id, 'Rejected', admin_id)
 
             try:
                 await context.bot.send_message(
@@ -7236,16 +7247,16 @@ async def handle_rejection_reason(update: Update, context: ContextTypes.DEFAULT_
             await update.message.reply_text(f"✅ Join request {request_id} rejected. User notified.")
 
     elif request_type == 'seat':
-        seat_req = api.get_seat_request(request_id)
+        seat_req = await api.get_seat_request(request_id)
         if seat_req:
-            api.reject_seat_request(request_id, admin_id, reason)
+            await api.reject_seat_request(request_id, admin_id, reason)
 
             # Extract user telegram ID from user_details
             user_telegram_id = seat_req.get('user_details', {}).get('telegram_id')
             if not user_telegram_id:
                 user_telegram_id = seat_req.get('user_id')  # fallback
 
-            lang = get_user_language(user_telegram_id)
+            lang = await get_user_language(user_telegram_id)
             try:
                 await context.bot.send_message(
                     chat_id=user_telegram_id,
@@ -7266,7 +7277,7 @@ async def approve_seat_request(update: Update, context: ContextTypes.DEFAULT_TYP
     """Admin approves seat request"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -7276,7 +7287,7 @@ async def approve_seat_request(update: Update, context: ContextTypes.DEFAULT_TYP
 
     # Get seat request details
     try:
-        seat_req = api.get_seat_request(request_id)
+        seat_req = await api.get_seat_request(request_id)
         logger.info(f"Seat request retrieved: {seat_req}")
     except Exception as e:
         logger.error(f"Error getting seat request {request_id}: {e}")
@@ -7298,7 +7309,7 @@ async def approve_seat_request(update: Update, context: ContextTypes.DEFAULT_TYP
         return
 
     # Approve in database
-    success = api.approve_seat_request(request_id, query.from_user.id)
+    success = await api.approve_seat_request(request_id, query.from_user.id)
 
     if success:
         # Remove buttons for ALL admins
@@ -7315,7 +7326,7 @@ async def approve_seat_request(update: Update, context: ContextTypes.DEFAULT_TYP
             del notification_messages[request_id]
 
         # Get payment account details
-        payment_accounts = api.get_all_payment_accounts()
+        payment_accounts = await api.get_all_payment_accounts()
 
         # Extract user telegram ID from user_details
         user_telegram_id = seat_req.get('user_details', {}).get('telegram_id')
@@ -7352,7 +7363,7 @@ async def approve_seat_request(update: Update, context: ContextTypes.DEFAULT_TYP
         reply_markup = InlineKeyboardMarkup(keyboard)
 
         # Notify user with payment details
-        lang = get_user_language(user_telegram_id)
+        lang = await get_user_language(user_telegram_id)
         try:
             await context.bot.send_message(
                 chat_id=user_telegram_id,
@@ -7369,7 +7380,7 @@ async def approve_seat_request(update: Update, context: ContextTypes.DEFAULT_TYP
             }
 
             # Add user to credit list
-            api.add_user_credit(
+            await api.add_user_credit(
                 user_telegram_id,
                 seat_req.get('user_details', {}).get('username', 'User'),
                 seat_req['pppoker_id'],
@@ -7405,7 +7416,7 @@ async def reject_seat_request(update: Update, context: ContextTypes.DEFAULT_TYPE
     """Admin rejects seat request - ask for reason"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -7446,7 +7457,7 @@ async def auto_reject_seat_request(context: ContextTypes.DEFAULT_TYPE):
     pppoker_id = job_data['pppoker_id']
 
     # Check if seat request still pending
-    seat_req = api.get_seat_request(request_id)
+    seat_req = await api.get_seat_request(request_id)
     if not seat_req or seat_req.get('status') != 'Pending':
         # Already processed, no need to auto-reject
         logger.info(f"Seat request {request_id} already processed, skipping auto-reject")
@@ -7454,7 +7465,7 @@ async def auto_reject_seat_request(context: ContextTypes.DEFAULT_TYPE):
 
     # Auto-reject the seat request
     try:
-        api.reject_seat_request(request_id, 0, "Auto-rejected: Response timeout (2 minutes)")
+        await api.reject_seat_request(request_id, 0, "Auto-rejected: Response timeout (2 minutes)")
         logger.info(f"Auto-rejected seat request {request_id} due to timeout")
 
         # Remove buttons for ALL admins
@@ -7479,7 +7490,7 @@ async def auto_reject_seat_request(context: ContextTypes.DEFAULT_TYPE):
             del notification_messages[request_id]
 
         # Notify user with a nice message
-        lang = get_user_language(user_id)
+        lang = await get_user_language(user_id)
         try:
             await context.bot.send_message(
                 chat_id=user_id,
@@ -7499,7 +7510,7 @@ async def first_slip_reminder(context: ContextTypes.DEFAULT_TYPE):
     user_id = context.job.data
 
     # Check if user still has active credit
-    credit = api.get_user_credit(user_id)
+    credit = await api.get_user_credit(user_id)
     if not credit:
         # Already settled, cancel
         if user_id in seat_reminder_jobs:
@@ -7512,10 +7523,10 @@ async def first_slip_reminder(context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Increment reminder count
-    api.increment_credit_reminder(user_id)
+    await api.increment_credit_reminder(user_id)
 
     # Send reminder
-    lang = get_user_language(user_id)
+    lang = await get_user_language(user_id)
     try:
         await context.bot.send_message(
             chat_id=user_id,
@@ -7540,7 +7551,7 @@ async def final_slip_reminder(context: ContextTypes.DEFAULT_TYPE):
     user_id = context.job.data
 
     # Check if user still has active credit
-    credit = api.get_user_credit(user_id)
+    credit = await api.get_user_credit(user_id)
     if not credit:
         # Already settled
         if user_id in seat_reminder_jobs:
@@ -7548,10 +7559,10 @@ async def final_slip_reminder(context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Increment reminder count
-    api.increment_credit_reminder(user_id)
+    await api.increment_credit_reminder(user_id)
 
     # Send final reminder
-    lang = get_user_language(user_id)
+    lang = await get_user_language(user_id)
     try:
         await context.bot.send_message(
             chat_id=user_id,
@@ -7578,13 +7589,13 @@ async def show_seat_account_details(update: Update, context: ContextTypes.DEFAUL
     request_id = '_'.join(parts[3:])  # Handle if request_id contains underscores
 
     # Get payment accounts
-    payment_accounts = api.get_all_payment_accounts()
+    payment_accounts = await api.get_all_payment_accounts()
 
     if account_type in payment_accounts:
         account = payment_accounts[account_type]
         account_number = account.get('account_number', 'N/A')
         account_holder = account.get('account_name', '')
-        lang = get_user_language(query.from_user.id)
+        lang = await get_user_language(query.from_user.id)
 
         # Method names
         method_names = {'BML': 'Bank of Maldives', 'MIB': 'Maldives Islamic Bank', 'USD': 'USD Bank Transfer', 'USDT': 'USDT (BEP20)'}
@@ -7598,7 +7609,7 @@ async def show_seat_account_details(update: Update, context: ContextTypes.DEFAUL
             message += get_message('seat_pay_via', lang, method=method_name) + "\n\n"
 
             # Show exchange rate for USDT
-            usdt_rate = api.get_exchange_rate('USDT', 'MVR')
+            usdt_rate = await api.get_exchange_rate('USDT', 'MVR')
             if usdt_rate:
                 message += get_message('seat_current_rate', lang, rate=f"{float(usdt_rate):.2f}") + "\n\n"
 
@@ -7630,7 +7641,7 @@ async def upload_seat_slip_button(update: Update, context: ContextTypes.DEFAULT_
     await query.answer()
 
     # Check if user has active seat request
-    lang = get_user_language(query.from_user.id)
+    lang = await get_user_language(query.from_user.id)
     if query.from_user.id not in seat_request_data:
         await query.edit_message_text(
             get_message('seat_no_active', lang),
@@ -7650,7 +7661,7 @@ async def upload_seat_slip_button(update: Update, context: ContextTypes.DEFAULT_
 async def handle_seat_slip_upload(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle payment slip upload for seat request"""
     user = update.effective_user
-    lang = get_user_language(user.id)
+    lang = await get_user_language(user.id)
 
     # Check if user has pending seat request
     if user.id not in seat_request_data:
@@ -7733,7 +7744,7 @@ async def handle_seat_slip_upload(update: Update, context: ContextTypes.DEFAULT_
         if extracted_details.get('receiver_name'):
             # Check against all payment methods since we don't know which one user used
             for method in ['BML', 'MIB']:
-                stored_holder_name = api.get_payment_account_holder(method)
+                stored_holder_name = await api.get_payment_account_holder(method)
                 if stored_holder_name:
                     extracted_receiver = extracted_details['receiver_name'].upper().strip()
                     stored_holder = stored_holder_name.upper().strip()
@@ -7753,7 +7764,7 @@ async def handle_seat_slip_upload(update: Update, context: ContextTypes.DEFAULT_
         if extracted_details.get('receiver_account_number'):
             # Check against all payment methods since we don't know which one user used
             for method in ['BML', 'MIB']:
-                stored_account_number = api.get_payment_account_details(method)
+                stored_account_number = await api.get_payment_account_details(method)
                 if stored_account_number:
                     extracted_account = extracted_details['receiver_account_number'].replace(' ', '').replace('-', '').strip()
                     stored_account = stored_account_number.replace(' ', '').replace('-', '').strip()
@@ -7768,8 +7779,11 @@ async def handle_seat_slip_upload(update: Update, context: ContextTypes.DEFAULT_
                         account_validation_warning = ""
                         break
 
+        # Flag receipts whose reference number was already used
+        duplicate_warning = await get_duplicate_receipt_warning(extracted_details, user.id, 'seat', request_id)
+
         # Combine warnings
-        validation_warnings = name_validation_warning + account_validation_warning
+        validation_warnings = name_validation_warning + account_validation_warning + duplicate_warning
 
     # Save extracted sender name and payment method to seat request
     if extracted_details:
@@ -7777,7 +7791,7 @@ async def handle_seat_slip_upload(update: Update, context: ContextTypes.DEFAULT_
         payment_method = extracted_details.get('bank', '')
         if sender_name:
             try:
-                api.update_seat_request_slip_details(request_id, sender_name, payment_method)
+                await api.update_seat_request_slip_details(request_id, sender_name, payment_method)
                 logger.info(f"Updated seat request {request_id} with sender name: {sender_name}")
             except Exception as e:
                 logger.error(f"Failed to update seat request slip details: {e}")
@@ -7810,7 +7824,7 @@ async def handle_seat_slip_upload(update: Update, context: ContextTypes.DEFAULT_
     # Send to all admins
     all_admin_ids = [ADMIN_USER_ID]
     try:
-        regular_admins_response = api.get_all_admins()
+        regular_admins_response = await api.get_all_admins()
 
         # Handle paginated response from Django API
         if isinstance(regular_admins_response, dict) and 'results' in regular_admins_response:
@@ -7868,7 +7882,7 @@ async def settle_seat_slip(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Admin verifies and settles seat slip"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -7877,7 +7891,7 @@ async def settle_seat_slip(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.answer()
 
     # Get seat request
-    seat_req = api.get_seat_request(request_id)
+    seat_req = await api.get_seat_request(request_id)
     if not seat_req:
         await query.edit_message_caption(
             caption=f"{query.message.caption}\n\n❌ _Request not found._",
@@ -7897,11 +7911,11 @@ async def settle_seat_slip(update: Update, context: ContextTypes.DEFAULT_TYPE):
         user_telegram_id = seat_req.get('user_id')  # fallback
 
     # Settle in database (mark as completed and create deposit)
-    success = api.settle_seat_request(request_id, query.from_user.id)
+    success = await api.settle_seat_request(request_id, query.from_user.id)
 
     if success:
         # Clear user credit
-        api.clear_user_credit(user_telegram_id)
+        await api.clear_user_credit(user_telegram_id)
 
         # Clean up tracking
         if user_telegram_id in seat_request_data:
@@ -7935,7 +7949,7 @@ async def settle_seat_slip(update: Update, context: ContextTypes.DEFAULT_TYPE):
             del notification_messages[f"slip_{request_id}"]
 
         # Notify user
-        lang = get_user_language(user_telegram_id)
+        lang = await get_user_language(user_telegram_id)
         try:
             await context.bot.send_message(
                 chat_id=user_telegram_id,
@@ -7955,7 +7969,7 @@ async def reject_seat_slip(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Admin rejects seat slip"""
     query = update.callback_query
 
-    if not is_admin(query.from_user.id):
+    if not await is_admin(query.from_user.id):
         await query.answer("❌ Not authorized", show_alert=True)
         return
 
@@ -7964,7 +7978,7 @@ async def reject_seat_slip(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.answer()
 
     # Get seat request
-    seat_req = api.get_seat_request(request_id)
+    seat_req = await api.get_seat_request(request_id)
     if not seat_req:
         await query.edit_message_caption(
             caption=f"{query.message.caption}\n\n❌ _Request not found._",
@@ -8005,7 +8019,7 @@ async def reject_seat_slip(update: Update, context: ContextTypes.DEFAULT_TYPE):
         del notification_messages[f"slip_{request_id}"]
 
     # Notify user to reupload or contact support
-    lang = get_user_language(user_telegram_id)
+    lang = await get_user_language(user_telegram_id)
     try:
         await context.bot.send_message(
             chat_id=user_telegram_id,
@@ -8049,7 +8063,7 @@ async def spin_admin_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     user_id = query.from_user.id
 
-    if not is_admin(user_id):
+    if not await is_admin(user_id):
         await query.edit_message_text("❌ Admin access required!")
         return
 
@@ -8111,11 +8125,11 @@ async def spin_admin_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
 
         # Send freespins using the chat directly
         user = query.from_user
-        lang = get_user_language(user.id)
+        lang = await get_user_language(user.id)
 
         try:
             # Get user's spin data
-            user_data = spin_bot.api.get_spin_user(user.id)
+            user_data = await spin_bot.api.get_spin_user(user.id)
 
             if not user_data or user_data.get('available_spins', 0) == 0:
                 # Create deposit button
@@ -8273,7 +8287,7 @@ async def approve_spin_callback(update: Update, context: ContextTypes.DEFAULT_TY
 
     user = query.from_user
 
-    if not is_admin(user.id):
+    if not await is_admin(user.id):
         await query.edit_message_text("❌ Admin access required!")
         return
 
@@ -8293,7 +8307,7 @@ async def approve_spin_callback(update: Update, context: ContextTypes.DEFAULT_TY
     for spin_id in spin_ids:
         try:
             # Get spin data before approval
-            spin_data = spin_bot.api.get_spin_by_id(spin_id)
+            spin_data = await spin_bot.api.get_spin_by_id(spin_id)
 
             if not spin_data:
                 logger.warning(f"Spin ID {spin_id} not found")
@@ -8307,7 +8321,7 @@ async def approve_spin_callback(update: Update, context: ContextTypes.DEFAULT_TY
             target_username = spin_data.get('username', 'Unknown')
 
             # Mark as approved
-            spin_bot.api.approve_spin_reward(spin_id, user.id, approver_name)
+            await spin_bot.api.approve_spin_reward(spin_id, user.id, approver_name)
 
             # Add to totals
             chips = int(spin_data.get('chips', 0))
@@ -8321,11 +8335,11 @@ async def approve_spin_callback(update: Update, context: ContextTypes.DEFAULT_TY
             })
 
             # Update user's total approved chips
-            user_data = spin_bot.api.get_spin_user(spin_data['user_id'])
+            user_data = await spin_bot.api.get_spin_user(spin_data['user_id'])
             if user_data:
                 current_chips = user_data.get('total_chips_earned', 0)
                 new_total = current_chips + chips
-                spin_bot.api.update_spin_user(
+                await spin_bot.api.update_spin_user(
                     user_id=spin_data['user_id'],
                     username=target_username,
                     total_chips_earned=new_total
@@ -8437,7 +8451,7 @@ async def approve_spin_callback(update: Update, context: ContextTypes.DEFAULT_TY
                     logger.error(f"Failed to notify super admin: {e}")
 
             # Send to all other admins
-            admins_response = spin_bot.api.get_all_admins()
+            admins_response = await spin_bot.api.get_all_admins()
             logger.info(f"📋 Got admin list response type: {type(admins_response)}")
 
             # Handle paginated response from Django API
@@ -8503,7 +8517,7 @@ async def approve_spinhistory_callback(update: Update, context: ContextTypes.DEF
 
     user = query.from_user
 
-    if not is_admin(user.id):
+    if not await is_admin(user.id):
         await query.edit_message_text("❌ Admin access required!")
         return
 
@@ -8513,7 +8527,7 @@ async def approve_spinhistory_callback(update: Update, context: ContextTypes.DEF
         target_user_id = int(query.data.replace("approve_spinhistory_", ""))
 
         # Get all pending spins for this user
-        pending = spin_bot.api.get_pending_spin_rewards()
+        pending = await spin_bot.api.get_pending_spin_rewards(slim=True)
 
         # Handle paginated response
         if isinstance(pending, dict) and 'results' in pending:
@@ -8538,32 +8552,13 @@ async def approve_spinhistory_callback(update: Update, context: ContextTypes.DEF
         # Get username from user_details
         username = user_pending[0].get('user_details', {}).get('username', 'Unknown')
 
-        # Get user data first
-        user_data = spin_bot.api.get_spin_user(target_user_id)
-
-        # Approve each pending spin
-        for reward in user_pending:
-            spin_id = reward.get('id')  # Use 'id' field from Django API, not 'row_number'
-            chips = reward.get('chips', 0)
-
-            # Skip if spin_id is None
-            if not spin_id:
-                logger.warning(f"Skipping reward with no id: {reward}")
-                continue
-
-            success = spin_bot.api.approve_spin_reward(spin_id, user.id)  # Pass admin user ID, not name
-            if success:
-                approved_count += 1
-                total_chips += chips
-
-        # Update user's total chips earned
-        if user_data:
-            current_chips = user_data.get('total_chips_earned', 0)
-            new_total = current_chips + total_chips
-            spin_bot.api.update_spin_user(
-                telegram_id=target_user_id,
-                total_chips_earned=new_total
-            )
+        # Approve all pending spins in one request
+        # (the API also adds the approved chips to the user's total_chips_earned)
+        spin_ids = [reward['id'] for reward in user_pending if reward.get('id')]
+        result = await spin_bot.api.bulk_approve_spin_rewards(spin_ids, user.id)  # Pass admin user ID, not name
+        if result:
+            approved_count = result.get('approved_count', 0)
+            total_chips = result.get('total_chips', 0)
 
         # Escape HTML characters to prevent parsing errors
         from html import escape
@@ -8588,7 +8583,7 @@ async def approve_spinhistory_callback(update: Update, context: ContextTypes.DEF
         # Get /pendingspins messages
         pendingspins_key = f"pendingspins_{target_user_id}"
         try:
-            pendingspins_messages = api.get_notification_messages(pendingspins_key)
+            pendingspins_messages = await api.get_notification_messages(pendingspins_key)
             logger.info(f"🗑️ Retrieved {len(pendingspins_messages)} stored /pendingspins messages from database")
         except Exception as e:
             logger.error(f"❌ Failed to retrieve /pendingspins messages from database: {e}")
@@ -8597,7 +8592,7 @@ async def approve_spinhistory_callback(update: Update, context: ContextTypes.DEF
         # Get instant notification messages
         instant_key = f"spin_reward_{target_user_id}"
         try:
-            instant_messages = api.get_notification_messages(instant_key)
+            instant_messages = await api.get_notification_messages(instant_key)
             logger.info(f"🗑️ Retrieved {len(instant_messages)} stored instant notification messages from database")
         except Exception as e:
             logger.error(f"❌ Failed to retrieve instant messages from database: {e}")
@@ -8654,8 +8649,8 @@ async def approve_spinhistory_callback(update: Update, context: ContextTypes.DEF
 
             # Clean up stored message IDs from Django database (both types)
             try:
-                deleted_pendingspins = api.delete_notification_messages(pendingspins_key)
-                deleted_instant = api.delete_notification_messages(instant_key)
+                deleted_pendingspins = await api.delete_notification_messages(pendingspins_key)
+                deleted_instant = await api.delete_notification_messages(instant_key)
                 logger.info(f"✅ Deleted {deleted_pendingspins} /pendingspins + {deleted_instant} instant notification messages from database")
             except Exception as e:
                 logger.error(f"❌ Failed to delete notification messages from database: {e}")
@@ -8666,11 +8661,11 @@ async def approve_spinhistory_callback(update: Update, context: ContextTypes.DEF
         # Notify the user with detailed message
         try:
             # Get PPPoker ID for the message
-            pppoker_id = spin_bot.api.get_pppoker_id_from_deposits(target_user_id)
+            pppoker_id = await spin_bot.api.get_pppoker_id_from_deposits(target_user_id)
             pppoker_id_str = pppoker_id if pppoker_id else "N/A"
 
             # Get user language for translated message
-            user_lang = get_user_language(target_user_id)
+            user_lang = await get_user_language(target_user_id)
             notification_text = get_message('rewards_approved_title', user_lang) + "\n" + get_message(
                 'rewards_approved_body', user_lang,
                 total_chips=total_chips,
@@ -8703,7 +8698,7 @@ async def approve_instant_callback(update: Update, context: ContextTypes.DEFAULT
 
     user = query.from_user
 
-    if not is_admin(user.id):
+    if not await is_admin(user.id):
         await query.answer("❌ Admin access required!", show_alert=True)
         return
 
@@ -8713,7 +8708,7 @@ async def approve_instant_callback(update: Update, context: ContextTypes.DEFAULT
         target_user_id = int(query.data.replace("approve_instant_", ""))
 
         # Get all pending spins for this user
-        pending = spin_bot.api.get_pending_spin_rewards()
+        pending = await spin_bot.api.get_pending_spin_rewards(slim=True)
 
         # Handle paginated response
         if isinstance(pending, dict) and 'results' in pending:
@@ -8728,7 +8723,7 @@ async def approve_instant_callback(update: Update, context: ContextTypes.DEFAULT
             # Try to find who already approved by checking spin history via Django API
             try:
                 # Query Django API for approved spins for this user
-                response = api.get_all_spin_history()
+                response = await api.get_all_spin_history(slim=True)
 
                 # Handle paginated response
                 if isinstance(response, dict) and 'results' in response:
@@ -8789,32 +8784,13 @@ async def approve_instant_callback(update: Update, context: ContextTypes.DEFAULT
         # Get username from user_details nested object (not directly from spin record)
         username = user_pending[0].get('user_details', {}).get('username', 'Unknown')
 
-        # Get user data first
-        user_data = spin_bot.api.get_spin_user(target_user_id)
-
-        # Approve each pending spin
-        for reward in user_pending:
-            spin_id = reward.get('id')  # Use 'id' field from Django API, not 'row_number'
-            chips = reward.get('chips', 0)
-
-            # Skip if spin_id is None
-            if not spin_id:
-                logger.warning(f"Skipping reward with no id: {reward}")
-                continue
-
-            success = spin_bot.api.approve_spin_reward(spin_id, user.id)  # Pass admin user ID, not name
-            if success:
-                approved_count += 1
-                total_chips += chips
-
-        # Update user's total chips earned
-        if user_data:
-            current_chips = user_data.get('total_chips_earned', 0)
-            new_total = current_chips + total_chips
-            spin_bot.api.update_spin_user(
-                telegram_id=target_user_id,
-                total_chips_earned=new_total
-            )
+        # Approve all pending spins in one request
+        # (the API also adds the approved chips to the user's total_chips_earned)
+        spin_ids = [reward['id'] for reward in user_pending if reward.get('id')]
+        result = await spin_bot.api.bulk_approve_spin_rewards(spin_ids, user.id)  # Pass admin user ID, not name
+        if result:
+            approved_count = result.get('approved_count', 0)
+            total_chips = result.get('total_chips', 0)
 
         # Escape HTML characters in names to prevent parsing errors
         from html import escape
@@ -8838,7 +8814,7 @@ async def approve_instant_callback(update: Update, context: ContextTypes.DEFAULT
 
         # Get stored message IDs from Django database
         try:
-            stored_messages = api.get_notification_messages(notification_key)
+            stored_messages = await api.get_notification_messages(notification_key)
             logger.info(f"🗑️ Retrieved {len(stored_messages)} stored messages from database for {notification_key}")
         except Exception as e:
             logger.error(f"❌ Failed to retrieve stored messages from database: {e}")
@@ -8891,7 +8867,7 @@ async def approve_instant_callback(update: Update, context: ContextTypes.DEFAULT
 
             # Clean up stored message IDs from Django database
             try:
-                deleted_count = api.delete_notification_messages(notification_key)
+                deleted_count = await api.delete_notification_messages(notification_key)
                 logger.info(f"✅ Deleted {deleted_count} notification messages from database for {notification_key}")
             except Exception as e:
                 logger.error(f"❌ Failed to delete notification messages from database: {e}")
@@ -8902,11 +8878,11 @@ async def approve_instant_callback(update: Update, context: ContextTypes.DEFAULT
 
         # Notify the user
         try:
-            pppoker_id = spin_bot.api.get_pppoker_id_from_deposits(target_user_id)
+            pppoker_id = await spin_bot.api.get_pppoker_id_from_deposits(target_user_id)
             pppoker_id_str = pppoker_id if pppoker_id else "N/A"
 
             # Get user language for translated message
-            user_lang = get_user_language(target_user_id)
+            user_lang = await get_user_language(target_user_id)
             notification_text = get_message('rewards_approved_title', user_lang) + "\n" + get_message(
                 'rewards_approved_body', user_lang,
                 total_chips=total_chips,
@@ -8955,7 +8931,7 @@ async def cashback_approve_callback(update: Update, context: ContextTypes.DEFAUL
         request_id = int(query.data.replace("cashback_approve_", ""))
 
         # Approve the cashback request
-        result = api.approve_cashback_request(request_id, approver_id)
+        result = await api.approve_cashback_request(request_id, approver_id)
 
         if not result:
             await query.edit_message_text(
@@ -8983,7 +8959,7 @@ async def cashback_approve_callback(update: Update, context: ContextTypes.DEFAUL
 
         # Notify user
         try:
-            user_lang = get_user_language(target_user_id)
+            user_lang = await get_user_language(target_user_id)
             cashback_msg = get_message('cashback_approved_title', user_lang) + "\n\n" + get_message(
                 'cashback_approved_body', user_lang,
                 amount=f"{cashback_amount:.2f}",
@@ -9031,7 +9007,7 @@ async def cashback_reject_callback(update: Update, context: ContextTypes.DEFAULT
         request_id = int(query.data.replace("cashback_reject_", ""))
 
         # Reject the cashback request
-        result = api.reject_cashback_request(request_id, rejector_id, "Rejected by admin")
+        result = await api.reject_cashback_request(request_id, rejector_id, "Rejected by admin")
 
         if not result:
             await query.edit_message_text(
@@ -9056,7 +9032,7 @@ async def cashback_reject_callback(update: Update, context: ContextTypes.DEFAULT
 
         # Notify user
         try:
-            user_lang = get_user_language(target_user_id)
+            user_lang = await get_user_language(target_user_id)
             reject_msg = get_message('cashback_rejected_title', user_lang) + "\n\n" + get_message(
                 'cashback_rejected_body', user_lang,
                 reason="Request rejected"
@@ -9101,13 +9077,13 @@ async def deposit_button_callback(update: Update, context: ContextTypes.DEFAULT_
         pass
 
     # Get user language
-    lang = get_user_language(update.effective_user.id)
+    lang = await get_user_language(update.effective_user.id)
 
     # Get user data
-    user_data = api.get_user(update.effective_user.id)
+    user_data = await api.get_user(update.effective_user.id)
 
     # Get all configured payment accounts
-    payment_accounts = api.get_all_payment_accounts()
+    payment_accounts = await api.get_all_payment_accounts()
 
     # Build keyboard with only configured payment methods
     keyboard = []
@@ -9160,11 +9136,11 @@ async def play_freespins_callback(update: Update, context: ContextTypes.DEFAULT_
             logger.warning(f"Could not delete message: {e}")
 
         user = query.from_user
-        lang = get_user_language(user.id)
+        lang = await get_user_language(user.id)
 
         try:
             # Get user's spin data
-            user_data = spin_bot.api.get_spin_user(user.id)
+            user_data = await spin_bot.api.get_spin_user(user.id)
             available = user_data.get('available_spins', 0) if user_data else 0
             total_chips = user_data.get('total_chips_earned', 0) if user_data else 0
 
@@ -9255,7 +9231,7 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     text = update.message.text
 
     # Check if admin is in "add spins mode"
-    if is_admin(user_id) and context.user_data.get('awaiting_user_id_for_spins'):
+    if await is_admin(user_id) and context.user_data.get('awaiting_user_id_for_spins'):
         # Admin sent a user ID
         target_user_id = text.strip()
         amount = context.user_data.get('pending_spin_amount')
@@ -9270,7 +9246,7 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
         return
 
     # Check if admin is replying to a user or providing rejection reason
-    if is_admin(user_id) and user_id in admin_reply_context:
+    if await is_admin(user_id) and user_id in admin_reply_context:
         context_data = admin_reply_context[user_id]
 
         # Check if it's a rejection reason
@@ -9283,13 +9259,13 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     # Admin menu buttons
     if text == "📋 Admin Panel":
         return await admin_panel.admin_panel(update, context)
-    elif text == "📊 View Deposits" and is_admin(user_id):
+    elif text == "📊 View Deposits" and await is_admin(user_id):
         return await admin_panel.admin_view_deposits(update, context)
-    elif text == "💸 View Withdrawals" and is_admin(user_id):
+    elif text == "💸 View Withdrawals" and await is_admin(user_id):
         return await admin_panel.admin_view_withdrawals(update, context)
-    elif text == "🎮 View Join Requests" and is_admin(user_id):
+    elif text == "🎮 View Join Requests" and await is_admin(user_id):
         return await admin_panel.admin_view_joins(update, context)
-    elif text == "💳 Payment Accounts" and is_admin(user_id):
+    elif text == "💳 Payment Accounts" and await is_admin(user_id):
         return await admin_panel.admin_view_accounts(update, context)
     # Language button (same in all languages)
     elif text == "🌐 Language / ބަސް":
@@ -9302,7 +9278,7 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     elif text in [BUTTON_LABELS['en']['free_spins'], BUTTON_LABELS['dv']['free_spins']]:
         return await freespins_command(update, context)
     elif text == "🎰 Spin Management":
-        if is_admin(user_id):
+        if await is_admin(user_id):
             return await spin_management_panel(update, context)
         else:
             await update.message.reply_text("❌ Admin access required!")
@@ -9311,7 +9287,7 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
         if user_id in support_mode_users:
             return await live_support_message(update, context)
         else:
-            lang = get_user_language(user_id)
+            lang = await get_user_language(user_id)
             await update.message.reply_text(
                 get_message('please_use_menu', lang)
             )
@@ -9326,7 +9302,7 @@ async def handle_photo_message(update: Update, context: ContextTypes.DEFAULT_TYP
         return await handle_seat_slip_upload(update, context)
 
     # Check if admin is replying to a support message
-    if is_admin(user_id) and user_id in admin_reply_context:
+    if await is_admin(user_id) and user_id in admin_reply_context:
         return await admin_reply_photo_received(update, context)
 
     # If user is in support mode, handle their photo
@@ -9777,10 +9753,10 @@ def main():
     )
 
     # Schedule 50/50 investment expiry check every hour
-    def check_expired_investments():
+    async def check_expired_investments():
         """Mark investments older than 24 hours as Lost"""
         try:
-            marked_count = api.mark_expired_investments_as_lost()
+            marked_count = await api.mark_expired_investments_as_lost()
             if marked_count > 0:
                 logger.info(f"Marked {marked_count} expired 50/50 investments as Lost")
         except Exception as e:
@@ -9793,94 +9769,84 @@ def main():
         name='Check Expired 50/50 Investments'
     )
 
-    # Schedule spin notification check every 3 seconds for near-instant notifications
-    async def check_spin_notifications():
-        """Check for new spin rewards and send notifications instantly"""
-        try:
-            from datetime import datetime, timedelta
-            import requests
-
-            # Get all pending spins that haven't been notified yet
-            # Filter at database level to avoid fetching already-notified spins
-            response = requests.get(
-                f'{DJANGO_API_URL}/spin-history/?status=Pending&notified_at__isnull=true',
-                headers={
-                    'Authorization': f'Bearer {api.token}' if hasattr(api, 'token') and api.token else '',
-                    'Content-Type': 'application/json'
-                }
-            )
-            if response.status_code != 200:
-                logger.error(f"Failed to get pending spins: HTTP {response.status_code} - {response.text}")
-                return
+    # Spin notifications are queued in the outbox by process_spin and delivered here.
+    # With REDIS_URL set the API publishes a wakeup after each spin commits, so the
+    # listener delivers instantly; the scheduled sweep is only a safety net.
+    spin_notify_lock = asyncio.Lock()
+    spin_notify_pending = asyncio.Event()  # Set by every wakeup, cleared at the start of each pass
+
+    async def deliver_spin_notifications():
+        """Send all undelivered spin notifications from the outbox"""
+        spin_notify_pending.set()
+        # Listener and sweep can fire together - only one drain at a time.
+        # A wakeup during a drain leaves the flag set, so the running drain makes another pass.
+        if spin_notify_lock.locked():
+            return
+        async with spin_notify_lock:
+            while spin_notify_pending.is_set():
+                spin_notify_pending.clear()
+                try:
+                    try:
+                        notifications = await api.get_pending_spin_notifications()
+                    except Exception as e:
+                        logger.error(f"Failed to get pending spin notifications: {e}")
+                        return
 
-            data = response.json()
-            pending_spins = data.get('results', []) if isinstance(data, dict) else data
+                    if not notifications:
+                        continue
 
-            if not pending_spins:
-                # No unnotified spins - this is normal, just check again later
-                return
+                    # Merge notifications from the same user into one message
+                    from collections import defaultdict
+                    user_notifications = defaultdict(list)
+                    for notification in notifications:
+                        user_notifications[notification['user_telegram_id']].append(notification)
 
-            logger.info(f"📊 Check spin notifications: Found {len(pending_spins)} unnotified pending spins")
+                    logger.info(f"📨 Sending spin notifications for {len(user_notifications)} user(s) ({len(notifications)} outbox rows)")
+                    for user_id, batch in user_notifications.items():
+                        await send_spin_notification(application, user_id, batch)
 
-            # Group by user for batching spins from same session
-            from collections import defaultdict
-            user_all_spins = defaultdict(list)
+                except Exception as e:
+                    logger.error(f"❌ Error delivering spin notifications: {e}")
+                    import traceback
+                    logger.error(traceback.format_exc())
+                    return
 
-            # Group all unnotified spins by user
-            for spin in pending_spins:
-                user_id = spin.get('user_details', {}).get('telegram_id')
-                if user_id:
-                    user_all_spins[user_id].append(spin)
-                else:
-                    logger.warning(f"⚠️ Spin {spin.get('id')} has no user telegram_id")
-
-            # Smart batching: Wait 2 seconds only if user just spun (to catch multiple quick spins)
-            # This allows batching 50x spins while keeping notifications near-instant
-            user_spins = {}
-            for user_id, spins in user_all_spins.items():
-                # Find the most recent spin for this user
-                most_recent_spin = max(spins, key=lambda s: s['created_at'])
-                created_at_str = most_recent_spin['created_at'].replace('Z', '+00:00')
-                created_at = datetime.fromisoformat(created_at_str)
-
-                # Use UTC for both timestamps to avoid timezone issues
-                from datetime import timezone
-                now_utc = datetime.now(timezone.utc)
-                if created_at.tzinfo is None:
-                    created_at = created_at.replace(tzinfo=timezone.utc)
-
-                age_seconds = (now_utc - created_at).total_seconds()
-
-                logger.info(f"📅 User {user_id}: {len(spins)} unnotified spins, most recent is {age_seconds:.1f}s old")
-
-                # Smart logic: Send immediately if 2+ seconds old OR if user has 10+ spins (bulk spin)
-                if age_seconds >= 2 or len(spins) >= 10:
-                    logger.info(f"✅ Sending instant notification for user {user_id} ({len(spins)} spins)")
-                    user_spins[user_id] = spins
-                else:
-                    logger.info(f"⏳ User {user_id} batch waiting {age_seconds:.1f}s (need 2s)")
+    async def spin_notification_listener():
+        """Deliver spin notifications as soon as the API publishes a wakeup"""
+        import redis.asyncio as aioredis
 
-            # Send notifications for each user
-            if user_spins:
-                logger.info(f"📨 Sending spin notifications for {len(user_spins)} user(s) (notifying users + all admins)")
-                for user_id, spins in user_spins.items():
-                    await send_spin_notification(application, user_id, spins)
-            else:
-                logger.info(f"⏳ All unnotified spins are too recent (waiting 2s for batching)")
-
-        except Exception as e:
-            logger.error(f"❌ Error checking spin notifications: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        channel = os.getenv('SPIN_NOTIFY_CHANNEL', 'spin_notifications')
+        while True:
+            client = aioredis.from_url(REDIS_URL)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(channel)
+                logger.info(f"📡 Listening for spin notification wakeups on '{channel}'")
+                # Deliver anything queued while we were disconnected
+                await deliver_spin_notifications()
+                async for message in pubsub.listen():
+                    if message.get('type') != 'message':
+                        continue
+                    # Short pause so several spins committed together go out as one message
+                    await asyncio.sleep(1)
+                    await deliver_spin_notifications()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Spin notification listener error, reconnecting in 5s: {e}")
+                await asyncio.sleep(5)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
 
-    async def send_spin_notification(app, user_id, spins):
+    async def send_spin_notification(app, user_id, notifications):
         """Send notification to user and admins about new spin rewards"""
         try:
-            total_chips = sum(s.get('chips', 0) for s in spins)
-            spin_count = len(spins)
+            total_chips = sum(n.get('total_chips', 0) for n in notifications)
+            spin_count = sum(n.get('spin_count', 0) for n in notifications)
 
             # Get current user info from API (not from spin record which might be outdated)
-            user_info = api.get_user_by_telegram_id(user_id)
+            user_info = await api.get_user_by_telegram_id(user_id)
             logger.info(f"📋 Retrieved user info from API: {user_info}")
 
             if isinstance(user_info, dict) and user_info:
@@ -9890,14 +9856,14 @@ def main():
                 pppoker_id = user_info.get('pppoker_id', 'N/A')
                 logger.info(f"📝 Using API data - Username: {username}, PPPoker ID: {pppoker_id}")
             else:
-                # Fallback to spin record if API call fails
-                logger.warning(f"⚠️ API call failed, using spin record data")
-                username = spins[0].get('user_details', {}).get('username', 'User')
-                pppoker_id = spins[0].get('user_details', {}).get('pppoker_id', 'N/A')
-                logger.info(f"📝 Using spin record - Username: {username}, PPPoker ID: {pppoker_id}")
+                # Fallback to outbox record if API call fails
+                logger.warning(f"⚠️ API call failed, using outbox record data")
+                username = (notifications[0].get('username') or 'User').lstrip('@')
+                pppoker_id = notifications[0].get('pppoker_id') or 'N/A'
+                logger.info(f"📝 Using outbox record - Username: {username}, PPPoker ID: {pppoker_id}")
 
             # Notify user
-            user_lang = get_user_language(user_id)
+            user_lang = await get_user_language(user_id)
             if user_lang == 'dv':
                 spin_word = 'ސްޕިން' if spin_count == 1 else 'ސްޕިން'
                 user_message = (
@@ -9922,28 +9888,15 @@ def main():
 
             # Notify admins - show TOTAL pending rewards for this user
             from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-            import requests
 
             # Get ALL pending spins for this user to show total
             try:
-                response = requests.get(
-                    f'{DJANGO_API_URL}/spin-history/?status=Pending',
-                    headers={
-                        'Authorization': f'Bearer {api.token}' if hasattr(api, 'token') and api.token else '',
-                        'Content-Type': 'application/json'
-                    }
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    all_pending = data.get('results', []) if isinstance(data, dict) else data
-                    # Filter for this specific user
-                    user_pending = [s for s in all_pending if s.get('user_details', {}).get('telegram_id') == user_id]
-                    total_pending_count = len(user_pending)
-                    total_pending_chips = sum(s.get('chips', 0) for s in user_pending)
-                else:
-                    # Fallback to current batch
-                    total_pending_count = spin_count
-                    total_pending_chips = total_chips
+                data = await api._get('spin-history/', params={'status': 'Pending'})
+                all_pending = data.get('results', []) if isinstance(data, dict) else data
+                # Filter for this specific user
+                user_pending = [s for s in all_pending if s.get('user_details', {}).get('telegram_id') == user_id]
+                total_pending_count = len(user_pending)
+                total_pending_chips = sum(s.get('chips', 0) for s in user_pending)
             except Exception as e:
                 logger.error(f"Error fetching total pending: {e}")
                 total_pending_count = spin_count
@@ -9992,7 +9945,7 @@ def main():
                 )
                 # Store message ID in Django database for later button removal
                 try:
-                    api.store_notification_message(
+                    await api.store_notification_message(
                         notification_type='spin_reward',
                         notification_key=notification_key,
                         admin_telegram_id=ADMIN_USER_ID,
@@ -10005,7 +9958,7 @@ def main():
                 logger.error(f"Failed to notify super admin: {e}")
 
             # Send to regular admins with button
-            admins_response = api.get_all_admins()
+            admins_response = await api.get_all_admins()
             logger.info(f"📋 Retrieved admins response: {admins_response}")
 
             # Handle paginated response
@@ -10034,7 +9987,7 @@ def main():
                             )
                             # Store message ID in Django database for later button removal
                             try:
-                                api.store_notification_message(
+                                await api.store_notification_message(
                                     notification_type='spin_reward',
                                     notification_key=notification_key,
                                     admin_telegram_id=admin_telegram_id,
@@ -10053,39 +10006,23 @@ def main():
             else:
                 logger.warning(f"⚠️ No admins to notify (besides super admin)")
 
-            # Mark spins as notified
-            from datetime import datetime, timezone
-            now_iso = datetime.now(timezone.utc).isoformat()
-            logger.info(f"⏰ Marking {len(spins)} spins as notified at {now_iso}")
-
-            for spin in spins:
-                try:
-                    # Use the django_api method to properly mark as notified
-                    result = api.update_spin_history(
-                        spin_id=spin['id'],
-                        notified_at=now_iso
-                    )
-                    logger.info(f"✅ API response for spin {spin['id']}: {result}")
-
-                    # Verify it was actually updated
-                    if result and result.get('notified_at'):
-                        logger.info(f"✅ Successfully marked spin {spin['id']} as notified")
-                    else:
-                        logger.error(f"⚠️ Spin {spin['id']} marked but API returned unexpected response: {result}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to mark spin {spin['id']} as notified: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+            # Mark outbox rows delivered and their spins notified in one request
+            notification_ids = [n['id'] for n in notifications]
+            try:
+                result = await api.ack_spin_notifications(notification_ids)
+                logger.info(f"✅ Acked {result.get('delivered_count')} notification(s), marked {result.get('marked_spins')} spins as notified")
+            except Exception as e:
+                logger.error(f"❌ Failed to ack spin notifications {notification_ids}: {e}")
 
         except Exception as e:
             logger.error(f"Error sending spin notification: {e}")
 
     scheduler.add_job(
-        check_spin_notifications,
+        deliver_spin_notifications,
         trigger='interval',
-        seconds=3,  # Check every 3 seconds for near-instant notifications
-        id='check_spin_notifications',
-        name='Check Spin Notifications'
+        seconds=30 if REDIS_URL else 3,  # Safety sweep with Redis, polling without
+        id='deliver_spin_notifications',
+        name='Deliver Spin Notifications'
     )
 
     # Start scheduler after application initializes
@@ -10093,10 +10030,30 @@ def main():
         scheduler.start()
         logger.info("Scheduler started - Daily reports will be sent at midnight (00:00) Maldives time")
         logger.info("50/50 investment expiry check will run every hour")
-        logger.info("Spin notifications: Near-instant delivery (3s checks, 2s batching for multiple spins)")
+        if REDIS_URL:
+            application.bot_data['spin_notification_listener'] = asyncio.create_task(spin_notification_listener())
+            logger.info("Spin notifications: Push delivery via Redis (30s safety sweep)")
+        else:
+            logger.info("Spin notifications: Polling the outbox every 3s (set REDIS_URL for push delivery)")
+        await resume_broadcasts(application)
 
     application.post_init = post_init
 
+    # Close pooled Django API connections on shutdown
+    async def post_shutdown(application):
+        listener = application.bot_data.get('spin_notification_listener')
+        if listener:
+            listener.cancel()
+        # Stop running broadcasts; each saves its progress before exiting so the next start resumes it
+        broadcast_tasks = list(application.bot_data.get('broadcast_tasks', {}).values())
+        for task in broadcast_tasks:
+            task.cancel()
+        await asyncio.gather(*broadcast_tasks, return_exceptions=True)
+        await api.aclose()
+        await admin_panel.api.aclose()
+
+    application.post_shutdown = post_shutdown
+
     # Add error handler
     async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Log errors caused by updates."""
@@ -0,0 +1,346 @@
+"""
+Concurrent broadcast engine for admin announcements.
+A small pool of workers sends one broadcast job to its recipients. Every send
+first takes a token from one shared TokenBucket, so the bot as a whole stays
+under Telegram's broadcast limit however many workers or broadcasts run, and a
+FloodWait (RetryAfter) pauses the bucket for every worker at once.
+Progress is saved through the API as it goes so a restarted bot resumes the
+broadcast from where it stopped instead of starting over.
+Photos from a local file, bytes or a URL are uploaded to Telegram once and every
+recipient is sent the resulting file_id (see upload_broadcast_photo).
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import telegram
+from telegram import InlineKeyboardMarkup
+
+logger = logging.getLogger(__name__)
+
+# Telegram FAQ: ~30 msg/sec per bot for bulk messages, 25 leaves a safety margin
+BROADCAST_RATE = float(os.getenv('BROADCAST_RATE', 25))
+BROADCAST_BURST = float(os.getenv('BROADCAST_BURST', 5))  # Tokens that may be spent back to back
+BROADCAST_WORKERS = int(os.getenv('BROADCAST_WORKERS', 10))  # Concurrent sends (hides request latency)
+BROADCAST_MAX_RETRIES = 2  # FloodWait retries per recipient
+BROADCAST_SAVE_INTERVAL = float(os.getenv('BROADCAST_SAVE_INTERVAL', 5))  # Seconds between progress saves/reports
+
+
+class TokenBucket:
+    """
+    Async token bucket: acquire() waits for a token (refilled at rate per second,
+    holding at most capacity), pause() holds every caller back until a delay passes.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for seconds (extends, never shortens, a running pause)"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        # Start from an empty bucket afterwards - no burst straight after a FloodWait
+        self.tokens = 0
+        self.updated_at = self.paused_until
+
+
+# Shared by every broadcast so concurrent broadcasts split the rate instead of adding up
+broadcast_limiter = TokenBucket(BROADCAST_RATE, BROADCAST_BURST)
+
+
+def serialize_content(content: Dict) -> Dict:
+    """Content as stored on the BroadcastJob (reply_markup as a plain dict)"""
+    stored = dict(content)
+    if isinstance(stored.get('reply_markup'), InlineKeyboardMarkup):
+        stored['reply_markup'] = stored['reply_markup'].to_dict()
+    return stored
+
+
+def deserialize_content(stored: Dict, bot) -> Dict:
+    """Inverse of serialize_content"""
+    content = dict(stored)
+    if content.get('reply_markup'):
+        content['reply_markup'] = InlineKeyboardMarkup.de_json(content['reply_markup'], bot)
+    return content
+
+
+def is_telegram_file_id(photo) -> bool:
+    """True if photo is already a Telegram file_id (not a URL, local path, bytes or file object)"""
+    return (isinstance(photo, str) and
+            not photo.startswith(('http://', 'https://')) and
+            not os.path.isfile(photo))
+
+
+def read_media_source(photo):
+    """
+    Resolve a photo that still has to be uploaded into (content_hash, upload_source).
+    Local files and file objects are read into bytes and hashed by content;
+    URLs are left for Telegram to fetch and keyed by the URL itself.
+    """
+    if isinstance(photo, str) and photo.startswith(('http://', 'https://')):
+        return hashlib.sha256(photo.encode()).hexdigest(), photo
+    if isinstance(photo, (str, os.PathLike)):
+        with open(photo, 'rb') as f:
+            data = f.read()
+    elif isinstance(photo, bytes):
+        data = photo
+    else:
+        data = photo.read()
+    return hashlib.sha256(data).hexdigest(), data
+
+
+class MediaCache:
+    """
+    Content hash -> Telegram file_id of media this bot already uploaded.
+    Persisted through the API (BroadcastMedia) so uploads are reused across
+    broadcasts and restarts; lookups are memoized in-process.
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self._file_ids: Dict[str, str] = {}
+
+    async def get(self, content_hash: str) -> Optional[str]:
+        file_id = self._file_ids.get(content_hash)
+        if file_id:
+            return file_id
+        try:
+            file_id = await self.api.get_broadcast_media(content_hash)
+        except Exception as e:
+            logger.warning(f"Broadcast media lookup failed: {e}")
+            return None
+        if file_id:
+            self._file_ids[content_hash] = file_id
+        return file_id
+
+    async def put(self, content_hash: str, file_id: str):
+        self._file_ids[content_hash] = file_id
+        try:
+            await self.api.save_broadcast_media(content_hash, file_id)
+        except Exception as e:
+            logger.warning(f"Failed to persist broadcast media {content_hash[:12]}: {e}")
+
+
+async def upload_broadcast_photo(bot, media_cache: MediaCache, photo, upload_chat_id: int) -> str:
+    """
+    Return a file_id for a broadcast photo, uploading it at most once.
+
+    A file_id is returned as is. Otherwise the content hash is looked up in
+    media_cache; on a miss the photo is uploaded once by sending it to
+    upload_chat_id (the admin, as a preview) and the returned file_id is cached.
+    """
+    if is_telegram_file_id(photo):
+        return photo
+
+    content_hash, source = read_media_source(photo)
+    file_id = await media_cache.get(content_hash)
+    if file_id:
+        logger.info(f"📎 Broadcast photo {content_hash[:12]} already uploaded, reusing its file_id")
+        return file_id
+
+    message = await bot.send_photo(
+        chat_id=upload_chat_id,
+        photo=source,
+        caption="📎 Broadcast image uploaded - users receive this copy."
+    )
+    file_id = message.photo[-1].file_id  # Largest size Telegram generated
+    await media_cache.put(content_hash, file_id)
+    logger.info(f"📎 Broadcast photo {content_hash[:12]} uploaded once, sending by file_id")
+    return file_id
+
+
+async def send_broadcast_message(bot, chat_id: int, message_type: str, content: Dict):
+    """Send one broadcast message ('text' or 'photo') to chat_id"""
+    if message_type == 'photo':
+        return await bot.send_photo(
+            chat_id=chat_id,
+            photo=content['photo'],
+            caption=content.get('caption'),
+            parse_mode=content.get('parse_mode', 'HTML'),
+            reply_markup=content.get('reply_markup')
+        )
+    if message_type == 'text':
+        return await bot.send_message(
+            chat_id=chat_id,
+            text=content['text'],
+            parse_mode=content.get('parse_mode', 'HTML'),
+            reply_markup=content.get('reply_markup')
+        )
+    raise ValueError(f"Unsupported broadcast message type: {message_type}")
+
+
+class BroadcastRun:
+    """
+    Sends one BroadcastJob from its saved cursor to the last recipient.
+
+    Workers pull the next recipient index from a shared cursor. next_index only
+    advances over the contiguous run of handled recipients, and the saved counts
+    cover exactly those recipients, so after a crash only the few sends that
+    finished out of order past next_index are repeated (and counted once).
+    """
+
+    def __init__(self, bot, api, job: Dict, limiter: TokenBucket = None, workers: int = BROADCAST_WORKERS):
+        self.bot = bot
+        self.api = api
+        self.job_id = job['id']
+        self.message_type = job['message_type']
+        self.content = deserialize_content(job['content'], bot)
+        self.recipient_ids: List[int] = job['recipient_ids']
+        self.admin_chat_id = job.get('admin_chat_id')
+        self.progress_message_id = job.get('progress_message_id')
+        self.limiter = limiter or broadcast_limiter
+        self.workers = workers
+
+        self.counts = {
+            'success': job.get('success_count', 0),
+            'blocked': job.get('blocked_count', 0),
+            'failed': job.get('failed_count', 0),
+        }
+        self.start_index = job.get('next_index', 0)
+        self.next_index = self.start_index  # Every recipient before this has been handled
+        self._cursor = self.start_index  # Next recipient handed to a worker
+        self._handled = {}  # index -> outcome for recipients past next_index (workers finish out of order)
+        self.started_at = time.monotonic()
+
+    @property
+    def total(self) -> int:
+        return len(self.recipient_ids)
+
+    def snapshot(self) -> Dict:
+        """Live progress: counts, recipients handled, send rate and ETA"""
+        counts = dict(self.counts)
+        for outcome in self._handled.values():
+            counts[outcome] += 1
+        done = self.next_index + len(self._handled)
+        elapsed = time.monotonic() - self.started_at
+        rate = (done - self.start_index) / elapsed if elapsed > 0 else 0.0
+        return {
+            'job_id': self.job_id,
+            'total': self.total,
+            'done': done,
+            'success': counts['success'],
+            'blocked': counts['blocked'],
+            'failed': counts['failed'],
+            'rate': rate,
+            'eta_seconds': (self.total - done) / rate if rate > 0 else None,
+            'elapsed_seconds': elapsed,
+        }
+
+    async def run(self, on_progress: Optional[Callable[[Dict], Awaitable]] = None) -> Dict:
+        """
+        Send to every remaining recipient and return the final snapshot.
+        on_progress(snapshot) is awaited every BROADCAST_SAVE_INTERVAL seconds.
+        Progress is saved on the same schedule and when the run ends or is cancelled.
+        """
+        remaining = self.total - self._cursor
+        logger.info(f"📢 Broadcast {self.job_id}: sending to {remaining} of {self.total} recipients "
+                    f"({BROADCAST_RATE:g} msg/sec, {self.workers} workers)")
+
+        workers = [asyncio.create_task(self._worker()) for _ in range(min(self.workers, remaining))]
+        reporter = asyncio.create_task(self._report_loop(on_progress))
+        completed = False
+        try:
+            await asyncio.gather(*workers)
+            completed = True
+        finally:
+            reporter.cancel()
+            for worker in workers:
+                worker.cancel()
+            await self._save(completed)
+
+        snapshot = self.snapshot()
+        logger.info(f"✅ Broadcast {self.job_id} completed: {snapshot['success']} sent, "
+                    f"{snapshot['blocked']} blocked, {snapshot['failed']} failed "
+                    f"in {snapshot['elapsed_seconds']:.0f}s")
+        return snapshot
+
+    async def _worker(self):
+        while self._cursor < self.total:
+            index = self._cursor
+            self._cursor += 1
+            outcome = await self._send(self.recipient_ids[index])
+            self._mark_handled(index, outcome)
+
+    def _mark_handled(self, index: int, outcome: str):
+        self._handled[index] = outcome
+        while self.next_index in self._handled:
+            self.counts[self._handled.pop(self.next_index)] += 1
+            self.next_index += 1
+
+    async def _send(self, chat_id: int) -> str:
+        """Send to one recipient; returns 'success', 'blocked' or 'failed'"""
+        for _ in range(BROADCAST_MAX_RETRIES + 1):
+            await self.limiter.acquire()
+            try:
+                await send_broadcast_message(self.bot, chat_id, self.message_type, self.content)
+                return 'success'
+
+            except telegram.error.RetryAfter as e:
+                # FloodWait applies to the whole bot - hold back every worker, then retry
+                wait_seconds = float(e.retry_after)
+                logger.warning(f"Broadcast {self.job_id}: FloodWait, pausing all sends for {wait_seconds}s")
+                self.limiter.pause(wait_seconds)
+
+            except telegram.error.Forbidden:
+                # User blocked the bot
+                logger.info(f"User {chat_id} has blocked the bot")
+                return 'blocked'
+
+            except telegram.error.BadRequest as e:
+                # Chat not found (deleted account?) and similar permanent errors
+                logger.info(f"Broadcast {self.job_id}: cannot send to {chat_id}: {e}")
+                return 'failed'
+
+            except Exception as e:
+                logger.error(f"Failed to send broadcast {self.job_id} to user {chat_id}: {e}")
+                return 'failed'
+
+        logger.error(f"Failed to send to {chat_id} after {BROADCAST_MAX_RETRIES} retries")
+        return 'failed'
+
+    async def _report_loop(self, on_progress):
+        while True:
+            await asyncio.sleep(BROADCAST_SAVE_INTERVAL)
+            await self._save(False)
+            if on_progress:
+                try:
+                    await on_progress(self.snapshot())
+                except Exception as e:
+                    logger.warning(f"Broadcast {self.job_id}: progress report failed: {e}")
+
+    async def _save(self, completed: bool):
+        try:
+            await self.api.save_broadcast_progress(
+                self.job_id,
+                next_index=self.next_index,
+                success_count=self.counts['success'],
+                blocked_count=self.counts['blocked'],
+                failed_count=self.counts['failed'],
+                completed=completed
+            )
+        except Exception as e:
+            logger.error(f"Broadcast {self.job_id}: failed to save progress: {e}")
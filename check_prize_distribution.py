@@ -0,0 +1,77 @@
+"""
+Statistical check for the mini app prize sampler.
+Draws a large seeded sample from PRIZE_TABLE and runs chi-square
+goodness-of-fit tests against PRIZE_WEIGHTS (prize frequencies) and against
+a uniform split over each prize's wheel segments.
+Exits non-zero if any test fails at the 0.1% level.
+
+Usage: python check_prize_distribution.py [draws] [seed]
+"""
+import random
+import sys
+from collections import Counter
+
+from spin_prizes import PRIZE_TABLE, PRIZE_WEIGHTS, WHEEL_PRIZES
+
+# Chi-square critical values at p = 0.001, indexed by degrees of freedom
+CHI2_CRITICAL_001 = {1: 10.828, 2: 13.816, 3: 16.266, 4: 18.467, 5: 20.515, 6: 22.458}
+
+
+def chi_square(observed, expected):
+    """Pearson's chi-square statistic over matching keys"""
+    return sum((observed.get(key, 0) - exp) ** 2 / exp for key, exp in expected.items())
+
+
+def check_distribution(draws=2_000_000, seed=20240101):
+    """Print each test and return the names of the failing ones"""
+    rng = random.Random(seed)
+    results = PRIZE_TABLE.draw(draws, rng=rng)
+    failures = []
+
+    # Display-only segments must never be drawn and segments must match their prize
+    for result in results:
+        wheel_prize = WHEEL_PRIZES[result['segment_index']]
+        expected_display = wheel_prize if wheel_prize == "Try Again!" else f"{wheel_prize} Chips"
+        if wheel_prize not in PRIZE_WEIGHTS or result['prize'] != expected_display:
+            print(f"FAIL segment {result['segment_index']} ({wheel_prize}) returned {result['prize']}")
+            return ['segment mapping']
+
+    # Prize frequencies vs PRIZE_WEIGHTS
+    total_weight = sum(PRIZE_WEIGHTS.values())
+    displays = {prize: prize if prize == "Try Again!" else f"{prize} Chips" for prize in PRIZE_WEIGHTS}
+    observed = Counter(result['prize'] for result in results)
+    expected = {displays[prize]: draws * weight / total_weight for prize, weight in PRIZE_WEIGHTS.items()}
+    stat = chi_square(observed, expected)
+    critical = CHI2_CRITICAL_001[len(expected) - 1]
+    ok = stat <= critical
+    print(f"{'OK  ' if ok else 'FAIL'} prizes   chi2={stat:8.3f} (critical {critical})")
+    for prize, exp in expected.items():
+        print(f"       {prize:>12}: observed {observed.get(prize, 0):>9} expected {exp:>11.1f}")
+    if not ok:
+        failures.append('prize frequencies')
+
+    # Segment choice is uniform among the segments showing the same prize
+    for prize in PRIZE_WEIGHTS:
+        segments = [i for i, p in enumerate(WHEEL_PRIZES) if p == prize]
+        if len(segments) < 2:
+            continue
+        hits = Counter(r['segment_index'] for r in results if r['prize'] == displays[prize])
+        prize_total = sum(hits.values())
+        stat = chi_square(hits, {segment: prize_total / len(segments) for segment in segments})
+        critical = CHI2_CRITICAL_001[len(segments) - 1]
+        ok = stat <= critical
+        print(f"{'OK  ' if ok else 'FAIL'} segments {displays[prize]:>12} chi2={stat:8.3f} (critical {critical}) {dict(hits)}")
+        if not ok:
+            failures.append(f'{prize} segments')
+
+    return failures
+
+
+if __name__ == '__main__':
+    draws = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 20240101
+    failures = check_distribution(draws, seed)
+    if failures:
+        print(f"\nDistribution check failed: {', '.join(failures)}")
+        sys.exit(1)
+    print("\nDrawn distribution matches PRIZE_WEIGHTS")
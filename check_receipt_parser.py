@@ -0,0 +1,66 @@
+"""
+Regression check and per-bank accuracy report for the receipt parser.
+Parses every fixture in receipt_fixtures.py with vision_api.parse_payment_details,
+prints field accuracy per bank (BML/MIB) against what a person reads off the
+receipt, and exits non-zero if any field differs from its recorded result
+(expected, or the known miss for fields the parser does not read yet).
+
+Usage: python check_receipt_parser.py [-v]
+"""
+import sys
+from collections import defaultdict
+
+from receipt_fixtures import PARSED_FIELDS, RECEIPT_FIXTURES
+from vision_api import parse_payment_details
+
+
+def check_receipt_parser(verbose=False):
+    """Print accuracy per bank and field and return the regressions as [(fixture, field, got, want)]"""
+    correct = defaultdict(lambda: defaultdict(int))
+    regressions = []
+    fixed = []
+
+    for fixture in RECEIPT_FIXTURES:
+        details = parse_payment_details(fixture['text'])
+        bank = fixture['bank'] or 'other'
+        known_misses = fixture.get('known_misses', {})
+
+        for field in PARSED_FIELDS:
+            got = details[field]
+            expected = fixture['expected'][field]
+            recorded = known_misses.get(field, expected)
+            correct[bank][field] += got == expected
+            if got != recorded:
+                if got == expected:
+                    fixed.append((fixture['name'], field))
+                else:
+                    regressions.append((fixture['name'], field, got, recorded))
+            elif verbose and got != expected:
+                print(f"MISS {fixture['name']}.{field}: got {got!r}, expected {expected!r}")
+
+    counts = defaultdict(int)
+    for fixture in RECEIPT_FIXTURES:
+        counts[fixture['bank'] or 'other'] += 1
+
+    print(f"{'bank':<6} {'receipts':>8} " + ' '.join(f"{field[:10]:>10}" for field in PARSED_FIELDS) + f" {'overall':>8}")
+    for bank in sorted(counts):
+        total = counts[bank]
+        per_field = [correct[bank][field] / total for field in PARSED_FIELDS]
+        print(f"{bank:<6} {total:>8} " + ' '.join(f"{score:>10.0%}" for score in per_field)
+              + f" {sum(per_field) / len(per_field):>8.1%}")
+
+    for name, field in fixed:
+        print(f"FIXED {name}.{field} now matches expected - drop it from known_misses")
+
+    return regressions
+
+
+if __name__ == '__main__':
+    regressions = check_receipt_parser(verbose='-v' in sys.argv[1:])
+    if regressions:
+        print()
+        for name, field, got, want in regressions:
+            print(f"FAIL {name}.{field}: got {got!r}, recorded {want!r}")
+        print(f"\n{len(regressions)} field(s) regressed")
+        sys.exit(1)
+    print("\nNo parser regressions")
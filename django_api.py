@@ -2,12 +2,22 @@
 Django API Wrapper for Telegram Bot
 Provides simple interface to interact with Django REST API
 Replaces direct Google Sheets access with fast database queries
+
+AsyncDjangoAPI is the native asyncio client used by the bot handlers.
+DjangoAPI is a blocking shim over it for Flask and one-off scripts.
 """
 
 import os
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import inspect
 import logging
-import requests
-from typing import Dict, List, Optional, Any
+import threading
+import time
+import httpx
+from typing import Dict, List, Optional, Any, AsyncIterator
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,19 +27,153 @@ logger = logging.getLogger(__name__)
 # Get Django API URL from environment or use default
 DJANGO_API_URL = os.getenv('DJANGO_API_URL', 'http://localhost:8000/api')
 
+# Connection pool for the shared keep-alive HTTP client
+API_TIMEOUT = float(os.getenv('DJANGO_API_TIMEOUT', '10'))
+API_MAX_CONNECTIONS = int(os.getenv('DJANGO_API_MAX_CONNECTIONS', '50'))
+API_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('DJANGO_API_MAX_KEEPALIVE_CONNECTIONS', '20'))
+
+# Optional per-ID cache for detail lookups (seconds, 0 disables)
+DETAIL_CACHE_TTL = float(os.getenv('DJANGO_API_DETAIL_CACHE_TTL', '0'))
+DETAIL_CACHE_MAX_ENTRIES = 1000
+
+# Rows per page when streaming list endpoints with iter_all
+ITER_PAGE_SIZE = int(os.getenv('DJANGO_API_ITER_PAGE_SIZE', '500'))
+
+# How long the admin set is trusted before it is reloaded (seconds, 0 disables)
+ADMIN_CACHE_TTL = float(os.getenv('DJANGO_API_ADMIN_CACHE_TTL', '60'))
+
+# Most spins process_spin accepts per request (SpinHistoryViewSet.MAX_SPINS_PER_REQUEST);
+# Spin All with more available spins is sent as several batches
+PROCESS_SPIN_MAX_BATCH = 100
+
+
+def spin_batch_key(idempotency_key: Optional[str], batch_index: int, batch_count: int) -> Optional[str]:
+    """
+    Idempotency key for one batch of a split process_spin call.
+    A single batch keeps the caller's key; otherwise each batch gets a stable
+    derived key (64 hex chars), so retrying the whole request replays the
+    batches that were already recorded and only sends the rest.
+    """
+    if not idempotency_key or batch_count == 1:
+        return idempotency_key
+    return hashlib.sha256(f"{idempotency_key}:{batch_index}".encode()).hexdigest()
+
+
+class AdminSetCache:
+    """
+    Process-wide set of active admin telegram IDs
+
+    Loaded with one request, reloaded once the TTL expires and dropped
+    immediately when an admin is added or removed through the API, so
+    is_admin is a set lookup on the hot path.
+    """
+
+    def __init__(self, ttl: float = ADMIN_CACHE_TTL):
+        self.ttl = ttl
+        self._admin_ids: Optional[frozenset] = None
+        self._expires_at = 0.0
+
+    async def contains(self, api: 'AsyncDjangoAPI', telegram_id: int) -> bool:
+        """Check membership, reloading the admin set through api when stale"""
+        if self._admin_ids is None or time.monotonic() >= self._expires_at:
+            try:
+                admins = await api._get_all_pages('admins/', {'fields': 'telegram_id,is_active'})
+            except Exception as e:
+                if self._admin_ids is None:
+                    raise
+                # Keep serving the last known set rather than locking admins out
+                logger.warning(f"Admin set refresh failed, using cached set: {e}")
+            else:
+                self._admin_ids = frozenset(
+                    int(admin['telegram_id']) for admin in admins if admin.get('is_active')
+                )
+                self._expires_at = time.monotonic() + self.ttl
+        return int(telegram_id) in self._admin_ids
+
+    def invalidate(self):
+        """Force a reload on the next check"""
+        self._admin_ids = None
+
+
+admin_cache = AdminSetCache()
+
+# How often the cached counter status is revalidated with the server (seconds, 0 disables)
+COUNTER_CACHE_TTL = float(os.getenv('DJANGO_API_COUNTER_CACHE_TTL', '30'))
 
-class DjangoAPI:
-    """Wrapper class for Django REST API endpoints"""
 
-    def __init__(self, base_url: str = DJANGO_API_URL):
+class CounterStateCache:
+    """
+    Process-wide copy of the CounterStatus singleton
+
+    Revalidated with a conditional GET (ETag) once the TTL expires and
+    replaced straight away by the toggle response, so gating user flows
+    on the counter costs no request. `version` is the row's updated_at.
+    """
+
+    def __init__(self, ttl: float = COUNTER_CACHE_TTL):
+        self.ttl = ttl
+        self._status: Optional[Dict] = None
+        self._etag: Optional[str] = None
+        self._expires_at = 0.0
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._status.get('updated_at') if self._status else None
+
+    async def get(self, api: 'AsyncDjangoAPI', fresh: bool = False) -> Dict:
+        """Return the counter status, revalidating through api when stale or fresh=True"""
+        if fresh or self._status is None or time.monotonic() >= self._expires_at:
+            headers = {'If-None-Match': self._etag} if self._etag and self._status else {}
+            response = await api.client.get(f'{api.base_url}/counter-status/current/', headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+                self._status = response.json()
+                self._etag = response.headers.get('ETag')
+            self._expires_at = time.monotonic() + self.ttl
+        return dict(self._status)
+
+    def update(self, status: Dict):
+        """Store a status returned by a write (e.g. toggle); the next poll refetches the ETag"""
+        self._status = dict(status)
+        self._etag = None
+        self._expires_at = time.monotonic() + self.ttl
+
+
+counter_cache = CounterStateCache()
+
+
+class AsyncDjangoAPI:
+    """Non-blocking wrapper class for Django REST API endpoints"""
+
+    def __init__(self, base_url: str = DJANGO_API_URL, detail_cache_ttl: float = DETAIL_CACHE_TTL):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self._client: Optional[httpx.AsyncClient] = None
+        self.detail_cache_ttl = detail_cache_ttl
+        self._detail_cache: Dict[tuple, tuple] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled keep-alive client, created lazily on the running event loop"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=API_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=API_MAX_CONNECTIONS,
+                    max_keepalive_connections=API_MAX_KEEPALIVE_CONNECTIONS
+                )
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close pooled connections (call on shutdown)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
-    def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+    async def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
         """Make GET request to API"""
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = await self.client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -39,130 +183,174 @@ class DjangoAPI:
                 raise ValueError(f"API returned null response for {endpoint}")
 
             return data
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"GET {url} failed: {e}, Response: {response.text if 'response' in locals() else 'N/A'}")
             raise
 
-    def _post(self, endpoint: str, data: Optional[Dict] = None) -> Any:
+    async def _post(self, endpoint: str, data: Optional[Dict] = None) -> Any:
         """Make POST request to API"""
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = self.session.post(url, json=data, timeout=10)
+            response = await self.client.post(url, json=data)
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"POST {url} failed: {e}, Response: {response.text if 'response' in locals() else 'N/A'}")
             raise
 
-    def _put(self, endpoint: str, data: Optional[Dict] = None) -> Any:
+    async def _put(self, endpoint: str, data: Optional[Dict] = None) -> Any:
         """Make PUT request to API"""
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = self.session.put(url, json=data, timeout=10)
+            response = await self.client.put(url, json=data)
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"PUT {url} failed: {e}, Response: {response.text if 'response' in locals() else 'N/A'}")
             raise
 
-    def _patch(self, endpoint: str, data: Optional[Dict] = None) -> Any:
+    async def _patch(self, endpoint: str, data: Optional[Dict] = None) -> Any:
         """Make PATCH request to API"""
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = self.session.patch(url, json=data, timeout=10)
+            response = await self.client.patch(url, json=data)
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"PATCH {url} failed: {e}, Response: {response.text if 'response' in locals() else 'N/A'}")
             raise
 
-    def _delete(self, endpoint: str) -> Any:
+    async def _delete(self, endpoint: str) -> Any:
         """Make DELETE request to API"""
         url = f"{self.base_url}/{endpoint}"
-        response = self.session.delete(url, timeout=10)
+        response = await self.client.delete(url)
         response.raise_for_status()
         return response.json() if response.text else {}
 
+    async def _get_detail(self, endpoint: str, obj_id: int) -> Optional[Dict]:
+        """GET a single record via its detail route (returns None if not found)"""
+        key = (endpoint, int(obj_id))
+        if self.detail_cache_ttl > 0:
+            cached = self._detail_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+        try:
+            data = await self._get(f'{endpoint}/{int(obj_id)}/')
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        if self.detail_cache_ttl > 0:
+            now = time.monotonic()
+            if len(self._detail_cache) >= DETAIL_CACHE_MAX_ENTRIES:
+                self._detail_cache = {k: v for k, v in self._detail_cache.items() if v[0] > now}
+            self._detail_cache[key] = (now + self.detail_cache_ttl, data)
+        return data
+
+    async def iter_all(self, endpoint: str, **filters) -> AsyncIterator[Dict]:
+        """
+        Stream every row of a list endpoint, holding one page in memory at a time
+
+        Asks for cursor pagination (keyset on created_at, id) and follows the `next`
+        links; endpoints without cursor support fall back to page numbers.
+
+        Args:
+            endpoint: List endpoint, e.g. 'deposits/'
+            **filters: Query parameters such as status='Pending' or fields='id,amount'
+        """
+        params = {'pagination': 'cursor', 'page_size': ITER_PAGE_SIZE, **filters}
+        while True:
+            response = await self._get(endpoint, params=params)
+            if isinstance(response, list):
+                for row in response:
+                    yield row
+                return
+            if not isinstance(response, dict):
+                return
+
+            for row in response.get('results', []):
+                yield row
+
+            next_url = response.get('next')
+            if not next_url:
+                return
+            # The next link carries the cursor/page plus every filter we sent
+            params = dict(httpx.URL(next_url).params)
+
+    async def _get_all_pages(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
+        """GET a list endpoint and follow pagination until every row is fetched"""
+        return [row async for row in self.iter_all(endpoint, **(params or {}))]
+
+    def _invalidate_detail(self, endpoint: str, obj_id: int):
+        """Drop a cached detail record after it has been modified"""
+        self._detail_cache.pop((endpoint, int(obj_id)), None)
+
     # ==================== USER METHODS ====================
 
-    def get_user_by_telegram_id(self, telegram_id: int) -> Optional[Dict]:
+    async def get_user_by_telegram_id(self, telegram_id: int) -> Optional[Dict]:
         """Get user by Telegram ID"""
         try:
-            return self._get(f'users/by_telegram_id/', params={'telegram_id': telegram_id})
-        except requests.exceptions.HTTPError as e:
+            return await self._get(f'users/by_telegram_id/', params={'telegram_id': telegram_id})
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
 
-    def create_user(self, telegram_id: int, username: str, pppoker_id: str = '') -> Dict:
+    async def create_user(self, telegram_id: int, username: str, pppoker_id: str = '') -> Dict:
         """Create or get user by Telegram ID"""
         data = {
             'telegram_id': telegram_id,
             'username': username,
             'pppoker_id': pppoker_id
         }
-        result = self._post('users/by_telegram_id/', data)
+        result = await self._post('users/by_telegram_id/', data)
         return result.get('user')
 
-    def get_or_create_user(self, telegram_id: int, username: str, pppoker_id: str = '') -> Dict:
+    async def get_or_create_user(self, telegram_id: int, username: str, pppoker_id: str = '') -> Dict:
         """Get existing user or create new one"""
-        return self.create_user(telegram_id, username, pppoker_id)
+        return await self.create_user(telegram_id, username, pppoker_id)
 
-    def create_or_update_user(self, telegram_id: int, username: str = None,
+    async def create_or_update_user(self, telegram_id: int, username: str = None,
                              first_name: str = None, last_name: str = None,
                              pppoker_id: str = '') -> Dict:
         """Create or update user with additional fields"""
         # Construct username from first_name and last_name if not provided
         if not username:
             username = f"{first_name or ''}{last_name or ''}".strip() or f"user_{telegram_id}"
-        return self.create_user(telegram_id, username, pppoker_id)
+        return await self.create_user(telegram_id, username, pppoker_id)
 
-    def update_user_balance(self, user_id: int, new_balance: float) -> Dict:
+    async def update_user_balance(self, user_id: int, new_balance: float) -> Dict:
         """Update user's balance"""
         data = {'balance': new_balance}
-        return self._put(f'users/{user_id}/', data)
+        return await self._put(f'users/{user_id}/', data)
 
-    def update_user_pppoker_id(self, user_id: int, pppoker_id: str) -> Dict:
+    async def update_user_pppoker_id(self, user_id: int, pppoker_id: str) -> Dict:
         """Update user's PPPoker ID"""
         data = {'pppoker_id': pppoker_id}
-        return self._patch(f'users/{user_id}/', data)
+        return await self._patch(f'users/{user_id}/', data)
 
-    def update_user_language(self, telegram_id: int, language: str) -> Dict:
+    async def update_user_language(self, telegram_id: int, language: str) -> Dict:
         """Update user's language preference"""
         try:
-            response = requests.patch(
-                f'{self.base_url}/users/{telegram_id}/update_language/',
-                json={'language': language},
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            return await self._patch(f'users/{telegram_id}/update_language/', {'language': language})
         except Exception as e:
             logger.error(f"Failed to update language for user {telegram_id}: {e}")
             raise
 
-    def get_all_users(self) -> List[Dict]:
-        """Get all users (handles pagination to fetch ALL pages)"""
-        all_users = []
-        page = 1
-        while True:
-            response = self._get('users/', params={'page': page, 'page_size': 1000})
-            if isinstance(response, dict) and 'results' in response:
-                all_users.extend(response['results'])
-                if not response.get('next'):
-                    break
-                page += 1
-            elif isinstance(response, list):
-                all_users.extend(response)
-                break
-            else:
-                break
-        return all_users
+    async def get_all_users(self, fields: Optional[str] = None) -> List[Dict]:
+        """
+        Get all users (handles pagination to fetch ALL pages)
+
+        Args:
+            fields: Optional comma-separated field list (e.g. 'telegram_id') to trim the response
+        """
+        return await self._get_all_pages('users/', {'fields': fields} if fields else None)
 
     # ==================== DEPOSIT METHODS ====================
 
-    def create_deposit(self, user_id: int, amount: float, method: str, account_name: str,
+    async def create_deposit(self, user_id: int, amount: float, method: str, account_name: str,
                       proof_image_path: str, pppoker_id: str) -> Dict:
         """Create new deposit request"""
         data = {
@@ -174,29 +362,31 @@ class DjangoAPI:
             'pppoker_id': pppoker_id,
             'status': 'Pending'
         }
-        return self._post('deposits/', data)
+        return await self._post('deposits/', data)
 
-    def get_pending_deposits(self) -> List[Dict]:
+    async def get_pending_deposits(self) -> List[Dict]:
         """Get all pending deposits"""
-        return self._get('deposits/pending/')
+        return await self._get('deposits/pending/')
 
-    def approve_deposit(self, deposit_id: int, admin_id: int, add_balance: bool = True) -> Dict:
+    async def approve_deposit(self, deposit_id: int, admin_id: int, add_balance: bool = True) -> Dict:
         """Approve a deposit"""
         data = {'admin_id': admin_id, 'add_balance': add_balance}
-        return self._post(f'deposits/{deposit_id}/approve/', data)
+        self._invalidate_detail('deposits', deposit_id)
+        return await self._post(f'deposits/{deposit_id}/approve/', data)
 
-    def reject_deposit(self, deposit_id: int, admin_id: int, reason: str = '') -> Dict:
+    async def reject_deposit(self, deposit_id: int, admin_id: int, reason: str = '') -> Dict:
         """Reject a deposit"""
         data = {'admin_id': admin_id, 'reason': reason}
-        return self._post(f'deposits/{deposit_id}/reject/', data)
+        self._invalidate_detail('deposits', deposit_id)
+        return await self._post(f'deposits/{deposit_id}/reject/', data)
 
-    def get_all_deposits(self) -> List[Dict]:
-        """Get all deposits"""
-        return self._get('deposits/')
+    async def get_all_deposits(self, fields: Optional[str] = None) -> List[Dict]:
+        """Get all deposits (fields: optional comma-separated projection, e.g. 'id,status,user_details.telegram_id')"""
+        return await self._get_all_pages('deposits/', {'fields': fields} if fields else None)
 
-    def get_user_deposits(self, telegram_id: int) -> List[Dict]:
+    async def get_user_deposits(self, telegram_id: int) -> List[Dict]:
         """Get all deposits for a specific user"""
-        response = self._get(f'deposits/?user={telegram_id}')
+        response = await self._get(f'deposits/?user={telegram_id}')
         # Handle paginated response
         if isinstance(response, dict) and 'results' in response:
             return response['results']
@@ -204,7 +394,7 @@ class DjangoAPI:
 
     # ==================== WITHDRAWAL METHODS ====================
 
-    def create_withdrawal(self, user_id: int, amount: float, method: str,
+    async def create_withdrawal(self, user_id: int, amount: float, method: str,
                          account_name: str, account_number: str, pppoker_id: str) -> Dict:
         """Create new withdrawal request"""
         data = {
@@ -216,57 +406,59 @@ class DjangoAPI:
             'pppoker_id': pppoker_id,
             'status': 'Pending'
         }
-        return self._post('withdrawals/', data)
+        return await self._post('withdrawals/', data)
 
-    def get_pending_withdrawals(self) -> List[Dict]:
+    async def get_pending_withdrawals(self) -> List[Dict]:
         """Get all pending withdrawals"""
-        return self._get('withdrawals/pending/')
+        return await self._get('withdrawals/pending/')
 
-    def approve_withdrawal(self, withdrawal_id: int, admin_id: int) -> Dict:
+    async def approve_withdrawal(self, withdrawal_id: int, admin_id: int) -> Dict:
         """Approve a withdrawal"""
         data = {'admin_id': admin_id}
-        return self._post(f'withdrawals/{withdrawal_id}/approve/', data)
+        self._invalidate_detail('withdrawals', withdrawal_id)
+        return await self._post(f'withdrawals/{withdrawal_id}/approve/', data)
 
-    def reject_withdrawal(self, withdrawal_id: int, admin_id: int, reason: str = '') -> Dict:
+    async def reject_withdrawal(self, withdrawal_id: int, admin_id: int, reason: str = '') -> Dict:
         """Reject a withdrawal"""
         data = {'admin_id': admin_id, 'reason': reason}
-        return self._post(f'withdrawals/{withdrawal_id}/reject/', data)
+        self._invalidate_detail('withdrawals', withdrawal_id)
+        return await self._post(f'withdrawals/{withdrawal_id}/reject/', data)
 
-    def get_all_withdrawals(self) -> List[Dict]:
+    async def get_all_withdrawals(self) -> List[Dict]:
         """Get all withdrawals"""
-        return self._get('withdrawals/')
+        return await self._get_all_pages('withdrawals/')
 
     # ==================== SPIN USER METHODS ====================
 
-    def get_or_create_spin_user(self, telegram_id: int) -> Dict:
+    async def get_or_create_spin_user(self, telegram_id: int) -> Dict:
         """Get or create spin user by Telegram ID"""
         data = {'telegram_id': telegram_id}
-        result = self._post('spin-users/by_telegram_id/', data)
+        result = await self._post('spin-users/by_telegram_id/', data)
         return result.get('spin_user')
 
-    def add_spins(self, spin_user_id: int, spins: int) -> Dict:
+    async def add_spins(self, spin_user_id: int, spins: int) -> Dict:
         """Add spins to user"""
         data = {'spins': spins}
-        return self._post(f'spin-users/{spin_user_id}/add_spins/', data)
+        return await self._post(f'spin-users/{spin_user_id}/add_spins/', data)
 
-    def get_spin_user(self, telegram_id: int) -> Optional[Dict]:
+    async def get_spin_user(self, telegram_id: int) -> Optional[Dict]:
         """Get spin user by telegram ID (returns None if not exists)"""
         try:
-            result = self._get(f'spin-users/by_telegram_id/', params={'telegram_id': telegram_id})
+            result = await self._get(f'spin-users/by_telegram_id/', params={'telegram_id': telegram_id})
             return result.get('spin_user')
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
 
-    def create_spin_user(self, user_id: int, username: str, available_spins: int = 0,
+    async def create_spin_user(self, user_id: int, username: str, available_spins: int = 0,
                         total_deposit: float = 0, pppoker_id: str = '') -> Dict:
         """Create new spin user (or get existing) and set initial values"""
         # First ensure the main user exists
-        self.get_or_create_user(user_id, username, pppoker_id)
+        await self.get_or_create_user(user_id, username, pppoker_id)
 
         # Get or create spin user
-        result = self._post('spin-users/by_telegram_id/', {'telegram_id': user_id})
+        result = await self._post('spin-users/by_telegram_id/', {'telegram_id': user_id})
         spin_user = result.get('spin_user')
 
         # Update with provided values using PUT
@@ -277,24 +469,24 @@ class DjangoAPI:
             'total_spins_used': spin_user.get('total_spins_used', 0),
             'total_chips_earned': spin_user.get('total_chips_earned', 0)
         }
-        return self._put(f'spin-users/{spin_user_id}/', updated_data)
+        return await self._put(f'spin-users/{spin_user_id}/', updated_data)
 
-    def update_spin_user(self, user_id: int, username: str = None, available_spins: int = None,
+    async def update_spin_user(self, user_id: int, username: str = None, available_spins: int = None,
                         total_deposit: float = None, pppoker_id: str = None,
                         total_chips_earned: int = None, total_spins_used: int = None) -> Dict:
         """Update existing spin user"""
         # Get the spin user first
-        result = self._post('spin-users/by_telegram_id/', {'telegram_id': user_id})
+        result = await self._post('spin-users/by_telegram_id/', {'telegram_id': user_id})
         spin_user = result.get('spin_user')
         spin_user_id = spin_user.get('id')
 
         # Update main user's pppoker_id if provided
         if pppoker_id is not None:
             try:
-                user = self.get_user_by_telegram_id(user_id)
+                user = await self.get_user_by_telegram_id(user_id)
                 if user and user.get('pppoker_id') != pppoker_id:
                     # Update main user's pppoker_id
-                    self.get_or_create_user(user_id, username or user.get('username'), pppoker_id)
+                    await self.get_or_create_user(user_id, username or user.get('username'), pppoker_id)
             except Exception as e:
                 logger.warning(f"Could not update pppoker_id for user {user_id}: {e}")
 
@@ -306,69 +498,100 @@ class DjangoAPI:
             'total_chips_earned': total_chips_earned if total_chips_earned is not None else spin_user.get('total_chips_earned', 0)
         }
 
-        return self._put(f'spin-users/{spin_user_id}/', update_data)
+        return await self._put(f'spin-users/{spin_user_id}/', update_data)
 
     # ==================== SPIN HISTORY METHODS ====================
 
-    def process_spin(self, telegram_id: int, results: List[Dict], username: str = None) -> Dict:
-        """Process one or more spins"""
+    async def process_spin(self, telegram_id: int, results: List[Dict], username: str = None,
+                           spin_count: int = None, idempotency_key: str = None) -> Dict:
+        """
+        Process one or more spins
+        spin_count defaults to len(results); pass it when results only lists the
+        spins that won something. With an idempotency_key, retrying the same batch
+        returns the first response (with 'replayed': True) instead of spinning again.
+        """
         data = {
             'telegram_id': telegram_id,
-            'spin_count': len(results),
+            'spin_count': spin_count if spin_count is not None else len(results),
             'results': results
         }
         if username:
             data['username'] = username
-        return self._post('spin-history/process_spin/', data)
+        if idempotency_key:
+            data['idempotency_key'] = idempotency_key
+        return await self._post('spin-history/process_spin/', data)
 
-    def get_pending_spin_rewards(self) -> List[Dict]:
-        """Get all pending spin rewards"""
-        return self._get('spin-history/pending/')
+    async def get_pending_spin_rewards(self, slim: bool = False) -> List[Dict]:
+        """Get all pending spin rewards (slim=True nests only a user summary)"""
+        return await self._get('spin-history/pending/', params={'slim': 'true'} if slim else None)
 
-    def approve_spin_reward(self, spin_id: int, admin_id: int) -> Dict:
+    async def approve_spin_reward(self, spin_id: int, admin_id: int) -> Dict:
         """Approve a spin reward"""
         data = {'admin_id': admin_id}
-        return self._post(f'spin-history/{spin_id}/approve/', data)
+        self._invalidate_detail('spin-history', spin_id)
+        return await self._post(f'spin-history/{spin_id}/approve/', data)
 
-    def update_spin_history(self, spin_id: int, **kwargs) -> Dict:
+    async def bulk_approve_spin_rewards(self, spin_ids: List[int], admin_id: int) -> Dict:
+        """
+        Approve several spin rewards in one request
+
+        Returns:
+            Dict with approved_count, approved_ids and total_chips (only
+            spins that were still pending are approved and counted)
+        """
+        for spin_id in spin_ids:
+            self._invalidate_detail('spin-history', spin_id)
+        return await self._post('spin-history/bulk_approve/', {'ids': spin_ids, 'admin_id': admin_id})
+
+    async def bulk_mark_spins_notified(self, spin_ids: List[int], notified_at: str = None) -> Dict:
+        """Mark several pending spins as notified in one request (notified_at defaults to now)"""
+        for spin_id in spin_ids:
+            self._invalidate_detail('spin-history', spin_id)
+        data = {'ids': spin_ids}
+        if notified_at:
+            data['notified_at'] = notified_at
+        return await self._post('spin-history/bulk_mark_notified/', data)
+
+    async def update_spin_history(self, spin_id: int, **kwargs) -> Dict:
         """Update a spin history record (e.g., notified_at)"""
+        self._invalidate_detail('spin-history', spin_id)
         # Use custom mark_notified endpoint for notified_at updates (more reliable)
         if 'notified_at' in kwargs and len(kwargs) == 1:
-            return self._post(f'spin-history/{spin_id}/mark_notified/', {'notified_at': kwargs['notified_at']})
+            return await self._post(f'spin-history/{spin_id}/mark_notified/', {'notified_at': kwargs['notified_at']})
         else:
             # Use PATCH for other updates
-            return self._patch(f'spin-history/{spin_id}/', kwargs)
+            return await self._patch(f'spin-history/{spin_id}/', kwargs)
 
-    def get_all_spin_history(self) -> List[Dict]:
-        """Get all spin history"""
-        return self._get('spin-history/')
+    async def get_all_spin_history(self, slim: bool = False) -> List[Dict]:
+        """Get all spin history (slim=True nests only a user summary)"""
+        return await self._get_all_pages('spin-history/', {'slim': 'true'} if slim else None)
 
-    def get_spin_statistics(self) -> Dict:
+    async def get_spin_statistics(self) -> Dict:
         """Get spin bot statistics (total users, spins, chips, etc.)"""
-        return self._get('spin-users/statistics/')
+        return await self._get('spin-users/statistics/')
 
     # ==================== JOIN REQUEST METHODS ====================
 
-    def create_join_request(self, user_id: int, pppoker_id: str) -> Dict:
+    async def create_join_request(self, user_id: int, pppoker_id: str) -> Dict:
         """Create new join request"""
         data = {
             'user': user_id,
             'pppoker_id': pppoker_id,
             'status': 'Pending'
         }
-        return self._post('join-requests/', data)
+        return await self._post('join-requests/', data)
 
-    def get_pending_join_requests(self) -> List[Dict]:
+    async def get_pending_join_requests(self) -> List[Dict]:
         """Get all pending join requests"""
-        return self._get('join-requests/pending/')
+        return await self._get('join-requests/pending/')
 
-    def get_all_join_requests(self) -> List[Dict]:
+    async def get_all_join_requests(self) -> List[Dict]:
         """Get all join requests"""
-        return self._get('join-requests/')
+        return await self._get_all_pages('join-requests/')
 
     # ==================== SEAT REQUEST METHODS ====================
 
-    def create_seat_request(self, user_id: int, amount: float, slip_image_path: str, pppoker_id: str) -> Dict:
+    async def create_seat_request(self, user_id: int, amount: float, slip_image_path: str, pppoker_id: str) -> Dict:
         """Create new seat request"""
         data = {
             'user': user_id,
@@ -377,39 +600,43 @@ class DjangoAPI:
             'pppoker_id': pppoker_id,
             'status': 'Pending'
         }
-        return self._post('seat-requests/', data)
+        return await self._post('seat-requests/', data)
 
-    def get_pending_seat_requests(self) -> List[Dict]:
+    async def get_pending_seat_requests(self) -> List[Dict]:
         """Get all pending seat requests"""
-        return self._get('seat-requests/pending/')
+        return await self._get('seat-requests/pending/')
 
-    def get_all_seat_requests(self) -> List[Dict]:
+    async def get_all_seat_requests(self) -> List[Dict]:
         """Get all seat requests"""
-        return self._get('seat-requests/')
+        return await self._get_all_pages('seat-requests/')
 
-    def approve_seat_request(self, seat_request_id: int, admin_id: int) -> Dict:
+    async def approve_seat_request(self, seat_request_id: int, admin_id: int) -> Dict:
         """Approve a seat request"""
         data = {'admin_id': admin_id}
-        return self._post(f'seat-requests/{seat_request_id}/approve/', data)
+        self._invalidate_detail('seat-requests', seat_request_id)
+        return await self._post(f'seat-requests/{seat_request_id}/approve/', data)
 
-    def reject_seat_request(self, seat_request_id: int, admin_id: int, reason: str = '') -> Dict:
+    async def reject_seat_request(self, seat_request_id: int, admin_id: int, reason: str = '') -> Dict:
         """Reject a seat request"""
         data = {'admin_id': admin_id, 'reason': reason}
-        return self._post(f'seat-requests/{seat_request_id}/reject/', data)
+        self._invalidate_detail('seat-requests', seat_request_id)
+        return await self._post(f'seat-requests/{seat_request_id}/reject/', data)
 
-    def settle_seat_request(self, seat_request_id: int, admin_id: int, payment_method: str = 'Seat Payment') -> Dict:
+    async def settle_seat_request(self, seat_request_id: int, admin_id: int, payment_method: str = 'Seat Payment') -> Dict:
         """Settle a seat request - creates deposit and marks as completed"""
         data = {'admin_id': admin_id, 'payment_method': payment_method}
-        return self._post(f'seat-requests/{seat_request_id}/settle/', data)
+        self._invalidate_detail('seat-requests', seat_request_id)
+        return await self._post(f'seat-requests/{seat_request_id}/settle/', data)
 
-    def update_seat_request_slip_details(self, seat_request_id: int, sender_account_name: str, payment_method: str = '') -> Dict:
+    async def update_seat_request_slip_details(self, seat_request_id: int, sender_account_name: str, payment_method: str = '') -> Dict:
         """Update seat request with slip details (sender name, payment method)"""
         data = {'sender_account_name': sender_account_name, 'payment_method': payment_method}
-        return self._patch(f'seat-requests/{seat_request_id}/', data)
+        self._invalidate_detail('seat-requests', seat_request_id)
+        return await self._patch(f'seat-requests/{seat_request_id}/', data)
 
     # ==================== CASHBACK REQUEST METHODS ====================
 
-    def create_cashback_request(self, user_id: int = None, username: str = None,
+    async def create_cashback_request(self, user_id: int = None, username: str = None,
                                pppoker_id: str = None, loss_amount: float = None,
                                cashback_amount: float = None, cashback_percentage: float = None,
                                promotion_id: int = None, week_start: str = None,
@@ -425,11 +652,11 @@ class DjangoAPI:
 
         # Get user database ID from telegram_id if provided
         if telegram_id and not user_id:
-            user_obj = self.get_or_create_user(telegram_id, username or str(telegram_id))
+            user_obj = await self.get_or_create_user(telegram_id, username or str(telegram_id))
             user_id = user_obj.get('id')
         elif user_id and not telegram_id:
             # Assume user_id is telegram_id in old format
-            user_obj = self.get_or_create_user(user_id, username or str(user_id))
+            user_obj = await self.get_or_create_user(user_id, username or str(user_id))
             user_id = user_obj.get('id')
 
         # Use today's date for legacy week fields (not actually weekly-based)
@@ -453,30 +680,30 @@ class DjangoAPI:
             'pppoker_id': pppoker_id or 'N/A',
             'status': 'Pending'
         }
-        return self._post('cashback-requests/', data)
+        return await self._post('cashback-requests/', data)
 
-    def get_pending_cashback_requests(self) -> List[Dict]:
+    async def get_pending_cashback_requests(self) -> List[Dict]:
         """Get all pending cashback requests"""
-        return self._get('cashback-requests/pending/')
+        return await self._get('cashback-requests/pending/')
 
-    def get_all_cashback_requests(self) -> List[Dict]:
+    async def get_all_cashback_requests(self) -> List[Dict]:
         """Get all cashback requests"""
-        return self._get('cashback-requests/')
+        return await self._get_all_pages('cashback-requests/')
 
-    def approve_cashback_request(self, request_id: int, approved_by: int) -> Dict:
+    async def approve_cashback_request(self, request_id: int, approved_by: int) -> Dict:
         """Approve a cashback request"""
         data = {'approved_by': approved_by}
-        return self._post(f'cashback-requests/{request_id}/approve/', data)
+        return await self._post(f'cashback-requests/{request_id}/approve/', data)
 
-    def reject_cashback_request(self, request_id: int, approved_by: int, rejection_reason: str = '') -> Dict:
+    async def reject_cashback_request(self, request_id: int, approved_by: int, rejection_reason: str = '') -> Dict:
         """Reject a cashback request"""
         data = {
             'approved_by': approved_by,
             'rejection_reason': rejection_reason
         }
-        return self._post(f'cashback-requests/{request_id}/reject/', data)
+        return await self._post(f'cashback-requests/{request_id}/reject/', data)
 
-    def check_cashback_eligibility(self, telegram_id: int, promotion_id: int = None,
+    async def check_cashback_eligibility(self, telegram_id: int, promotion_id: int = None,
                                    min_deposit: float = 500) -> Dict:
         """Check if user is eligible for cashback based on loss and minimum deposit"""
         try:
@@ -487,7 +714,7 @@ class DjangoAPI:
             if promotion_id:
                 params['promotion_id'] = promotion_id
 
-            result = self._get('cashback-requests/check_eligibility/', params=params)
+            result = await self._get('cashback-requests/check_eligibility/', params=params)
             return result
         except Exception as e:
             logger.error(f"Error checking cashback eligibility: {e}")
@@ -508,13 +735,13 @@ class DjangoAPI:
                 'already_claimed': False
             }
 
-    def record_cashback_bonus(self, telegram_id: int, promotion_id: int,
+    async def record_cashback_bonus(self, telegram_id: int, promotion_id: int,
                              cashback_request_id: int, loss_amount: float,
                              cashback_amount: float) -> bool:
         """Record that a user received a cashback bonus"""
         try:
             # Get user's database ID
-            user = self.get_or_create_user(telegram_id, str(telegram_id))
+            user = await self.get_or_create_user(telegram_id, str(telegram_id))
             user_id = user.get('id')
 
             data = {
@@ -525,7 +752,7 @@ class DjangoAPI:
                 'cashback_amount': cashback_amount,
                 'notes': f'Cashback bonus applied: {cashback_amount}'
             }
-            self._post('cashback-eligibility/', data)
+            await self._post('cashback-eligibility/', data)
             return True
         except Exception as e:
             logger.error(f"Error recording cashback bonus: {e}")
@@ -533,11 +760,11 @@ class DjangoAPI:
 
     # ==================== PAYMENT ACCOUNT METHODS ====================
 
-    def get_active_payment_accounts(self) -> List[Dict]:
+    async def get_active_payment_accounts(self) -> List[Dict]:
         """Get all active payment accounts"""
-        return self._get('payment-accounts/active/')
+        return await self._get('payment-accounts/active/')
 
-    def create_payment_account(self, method: str, account_name: str, account_number: str) -> Dict:
+    async def create_payment_account(self, method: str, account_name: str, account_number: str) -> Dict:
         """Create new payment account"""
         data = {
             'method': method,
@@ -545,13 +772,13 @@ class DjangoAPI:
             'account_number': account_number,
             'is_active': True
         }
-        return self._post('payment-accounts/', data)
+        return await self._post('payment-accounts/', data)
 
-    def update_payment_account(self, method: str, account_number: str, account_name: str = None) -> Dict:
+    async def update_payment_account(self, method: str, account_number: str, account_name: str = None) -> Dict:
         """Update or create payment account"""
         # First, try to get existing account by method
         try:
-            accounts = self.get_all_payment_accounts()
+            accounts = await self.get_all_payment_accounts()
             logger.info(f"Retrieved accounts: {accounts}, type: {type(accounts)}")
 
             # Handle case where accounts might be a string or error
@@ -572,46 +799,46 @@ class DjangoAPI:
                 # Update existing account
                 account_id = existing.get('id')
                 logger.info(f"Updating existing payment account {method} (ID: {account_id})")
-                return self._put(f'payment-accounts/{account_id}/', data)
+                return await self._put(f'payment-accounts/{account_id}/', data)
             else:
                 # Create new account
                 logger.info(f"Creating new payment account {method}")
-                return self._post('payment-accounts/', data)
+                return await self._post('payment-accounts/', data)
         except Exception as e:
             logger.error(f"Error updating payment account {method}: {e}", exc_info=True)
             raise  # Re-raise so bot can show error to admin
 
-    def get_all_payment_accounts(self) -> List[Dict]:
+    async def get_all_payment_accounts(self) -> List[Dict]:
         """Get all payment accounts"""
-        return self._get('payment-accounts/')
+        return await self._get('payment-accounts/')
 
-    def get_payment_account(self, account_id: int) -> Optional[Dict]:
+    async def get_payment_account(self, account_id: int) -> Optional[Dict]:
         """Get a single payment account by ID"""
         try:
-            return self._get(f'payment-accounts/{account_id}/')
-        except requests.exceptions.HTTPError as e:
+            return await self._get(f'payment-accounts/{account_id}/')
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 logger.warning(f"Payment account {account_id} not found")
                 return None
             raise
 
-    def update_payment_account(self, account_id: int, **kwargs) -> Dict:
+    async def update_payment_account(self, account_id: int, **kwargs) -> Dict:
         """Update a payment account by ID"""
-        return self._patch(f'payment-accounts/{account_id}/', kwargs)
+        return await self._patch(f'payment-accounts/{account_id}/', kwargs)
 
-    def delete_payment_account(self, account_id: int) -> bool:
+    async def delete_payment_account(self, account_id: int) -> bool:
         """Delete a payment account by ID (sets is_active=False)"""
         try:
-            self._patch(f'payment-accounts/{account_id}/', {'is_active': False})
+            await self._patch(f'payment-accounts/{account_id}/', {'is_active': False})
             return True
         except Exception as e:
             logger.error(f"Error deleting payment account: {e}")
             return False
 
-    def clear_payment_account(self, method: str) -> bool:
+    async def clear_payment_account(self, method: str) -> bool:
         """Deactivate a payment account by method"""
         try:
-            response = self.get_all_payment_accounts()
+            response = await self.get_all_payment_accounts()
 
             # Handle paginated response
             if isinstance(response, dict) and 'results' in response:
@@ -638,7 +865,7 @@ class DjangoAPI:
                 'is_active': False
             }
 
-            result = self._put(f'payment-accounts/{account_id}/', data)
+            result = await self._put(f'payment-accounts/{account_id}/', data)
             logger.info(f"Deactivated payment account {method} (ID: {account_id})")
             return True
         except Exception as e:
@@ -647,12 +874,14 @@ class DjangoAPI:
 
     # ==================== ADMIN METHODS ====================
 
-    def is_admin(self, telegram_id: int) -> bool:
-        """Check if telegram_id is an admin"""
-        result = self._get('admins/check/', params={'telegram_id': telegram_id})
+    async def is_admin(self, telegram_id: int) -> bool:
+        """Check if telegram_id is an admin (served from the shared admin cache)"""
+        if admin_cache.ttl > 0:
+            return await admin_cache.contains(self, telegram_id)
+        result = await self._get('admins/check/', params={'telegram_id': telegram_id})
         return result.get('is_admin', False)
 
-    def create_admin(self, telegram_id: int, username: str, role: str = 'Admin') -> Dict:
+    async def create_admin(self, telegram_id: int, username: str, role: str = 'Admin') -> Dict:
         """Create new admin"""
         data = {
             'telegram_id': telegram_id,
@@ -660,16 +889,19 @@ class DjangoAPI:
             'role': role,
             'is_active': True
         }
-        return self._post('admins/', data)
+        result = await self._post('admins/', data)
+        admin_cache.invalidate()
+        return result
 
-    def get_all_admins(self) -> List[Dict]:
+    async def get_all_admins(self) -> List[Dict]:
         """Get all admins"""
-        return self._get('admins/')
+        return await self._get('admins/')
 
-    def remove_admin(self, admin_id: int) -> bool:
+    async def remove_admin(self, admin_id: int) -> bool:
         """Remove/delete an admin by their database ID"""
         try:
-            self._delete(f'admins/{admin_id}/')
+            await self._delete(f'admins/{admin_id}/')
+            admin_cache.invalidate()
             return True
         except Exception as e:
             logger.error(f"Error removing admin {admin_id}: {e}")
@@ -677,19 +909,23 @@ class DjangoAPI:
 
     # ==================== COUNTER STATUS METHODS ====================
 
-    def get_counter_status(self) -> Dict:
-        """Get current counter status"""
-        return self._get('counter-status/current/')
+    async def get_counter_status(self, fresh: bool = False) -> Dict:
+        """Get current counter status (cached; fresh=True revalidates with the server first)"""
+        if counter_cache.ttl > 0:
+            return await counter_cache.get(self, fresh=fresh)
+        return await self._get('counter-status/current/')
 
-    def toggle_counter(self, admin_id: int) -> Dict:
+    async def toggle_counter(self, admin_id: int) -> Dict:
         """Toggle counter open/close"""
         data = {'admin_id': admin_id}
-        return self._post('counter-status/toggle/', data)
+        status = await self._post('counter-status/toggle/', data)
+        counter_cache.update(status)
+        return status
 
-    def is_counter_open(self) -> bool:
+    async def is_counter_open(self) -> bool:
         """Check if counter is currently open"""
         try:
-            status = self.get_counter_status()
+            status = await self.get_counter_status()
             return status.get('is_open', True)
         except Exception:
             # If API fails, assume counter is open
@@ -697,14 +933,14 @@ class DjangoAPI:
 
     # ==================== PROMO CODE METHODS ====================
 
-    def get_active_promo_codes(self, promo_type: str = None) -> List[Dict]:
+    async def get_active_promo_codes(self, promo_type: str = None) -> List[Dict]:
         """Get all active promo codes, optionally filtered by type"""
         params = {}
         if promo_type:
             params['promo_type'] = promo_type
-        return self._get('promo-codes/active/', params=params)
+        return await self._get('promo-codes/active/', params=params)
 
-    def create_promo_code(self, code: str, percentage: float, start_date: str, end_date: str,
+    async def create_promo_code(self, code: str, percentage: float, start_date: str, end_date: str,
                          promo_type: str = 'bonus') -> Dict:
         """Create new promo code"""
         data = {
@@ -715,34 +951,34 @@ class DjangoAPI:
             'end_date': end_date,
             'is_active': True
         }
-        return self._post('promo-codes/', data)
+        return await self._post('promo-codes/', data)
 
-    def get_all_promo_codes(self) -> List[Dict]:
+    async def get_all_promo_codes(self) -> List[Dict]:
         """Get all promo codes"""
-        return self._get('promo-codes/')
+        return await self._get('promo-codes/')
 
-    def deactivate_promotion(self, promotion_id: int) -> bool:
+    async def deactivate_promotion(self, promotion_id: int) -> bool:
         """Deactivate a promotion by setting is_active to False"""
         try:
-            self._patch(f'promo-codes/{promotion_id}/', {'is_active': False})
+            await self._patch(f'promo-codes/{promotion_id}/', {'is_active': False})
             return True
         except Exception as e:
             logger.error(f"Error deactivating promotion {promotion_id}: {e}")
             return False
 
-    def deactivate_cashback_promotion(self, promotion_id: int) -> bool:
+    async def deactivate_cashback_promotion(self, promotion_id: int) -> bool:
         """Deactivate a cashback promotion by setting is_active to False"""
         try:
-            self._patch(f'promo-codes/{promotion_id}/', {'is_active': False})
+            await self._patch(f'promo-codes/{promotion_id}/', {'is_active': False})
             return True
         except Exception as e:
             logger.error(f"Error deactivating cashback promotion {promotion_id}: {e}")
             return False
 
-    def check_user_promotion_eligibility(self, telegram_id: int, promotion_id: int) -> bool:
+    async def check_user_promotion_eligibility(self, telegram_id: int, promotion_id: int) -> bool:
         """Check if user is eligible for a promotion"""
         try:
-            result = self._get('promotion-eligibility/check_eligibility/', params={
+            result = await self._get('promotion-eligibility/check_eligibility/', params={
                 'telegram_id': telegram_id,
                 'promotion_id': promotion_id
             })
@@ -751,13 +987,13 @@ class DjangoAPI:
             logger.error(f"Error checking promotion eligibility: {e}")
             return False
 
-    def record_promotion_bonus(self, telegram_id: int, promotion_id: int,
+    async def record_promotion_bonus(self, telegram_id: int, promotion_id: int,
                               deposit_id: int, deposit_amount: float,
                               bonus_amount: float) -> bool:
         """Record that a user received a promotion bonus"""
         try:
             # Get user's database ID
-            user = self.get_or_create_user(telegram_id, str(telegram_id))
+            user = await self.get_or_create_user(telegram_id, str(telegram_id))
             user_id = user.get('id')
 
             data = {
@@ -768,7 +1004,7 @@ class DjangoAPI:
                 'bonus_amount': bonus_amount,
                 'notes': f'Promotion bonus applied: {bonus_amount}'
             }
-            self._post('promotion-eligibility/', data)
+            await self._post('promotion-eligibility/', data)
             return True
         except Exception as e:
             logger.error(f"Error recording promotion bonus: {e}")
@@ -776,7 +1012,7 @@ class DjangoAPI:
 
     # ==================== SUPPORT MESSAGE METHODS ====================
 
-    def create_support_message(self, user_id: int, message: str, is_from_user: bool = True,
+    async def create_support_message(self, user_id: int, message: str, is_from_user: bool = True,
                               replied_by: Optional[int] = None) -> Dict:
         """Create new support message"""
         data = {
@@ -785,15 +1021,15 @@ class DjangoAPI:
             'is_from_user': is_from_user,
             'replied_by': replied_by
         }
-        return self._post('support-messages/', data)
+        return await self._post('support-messages/', data)
 
-    def get_all_support_messages(self) -> List[Dict]:
+    async def get_all_support_messages(self) -> List[Dict]:
         """Get all support messages"""
-        return self._get('support-messages/')
+        return await self._get('support-messages/')
 
     # ==================== USER CREDIT METHODS ====================
 
-    def create_user_credit(self, user_id: int, amount: float, credit_type: str,
+    async def create_user_credit(self, user_id: int, amount: float, credit_type: str,
                           description: str, created_by: int) -> Dict:
         """Create new user credit record"""
         data = {
@@ -803,24 +1039,16 @@ class DjangoAPI:
             'description': description,
             'created_by': created_by
         }
-        return self._post('user-credits/', data)
+        return await self._post('user-credits/', data)
 
-    def get_all_user_credits(self) -> List[Dict]:
+    async def get_all_user_credits(self) -> List[Dict]:
         """Get all user credits"""
-        response = self._get('user-credits/')
-        # Handle paginated response
-        if isinstance(response, dict) and 'results' in response:
-            return response['results']
-        elif isinstance(response, list):
-            return response
-        else:
-            logger.error(f"Unexpected response format from user-credits: {type(response)}")
-            return []
+        return await self._get_all_pages('user-credits/')
 
-    def get_user_credit(self, telegram_id: int) -> Optional[Dict]:
+    async def get_user_credit(self, telegram_id: int) -> Optional[Dict]:
         """Get a specific user's active credit by telegram_id"""
         try:
-            response = self._get(f'user-credits/?user={telegram_id}')
+            response = await self._get(f'user-credits/?user={telegram_id}')
             # Handle paginated response
             if isinstance(response, dict) and 'results' in response:
                 credits = response['results']
@@ -835,10 +1063,10 @@ class DjangoAPI:
             logger.error(f"Error getting user credit for {telegram_id}: {e}")
             return None
 
-    def increment_credit_reminder(self, telegram_id: int) -> bool:
+    async def increment_credit_reminder(self, telegram_id: int) -> bool:
         """Increment the reminder count for a user's credit"""
         try:
-            credit = self.get_user_credit(telegram_id)
+            credit = await self.get_user_credit(telegram_id)
             if not credit:
                 return False
 
@@ -846,7 +1074,7 @@ class DjangoAPI:
             current_count = credit.get('reminder_count', 0)
 
             # Update the reminder count
-            self._patch(f'user-credits/{credit_id}/', {'reminder_count': current_count + 1})
+            await self._patch(f'user-credits/{credit_id}/', {'reminder_count': current_count + 1})
             return True
         except Exception as e:
             logger.error(f"Error incrementing reminder for {telegram_id}: {e}")
@@ -854,11 +1082,11 @@ class DjangoAPI:
 
     # ==================== EXCHANGE RATE METHODS ====================
 
-    def get_active_exchange_rates(self) -> List[Dict]:
+    async def get_active_exchange_rates(self) -> List[Dict]:
         """Get all active exchange rates"""
-        return self._get('exchange-rates/active/')
+        return await self._get('exchange-rates/active/')
 
-    def create_exchange_rate(self, currency_from: str, currency_to: str, rate: float) -> Dict:
+    async def create_exchange_rate(self, currency_from: str, currency_to: str, rate: float) -> Dict:
         """Create new exchange rate"""
         data = {
             'currency_from': currency_from,
@@ -866,21 +1094,21 @@ class DjangoAPI:
             'rate': rate,
             'is_active': True
         }
-        return self._post('exchange-rates/', data)
+        return await self._post('exchange-rates/', data)
 
-    def get_all_exchange_rates(self) -> List[Dict]:
+    async def get_all_exchange_rates(self) -> List[Dict]:
         """Get all exchange rates"""
-        return self._get('exchange-rates/')
+        return await self._get('exchange-rates/')
 
-    def update_exchange_rate(self, rate_id: int, rate: float) -> Dict:
+    async def update_exchange_rate(self, rate_id: int, rate: float) -> Dict:
         """Update an existing exchange rate"""
         data = {'rate': rate}
-        return self._patch(f'exchange-rates/{rate_id}/', data)
+        return await self._patch(f'exchange-rates/{rate_id}/', data)
 
-    def get_exchange_rate_by_currencies(self, currency_from: str, currency_to: str) -> Optional[Dict]:
+    async def get_exchange_rate_by_currencies(self, currency_from: str, currency_to: str) -> Optional[Dict]:
         """Get exchange rate by currency pair"""
         try:
-            all_rates = self.get_all_exchange_rates()
+            all_rates = await self.get_all_exchange_rates()
             for rate_obj in all_rates:
                 if (rate_obj.get('currency_from') == currency_from and
                     rate_obj.get('currency_to') == currency_to):
@@ -890,21 +1118,21 @@ class DjangoAPI:
             logger.error(f"Error getting exchange rate by currencies: {e}")
             return None
 
-    def set_exchange_rate(self, currency_from: str, currency_to: str, rate: float) -> Dict:
+    async def set_exchange_rate(self, currency_from: str, currency_to: str, rate: float) -> Dict:
         """Create or update exchange rate"""
-        existing = self.get_exchange_rate_by_currencies(currency_from, currency_to)
+        existing = await self.get_exchange_rate_by_currencies(currency_from, currency_to)
         if existing:
-            return self.update_exchange_rate(existing['id'], rate)
+            return await self.update_exchange_rate(existing['id'], rate)
         else:
-            return self.create_exchange_rate(currency_from, currency_to, rate)
+            return await self.create_exchange_rate(currency_from, currency_to, rate)
 
     # ==================== 50-50 INVESTMENT METHODS ====================
 
-    def get_active_investments(self) -> List[Dict]:
+    async def get_active_investments(self) -> List[Dict]:
         """Get all active investments"""
-        return self._get('investments/active/')
+        return await self._get('investments/active/')
 
-    def create_investment(self, pppoker_id: str, investment_amount: float, start_date: str,
+    async def create_investment(self, pppoker_id: str, investment_amount: float, start_date: str,
                          notes: str = '', user_id: int = None) -> Dict:
         """Create new 50-50 investment (for trusted players, may not be Telegram users)"""
         data = {
@@ -919,16 +1147,16 @@ class DjangoAPI:
         # Optional: link to Telegram user if provided
         if user_id:
             data['user'] = user_id
-        return self._post('investments/', data)
+        return await self._post('investments/', data)
 
-    def get_all_investments(self) -> List[Dict]:
+    async def get_all_investments(self) -> List[Dict]:
         """Get all investments"""
-        return self._get('investments/')
+        return await self._get_all_pages('investments/')
 
-    def mark_expired_investments_as_lost(self) -> int:
+    async def mark_expired_investments_as_lost(self) -> int:
         """Mark investments older than 24 hours as Lost"""
         try:
-            result = self._post('investments/mark_expired_as_lost/', {})
+            result = await self._post('investments/mark_expired_as_lost/', {})
             return result.get('marked_count', 0)
         except Exception as e:
             logger.error(f"Error marking expired investments: {e}")
@@ -936,22 +1164,22 @@ class DjangoAPI:
 
     # ==================== CLUB BALANCE METHODS ====================
 
-    def create_club_balance(self, user_id: int, balance: float, notes: str = '') -> Dict:
+    async def create_club_balance(self, user_id: int, balance: float, notes: str = '') -> Dict:
         """Create or update club balance"""
         data = {
             'user': user_id,
             'balance': balance,
             'notes': notes
         }
-        return self._post('club-balances/', data)
+        return await self._post('club-balances/', data)
 
-    def get_all_club_balances(self) -> List[Dict]:
+    async def get_all_club_balances(self) -> List[Dict]:
         """Get all club balances"""
-        return self._get('club-balances/')
+        return await self._get('club-balances/')
 
     # ==================== INVENTORY TRANSACTION METHODS ====================
 
-    def create_inventory_transaction(self, item_name: str, quantity: int, transaction_type: str,
+    async def create_inventory_transaction(self, item_name: str, quantity: int, transaction_type: str,
                                     price_per_unit: float, total_amount: float,
                                     created_by: int, notes: str = '') -> Dict:
         """Create new inventory transaction"""
@@ -964,15 +1192,163 @@ class DjangoAPI:
             'notes': notes,
             'created_by': created_by
         }
-        return self._post('inventory-transactions/', data)
+        return await self._post('inventory-transactions/', data)
 
-    def get_all_inventory_transactions(self) -> List[Dict]:
+    async def get_all_inventory_transactions(self) -> List[Dict]:
         """Get all inventory transactions"""
-        return self._get('inventory-transactions/')
+        return await self._get('inventory-transactions/')
+
+    # ==================== REPORT METHODS ====================
+
+    async def get_pnl_report(self, periods: Dict[str, tuple]) -> Dict[str, Dict]:
+        """
+        Get aggregated profit/loss totals for several periods in one request
+
+        Args:
+            periods: {period_name: (start_datetime, end_datetime)}
+
+        Returns:
+            Dict keyed by period name with deposits, withdrawals, spin_rewards,
+            spin_count, cashback, investments and credits totals
+        """
+        data = {
+            'periods': [
+                {'name': name, 'start': start.isoformat(), 'end': end.isoformat()}
+                for name, (start, end) in periods.items()
+            ]
+        }
+        return await self._post('reports/pnl/', data)
+
+    # ==================== SPIN NOTIFICATION OUTBOX METHODS ====================
+
+    async def get_pending_spin_notifications(self) -> List[Dict]:
+        """
+        Get undelivered spin notifications, oldest first
+
+        Returns:
+            List of outbox rows with user_telegram_id, username, pppoker_id,
+            spin_ids, spin_count and total_chips
+        """
+        response = await self._get('spin-notifications/pending/')
+        return response if isinstance(response, list) else []
+
+    async def ack_spin_notifications(self, notification_ids: List[int]) -> Dict:
+        """
+        Mark spin notifications as delivered (also sets notified_at on their spins)
+
+        Args:
+            notification_ids: Outbox row IDs that were sent to the admins
+
+        Returns:
+            Dict with delivered_count and marked_spins
+        """
+        return await self._post('spin-notifications/ack/', {'ids': notification_ids})
+
+    # ==================== RECEIPT REFERENCE METHODS ====================
+
+    async def check_receipt_reference(self, reference_number: str, telegram_id: int, source: str,
+                                      source_id: int = None, bank: str = None,
+                                      content_hash: str = None) -> Dict:
+        """
+        Record a receipt's reference number and check whether it was uploaded before
+
+        Args:
+            reference_number: Bank reference parsed from the receipt
+            telegram_id: Uploader's Telegram ID
+            source: 'deposit' or 'seat'
+            source_id: Deposit / seat request ID, if already created
+            bank: Bank parsed from the receipt
+            content_hash: Image content hash from vision_api
+
+        Returns:
+            {'duplicate': False} or {'duplicate': True, 'first_seen': {...}}
+        """
+        data = {
+            'reference_number': reference_number,
+            'telegram_id': telegram_id,
+            'source': source,
+            'source_id': source_id,
+            'bank': bank,
+            'content_hash': content_hash
+        }
+        return await self._post('receipt-references/check_in/', data)
+
+    # ==================== BROADCAST METHODS ====================
+
+    async def create_broadcast_job(self, message_type: str, content: Dict, recipient_ids: List[int],
+                                   admin_chat_id: int = None, progress_message_id: int = None) -> Dict:
+        """
+        Record a new broadcast before the bot starts sending it
+
+        Args:
+            message_type: 'text' or 'photo'
+            content: JSON-serializable content (text/photo, caption, parse_mode, reply_markup dict)
+            recipient_ids: Telegram IDs to send to, in send order
+            admin_chat_id: Chat that receives progress updates
+            progress_message_id: Message edited with live progress
+
+        Returns:
+            Dict containing the created broadcast job
+        """
+        data = {
+            'message_type': message_type,
+            'content': content,
+            'recipient_ids': recipient_ids,
+            'admin_chat_id': admin_chat_id,
+            'progress_message_id': progress_message_id
+        }
+        return await self._post('broadcasts/', data)
+
+    async def get_running_broadcasts(self) -> List[Dict]:
+        """Get broadcasts that have not finished (to resume after a restart), oldest first"""
+        response = await self._get('broadcasts/running/')
+        return response if isinstance(response, list) else []
+
+    async def save_broadcast_progress(self, job_id: int, next_index: int, success_count: int,
+                                      blocked_count: int, failed_count: int, completed: bool = False) -> Dict:
+        """
+        Save a broadcast's send progress
+
+        Args:
+            job_id: Broadcast job ID
+            next_index: Every recipient before this index has been handled
+            success_count, blocked_count, failed_count: Running totals
+            completed: Mark the broadcast finished
+
+        Returns:
+            Dict with id, next_index and status
+        """
+        data = {
+            'next_index': next_index,
+            'success_count': success_count,
+            'blocked_count': blocked_count,
+            'failed_count': failed_count,
+            'completed': completed
+        }
+        return await self._post(f'broadcasts/{job_id}/progress/', data)
+
+    async def get_broadcast_media(self, content_hash: str) -> Optional[str]:
+        """Get the Telegram file_id of media already uploaded with this content hash (None if never uploaded)"""
+        try:
+            media = await self._get('broadcast-media/by_hash/', params={'content_hash': content_hash})
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+        return media.get('file_id')
+
+    async def save_broadcast_media(self, content_hash: str, file_id: str, media_type: str = 'photo') -> Dict:
+        """Remember the Telegram file_id of uploaded media so later broadcasts reuse it"""
+        data = {
+            'content_hash': content_hash,
+            'file_id': file_id,
+            'media_type': media_type
+        }
+        return await self._post('broadcast-media/remember/', data)
 
     # ==================== NOTIFICATION MESSAGE METHODS ====================
 
-    def store_notification_message(self, notification_type: str, notification_key: str,
+    async def store_notification_message(self, notification_type: str, notification_key: str,
                                    admin_telegram_id: int, message_id: int) -> Dict:
         """
         Store a notification message ID for later button removal
@@ -992,9 +1368,9 @@ class DjangoAPI:
             'admin_telegram_id': admin_telegram_id,
             'message_id': message_id
         }
-        return self._post('notification-messages/', data)
+        return await self._post('notification-messages/', data)
 
-    def get_notification_messages(self, notification_key: str) -> List[Dict]:
+    async def get_notification_messages(self, notification_key: str) -> List[Dict]:
         """
         Get all notification messages for a given key
 
@@ -1004,10 +1380,10 @@ class DjangoAPI:
         Returns:
             List of notification message records with admin_telegram_id and message_id
         """
-        response = self._get(f'notification-messages/get_by_key/?notification_key={notification_key}')
+        response = await self._get(f'notification-messages/get_by_key/?notification_key={notification_key}')
         return response if isinstance(response, list) else []
 
-    def delete_notification_messages(self, notification_key: str) -> int:
+    async def delete_notification_messages(self, notification_key: str) -> int:
         """
         Delete all notification messages for a given key
 
@@ -1017,17 +1393,83 @@ class DjangoAPI:
         Returns:
             Number of messages deleted
         """
-        response = self._delete_with_body('notification-messages/delete_by_key/', {'notification_key': notification_key})
+        response = await self._delete_with_body('notification-messages/delete_by_key/', {'notification_key': notification_key})
         return response.get('deleted_count', 0)
 
-    def _delete_with_body(self, endpoint: str, data: Dict) -> Dict:
+    async def _delete_with_body(self, endpoint: str, data: Dict) -> Dict:
         """DELETE request with JSON body (not standard but Django REST supports it)"""
         url = f'{self.base_url}/{endpoint}'
-        headers = {'Content-Type': 'application/json'}
-        response = requests.delete(url, json=data, headers=headers, timeout=30)
+        response = await self.client.request('DELETE', url, json=data)
         response.raise_for_status()
         return response.json()
 
 
-# Create singleton instance
-api = DjangoAPI()
+# ==================== SYNC SHIM ====================
+
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Background event loop that serves every blocking shim call"""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(target=_sync_loop.run_forever, name='django-api-sync', daemon=True).start()
+    return _sync_loop
+
+
+def run_sync(coro) -> Any:
+    """Run an API coroutine to completion from synchronous code"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop()).result()
+
+
+def run_background(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the shim's event loop without waiting for it"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop())
+
+
+class SyncAPIShim:
+    """
+    Blocking facade over an async API class, for Flask views and scripts.
+
+    Every coroutine method of the wrapped instance is exposed as a plain
+    method (and async generators such as iter_all as plain generators); the
+    calls run on one private event loop so the pooled client is reused
+    across threads.
+    """
+
+    async_class = None
+
+    def __init__(self, *args, **kwargs):
+        self._async_api = self.async_class(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._async_api, name)
+        if inspect.isasyncgenfunction(attr):
+            @functools.wraps(attr)
+            def iterate(*args, **kwargs):
+                agen = attr(*args, **kwargs)
+                try:
+                    while True:
+                        try:
+                            yield run_sync(agen.__anext__())
+                        except StopAsyncIteration:
+                            return
+                finally:
+                    run_sync(agen.aclose())
+            return iterate
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            return run_sync(attr(*args, **kwargs))
+        return call
+
+
+class DjangoAPI(SyncAPIShim):
+    """Blocking wrapper class for Django REST API endpoints"""
+
+    async_class = AsyncDjangoAPI
@@ -0,0 +1,164 @@
+"""
+Shared state backends for the mini app (spin cooldowns, user cache, win notification batches).
+MemoryCache keeps everything in-process (bounded LRU + TTL, one worker);
+RedisCache shares it between workers and instances.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Entries kept by the in-memory backend before the least recently used are evicted
+MEMORY_CACHE_MAX_ENTRIES = int(os.getenv('MINI_APP_CACHE_MAX_ENTRIES', 10000))
+
+
+class CacheBackend:
+    """
+    Interface for the mini app's shared state.
+    Every key carries a TTL in seconds; values must be JSON-serializable.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for key, or None if missing/expired"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Store value under key for ttl seconds"""
+        raise NotImplementedError
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        """Store value only if key is absent; True if it was stored (atomic)"""
+        raise NotImplementedError
+
+    def incr(self, key: str, amount: int, ttl: float) -> int:
+        """Add amount to the integer at key (missing = 0), refresh its TTL and return the total"""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """Remove key if present"""
+        raise NotImplementedError
+
+    def pop(self, key: str) -> Optional[Any]:
+        """Remove key and return its value (atomic get + delete)"""
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-process backend with TTL expiry and LRU eviction"""
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def _get_live(self, key: str):
+        """Return the (expires_at, value) entry if it has not expired (caller holds the lock)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, value: Any, ttl: float):
+        """Insert or replace key, evicting the least recently used entries (caller holds the lock)"""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._get_live(key)
+            return entry[1] if entry else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._store(key, value, ttl)
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        with self._lock:
+            if self._get_live(key):
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    def incr(self, key: str, amount: int, ttl: float) -> int:
+        with self._lock:
+            entry = self._get_live(key)
+            total = (entry[1] if entry else 0) + amount
+            self._store(key, total, ttl)
+            return total
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._get_live(key)
+            if entry is None:
+                return None
+            del self._data[key]
+            return entry[1]
+
+
+class RedisCache(CacheBackend):
+    """Redis backend shared by every mini app worker (values stored as JSON)"""
+
+    def __init__(self, url: str, prefix: str = 'miniapp:'):
+        import redis
+
+        self.redis = redis.Redis.from_url(url, socket_timeout=2)
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    @staticmethod
+    def _ms(ttl: float) -> int:
+        return max(1, int(ttl * 1000))
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.redis.get(self._key(key))
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        self.redis.set(self._key(key), json.dumps(value), px=self._ms(ttl))
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        return bool(self.redis.set(self._key(key), json.dumps(value), px=self._ms(ttl), nx=True))
+
+    def incr(self, key: str, amount: int, ttl: float) -> int:
+        pipe = self.redis.pipeline()
+        pipe.incrby(self._key(key), amount)
+        pipe.pexpire(self._key(key), self._ms(ttl))
+        total, _ = pipe.execute()
+        return int(total)
+
+    def delete(self, key: str):
+        self.redis.delete(self._key(key))
+
+    def pop(self, key: str) -> Optional[Any]:
+        pipe = self.redis.pipeline()
+        pipe.get(self._key(key))
+        pipe.delete(self._key(key))
+        raw, _ = pipe.execute()
+        return json.loads(raw) if raw is not None else None
+
+
+def get_cache_backend() -> CacheBackend:
+    """RedisCache when REDIS_URL is set (required for more than one worker), else MemoryCache"""
+    redis_url = os.getenv('REDIS_URL')
+    if redis_url:
+        logger.info("✅ Mini app state shared via Redis")
+        return RedisCache(redis_url)
+    logger.info("📦 Mini app state kept in memory (single worker only)")
+    return MemoryCache()
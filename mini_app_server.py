@@ -9,14 +9,16 @@ import os
 import logging
 from dotenv import load_dotenv
 # DJANGO MIGRATION: Using Django API only (No Google Sheets)
-from django_api import DjangoAPI
+from django_api import DjangoAPI, run_background, PROCESS_SPIN_MAX_BATCH, spin_batch_key
+from spin_prizes import PRIZE_TABLE
+from mini_app_cache import get_cache_backend
 import pytz
 import asyncio
 from telegram import Bot
 from telegram.error import TelegramError
-import random
 import time
-from collections import defaultdict
+import uuid
+import httpx
 from datetime import datetime
 
 # Load environment variables
@@ -59,29 +61,31 @@ def get_managers():
     return api, bot
 
 
+# Cooldowns, user cache and notification batches (Redis when REDIS_URL is set)
+cache = get_cache_backend()
+
 # Rate limiting - max 1 spin per second per user
-user_last_spin = defaultdict(float)
 SPIN_COOLDOWN = 1.0  # seconds
 
 # Simple cache for user data (5 minute TTL for better performance during high load)
-user_data_cache = {}
-cache_timestamps = {}
 CACHE_TTL = 300  # seconds (5 minutes - increased for launch to reduce Sheets API calls)
 
 # Notification aggregator - collect wins over short time period for batch notifications
-pending_notifications = defaultdict(lambda: {'chips': 0, 'wins': [], 'timer': None, 'username': '', 'pppoker_id': ''})
 NOTIFICATION_DELAY = 3.0  # seconds - wait 3s to collect all wins before sending notification
+# Batch keys outlive the delay so a slow worker can still flush them
+NOTIFICATION_TTL = 60  # seconds
+
+# Idempotent spins - a retried request with the same key gets the first response back
+SPIN_RESPONSE_TTL = 600  # seconds
+PROCESS_SPIN_ATTEMPTS = 3  # Django calls per spin request (retries reuse the idempotency key)
 
 
 def get_cached_user_data(user_id):
     """Get user data from cache or fetch fresh"""
-    current_time = time.time()
-
-    # Check if cache is valid
-    if user_id in user_data_cache:
-        if current_time - cache_timestamps.get(user_id, 0) < CACHE_TTL:
-            logger.info(f"📦 Cache hit for user {user_id}")
-            return user_data_cache[user_id]
+    user_data = cache.get(f'user:{user_id}')
+    if user_data is not None:
+        logger.info(f"📦 Cache hit for user {user_id}")
+        return user_data
 
     # Fetch fresh data
     logger.info(f"🔄 Cache miss for user {user_id}, fetching from api")
@@ -90,18 +94,15 @@ def get_cached_user_data(user_id):
     user_data = api.get_or_create_spin_user(user_id)
 
     # Update cache
-    user_data_cache[user_id] = user_data
-    cache_timestamps[user_id] = current_time
+    if user_data:
+        cache.set(f'user:{user_id}', user_data, CACHE_TTL)
 
     return user_data
 
 
 def invalidate_user_cache(user_id):
     """Invalidate cache for a user after their data changes"""
-    if user_id in user_data_cache:
-        del user_data_cache[user_id]
-    if user_id in cache_timestamps:
-        del cache_timestamps[user_id]
+    cache.delete(f'user:{user_id}')
 
 
 async def notify_user_win(user_id: int, username: str, prize: str, chips: int):
@@ -118,57 +119,49 @@ async def notify_admin(user_id: int, username: str, prize: str, chips: int, pppo
     logger.info(f"✅ Admin notification will be sent in batch for {username} winning {prize}")
 
 
-def send_aggregated_notifications(user_id: int):
-    """Send combined notification for all wins accumulated in the time window"""
-    import threading
+def queue_win_notification(user_id: int, username: str, pppoker_id: str, chips: int):
+    """
+    Add chips to the user's pending notification and restart its delay timer
+    The latest win's token marks which flush (on whichever worker) sends the batch
+    """
+    total = cache.incr(f'notify:{user_id}:chips', chips, NOTIFICATION_TTL)
+    token = uuid.uuid4().hex
+    cache.set(f'notify:{user_id}:meta', {
+        'token': token,
+        'username': username,
+        'pppoker_id': pppoker_id
+    }, NOTIFICATION_TTL)
 
-    notification_data = pending_notifications[user_id]
-    total_chips = notification_data['chips']
-    username = notification_data['username']
-    pppoker_id = notification_data['pppoker_id']
+    run_background(send_aggregated_notifications(user_id, token))
+    logger.info(f"⏰ Notification timer set for {NOTIFICATION_DELAY}s (Total pending: {total} chips)")
 
-    if total_chips > 0:
-        logger.info(f"📬 Sending aggregated notification: {username} won {total_chips} chips total")
 
-        # Send notifications with proper async handling
-        try:
-            # Create a fresh event loop for each notification batch
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            async def send_all():
-                """Send all notifications together"""
-                try:
-                    await notify_user_win(user_id, username, f"{total_chips} Chips Total", total_chips)
-                    await notify_admin(user_id, username, f"{total_chips} Chips Total", total_chips, pppoker_id)
-                except Exception as e:
-                    logger.error(f"❌ Error in send_all: {e}")
-                    raise
-
-            try:
-                loop.run_until_complete(send_all())
-                logger.info(f"✅ Aggregated notifications sent successfully")
-            finally:
-                # Clean up all pending tasks before closing loop
-                pending_tasks = asyncio.all_tasks(loop)
-                for task in pending_tasks:
-                    task.cancel()
+async def send_aggregated_notifications(user_id: int, token: str):
+    """Send combined notification for all wins accumulated in the time window"""
+    await asyncio.sleep(NOTIFICATION_DELAY)
 
-                # Run loop one more time to allow cancellations to complete
-                loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
+    # A newer win restarted the timer - its flush will send the batch
+    meta = await asyncio.to_thread(cache.get, f'notify:{user_id}:meta')
+    if not meta or meta['token'] != token:
+        return
 
-                # Close the loop
-                loop.close()
+    # Clear pending notifications for this user (later wins start a new batch)
+    await asyncio.to_thread(cache.delete, f'notify:{user_id}:meta')
+    total_chips = await asyncio.to_thread(cache.pop, f'notify:{user_id}:chips') or 0
+    username = meta['username']
+    pppoker_id = meta['pppoker_id']
 
+    if total_chips > 0:
+        logger.info(f"📬 Sending aggregated notification: {username} won {total_chips} chips total")
+        try:
+            await notify_user_win(user_id, username, f"{total_chips} Chips Total", total_chips)
+            await notify_admin(user_id, username, f"{total_chips} Chips Total", total_chips, pppoker_id)
+            logger.info(f"✅ Aggregated notifications sent successfully")
         except Exception as e:
             logger.error(f"❌ Failed to send aggregated notifications: {e}")
             import traceback
             traceback.print_exc()
 
-    # Clear pending notifications for this user
-    if user_id in pending_notifications:
-        del pending_notifications[user_id]
-
 
 @app.route('/')
 def serve_mini_app():
@@ -213,6 +206,33 @@ def get_spins():
         return jsonify({'error': str(e)}), 500
 
 
+def record_spin_batch(api, user_id, batch, username, idempotency_key):
+    """
+    Send one batch to Django's process_spin, retrying dropped connections.
+    Returns None once every attempt failed in transport; an error response
+    from Django (httpx.HTTPStatusError) is raised to the caller untouched.
+    """
+    for attempt in range(1, PROCESS_SPIN_ATTEMPTS + 1):
+        try:
+            return api.process_spin(user_id, batch, username=username, idempotency_key=idempotency_key)
+        except httpx.TransportError as e:
+            # Timeout / dropped connection - the batch may or may not be recorded, the key makes retrying safe
+            logger.warning(f"⚠️ process_spin attempt {attempt} failed for user {username}: {e}")
+    logger.error(f"❌ Failed to process spins for user {username} after {PROCESS_SPIN_ATTEMPTS} attempts")
+    return None
+
+
+def django_error_message(error, default):
+    """The 'error' Django sent with a failed response, or default if it sent none"""
+    try:
+        body = error.response.json()
+    except ValueError:
+        return default
+    if isinstance(body, dict) and body.get('error'):
+        return str(body['error'])
+    return default
+
+
 @app.route('/api/spin', methods=['POST'])
 def spin():
     """Process spin - OPTIMIZED with rate limiting and caching"""
@@ -223,21 +243,30 @@ def spin():
 
         if not user_id:
             return jsonify({'error': 'Missing user_id'}), 400
-
-        # Rate limiting - prevent spam
+        if not isinstance(spin_count, int) or spin_count < 1:
+            return jsonify({'error': 'spin_count must be a positive integer'}), 400
+
+        idempotency_key = data.get('idempotency_key') or request.headers.get('Idempotency-Key')
+        if idempotency_key:
+            # Client retry of a spin we already answered
+            cached_response = cache.get(f'spin_response:{user_id}:{idempotency_key}')
+            if cached_response:
+                logger.info(f"↩️ Replaying spin response for user {user_id} (key {idempotency_key})")
+                return jsonify(cached_response)
+        else:
+            # Older clients send no key - still lets our own retries to Django be safe
+            idempotency_key = uuid.uuid4().hex
+
+        # Rate limiting - prevent spam (atomic, so two workers can't both let a spin through)
         current_time = time.time()
-        last_spin = user_last_spin.get(user_id, 0)
-
-        if current_time - last_spin < SPIN_COOLDOWN:
-            remaining = SPIN_COOLDOWN - (current_time - last_spin)
+        if not cache.add(f'cooldown:{user_id}', current_time, SPIN_COOLDOWN):
+            last_spin = cache.get(f'cooldown:{user_id}') or current_time
+            remaining = max(0.0, SPIN_COOLDOWN - (current_time - last_spin))
             return jsonify({
                 'success': False,
                 'message': f'Please wait {remaining:.1f}s before spinning again'
             }), 429
 
-        # Update last spin time
-        user_last_spin[user_id] = current_time
-
         api, _ = get_managers()
         # Use cached data for faster response
         user_data = get_cached_user_data(user_id)
@@ -273,125 +302,61 @@ def spin():
                 'message': f"You only have {available_spins} spin(s)!"
             }), 400
 
-        # WHEEL PRIZES - MUST match frontend exactly! (16 segments)
-        # NOTE: iPhone, MacBook, AirPods, Watch are DISPLAY ONLY - backend never selects them!
-        wheel_prizes = [
-            "500", "Try Again!", "50", "iPhone", "20", "Try Again!",
-            "100", "MacBook", "10", "Try Again!", "250", "AirPods",
-            "20", "Try Again!", "50", "Watch"
-        ]
-
-        # DEBUG: Log prize order
-        logger.info("📋 PRIZE ORDER (Backend):")
-        for idx, p in enumerate(wheel_prizes):
-            logger.info(f"  {idx}: {p}")
-
-        # PRIZE WEIGHTS - Optimized for 65% club profit margin
-        # Try Again: 82.489%, Win chips: 17.511%
-        # Average payout: 3.53 chips per spin
-        prize_weights = {
-            "Try Again!": 82489,  # 82.489% - Most spins lose
-            "10": 10000,          # 10.000% - Common small win
-            "20": 5000,           # 5.000% - Uncommon small win
-            "50": 2000,           # 2.000% - Rare medium win
-            "100": 500,           # 0.500% - Very rare good win
-            "250": 10,            # 0.010% - Extremely rare big win
-            "500": 1              # 0.001% - Legendary jackpot (1 in 100k)
-        }
-
-        results = []
+        # Draw every outcome (prize + wheel segment) in one call from the precomputed table
+        results = PRIZE_TABLE.draw(spin_count)
+        logger.info(f"🎲 Drew {spin_count} spin(s): {[r['segment_index'] for r in results]}")
 
-        for i in range(spin_count):
-            # Pick prize based on weights
-            prize = random.choices(
-                list(prize_weights.keys()),
-                weights=list(prize_weights.values()),
-                k=1
-            )[0]
-
-            # Find matching segment index
-            matching_indices = [i for i, p in enumerate(wheel_prizes) if p == prize]
-            segment_index = random.choice(matching_indices)
-
-            # Format prize display
-            if prize == "Try Again!":
-                prize_display = "Try Again!"
-                chips = 0
+        # Record ALL spins via the Django process_spin endpoint before answering
+        # This handles: creating spin history records, deducting spins, updating totals
+        # Spin All above the per-request cap goes out as several batches
+        batches = [results[i:i + PROCESS_SPIN_MAX_BATCH] for i in range(0, len(results), PROCESS_SPIN_MAX_BATCH)]
+        recorded_results = []
+        new_chips_won = 0  # Chips from batches recorded by this request (not replays)
+        replayed = False
+        for batch_index, batch in enumerate(batches):
+            batch_key = spin_batch_key(idempotency_key, batch_index, len(batches))
+            # Pass username to preserve it in database
+            try:
+                spin_response = record_spin_batch(api, user_id, batch, username, batch_key)
+            except httpx.HTTPStatusError as e:
+                invalidate_user_cache(user_id)
+                if e.response.status_code >= 500:
+                    raise
+                # Django refused the batch (e.g. not enough spins left) - pass its reason on
+                logger.warning(f"⚠️ process_spin rejected for user {username}: {e.response.status_code} {e.response.text}")
+                return jsonify({
+                    'success': False,
+                    'message': django_error_message(e, 'Could not record your spin')
+                }), 400
+            if spin_response is None:
+                invalidate_user_cache(user_id)
+                return jsonify({'success': False, 'message': 'Could not record your spin, please try again'}), 503
+
+            if spin_response.get('replayed', False):
+                # Django already recorded this batch on an earlier attempt - show what was recorded
+                replayed = True
+                batch = PRIZE_TABLE.results_for(spin_response.get('spins', []))
             else:
-                prize_display = f"{prize} Chips"
-                chips = int(prize)
+                new_chips_won += sum(r.get('chips', 0) for r in batch if r.get('chips', 0) > 0)
+            recorded_results.extend(batch)
 
-            logger.info(f"🎲 Spin {i+1}: prize={prize}, matching_indices={matching_indices}, chosen_segment={segment_index}")
-            logger.info(f"   wheel_prizes[{segment_index}] = {wheel_prizes[segment_index]}")
+        results = recorded_results
+        logger.info(f"✅ Processed {len(results)} spins via Django API for user {username} "
+                    f"in {len(batches)} batch(es){' (replayed)' if replayed else ''}")
 
-            results.append({
-                'prize': prize_display,
-                'segment_index': segment_index,
-                'chips': chips  # Store chips for notification later
-            })
-
-        # Log ALL spins to Django API using process_spin endpoint
-        # This handles: creating spin history records, deducting spins, updating totals
-        import threading
-
-        def log_all_spins():
-            try:
-                # Prepare results for Django API
-                spin_results = []
-                for result in results:
-                    spin_results.append({
-                        'prize': result['prize'],
-                        'chips': result['chips'],
-                        'segment_index': result['segment_index']
-                    })
-
-                # Send to Django API - handles everything in one call
-                # Pass username to preserve it in database
-                response = api.process_spin(user_id, spin_results, username=username)
-                logger.info(f"✅ Processed {len(spin_results)} spins via Django API for user {username}")
-
-            except Exception as e:
-                logger.error(f"❌ Failed to process spins: {e}")
-                import traceback
-                traceback.print_exc()
-
-        # Start logging thread (non-daemon so it completes)
-        log_thread = threading.Thread(target=log_all_spins)
-        log_thread.start()
-
-        # Wait for logging to complete (max 10 seconds)
-        log_thread.join(timeout=10.0)
-
-        # Calculate new values (Django API already updated these, but we need them for response)
-        new_available = available_spins - spin_count
+        # Django already updated these - use its balance rather than our cached copy
+        new_available = spin_response.get('available_spins', available_spins - spin_count)
         total_used = user_data.get('total_spins_used', 0) + spin_count
 
         # Invalidate cache so next request gets fresh data from Django
         invalidate_user_cache(user_id)
 
         # Aggregate notifications - collect wins over short time period for batch notifications
-        total_chips_won = sum(r.get('chips', 0) for r in results if isinstance(r, dict) and r.get('chips', 0) > 0)
+        if new_chips_won > 0:
+            logger.info(f"💰 Chips won this spin: {new_chips_won} - Adding to pending notifications")
 
-        if total_chips_won > 0:
-            logger.info(f"💰 Chips won this spin: {total_chips_won} - Adding to pending notifications")
-
-            # Add to pending notifications
-            import threading
-            notification_data = pending_notifications[user_id]
-            notification_data['chips'] += total_chips_won
-            notification_data['username'] = username
-            notification_data['pppoker_id'] = pppoker_id
-
-            # Cancel existing timer if any
-            if notification_data['timer'] is not None:
-                notification_data['timer'].cancel()
-
-            # Start new timer - will send notification after delay if no more wins
-            timer = threading.Timer(NOTIFICATION_DELAY, send_aggregated_notifications, args=[user_id])
-            timer.start()
-            notification_data['timer'] = timer
-
-            logger.info(f"⏰ Notification timer set for {NOTIFICATION_DELAY}s (Total pending: {notification_data['chips']} chips)")
+            # Add to pending notifications (flushed on the shared event loop)
+            queue_win_notification(user_id, username, pppoker_id, new_chips_won)
 
         # Build response
         response = {
@@ -407,6 +372,8 @@ def spin():
             response['display_prize'] = results[0]['prize']
             response['segment_index'] = results[0]['segment_index']
 
+        cache.set(f'spin_response:{user_id}:{idempotency_key}', response, SPIN_RESPONSE_TTL)
+
         logger.info(f"Spin successful: User {user_id} - {results}")
         return jsonify(response)
 
@@ -418,5 +385,6 @@ def spin():
 
 
 if __name__ == '__main__':
+    # Local development only - production runs under gunicorn (see start-spins.sh)
     port = int(os.getenv('PORT', os.getenv('MINI_APP_PORT', 5000)))
     app.run(host='0.0.0.0', port=port, debug=False)
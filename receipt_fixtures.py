@@ -0,0 +1,233 @@
+"""
+Synthetic BML/MIB receipt texts for the receipt parser check and benchmark.
+Each fixture is OCR output laid out like a real bank receipt (made-up names,
+accounts and references - no customer data) with the values a person reading
+the receipt would extract.
+
+known_misses records fields the parser currently gets wrong and what it returns
+instead: accuracy is scored against expected, regressions against expected with
+known_misses applied. Drop an entry once the parser reads that field correctly.
+"""
+
+PARSED_FIELDS = ['reference_number', 'sender_name', 'receiver_name', 'receiver_account_number',
+                 'amount', 'bank', 'currency']
+
+RECEIPT_FIXTURES = [
+    {
+        'name': 'bml_transfer_same_line',
+        'bank': 'BML',
+        'text': """Transaction receipt
+Status SUCCESS
+Message Transfer successful
+Reference BLAZ204417730581
+Transaction date 14/03/2025 21:05
+From AHMD.SHIFAU
+To BILLIONAIRES CLUB 7730000123456
+Amount MVR 500.00
+Purpose Transfer
+bankofmaldives.com.mv""",
+        'expected': {
+            'reference_number': 'BLAZ204417730581',
+            'sender_name': 'Ahmd.Shifau',
+            'receiver_name': 'Billionaires Club',
+            'receiver_account_number': '7730000123456',
+            'amount': 500.0,
+            'bank': 'BML',
+            'currency': 'MVR',
+        },
+        # Account on the "To" line itself, bank only named in the footer URL
+        'known_misses': {'receiver_account_number': None, 'bank': None},
+    },
+    {
+        'name': 'bml_transfer_split_lines',
+        'bank': 'BML',
+        'text': """BANK OF MALDIVES
+Transaction Receipt
+Status
+SUCCESS
+Reference
+BLAZ309912447210
+Transaction date
+02/04/2025 09:41
+From
+I.NASEER
+To
+BILLIONAIRES CLUB
+7730000123456
+Amount
+MVR 1,250.00
+Purpose
+Gaming top up""",
+        'expected': {
+            'reference_number': 'BLAZ309912447210',
+            'sender_name': 'I.Naseer',
+            'receiver_name': 'Billionaires Club',
+            'receiver_account_number': '7730000123456',
+            'amount': 1250.0,
+            'bank': 'BML',
+            'currency': 'MVR',
+        },
+    },
+    {
+        'name': 'bml_favourite_transfer',
+        'bank': 'BML',
+        'text': """11:42
+Transfer successful
+BML
+From AISHATH RIFA
+To M.ZAHIR 7701234567890
+Amount MVR 75.50
+Reference BLAZ118820094411
+Date 21/01/2025""",
+        'expected': {
+            'reference_number': 'BLAZ118820094411',
+            'sender_name': 'Aishath Rifa',
+            'receiver_name': 'M.Zahir',
+            'receiver_account_number': '7701234567890',
+            'amount': 75.5,
+            'bank': 'BML',
+            'currency': 'MVR',
+        },
+        'known_misses': {'receiver_account_number': None},
+    },
+    {
+        'name': 'bml_usd_transfer',
+        'bank': 'BML',
+        'text': """Bank of Maldives
+Status SUCCESS
+Reference BLAZ550012378845
+From HUSSAIN ALI
+To PP CLUB ACCOUNT 7730000998877
+Amount USD 40.00
+Remarks deposit""",
+        'expected': {
+            'reference_number': 'BLAZ550012378845',
+            'sender_name': 'Hussain Ali',
+            'receiver_name': 'Pp Club Account',
+            'receiver_account_number': '7730000998877',
+            'amount': 40.0,
+            'bank': 'BML',
+            'currency': 'USD',
+        },
+        # "Amount USD 40.00" - no amount pattern allows a currency between label and value
+        'known_misses': {'receiver_account_number': None, 'amount': None, 'currency': None},
+    },
+    {
+        'name': 'mib_labels_then_values',
+        'bank': 'MIB',
+        'text': """Maldives Islamic Bank
+Thank you. Your request has been submitted for processing.
+Reference #
+759383063
+Transaction Date
+15-03-2025 10:11
+From
+To
+Amount
+MOHAMED.RAMIZ
+BILLIONAIRES CLUB
+90103101325241000
+MVR 300.00
+Remarks
+poker""",
+        'expected': {
+            'reference_number': '759383063',
+            'sender_name': 'Mohamed.Ramiz',
+            'receiver_name': 'Billionaires Club',
+            'receiver_account_number': '90103101325241000',
+            'amount': 300.0,
+            'bank': 'MIB',
+            'currency': 'MVR',
+        },
+    },
+    {
+        'name': 'mib_name_next_line',
+        'bank': 'MIB',
+        'text': """MIB
+Funds Transfer
+Reference # 761204998
+From
+A.MIUSHAL
+To
+AHMED SHAH
+90103101399887000
+MVR 150.00
+Status Date 20-03-2025""",
+        'expected': {
+            'reference_number': '761204998',
+            'sender_name': 'A.Miushal',
+            'receiver_name': 'Ahmed Shah',
+            'receiver_account_number': '90103101399887000',
+            'amount': 150.0,
+            'bank': 'MIB',
+            'currency': 'MVR',
+        },
+    },
+    {
+        'name': 'mib_amount_first',
+        'bank': 'MIB',
+        'text': """Maldives Islamic Bank
+1,000.00 MVR
+Transaction successful
+Reference
+770045612
+From
+FATHIMATH NUHA
+To
+BILLIONAIRES CLUB
+90103101325241000""",
+        'expected': {
+            'reference_number': '770045612',
+            'sender_name': 'Fathimath Nuha',
+            'receiver_name': 'Billionaires Club',
+            'receiver_account_number': '90103101325241000',
+            'amount': 1000.0,
+            'bank': 'MIB',
+            'currency': 'MVR',
+        },
+    },
+    {
+        'name': 'mib_transaction_id',
+        'bank': 'MIB',
+        'text': """MIB faisanet
+Transaction ID: 880012345
+Amount: 2500
+From
+IBRAHIM.W
+To
+CLUB ACCT
+90103101325241000""",
+        'expected': {
+            'reference_number': '880012345',
+            'sender_name': 'Ibrahim.W',
+            'receiver_name': 'Club Acct',
+            'receiver_account_number': '90103101325241000',
+            'amount': 2500.0,
+            'bank': 'MIB',
+            'currency': 'MVR',
+        },
+    },
+    {
+        'name': 'unlabelled_reference',
+        'bank': None,
+        'text': """Payment
+45.00
+AB12CD34EF
+Thank you""",
+        'expected': {
+            'reference_number': 'AB12CD34EF',
+            'sender_name': None,
+            'receiver_name': None,
+            'receiver_account_number': None,
+            'amount': 45.0,
+            'bank': None,
+            'currency': 'MVR',
+        },
+    },
+    {
+        'name': 'empty_ocr_result',
+        'bank': None,
+        'text': "",
+        'expected': {field: None for field in PARSED_FIELDS},
+    },
+]
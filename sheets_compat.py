@@ -3,106 +3,52 @@ Compatibility layer for legacy Google Sheets API methods
 This provides backward compatibility for bot.py while using Django API
 """
 
-from django_api import DjangoAPI
+from django_api import AsyncDjangoAPI, SyncAPIShim
 from typing import Dict, List, Optional
 import logging
-import requests
 
 logger = logging.getLogger(__name__)
 
 
-class SheetsCompatAPI(DjangoAPI):
+class AsyncSheetsCompatAPI(AsyncDjangoAPI):
     """Extended Django API with legacy Sheets API compatibility methods"""
 
-    def _filter_by_date_range(self, records: List[Dict], start_date, end_date) -> List[Dict]:
-        """Helper to filter records by date range"""
-        try:
-            from datetime import datetime
-            import pytz
-            filtered = []
-
-            # Handle case where records is not a list of dicts
-            if not records or not isinstance(records, list):
-                logger.info(f"No records to filter (got {type(records)})")
-                return []
-
-            logger.info(f"Filtering {len(records)} records between {start_date} and {end_date}")
-
-            # Ensure start_date and end_date are timezone-aware
-            if start_date.tzinfo is None:
-                utc = pytz.UTC
-                start_date = utc.localize(start_date)
-            if end_date.tzinfo is None:
-                utc = pytz.UTC
-                end_date = utc.localize(end_date)
-
-            for record in records:
-                # Skip if record is not a dict
-                if not isinstance(record, dict):
-                    continue
-
-                created_at = record.get('created_at')
-                if created_at:
-                    # Parse datetime string
-                    if isinstance(created_at, str):
-                        # Parse the ISO format datetime
-                        if created_at.endswith('Z'):
-                            # UTC time with 'Z' suffix
-                            record_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                        elif '+' in created_at or created_at.count('-') > 2:
-                            # Already has timezone info
-                            record_date = datetime.fromisoformat(created_at)
-                        else:
-                            # No timezone info - assume UTC
-                            record_date = datetime.fromisoformat(created_at)
-                            record_date = pytz.UTC.localize(record_date)
-                    else:
-                        record_date = created_at
-                        # Make timezone-aware if needed
-                        if record_date.tzinfo is None:
-                            record_date = pytz.UTC.localize(record_date)
-
-                    # Ensure we're comparing apples to apples - convert both to UTC
-                    if record_date.tzinfo is None:
-                        record_date = pytz.UTC.localize(record_date)
-
-                    record_date_utc = record_date.astimezone(pytz.UTC)
-                    start_date_utc = start_date.astimezone(pytz.UTC)
-                    end_date_utc = end_date.astimezone(pytz.UTC)
-
-                    # Filter by date range (compare in UTC)
-                    if record_date_utc >= start_date_utc and record_date_utc <= end_date_utc:
-                        filtered.append(record)
-
-            logger.info(f"Filtered to {len(filtered)} records")
-            return filtered
-        except Exception as e:
-            logger.error(f"Error filtering by date: {e}")
-            return []  # Return empty list if filtering fails
+    async def _get_by_date_range(self, endpoint: str, start_date, end_date) -> List[Dict]:
+        """Fetch records created within [start_date, end_date], filtered by the database"""
+        params = {
+            'created_after': start_date.isoformat(),
+            'created_before': end_date.isoformat()
+        }
+        records = await self._get_all_pages(endpoint, params)
+        logger.info(f"Fetched {len(records)} {endpoint} records between {start_date} and {end_date}")
+        return records
 
     # ==================== LEGACY USER METHODS ====================
 
-    def get_user(self, telegram_id: int) -> Optional[Dict]:
+    async def get_user(self, telegram_id: int) -> Optional[Dict]:
         """Get user by Telegram ID (legacy method)"""
-        return self.get_user_by_telegram_id(telegram_id)
+        return await self.get_user_by_telegram_id(telegram_id)
 
-    def get_all_user_ids(self) -> List[int]:
+    async def get_all_user_ids(self) -> List[int]:
         """Get all user telegram IDs"""
         try:
-            users = self.get_all_users()
-            return [user.get('telegram_id') for user in users if user.get('telegram_id')]
+            return [
+                user['telegram_id']
+                async for user in self.iter_all('users/', fields='telegram_id')
+                if user.get('telegram_id')
+            ]
         except Exception as e:
             logger.error(f"Error getting user IDs: {e}")
             return []
 
-    def update_user_pppoker_id(self, telegram_id: int, pppoker_id: str) -> bool:
+    async def update_user_pppoker_id(self, telegram_id: int, pppoker_id: str) -> bool:
         """Update user's PPPoker ID"""
         try:
-            user = self.get_user_by_telegram_id(telegram_id)
+            user = await self.get_user_by_telegram_id(telegram_id)
             if user:
                 # Use the direct update endpoint
                 user_id = user.get('id')
-                super().update_user_pppoker_id(user_id, pppoker_id)
+                await super().update_user_pppoker_id(user_id, pppoker_id)
                 logger.info(f"✅ Updated PPPoker ID for user {telegram_id} (DB ID: {user_id}) to {pppoker_id}")
                 return True
             else:
@@ -112,26 +58,19 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error updating PPPoker ID: {e}")
             return False
 
-    def update_user_account_name(self, telegram_id: int, account_name: str) -> bool:
+    async def update_user_account_name(self, telegram_id: int, account_name: str) -> bool:
         """Update user's account name - placeholder"""
         # This might not be supported in Django API yet
         return True
 
-    def update_user_language(self, telegram_id: int, language: str) -> bool:
+    async def update_user_language(self, telegram_id: int, language: str) -> bool:
         """Update user's language preference"""
         try:
-            user = self.get_user_by_telegram_id(telegram_id)
+            user = await self.get_user_by_telegram_id(telegram_id)
             if user:
                 user_id = user.get('id')
                 # Call the Django API endpoint with proper user ID
-                import requests
-                response = requests.patch(
-                    f'{self.base_url}/users/{user_id}/',
-                    json={'language': language},
-                    headers=self.headers,
-                    timeout=30
-                )
-                response.raise_for_status()
+                await self._patch(f'users/{user_id}/', {'language': language})
                 logger.info(f"✅ Updated language for user {telegram_id} (DB ID: {user_id}) to {language}")
                 return True
             else:
@@ -143,151 +82,104 @@ class SheetsCompatAPI(DjangoAPI):
 
     # ==================== LEGACY DEPOSIT METHODS ====================
 
-    def create_deposit_request(self, telegram_id: int, amount: float, method: str,
+    async def create_deposit_request(self, telegram_id: int, amount: float, method: str,
                               account_name: str, proof_image_path: str, pppoker_id: str) -> Dict:
         """Create deposit request (legacy method)"""
-        user = self.get_or_create_user(telegram_id, str(telegram_id), pppoker_id)
+        user = await self.get_or_create_user(telegram_id, str(telegram_id), pppoker_id)
         user_id = user.get('id')
-        return self.create_deposit(user_id, amount, method, account_name, proof_image_path, pppoker_id)
+        return await self.create_deposit(user_id, amount, method, account_name, proof_image_path, pppoker_id)
 
-    def get_deposit_request(self, deposit_id: int) -> Optional[Dict]:
+    async def get_deposit_request(self, deposit_id: int) -> Optional[Dict]:
         """Get single deposit by ID"""
         try:
-            deposits_response = self.get_all_deposits()
-
-            # Handle paginated response from Django API
-            if isinstance(deposits_response, dict) and 'results' in deposits_response:
-                deposits = deposits_response['results']
-            else:
-                deposits = deposits_response
-
-            logger.info(f"Searching for deposit {deposit_id} in {len(deposits)} deposits")
-
-            for deposit in deposits:
-                if isinstance(deposit, dict) and deposit.get('id') == deposit_id:
-                    logger.info(f"Found deposit {deposit_id}")
-                    return deposit
-
-            logger.warning(f"Deposit {deposit_id} not found in {len(deposits)} deposits")
-            return None
+            deposit = await self._get_detail('deposits', deposit_id)
+            if deposit is None:
+                logger.warning(f"Deposit {deposit_id} not found")
+            return deposit
         except Exception as e:
             logger.error(f"Error getting deposit: {e}")
             import traceback
             logger.error(traceback.format_exc())
             return None
 
-    def update_deposit_status(self, deposit_id: int, status: str, admin_id: int = None) -> bool:
+    async def update_deposit_status(self, deposit_id: int, status: str, admin_id: int = None) -> bool:
         """Update deposit status"""
         try:
             if status.lower() == 'approved':
-                self.approve_deposit(deposit_id, admin_id or 0)
+                await self.approve_deposit(deposit_id, admin_id or 0)
             elif status.lower() == 'rejected':
-                self.reject_deposit(deposit_id, admin_id or 0)
+                await self.reject_deposit(deposit_id, admin_id or 0)
             return True
         except Exception as e:
             logger.error(f"Error updating deposit status: {e}")
             return False
 
-    def get_deposits_by_date_range(self, start_date, end_date) -> List[Dict]:
+    async def get_deposits_by_date_range(self, start_date, end_date) -> List[Dict]:
         """Get deposits within date range"""
         try:
-            all_deposits = self.get_all_deposits()
-            # Handle paginated response
-            if isinstance(all_deposits, dict) and 'results' in all_deposits:
-                all_deposits = all_deposits['results']
-            return self._filter_by_date_range(all_deposits, start_date, end_date)
+            return await self._get_by_date_range('deposits/', start_date, end_date)
         except Exception as e:
             logger.error(f"Error getting deposits by date: {e}")
             return []
 
     # ==================== LEGACY WITHDRAWAL METHODS ====================
 
-    def create_withdrawal_request(self, telegram_id: int, amount: float, method: str,
+    async def create_withdrawal_request(self, telegram_id: int, amount: float, method: str,
                                  account_name: str, account_number: str, pppoker_id: str) -> Dict:
         """Create withdrawal request (legacy method)"""
-        user = self.get_or_create_user(telegram_id, str(telegram_id), pppoker_id)
+        user = await self.get_or_create_user(telegram_id, str(telegram_id), pppoker_id)
         user_id = user.get('id')
-        return self.create_withdrawal(user_id, amount, method, account_name, account_number, pppoker_id)
+        return await self.create_withdrawal(user_id, amount, method, account_name, account_number, pppoker_id)
 
-    def get_withdrawal_request(self, withdrawal_id: int) -> Optional[Dict]:
+    async def get_withdrawal_request(self, withdrawal_id: int) -> Optional[Dict]:
         """Get single withdrawal by ID"""
         try:
-            withdrawals_response = self.get_all_withdrawals()
-
-            # Handle paginated response from Django API
-            if isinstance(withdrawals_response, dict) and 'results' in withdrawals_response:
-                withdrawals = withdrawals_response['results']
-            else:
-                withdrawals = withdrawals_response
-
-            logger.info(f"Searching for withdrawal {withdrawal_id} in {len(withdrawals)} withdrawals")
-
-            for withdrawal in withdrawals:
-                if isinstance(withdrawal, dict) and withdrawal.get('id') == withdrawal_id:
-                    logger.info(f"Found withdrawal {withdrawal_id}")
-                    return withdrawal
-
-            logger.warning(f"Withdrawal {withdrawal_id} not found in {len(withdrawals)} withdrawals")
-            return None
+            withdrawal = await self._get_detail('withdrawals', withdrawal_id)
+            if withdrawal is None:
+                logger.warning(f"Withdrawal {withdrawal_id} not found")
+            return withdrawal
         except Exception as e:
             logger.error(f"Error getting withdrawal: {e}")
             import traceback
             logger.error(traceback.format_exc())
             return None
 
-    def update_withdrawal_status(self, withdrawal_id: int, status: str, admin_id: int = None) -> bool:
+    async def update_withdrawal_status(self, withdrawal_id: int, status: str, admin_id: int = None) -> bool:
         """Update withdrawal status"""
         try:
             if status.lower() == 'approved':
-                self.approve_withdrawal(withdrawal_id, admin_id or 0)
+                await self.approve_withdrawal(withdrawal_id, admin_id or 0)
             elif status.lower() == 'rejected':
-                self.reject_withdrawal(withdrawal_id, admin_id or 0)
+                await self.reject_withdrawal(withdrawal_id, admin_id or 0)
             return True
         except Exception as e:
             logger.error(f"Error updating withdrawal status: {e}")
             return False
 
-    def get_withdrawals_by_date_range(self, start_date, end_date) -> List[Dict]:
+    async def get_withdrawals_by_date_range(self, start_date, end_date) -> List[Dict]:
         """Get withdrawals within date range"""
         try:
-            all_withdrawals = self.get_all_withdrawals()
-            # Handle paginated response
-            if isinstance(all_withdrawals, dict) and 'results' in all_withdrawals:
-                all_withdrawals = all_withdrawals['results']
-            return self._filter_by_date_range(all_withdrawals, start_date, end_date)
+            return await self._get_by_date_range('withdrawals/', start_date, end_date)
         except Exception as e:
             logger.error(f"Error getting withdrawals by date: {e}")
             return []
 
     # ==================== LEGACY JOIN REQUEST METHODS ====================
 
-    def get_join_request(self, request_id: int) -> Optional[Dict]:
+    async def get_join_request(self, request_id: int) -> Optional[Dict]:
         """Get single join request by ID"""
         try:
-            requests_response = self.get_all_join_requests()
-
-            # Handle paginated response from Django API
-            if isinstance(requests_response, dict) and 'results' in requests_response:
-                requests = requests_response['results']
-            else:
-                requests = requests_response
-
-            logger.info(f"Searching for join request {request_id} in {len(requests)} requests")
-
-            for req in requests:
-                if isinstance(req, dict) and req.get('id') == request_id:
-                    logger.info(f"Found join request {request_id}")
-                    return req
-
-            logger.warning(f"Join request {request_id} not found in {len(requests)} requests")
-            return None
+            join_request = await self._get_detail('join-requests', request_id)
+            if join_request is None:
+                logger.warning(f"Join request {request_id} not found")
+            return join_request
         except Exception as e:
             logger.error(f"Error getting join request: {e}")
             import traceback
             logger.error(traceback.format_exc())
             return None
 
-    def update_join_request_status(self, request_id: int, status: str, admin_id: int = 0) -> bool:
+    async def update_join_request_status(self, request_id: int, status: str, admin_id: int = 0) -> bool:
         """Update join request status"""
         try:
             data = {'status': status}
@@ -297,7 +189,8 @@ class SheetsCompatAPI(DjangoAPI):
                 elif status == 'Rejected':
                     data['rejected_by'] = admin_id
 
-            self._patch(f'join-requests/{request_id}/', data)
+            self._invalidate_detail('join-requests', request_id)
+            await self._patch(f'join-requests/{request_id}/', data)
             return True
         except Exception as e:
             logger.error(f"Error updating join request {request_id}: {e}")
@@ -305,62 +198,50 @@ class SheetsCompatAPI(DjangoAPI):
 
     # ==================== LEGACY SEAT REQUEST METHODS ====================
 
-    def get_all_seat_requests(self) -> List[Dict]:
+    async def get_all_seat_requests(self) -> List[Dict]:
         """Get all seat requests from Django API"""
-        return super().get_all_seat_requests()
+        return await super().get_all_seat_requests()
 
-    def get_seat_request(self, request_id) -> Optional[Dict]:
+    async def get_seat_request(self, request_id) -> Optional[Dict]:
         """Get single seat request by ID"""
         try:
-            # Convert to int if string
-            if isinstance(request_id, str):
-                request_id = int(request_id)
-
-            requests = self.get_all_seat_requests()
-            # Handle paginated response
-            if isinstance(requests, dict) and 'results' in requests:
-                requests = requests['results']
-
-            for req in requests:
-                if req.get('id') == request_id:
-                    return req
-            return None
+            return await self._get_detail('seat-requests', request_id)
         except Exception as e:
             logger.error(f"Error getting seat request: {e}")
             return None
 
-    def settle_seat_request(self, request_id: int, admin_id: int, payment_method: str = 'Seat Payment') -> bool:
+    async def settle_seat_request(self, request_id: int, admin_id: int, payment_method: str = 'Seat Payment') -> bool:
         """Settle seat request - creates deposit and marks as completed"""
         try:
             if isinstance(request_id, str):
                 request_id = int(request_id)
-            super().settle_seat_request(request_id, admin_id, payment_method)
+            await super().settle_seat_request(request_id, admin_id, payment_method)
             return True
         except Exception as e:
             logger.error(f"Error settling seat request: {e}")
             return False
 
-    def approve_seat_request(self, request_id: int, admin_id: int) -> bool:
+    async def approve_seat_request(self, request_id: int, admin_id: int) -> bool:
         """Approve seat request"""
         try:
             # Convert to int if string
             if isinstance(request_id, str):
                 request_id = int(request_id)
 
-            super().approve_seat_request(request_id, admin_id)
+            await super().approve_seat_request(request_id, admin_id)
             return True
         except Exception as e:
             logger.error(f"Error approving seat request: {e}")
             return False
 
-    def reject_seat_request(self, request_id: int, admin_id: int, reason: str = '') -> bool:
+    async def reject_seat_request(self, request_id: int, admin_id: int, reason: str = '') -> bool:
         """Reject seat request"""
         try:
             # Convert to int if string
             if isinstance(request_id, str):
                 request_id = int(request_id)
 
-            super().reject_seat_request(request_id, admin_id, reason)
+            await super().reject_seat_request(request_id, admin_id, reason)
             return True
         except Exception as e:
             logger.error(f"Error rejecting seat request: {e}")
@@ -368,18 +249,18 @@ class SheetsCompatAPI(DjangoAPI):
 
     # ==================== LEGACY CASHBACK METHODS ====================
 
-    def check_cashback_eligibility(self, telegram_id: int, promotion_id: int = None,
+    async def check_cashback_eligibility(self, telegram_id: int, promotion_id: int = None,
                                    week_start: str = None, week_end: str = None,
                                    min_deposit: float = 500) -> Dict:
         """Check if user is eligible for cashback based on loss and minimum deposit"""
         # Call parent class method (DjangoAPI)
-        return super().check_cashback_eligibility(telegram_id, promotion_id, min_deposit)
+        return await super().check_cashback_eligibility(telegram_id, promotion_id, min_deposit)
 
-    def get_user_pending_cashback(self, telegram_id: int) -> List[Dict]:
+    async def get_user_pending_cashback(self, telegram_id: int) -> List[Dict]:
         """Get user's pending cashback requests"""
         try:
-            all_cashback = self.get_pending_cashback_requests()
-            user = self.get_user_by_telegram_id(telegram_id)
+            all_cashback = await self.get_pending_cashback_requests()
+            user = await self.get_user_by_telegram_id(telegram_id)
             if user:
                 user_id = user.get('id')
                 return [cb for cb in all_cashback if cb.get('user') == user_id]
@@ -388,29 +269,25 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting pending cashback: {e}")
             return []
 
-    def approve_cashback_request(self, request_id: int, approved_by: int) -> Dict:
+    async def approve_cashback_request(self, request_id: int, approved_by: int) -> Dict:
         """Approve a cashback request - delegates to DjangoAPI"""
-        return super().approve_cashback_request(request_id, approved_by)
+        return await super().approve_cashback_request(request_id, approved_by)
 
-    def reject_cashback_request(self, request_id: int, approved_by: int, rejection_reason: str = '') -> Dict:
+    async def reject_cashback_request(self, request_id: int, approved_by: int, rejection_reason: str = '') -> Dict:
         """Reject a cashback request - delegates to DjangoAPI"""
-        return super().reject_cashback_request(request_id, approved_by, rejection_reason)
+        return await super().reject_cashback_request(request_id, approved_by, rejection_reason)
 
-    def get_cashback_by_date_range(self, start_date, end_date) -> List[Dict]:
+    async def get_cashback_by_date_range(self, start_date, end_date) -> List[Dict]:
         """Get cashback requests by date range"""
         try:
-            all_cashback = self.get_all_cashback_requests()
-            # Handle paginated response
-            if isinstance(all_cashback, dict) and 'results' in all_cashback:
-                all_cashback = all_cashback['results']
-            return self._filter_by_date_range(all_cashback, start_date, end_date)
+            return await self._get_by_date_range('cashback-requests/', start_date, end_date)
         except Exception as e:
             logger.error(f"Error getting cashback by date: {e}")
             return []
 
     # ==================== LEGACY PROMOTION METHODS ====================
 
-    def create_promotion(self, bonus_percentage: float = None, percentage: float = None,
+    async def create_promotion(self, bonus_percentage: float = None, percentage: float = None,
                         start_date: str = None, end_date: str = None,
                         code: str = None, admin_id: int = None) -> bool:
         """Create deposit bonus promotion - supports multiple parameter formats for backward compatibility"""
@@ -425,30 +302,30 @@ class SheetsCompatAPI(DjangoAPI):
                 from datetime import datetime
                 code = f"BONUS_{datetime.now().year}"
 
-            self.create_promo_code(code, promo_percentage, start_date, end_date, promo_type='bonus')
+            await self.create_promo_code(code, promo_percentage, start_date, end_date, promo_type='bonus')
             return True
         except Exception as e:
             logger.error(f"Error creating promotion: {e}")
             return False
 
-    def get_active_promotion(self) -> Optional[Dict]:
+    async def get_active_promotion(self) -> Optional[Dict]:
         """Get active deposit bonus promotion"""
         try:
-            promos = self.get_active_promo_codes(promo_type='bonus')
+            promos = await self.get_active_promo_codes(promo_type='bonus')
             return promos[0] if promos else None
         except Exception as e:
             logger.error(f"Error getting active promotion: {e}")
             return None
 
-    def check_user_promotion_eligibility(self, telegram_id: int, pppoker_id: str = None,
+    async def check_user_promotion_eligibility(self, telegram_id: int, pppoker_id: str = None,
                                         promotion_id: int = None) -> bool:
         """Check if user is eligible for promotion (hasn't received bonus from this promo yet)"""
         if not promotion_id:
             return True  # If no promotion_id provided, assume eligible
         # Call parent class method (DjangoAPI)
-        return super().check_user_promotion_eligibility(telegram_id, promotion_id)
+        return await super().check_user_promotion_eligibility(telegram_id, promotion_id)
 
-    def record_promotion_bonus(self, user_id: int = None, telegram_id: int = None,
+    async def record_promotion_bonus(self, user_id: int = None, telegram_id: int = None,
                               pppoker_id: str = None, promotion_id: int = None,
                               deposit_request_id: int = None, deposit_amount: float = None,
                               bonus_amount: float = None, amount: float = None,
@@ -464,7 +341,7 @@ class SheetsCompatAPI(DjangoAPI):
                 return False
 
             # Call parent class method (DjangoAPI)
-            return super().record_promotion_bonus(
+            return await super().record_promotion_bonus(
                 telegram_id=tid,
                 promotion_id=promotion_id,
                 deposit_id=deposit_request_id or 0,  # May be 0 if deposit not yet created
@@ -475,7 +352,7 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error recording promotion bonus: {e}")
             return False
 
-    def create_cashback_promotion(self, cashback_percentage: float = None, percentage: float = None,
+    async def create_cashback_promotion(self, cashback_percentage: float = None, percentage: float = None,
                                  start_date: str = None, end_date: str = None,
                                  code: str = None, admin_id: int = None) -> bool:
         """Create cashback promotion - supports multiple parameter formats for backward compatibility"""
@@ -490,25 +367,25 @@ class SheetsCompatAPI(DjangoAPI):
                 from datetime import datetime
                 code = f"CASHBACK_{datetime.now().year}"
 
-            self.create_promo_code(code, promo_percentage, start_date, end_date, promo_type='cashback')
+            await self.create_promo_code(code, promo_percentage, start_date, end_date, promo_type='cashback')
             return True
         except Exception as e:
             logger.error(f"Error creating cashback promotion: {e}")
             return False
 
-    def get_active_cashback_promotion(self) -> Optional[Dict]:
+    async def get_active_cashback_promotion(self) -> Optional[Dict]:
         """Get active cashback promotion"""
         try:
-            promos = self.get_active_promo_codes(promo_type='cashback')
+            promos = await self.get_active_promo_codes(promo_type='cashback')
             return promos[0] if promos else None
         except Exception as e:
             logger.error(f"Error getting active cashback promotion: {e}")
             return None
 
-    def get_all_promotions(self) -> List[Dict]:
+    async def get_all_promotions(self) -> List[Dict]:
         """Get all deposit bonus promotions"""
         try:
-            all_promos = self.get_all_promo_codes()
+            all_promos = await self.get_all_promo_codes()
             # Handle paginated response or direct list
             if isinstance(all_promos, dict) and 'results' in all_promos:
                 all_promos = all_promos['results']
@@ -520,10 +397,10 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting all promotions: {e}")
             return []
 
-    def get_all_cashback_promotions(self) -> List[Dict]:
+    async def get_all_cashback_promotions(self) -> List[Dict]:
         """Get all cashback promotions"""
         try:
-            all_promos = self.get_all_promo_codes()
+            all_promos = await self.get_all_promo_codes()
             # Handle paginated response or direct list
             if isinstance(all_promos, dict) and 'results' in all_promos:
                 all_promos = all_promos['results']
@@ -535,7 +412,7 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting all cashback promotions: {e}")
             return []
 
-    def get_bonuses_by_date_range(self, start_date, end_date) -> List[Dict]:
+    async def get_bonuses_by_date_range(self, start_date, end_date) -> List[Dict]:
         """Get bonuses by date range - bonuses are tracked via PromotionEligibility, not a separate table"""
         # Bonuses are given during deposit approval and tracked in PromotionEligibility
         # For stats purposes, we can return empty since bonus amounts are already included
@@ -544,7 +421,7 @@ class SheetsCompatAPI(DjangoAPI):
 
     # ==================== LEGACY PAYMENT ACCOUNT METHODS ====================
 
-    def get_payment_account(self, method_or_id) -> Optional[Dict]:
+    async def get_payment_account(self, method_or_id) -> Optional[Dict]:
         """
         Get payment account by method name (str) or account ID (int)
 
@@ -554,10 +431,10 @@ class SheetsCompatAPI(DjangoAPI):
         try:
             # If integer ID provided, call parent DjangoAPI method
             if isinstance(method_or_id, int):
-                return super().get_payment_account(method_or_id)
+                return await super().get_payment_account(method_or_id)
 
             # Otherwise treat as method name (legacy behavior)
-            accounts = self.get_active_payment_accounts()
+            accounts = await self.get_active_payment_accounts()
             for account in accounts:
                 if account.get('method', '').lower() == str(method_or_id).lower():
                     return account
@@ -566,21 +443,21 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting payment account: {e}")
             return None
 
-    def get_payment_account_details(self, method: str) -> Optional[str]:
+    async def get_payment_account_details(self, method: str) -> Optional[str]:
         """Get payment account number"""
-        account = self.get_payment_account(method)
+        account = await self.get_payment_account(method)
         return account.get('account_number') if account else None
 
-    def get_payment_account_holder(self, method: str) -> Optional[str]:
+    async def get_payment_account_holder(self, method: str) -> Optional[str]:
         """Get payment account holder name"""
-        account = self.get_payment_account(method)
+        account = await self.get_payment_account(method)
         return account.get('account_name') if account else None
 
-    def get_all_payment_accounts(self) -> Dict:
+    async def get_all_payment_accounts(self) -> Dict:
         """Get all payment accounts in legacy format (dict keyed by method)"""
         try:
             # Get response from Django API
-            response = super().get_all_payment_accounts()
+            response = await super().get_all_payment_accounts()
             logger.info(f"Raw response from Django API: {response}, type: {type(response)}")
 
             # Handle paginated response from Django REST framework
@@ -620,7 +497,7 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting all payment accounts: {e}", exc_info=True)
             return {}
 
-    def update_payment_account(self, method_or_id, account_number=None, account_name=None, **kwargs):
+    async def update_payment_account(self, method_or_id, account_number=None, account_name=None, **kwargs):
         """
         Update payment account - supports both legacy and new calling patterns
 
@@ -636,11 +513,11 @@ class SheetsCompatAPI(DjangoAPI):
                     kwargs['account_number'] = account_number
                 if account_name is not None:
                     kwargs['account_name'] = account_name
-                return super().update_payment_account(method_or_id, **kwargs)
+                return await super().update_payment_account(method_or_id, **kwargs)
 
             # Legacy pattern: method + account details as positional args
             # First, find the account ID for this method
-            account = self.get_payment_account(method_or_id)
+            account = await self.get_payment_account(method_or_id)
             if not account:
                 raise ValueError(f"Payment account not found for method: {method_or_id}")
 
@@ -656,27 +533,28 @@ class SheetsCompatAPI(DjangoAPI):
                 update_data['account_name'] = account_name
 
             # Call parent with ID and kwargs
-            return super().update_payment_account(account_id, **update_data)
+            return await super().update_payment_account(account_id, **update_data)
         except Exception as e:
             logger.error(f"Error updating payment account: {e}", exc_info=True)
             raise  # Re-raise so bot shows error to admin
 
-    def clear_payment_account(self, method: str) -> bool:
+    async def clear_payment_account(self, method: str) -> bool:
         """Deactivate a payment account - delegates to DjangoAPI"""
-        return super().clear_payment_account(method)
+        return await super().clear_payment_account(method)
 
     # ==================== LEGACY COUNTER STATUS METHODS ====================
 
-    def set_counter_status(self, status: str, admin_id: int = None, announcement_sent: bool = True) -> bool:
+    async def set_counter_status(self, status: str, admin_id: int = None, announcement_sent: bool = True) -> bool:
         """Set counter status"""
         try:
-            current = self.get_counter_status()
+            # Revalidate first - toggling from a stale state would flip it the wrong way
+            current = await self.get_counter_status(fresh=True)
             is_currently_open = current.get('is_open', True)
             target_open = status.lower() in ['open', 'opened', 'true', '1']
 
             # Only toggle if status is different
             if is_currently_open != target_open:
-                self.toggle_counter(admin_id or 0)
+                await self.toggle_counter(admin_id or 0)
             return True
         except Exception as e:
             logger.error(f"Error setting counter status: {e}")
@@ -684,11 +562,11 @@ class SheetsCompatAPI(DjangoAPI):
 
     # ==================== LEGACY SPIN METHODS ====================
 
-    def update_spin_user(self, telegram_id: int, **kwargs) -> bool:
+    async def update_spin_user(self, telegram_id: int, **kwargs) -> bool:
         """Update spin user with new data"""
         try:
             # Get the user's database ID first
-            user = self.get_or_create_user(telegram_id, kwargs.get('username', 'User'))
+            user = await self.get_or_create_user(telegram_id, kwargs.get('username', 'User'))
             if not user:
                 logger.error(f"Failed to get user for telegram_id {telegram_id}")
                 return False
@@ -709,7 +587,7 @@ class SheetsCompatAPI(DjangoAPI):
                 return False
 
             # Get existing spin user
-            spin_user = self.get_spin_user(telegram_id)
+            spin_user = await self.get_spin_user(telegram_id)
             if not spin_user:
                 logger.error(f"Spin user not found for telegram_id {telegram_id}")
                 return False
@@ -717,90 +595,65 @@ class SheetsCompatAPI(DjangoAPI):
             spin_user_id = spin_user['id']
 
             # Update via Django API
-            response = requests.patch(
-                f"{self.base_url}/spin-users/{spin_user_id}/",
-                json=update_data,
-                timeout=10
-            )
-
-            if response.status_code in [200, 204]:
-                logger.info(f"Successfully updated spin user {telegram_id}: {update_data}")
-                return True
-            else:
-                logger.error(f"Failed to update spin user: {response.status_code} - {response.text}")
-                return False
+            await self._patch(f'spin-users/{spin_user_id}/', update_data)
+            logger.info(f"Successfully updated spin user {telegram_id}: {update_data}")
+            return True
 
         except Exception as e:
             logger.error(f"Error updating spin user: {e}")
             return False
 
-    def get_spin_by_id(self, spin_id: int) -> Optional[Dict]:
+    async def get_spin_by_id(self, spin_id: int) -> Optional[Dict]:
         """Get spin by ID"""
         try:
-            history = self.get_all_spin_history()
-            for spin in history:
-                if spin.get('id') == spin_id:
-                    return spin
-            return None
+            return await self._get_detail('spin-history', spin_id)
         except Exception as e:
             logger.error(f"Error getting spin: {e}")
             return None
 
-    def get_spins_by_date_range(self, start_date, end_date) -> List[Dict]:
+    async def get_spins_by_date_range(self, start_date, end_date) -> List[Dict]:
         """Get spins by date range"""
         try:
-            all_spins = self.get_all_spin_history()
-            # Handle paginated response
-            if isinstance(all_spins, dict) and 'results' in all_spins:
-                all_spins = all_spins['results']
-            return self._filter_by_date_range(all_spins, start_date, end_date)
+            return await self._get_by_date_range('spin-history/', start_date, end_date)
         except Exception as e:
             logger.error(f"Error getting spins by date: {e}")
             return []
 
-    def get_investments_by_date_range(self, start_date, end_date) -> List[Dict]:
+    async def get_investments_by_date_range(self, start_date, end_date) -> List[Dict]:
         """Get 50/50 investments by date range"""
         try:
-            all_investments = self.get_all_investments()
-            # Handle paginated response
-            if isinstance(all_investments, dict) and 'results' in all_investments:
-                all_investments = all_investments['results']
-            return self._filter_by_date_range(all_investments, start_date, end_date)
+            return await self._get_by_date_range('investments/', start_date, end_date)
         except Exception as e:
             logger.error(f"Error getting investments by date: {e}")
             return []
 
-    def get_credits_by_date_range(self, start_date, end_date) -> List[Dict]:
+    async def get_credits_by_date_range(self, start_date, end_date) -> List[Dict]:
         """Get user credits by date range"""
         try:
-            all_credits = self.get_all_user_credits()
-            # Handle paginated response
-            if isinstance(all_credits, dict) and 'results' in all_credits:
-                all_credits = all_credits['results']
-            return self._filter_by_date_range(all_credits, start_date, end_date)
+            return await self._get_by_date_range('user-credits/', start_date, end_date)
         except Exception as e:
             logger.error(f"Error getting credits by date: {e}")
             return []
 
     # ==================== LEGACY ADMIN METHODS ====================
 
-    def add_admin(self, telegram_id: int, username: str, name: str = '', added_by: int = None) -> bool:
+    async def add_admin(self, telegram_id: int, username: str, name: str = '', added_by: int = None) -> bool:
         """Add admin"""
         try:
             # Use username or construct from name if username is empty
             display_username = username if username else name or f"user_{telegram_id}"
-            self.create_admin(telegram_id, display_username)
+            await self.create_admin(telegram_id, display_username)
             logger.info(f"✅ Added admin {telegram_id} (@{display_username}) by {added_by}")
             return True
         except Exception as e:
             logger.error(f"Error adding admin: {e}")
             return False
 
-    def remove_admin(self, telegram_id: int) -> bool:
+    async def remove_admin(self, telegram_id: int) -> bool:
         """Remove admin by telegram_id"""
         try:
             # Get all admins and find the one with this telegram_id
-            admins = self.get_all_admins()
+            admins = await self.get_all_admins()
 
             # Handle paginated response
             if isinstance(admins, dict) and 'results' in admins:
@@ -818,7 +671,7 @@ class SheetsCompatAPI(DjangoAPI):
 
             # Remove admin using their database ID
             admin_id = admin_to_remove.get('id')
-            success = super().remove_admin(admin_id)
+            success = await super().remove_admin(admin_id)
 
             if success:
                 logger.info(f"✅ Removed admin {telegram_id} (DB ID: {admin_id})")
@@ -830,7 +683,7 @@ class SheetsCompatAPI(DjangoAPI):
 
     # ==================== LEGACY USER CREDIT METHODS ====================
 
-    def add_user_credit(self, telegram_id: int, username_or_amount, pppoker_id_or_credit_type,
+    async def add_user_credit(self, telegram_id: int, username_or_amount, pppoker_id_or_credit_type,
                        amount_or_description, request_id_or_created_by) -> bool:
         """Add user credit - supports both old and new signatures for backward compatibility"""
         try:
@@ -843,13 +696,13 @@ class SheetsCompatAPI(DjangoAPI):
                 amount = amount_or_description
                 request_id = request_id_or_created_by
 
-                user = self.get_or_create_user(telegram_id, username)
+                user = await self.get_or_create_user(telegram_id, username)
                 user_id = user.get('id')
 
                 # Update user's PPPoker ID if provided
                 if pppoker_id and pppoker_id != 'N/A':
                     try:
-                        self._patch(f'users/{user_id}/', {'pppoker_id': pppoker_id})
+                        await self._patch(f'users/{user_id}/', {'pppoker_id': pppoker_id})
                         logger.info(f"Updated user {telegram_id} PPPoker ID to {pppoker_id}")
                     except Exception as e:
                         logger.error(f"Failed to update user PPPoker ID: {e}")
@@ -858,7 +711,7 @@ class SheetsCompatAPI(DjangoAPI):
                 description = f"Seat request {request_id} for PPPoker ID {pppoker_id}"
                 created_by = 0  # System created
 
-                self.create_user_credit(user_id, amount, credit_type, description, created_by)
+                await self.create_user_credit(user_id, amount, credit_type, description, created_by)
                 return True
             else:
                 # New signature: (telegram_id, amount, credit_type, description, created_by)
@@ -867,19 +720,19 @@ class SheetsCompatAPI(DjangoAPI):
                 description = amount_or_description
                 created_by = request_id_or_created_by
 
-                user = self.get_or_create_user(telegram_id, str(telegram_id))
+                user = await self.get_or_create_user(telegram_id, str(telegram_id))
                 user_id = user.get('id')
-                self.create_user_credit(user_id, amount, credit_type, description, created_by)
+                await self.create_user_credit(user_id, amount, credit_type, description, created_by)
                 return True
         except Exception as e:
             logger.error(f"Error adding user credit: {e}")
             return False
 
-    def get_user_credit(self, telegram_id: int):
+    async def get_user_credit(self, telegram_id: int):
         """Get user's active credit by telegram_id"""
         # SheetsCompatAPI extends DjangoAPI, so we can call parent method directly
         try:
-            response = self._get(f'user-credits/?user={telegram_id}')
+            response = await self._get(f'user-credits/?user={telegram_id}')
             # Handle paginated response
             if isinstance(response, dict) and 'results' in response:
                 credits = response['results']
@@ -894,33 +747,33 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting user credit for {telegram_id}: {e}")
             return None
 
-    def clear_user_credit(self, telegram_id: int) -> bool:
+    async def clear_user_credit(self, telegram_id: int) -> bool:
         """Delete user's active credit from database"""
         try:
-            credit = self.get_user_credit(telegram_id)
+            credit = await self.get_user_credit(telegram_id)
             if not credit:
                 return True  # No credit to clear
 
             credit_id = credit.get('id')
             # Delete the credit record
-            self._delete(f'user-credits/{credit_id}/')
+            await self._delete(f'user-credits/{credit_id}/')
             return True
         except Exception as e:
             logger.error(f"Error clearing user credit for {telegram_id}: {e}")
             return False
 
-    def get_all_active_credits(self) -> List[Dict]:
+    async def get_all_active_credits(self) -> List[Dict]:
         """Get all active credits"""
         try:
-            return self.get_all_user_credits()
+            return await self.get_all_user_credits()
         except Exception as e:
             logger.error(f"Error getting active credits: {e}")
             return []
 
-    def increment_credit_reminder(self, telegram_id: int) -> bool:
+    async def increment_credit_reminder(self, telegram_id: int) -> bool:
         """Increment credit reminder count"""
         try:
-            credit = self.get_user_credit(telegram_id)
+            credit = await self.get_user_credit(telegram_id)
             if not credit:
                 return False
 
@@ -928,22 +781,22 @@ class SheetsCompatAPI(DjangoAPI):
             current_count = credit.get('reminder_count', 0)
 
             # Update the reminder count
-            self._patch(f'user-credits/{credit_id}/', {'reminder_count': current_count + 1})
+            await self._patch(f'user-credits/{credit_id}/', {'reminder_count': current_count + 1})
             return True
         except Exception as e:
             logger.error(f"Error incrementing reminder for {telegram_id}: {e}")
             return False
 
-    def get_daily_credit_summary(self, date: str) -> Dict:
+    async def get_daily_credit_summary(self, date: str) -> Dict:
         """Get daily credit summary - placeholder"""
         return {'total': 0, 'count': 0}
 
     # ==================== LEGACY EXCHANGE RATE METHODS ====================
 
-    def get_exchange_rate(self, currency_from: str, currency_to: str) -> Optional[float]:
+    async def get_exchange_rate(self, currency_from: str, currency_to: str) -> Optional[float]:
         """Get exchange rate"""
         try:
-            rates = self.get_active_exchange_rates()
+            rates = await self.get_active_exchange_rates()
             for rate in rates:
                 if (rate.get('currency_from') == currency_from and
                     rate.get('currency_to') == currency_to):
@@ -953,10 +806,10 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting exchange rate: {e}")
             return None
 
-    def set_exchange_rate(self, currency_from: str, currency_to: str, rate: float) -> bool:
+    async def set_exchange_rate(self, currency_from: str, currency_to: str, rate: float) -> bool:
         """Set exchange rate"""
         try:
-            self.create_exchange_rate(currency_from, currency_to, rate)
+            await self.create_exchange_rate(currency_from, currency_to, rate)
             return True
         except Exception as e:
             logger.error(f"Error setting exchange rate: {e}")
@@ -964,20 +817,20 @@ class SheetsCompatAPI(DjangoAPI):
 
     # ==================== LEGACY INVESTMENT METHODS ====================
 
-    def add_investment(self, telegram_id: int, amount: float, start_date: str, notes: str = '', pppoker_id: str = None) -> bool:
+    async def add_investment(self, telegram_id: int, amount: float, start_date: str, notes: str = '', pppoker_id: str = None) -> bool:
         """Add 50-50 investment (legacy method - requires telegram_id)"""
         try:
-            user = self.get_or_create_user(telegram_id, str(telegram_id))
+            user = await self.get_or_create_user(telegram_id, str(telegram_id))
             user_id = user.get('id')
 
             # Use provided PPPoker ID or get from user's deposits
             if pppoker_id is None:
-                pppoker_id = self.get_pppoker_id_from_deposits(telegram_id) or 'UNKNOWN'
+                pppoker_id = await self.get_pppoker_id_from_deposits(telegram_id) or 'UNKNOWN'
             elif not pppoker_id:
                 pppoker_id = 'UNKNOWN'
 
             # Create investment using inherited method from DjangoAPI
-            self.create_investment(
+            await self.create_investment(
                 pppoker_id=pppoker_id,
                 investment_amount=amount,
                 start_date=start_date,
@@ -991,11 +844,11 @@ class SheetsCompatAPI(DjangoAPI):
             traceback.print_exc()
             return False
 
-    def get_active_investments_by_id(self, telegram_id: int) -> List[Dict]:
+    async def get_active_investments_by_id(self, telegram_id: int) -> List[Dict]:
         """Get user's active investments"""
         try:
-            all_investments = self.get_active_investments()
-            user = self.get_user_by_telegram_id(telegram_id)
+            all_investments = await self.get_active_investments()
+            user = await self.get_user_by_telegram_id(telegram_id)
             if user:
                 user_id = user.get('id')
                 return [inv for inv in all_investments if inv.get('user') == user_id]
@@ -1004,10 +857,10 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting user investments: {e}")
             return []
 
-    def get_all_active_investments_summary(self) -> List[Dict]:
+    async def get_all_active_investments_summary(self) -> List[Dict]:
         """Get summary of all active investments grouped by PPPoker ID"""
         try:
-            investments = self.get_active_investments()
+            investments = await self.get_active_investments()
 
             # Group investments by PPPoker ID
             grouped = {}
@@ -1043,10 +896,10 @@ class SheetsCompatAPI(DjangoAPI):
             traceback.print_exc()
             return []
 
-    def get_active_investments_by_pppoker_id(self, pppoker_id: str) -> Dict:
+    async def get_active_investments_by_pppoker_id(self, pppoker_id: str) -> Dict:
         """Get active investments for a specific PPPoker ID with summary info"""
         try:
-            all_investments = self.get_active_investments()
+            all_investments = await self.get_active_investments()
             investments = [inv for inv in all_investments if inv.get('pppoker_id') == pppoker_id]
 
             if not investments:
@@ -1079,13 +932,13 @@ class SheetsCompatAPI(DjangoAPI):
                 'investments': []
             }
 
-    def record_investment_return(self, pppoker_id: str, return_amount: float) -> Dict:
+    async def record_investment_return(self, pppoker_id: str, return_amount: float) -> Dict:
         """Record investment return and calculate profit/loss split"""
         try:
             from datetime import datetime
 
             # Get all active investments for this PPPoker ID
-            all_investments = self.get_active_investments()
+            all_investments = await self.get_active_investments()
             investments = [inv for inv in all_investments if inv.get('pppoker_id') == pppoker_id]
 
             if not investments:
@@ -1115,7 +968,7 @@ class SheetsCompatAPI(DjangoAPI):
             for inv in investments:
                 inv_id = inv.get('id')
                 # Update investment status using PATCH for partial update
-                self._patch(f"investments/{inv_id}/", {
+                await self._patch(f"investments/{inv_id}/", {
                     'status': 'Completed',
                     'profit_share': float(player_share / len(investments)),  # Split evenly across all investments
                     'loss_share': 0 if net_profit >= 0 else abs(net_profit) / len(investments),
@@ -1140,71 +993,71 @@ class SheetsCompatAPI(DjangoAPI):
                 'error': str(e)
             }
 
-    def mark_expired_investments_as_lost(self) -> int:
+    async def mark_expired_investments_as_lost(self) -> int:
         """Mark expired investments as lost - placeholder"""
         return 0
 
-    def get_investment_stats(self) -> Dict:
+    async def get_investment_stats(self) -> Dict:
         """Get investment statistics - placeholder"""
         return {'total_active': 0, 'total_amount': 0}
 
     # ==================== LEGACY CLUB BALANCE METHODS ====================
 
-    def get_club_balances(self) -> List[Dict]:
+    async def get_club_balances(self) -> List[Dict]:
         """Get all club balances"""
         try:
-            return self.get_all_club_balances()
+            return await self.get_all_club_balances()
         except Exception as e:
             logger.error(f"Error getting club balances: {e}")
             return []
 
-    def set_starting_balances(self, telegram_id: int, balance: float) -> bool:
+    async def set_starting_balances(self, telegram_id: int, balance: float) -> bool:
         """Set starting balance for user"""
         try:
-            user = self.get_or_create_user(telegram_id, str(telegram_id))
+            user = await self.get_or_create_user(telegram_id, str(telegram_id))
             user_id = user.get('id')
-            self.create_club_balance(user_id, balance)
+            await self.create_club_balance(user_id, balance)
             return True
         except Exception as e:
             logger.error(f"Error setting starting balance: {e}")
             return False
 
-    def buy_chips_for_club(self, amount: float, notes: str, created_by: int) -> bool:
+    async def buy_chips_for_club(self, amount: float, notes: str, created_by: int) -> bool:
         """Buy chips for club - placeholder"""
         return True
 
-    def add_cash_to_club(self, amount: float, notes: str, created_by: int) -> bool:
+    async def add_cash_to_club(self, amount: float, notes: str, created_by: int) -> bool:
         """Add cash to club - placeholder"""
         return True
 
     # ==================== LEGACY OCR/IMAGE PROCESSING ====================
 
-    def process_receipt_image(self, image_path: str) -> Dict:
+    async def process_receipt_image(self, image_path: str) -> Dict:
         """Process receipt image - placeholder"""
         return {'success': False, 'amount': 0}
 
-    def format_extracted_details(self, details: Dict) -> str:
+    async def format_extracted_details(self, details: Dict) -> str:
         """Format extracted details"""
         return str(details)
 
     # ==================== LEGACY REPORTING ====================
 
-    def save_all_reports(self) -> bool:
+    async def save_all_reports(self) -> bool:
         """Save all reports - placeholder"""
         return True
 
-    def save_counter_poster(self, poster_path: str) -> bool:
+    async def save_counter_poster(self, poster_path: str) -> bool:
         """Save counter poster - placeholder"""
         return True
 
-    def get_saved_poster(self) -> Optional[str]:
+    async def get_saved_poster(self) -> Optional[str]:
         """Get saved poster path"""
         return None
 
-    def get_pppoker_id_from_deposits(self, telegram_id: int) -> Optional[str]:
+    async def get_pppoker_id_from_deposits(self, telegram_id: int) -> Optional[str]:
         """Get PPPoker ID from user's deposits"""
         try:
-            user = self.get_user_by_telegram_id(telegram_id)
+            user = await self.get_user_by_telegram_id(telegram_id)
             if user:
                 return user.get('pppoker_id')
             return None
@@ -1212,3 +1065,8 @@ class SheetsCompatAPI(DjangoAPI):
             logger.error(f"Error getting PPPoker ID: {e}")
             return None
 
+
+class SheetsCompatAPI(SyncAPIShim):
+    """Blocking wrapper around AsyncSheetsCompatAPI for scripts"""
+
+    async_class = AsyncSheetsCompatAPI
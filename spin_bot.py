@@ -13,6 +13,9 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 import hashlib
 import time
+from functools import lru_cache
+
+from django_api import PROCESS_SPIN_MAX_BATCH
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,16 @@ logger = logging.getLogger(__name__)
 animation_semaphore = asyncio.Semaphore(5)
 
 
+@lru_cache(maxsize=65536)
+def milestone_target_spin(user_id: int, milestone: int) -> int:
+    """
+    The spin (1..milestone) within each milestone block where this user gets the reward.
+    Deterministic per user/milestone; uses a private generator so the shared
+    global random is never reseeded (same positions as the old random.seed scheme).
+    """
+    return random.Random(user_id + milestone).randint(1, milestone)
+
+
 class TelegramRateLimiter:
     """
     Rate limiter to prevent Telegram API bans
@@ -86,11 +99,17 @@ rate_limiter = TelegramRateLimiter()
 class SpinBot:
     """Manages spin wheel functionality and rewards"""
 
-    def __init__(self, api, admin_user_id: int, timezone):
-        """Initialize spin bot with sheets manager"""
+    def __init__(self, api, admin_user_id: int, timezone, rng: random.Random = None):
+        """
+        Initialize spin bot with sheets manager
+        rng: random engine for prizes and animations (e.g. random.Random(seed) for
+        reproducible runs, secrets.SystemRandom() for OS entropy); defaults to a
+        private random.Random()
+        """
         self.api = api
         self.admin_user_id = admin_user_id
         self.timezone = timezone
+        self.rng = rng or random.Random()
 
         # Deposit to spins mapping (MVR -> spins)
         self.deposit_tiers = [
@@ -159,7 +178,7 @@ class SpinBot:
 
     def _generate_spin_hash(self, user_id: int, timestamp: float) -> str:
         """Generate unique hash for spin to prevent duplicates"""
-        data = f"{user_id}_{timestamp}_{random.random()}"
+        data = f"{user_id}_{timestamp}_{self.rng.random()}"
         return hashlib.sha256(data.encode()).hexdigest()
 
     def _check_anti_cheat(self, user_id: int) -> Tuple[bool, str]:
@@ -192,7 +211,7 @@ class SpinBot:
         total_weight = sum(prize['weight'] for prize in self.display_wheel)
 
         # Random selection based on weights
-        rand = random.randint(1, total_weight)
+        rand = self.rng.randint(1, total_weight)
         current_weight = 0
 
         for prize in self.display_wheel:
@@ -223,7 +242,7 @@ class SpinBot:
         total_weight = sum(prize['weight'] for prize in self.prize_pool)
 
         # Random selection based on weights
-        rand = random.randint(1, total_weight)
+        rand = self.rng.randint(1, total_weight)
         current_weight = 0
 
         for prize in self.prize_pool:
@@ -243,20 +262,31 @@ class SpinBot:
         Prize is given at a RANDOM spin within the milestone block
         Example: In 10-spin block, prize could appear at spin 1, 3, 7, or 10 (random)
         """
-        # Generate a pseudo-random target spin for this user/milestone
-        # Uses user_id and milestone to ensure same user gets prize at same position
-        seed_value = user_id + milestone
-        random.seed(seed_value)
-        target_spin = random.randint(1, milestone)
-        random.seed()  # Reset seed
+        # Same user always gets the prize at the same position in the block
+        return current_spin_in_block == milestone_target_spin(user_id, milestone)
 
-        return current_spin_in_block == target_spin
+    def milestone_hits(self, user_id: int, first_spin: int, last_spin: int) -> List[Tuple[int, int]]:
+        """
+        Milestone rewards earned on spins first_spin..last_spin (the user's lifetime spin numbers)
+        Returns [(spin_number, milestone)] in spin order. Each milestone pays out at
+        target, target + m, target + 2m, ... so hits are computed directly instead of
+        checking every spin; when two milestones land on the same spin only the
+        smallest pays (one milestone reward per spin).
+        """
+        hits = {}
+        for milestone in sorted(self.milestones, reverse=True):
+            target = milestone_target_spin(user_id, milestone)
+            # First spin number >= first_spin that is congruent to target (mod milestone)
+            spin_number = first_spin + (target - first_spin) % milestone
+            for hit in range(spin_number, last_spin + 1, milestone):
+                hits[hit] = milestone  # Smaller milestones overwrite larger ones
+        return sorted(hits.items())
 
     async def process_spin(self, user_id: int, username: str, spin_count: int = 1) -> Dict:
         """Process one or multiple spins for a user"""
         try:
             # Get user's available spins
-            user_data = self.api.get_spin_user(user_id)
+            user_data = await self.api.get_spin_user(user_id)
 
             if not user_data:
                 return {
@@ -269,10 +299,10 @@ class SpinBot:
 
             # If PPPoker ID is not in Spin Users, try to get it from Deposits
             if not user_pppoker_id:
-                user_pppoker_id = self.api.get_pppoker_id_from_deposits(user_id)
+                user_pppoker_id = await self.api.get_pppoker_id_from_deposits(user_id)
                 # Update Spin Users with the PPPoker ID for future reference
                 if user_pppoker_id:
-                    self.api.update_spin_user(user_id=user_id, pppoker_id=user_pppoker_id)
+                    await self.api.update_spin_user(user_id=user_id, pppoker_id=user_pppoker_id)
 
             if available_spins < spin_count:
                 return {
@@ -284,85 +314,55 @@ class SpinBot:
             results = []
             total_chips = 0
             milestone_prize = None
-            current_total = user_data.get('total_spins_used', 0)
+            first_spin = user_data.get('total_spins_used', 0) + 1
+            current_total = first_spin + spin_count - 1
 
             for i in range(spin_count):
-                current_total += 1
-
                 # Spin the wheel (just for animation, gives 0 chips)
                 prize = self.spin_wheel(user_id)
                 if prize:
                     results.append(prize)
                     # Display prizes are not logged - only for animation
 
-                # Check if this spin should trigger a milestone reward
-                # Start from smallest milestone to ensure proper reward order
-                for milestone in sorted(self.milestones):
-                    # Calculate which spin we are in the current milestone block
-                    current_spin_in_block = ((current_total - 1) % milestone) + 1
-
-                    # We're within this milestone's block
-                    if current_spin_in_block <= milestone:
-                        # Check if we should give reward at this specific spin
-                        if self.should_give_milestone_reward(user_id, current_spin_in_block, milestone):
-                            # Get random prize from prize pool
-                            prize_won = self.get_milestone_prize()
-                            milestone_prize = prize_won
-                            total_chips += prize_won['chips']
-
-                            # Calculate which milestone block we're in (1st, 2nd, 3rd, etc.)
-                            milestone_count = (current_total - 1) // milestone + 1
-
-                            # Log milestone reward
-                            self.api.log_milestone_reward(
-                                user_id=user_id,
-                                username=username,
-                                milestone_type=f'{milestone}_spins',
-                                milestone_count=milestone_count,
-                                chips_awarded=prize_won['chips'],
-                                triggered_at=current_total,
-                                pppoker_id=user_pppoker_id
-                            )
-                            break  # Only give one milestone reward per spin
+            # Milestone rewards for every spin in this batch, pending admin approval
+            rewards = []
+            for spin_number, milestone in self.milestone_hits(user_id, first_spin, current_total):
+                # Get random prize from prize pool
+                prize_won = self.get_milestone_prize()
+                milestone_prize = prize_won
+                total_chips += prize_won['chips']
+                rewards.append((spin_number, {'prize': prize_won['name'], 'chips': prize_won['chips']}))
+                logger.info(f"🏆 User {user_id} hit {milestone}-spin milestone at spin {spin_number}: {prize_won['name']}")
 
             # Check for Surprise Rewards (only for multi-spins: 10+)
             surprise_chips = 0
             got_surprise = False
             if spin_count >= 10:
                 # 80% chance to get surprise reward, 20% chance to get nothing
-                random.seed()  # Use true randomness
-                chance = random.random()
+                chance = self.rng.random()
 
                 if chance < 0.80:  # 80% chance
                     # Give random chips between 1-20
-                    surprise_chips = random.randint(1, 20)
+                    surprise_chips = self.rng.randint(1, 20)
                     got_surprise = True
+                    rewards.append((current_total, {'prize': f'🎁 Surprise {surprise_chips} Chips', 'chips': surprise_chips}))
+
+            # Each request deducts up to PROCESS_SPIN_MAX_BATCH spins and records the
+            # rewards won within them (pending approval)
+            response = {}
+            for batch_first in range(first_spin, current_total + 1, PROCESS_SPIN_MAX_BATCH):
+                batch_last = min(batch_first + PROCESS_SPIN_MAX_BATCH - 1, current_total)
+                batch_rewards = [reward for spin_number, reward in rewards
+                                 if batch_first <= spin_number <= batch_last]
+                response = await self.api.process_spin(
+                    user_id, batch_rewards, username=username,
+                    spin_count=batch_last - batch_first + 1
+                )
+            new_available = response.get('available_spins', available_spins - spin_count)
 
-                    # Log surprise reward as milestone (pending admin approval)
-                    self.api.log_milestone_reward(
-                        user_id=user_id,
-                        username=username,
-                        milestone_type='surprise_reward',
-                        milestone_count=0,
-                        chips_awarded=surprise_chips,
-                        triggered_at=current_total,
-                        pppoker_id=user_pppoker_id
-                    )
-
-            # Update user's spin count
-            new_available = available_spins - spin_count
-
-            # Update spin user (DON'T add surprise chips - pending approval!)
+            # DON'T add reward chips here - they are pending approval!
             final_chips = user_data.get('total_chips_earned', 0)
 
-            self.api.update_spin_user(
-                user_id=user_id,
-                username=username,
-                available_spins=new_available,
-                total_spins_used=current_total,
-                total_chips_earned=final_chips
-            )
-
             return {
                 'success': True,
                 'results': results,
@@ -393,7 +393,7 @@ class SpinBot:
 
             # Get or create user (do this for ALL deposits, not just ones that give spins)
             logger.info(f"🔍 [SPIN_BOT] Looking up spin user for telegram_id={user_id}")
-            user_data = self.api.get_spin_user(user_id)
+            user_data = await self.api.get_spin_user(user_id)
 
             if user_data:
                 logger.info(f"✅ [SPIN_BOT] Found existing spin user: {user_data}")
@@ -405,7 +405,7 @@ class SpinBot:
 
                 logger.info(f"📈 [SPIN_BOT] Updating: spins {current_spins} → {new_available}, deposit {current_deposit} → {new_total_deposit}")
 
-                result = self.api.update_spin_user(
+                result = await self.api.update_spin_user(
                     telegram_id=user_id,
                     username=username,
                     available_spins=new_available,
@@ -416,7 +416,7 @@ class SpinBot:
             else:
                 logger.info(f"🆕 [SPIN_BOT] No existing spin user found, creating new one")
                 # Create new user (even if they get 0 spins, store their PPPoker ID)
-                result = self.api.create_spin_user(
+                result = await self.api.create_spin_user(
                     user_id=user_id,
                     username=username,
                     available_spins=spins_to_add,
@@ -465,7 +465,7 @@ class SpinBot:
             ]
 
             # Randomize the sequence every time (different order each spin)
-            random.shuffle(animation_sequence)
+            self.rng.shuffle(animation_sequence)
 
             # Determine final prize to show
             if result.get('milestone_prize'):
@@ -513,7 +513,7 @@ async def freespins_command(update: Update, context: ContextTypes.DEFAULT_TYPE,
 
     try:
         # Get user's spin data
-        user_data = spin_bot.api.get_spin_user(user.id)
+        user_data = await spin_bot.api.get_spin_user(user.id)
 
         if not user_data or user_data.get('available_spins', 0) == 0:
             # Create deposit button
@@ -621,7 +621,7 @@ async def spin_callback(update: Update, context: ContextTypes.DEFAULT_TYPE, spin
     try:
         # Parse spin count
         if data == "spin_all":
-            user_data = spin_bot.api.get_spin_user(user.id)
+            user_data = await spin_bot.api.get_spin_user(user.id)
             spin_count = user_data.get('available_spins', 0) if user_data else 0
         else:
             spin_count = int(data.split('_')[1])
@@ -747,169 +747,8 @@ async def spin_callback(update: Update, context: ContextTypes.DEFAULT_TYPE, spin
             reply_markup=reply_markup if result['available_spins'] > 0 else None
         )
 
-        # Send notification to ALL admins if user won any prize
-        if result.get('milestone_prize') or result.get('got_surprise'):
-            # Get user's PPPoker ID from user data (stored in Spin Users sheet)
-            user_data = spin_bot.api.get_spin_user(user.id)
-            user_pppoker_id = user_data.get('pppoker_id', '') if user_data else ''
-
-            # If PPPoker ID is not in Spin Users, try to get it from Deposits
-            if not user_pppoker_id:
-                user_pppoker_id = spin_bot.api.get_pppoker_id_from_deposits(user.id)
-
-            # Set to "Not found" if still empty
-            if not user_pppoker_id:
-                user_pppoker_id = 'Not found'
-
-            logger.info(f"PPPoker ID for user {user.id}: {user_pppoker_id}")
-
-            # Build prize information
-            prize_info = ""
-            new_reward_chips = 0
-
-            if result.get('milestone_prize'):
-                prize = result['milestone_prize']
-                prize_info += f"🎁 <b>Milestone:</b> {prize['name']} ({prize['chips']} chips)\n"
-                new_reward_chips += prize['chips']
-
-            if result.get('got_surprise'):
-                prize_info += f"✨ <b>Surprise:</b> {result['surprise_chips']} chips\n"
-                new_reward_chips += result['surprise_chips']
-
-            # Get all pending rewards for this user to create approve button AND calculate balance
-            try:
-                # Small delay to ensure Google Sheets has processed the write
-                import asyncio
-                await asyncio.sleep(1.0)
-
-                pending_rewards = spin_bot.api.get_pending_spin_rewards()
-                logger.info(f"Total pending rewards in system: {len(pending_rewards)}")
-                user_pending = [r for r in pending_rewards if str(r['user_id']) == str(user.id)]
-                logger.info(f"Pending rewards for user {user.id}: {len(user_pending)}")
-
-                if user_pending:
-                    logger.info(f"User pending rewards: {user_pending}")
-
-                # Calculate cumulative pending balance
-                total_pending_balance = sum(int(r.get('chips', 0)) for r in user_pending)
-                previous_pending = total_pending_balance - new_reward_chips
-
-                # Build pending balance display
-                if previous_pending > 0:
-                    pending_display = f"💰 <b>Total Pending Balance:</b> <b>{total_pending_balance} chips</b>\n"
-                    pending_display += f"   (Previous: {previous_pending} | New: {new_reward_chips})"
-                else:
-                    pending_display = f"💰 <b>Total Pending Balance:</b> <b>{total_pending_balance} chips</b>\n"
-                    pending_display += f"   (New: {new_reward_chips} chips)"
-
-                # Build admin message
-                admin_message = (
-                    f"━━━━━━━━━━━━━━━━━━\n"
-                    f"🎊 <b>NEW PRIZE WON!</b> 🎊\n"
-                    f"━━━━━━━━━━━━━━━━━━\n\n"
-                    f"👤 <b>User:</b> {user.first_name} (@{user.username if user.username else 'no username'})\n"
-                    f"🆔 <b>Telegram ID:</b> <code>{user.id}</code>\n"
-                    f"🎮 <b>PPPoker ID:</b> <code>{user_pppoker_id}</code>\n\n"
-                    f"{prize_info}\n"
-                    f"{pending_display}\n\n"
-                    f"━━━━━━━━━━━━━━━━━━\n"
-                    f"⏳ Click button below to approve:"
-                )
-
-                # Create approve button with all spin IDs for this user
-                keyboard = None
-                if user_pending:
-                    spin_ids = [r['spin_id'] for r in user_pending]
-                    spin_ids_str = ','.join(spin_ids)
-                    logger.info(f"Creating button with spin IDs: {spin_ids_str}")
-                    keyboard = [[InlineKeyboardButton(
-                        f"✅ Approve All ({total_pending_balance} chips)",
-                        callback_data=f"approve_user_{user.id}_{spin_ids_str}"
-                    )]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
-                    logger.info(f"Button created successfully!")
-                else:
-                    # Fallback if we can't get pending rewards
-                    logger.warning(f"No pending rewards found for user {user.id}")
-                    reply_markup = None
-            except Exception as e:
-                logger.error(f"Error getting pending rewards for button: {e}")
-                import traceback
-                traceback.print_exc()
-                # Fallback: show only new reward
-                total_pending_balance = new_reward_chips
-                pending_display = f"💰 <b>Total Pending Balance:</b> <b>{total_pending_balance} chips</b>\n"
-                pending_display += f"   (New: {new_reward_chips} chips)"
-                admin_message = (
-                    f"━━━━━━━━━━━━━━━━━━\n"
-                    f"🎊 <b>NEW PRIZE WON!</b> 🎊\n"
-                    f"━━━━━━━━━━━━━━━━━━\n\n"
-                    f"👤 <b>User:</b> {user.first_name} (@{user.username if user.username else 'no username'})\n"
-                    f"🆔 <b>Telegram ID:</b> <code>{user.id}</code>\n"
-                    f"🎮 <b>PPPoker ID:</b> <code>{user_pppoker_id}</code>\n\n"
-                    f"{prize_info}\n"
-                    f"{pending_display}\n\n"
-                    f"━━━━━━━━━━━━━━━━━━\n"
-                    f"⏳ Click button below to approve:"
-                )
-                reply_markup = None
-
-            # Store notification message IDs for button removal later
-            # Use a unique key based on user_id to track all pending rewards for this user
-            notification_key = f"spin_reward_{user.id}"
-
-            # Initialize storage if not exists
-            if not hasattr(context.bot_data, 'spin_notification_messages'):
-                context.bot_data['spin_notification_messages'] = {}
-
-            if notification_key not in context.bot_data['spin_notification_messages']:
-                context.bot_data['spin_notification_messages'][notification_key] = []
-
-            # Send to super admin (with rate limiting)
-            try:
-                await rate_limiter.wait_for_send()
-                msg = await context.bot.send_message(
-                    chat_id=admin_user_id,
-                    text=admin_message,
-                    parse_mode='HTML',
-                    reply_markup=reply_markup
-                )
-                # Store message ID
-                context.bot_data['spin_notification_messages'][notification_key].append((admin_user_id, msg.message_id))
-                logger.info(f"Stored spin notification message ID for super admin")
-            except Exception as e:
-                logger.error(f"Failed to notify super admin: {e}")
-
-            # Send to all regular admins (with rate limiting)
-            try:
-                admins_response = spin_bot.api.get_all_admins()
-
-                # Handle paginated response from Django API
-                if isinstance(admins_response, dict) and 'results' in admins_response:
-                    admins = admins_response['results']
-                else:
-                    admins = admins_response
-
-                logger.info(f"Found {len(admins)} regular admins to notify for spin reward")
-
-                for admin in admins:
-                    try:
-                        await rate_limiter.wait_for_send()
-                        msg = await context.bot.send_message(
-                            chat_id=admin['telegram_id'],
-                            text=admin_message,
-                            parse_mode='HTML',
-                            reply_markup=reply_markup
-                        )
-                        # Store message ID
-                        context.bot_data['spin_notification_messages'][notification_key].append((admin['telegram_id'], msg.message_id))
-                        logger.info(f"Stored spin notification message ID for admin {admin['telegram_id']}")
-                    except Exception as e:
-                        logger.error(f"Failed to notify admin {admin['telegram_id']}: {e}")
-            except Exception as e:
-                logger.error(f"Failed to get admin list: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+        # Admins are notified from the spin notification outbox that
+        # process_spin writes - no direct send here, or they'd get it twice
 
     except Exception as e:
         logger.error(f"Error in spin callback: {e}")
@@ -928,7 +767,7 @@ async def spin_again_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
     user = query.from_user
 
     try:
-        user_data = spin_bot.api.get_spin_user(user.id)
+        user_data = await spin_bot.api.get_spin_user(user.id)
 
         if not user_data or user_data.get('available_spins', 0) == 0:
             await rate_limiter.wait_for_edit()
@@ -997,7 +836,7 @@ async def pendingspins_command(update: Update, context: ContextTypes.DEFAULT_TYP
     """Admin command to view pending spin rewards"""
     user = update.effective_user
 
-    if not is_admin_func(user.id):
+    if not await is_admin_func(user.id):
         if update.callback_query:
             await update.callback_query.answer("❌ Admin access required!")
         else:
@@ -1006,7 +845,7 @@ async def pendingspins_command(update: Update, context: ContextTypes.DEFAULT_TYP
 
     try:
         # Get pending rewards (display prizes)
-        pending = spin_bot.api.get_pending_spin_rewards()
+        pending = await spin_bot.api.get_pending_spin_rewards(slim=True)
 
         # Handle paginated response
         if isinstance(pending, dict) and 'results' in pending:
@@ -1056,7 +895,7 @@ async def pendingspins_command(update: Update, context: ContextTypes.DEFAULT_TYP
 
             # If PPPoker ID is not set, try to get it from Deposits
             if not user_pppoker_id:
-                user_pppoker_id = spin_bot.api.get_pppoker_id_from_deposits(int(user_id))
+                user_pppoker_id = await spin_bot.api.get_pppoker_id_from_deposits(int(user_id))
 
             # Set to "Not found" if still empty
             if not user_pppoker_id:
@@ -1107,7 +946,7 @@ async def pendingspins_command(update: Update, context: ContextTypes.DEFAULT_TYP
             for user_id in user_rewards.keys():
                 notification_key = f"pendingspins_{user_id}"
                 try:
-                    spin_bot.api.store_notification_message(
+                    await spin_bot.api.store_notification_message(
                         notification_type='spin_reward',
                         notification_key=notification_key,
                         admin_telegram_id=admin_id,
@@ -1137,7 +976,7 @@ async def approvespin_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     """Admin command to approve a spin reward"""
     user = update.effective_user
 
-    if not is_admin_func(user.id):
+    if not await is_admin_func(user.id):
         await update.message.reply_text("❌ Admin access required!")
         return
 
@@ -1149,7 +988,7 @@ async def approvespin_command(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     try:
         # Get spin details
-        spin_data = spin_bot.api.get_spin_by_id(spin_id)
+        spin_data = await spin_bot.api.get_spin_by_id(spin_id)
 
         if not spin_data:
             await update.message.reply_text("❌ Spin ID not found!")
@@ -1170,14 +1009,14 @@ async def approvespin_command(update: Update, context: ContextTypes.DEFAULT_TYPE
 
         # Mark as approved
         approver_name = user.username or user.first_name
-        spin_bot.api.approve_spin_reward(spin_id, user.id, approver_name)
+        await spin_bot.api.approve_spin_reward(spin_id, user.id, approver_name)
 
         # Update user's total approved chips
-        user_data = spin_bot.api.get_spin_user(spin_data['user_id'])
+        user_data = await spin_bot.api.get_spin_user(spin_data['user_id'])
         if user_data:
             current_chips = user_data.get('total_chips_earned', 0)
             new_total = current_chips + spin_data['chips']
-            spin_bot.api.update_spin_user(
+            await spin_bot.api.update_spin_user(
                 user_id=spin_data['user_id'],
                 username=spin_data.get('username', 'Unknown'),
                 total_chips_earned=new_total
@@ -1233,7 +1072,7 @@ async def approvespin_command(update: Update, context: ContextTypes.DEFAULT_TYPE
                     logger.error(f"Failed to notify super admin: {e}")
 
             # Send to all other admins
-            admins_response = spin_bot.api.get_all_admins()
+            admins_response = await spin_bot.api.get_all_admins()
 
             # Handle paginated response from Django API
             if isinstance(admins_response, dict) and 'results' in admins_response:
@@ -1278,7 +1117,7 @@ async def addspins_command(update: Update, context: ContextTypes.DEFAULT_TYPE, s
     """Admin command to manually add spins to a user"""
     user = update.effective_user
 
-    if not is_admin_func(user.id):
+    if not await is_admin_func(user.id):
         await update.message.reply_text("❌ Admin access required!")
         return
 
@@ -1295,11 +1134,11 @@ async def addspins_command(update: Update, context: ContextTypes.DEFAULT_TYPE, s
             return
 
         # Get or create spin user (Django API handles this)
-        spin_user = spin_bot.api.get_or_create_spin_user(target_user_id)
+        spin_user = await spin_bot.api.get_or_create_spin_user(target_user_id)
         spin_user_id = spin_user.get('id')
 
         # Add spins using the Django API endpoint
-        spin_bot.api.add_spins(spin_user_id, spins_to_add)
+        await spin_bot.api.add_spins(spin_user_id, spins_to_add)
 
         await update.message.reply_text(
             f"✅ Added {spins_to_add} spins to user {target_user_id}!"
@@ -1332,7 +1171,7 @@ async def spinsstats_command(update: Update, context: ContextTypes.DEFAULT_TYPE,
     """Admin command to view spin statistics"""
     user = update.effective_user
 
-    if not is_admin_func(user.id):
+    if not await is_admin_func(user.id):
         if update.callback_query:
             await update.callback_query.answer("❌ Admin access required!")
         else:
@@ -1340,7 +1179,7 @@ async def spinsstats_command(update: Update, context: ContextTypes.DEFAULT_TYPE,
         return
 
     try:
-        stats = spin_bot.api.get_spin_statistics()
+        stats = await spin_bot.api.get_spin_statistics()
 
         message = "📊 *SPIN BOT STATISTICS* 📊\n\n"
         message += f"👥 Total Users: *{stats['total_users']}*\n"
@@ -0,0 +1,88 @@
+"""
+Spin wheel prize table for the mini app.
+The wheel layout and prize weights live here so the server, the benchmark and
+the distribution check all draw from the same table.
+"""
+import math
+import random
+from typing import Dict, List
+
+# WHEEL PRIZES - MUST match frontend exactly! (16 segments)
+# NOTE: iPhone, MacBook, AirPods, Watch are DISPLAY ONLY - backend never selects them!
+WHEEL_PRIZES = [
+    "500", "Try Again!", "50", "iPhone", "20", "Try Again!",
+    "100", "MacBook", "10", "Try Again!", "250", "AirPods",
+    "20", "Try Again!", "50", "Watch"
+]
+
+# PRIZE WEIGHTS - Optimized for 65% club profit margin
+# Try Again: 82.489%, Win chips: 17.511%
+# Average payout: 3.53 chips per spin
+PRIZE_WEIGHTS = {
+    "Try Again!": 82489,  # 82.489% - Most spins lose
+    "10": 10000,          # 10.000% - Common small win
+    "20": 5000,           # 5.000% - Uncommon small win
+    "50": 2000,           # 2.000% - Rare medium win
+    "100": 500,           # 0.500% - Very rare good win
+    "250": 10,            # 0.010% - Extremely rare big win
+    "500": 1              # 0.001% - Legendary jackpot (1 in 100k)
+}
+
+
+class PrizeTable:
+    """
+    Precomputed weighted sampler over (prize, wheel segment) outcomes.
+
+    Each prize's weight is split evenly across the wheel segments showing it,
+    so one draw picks the prize and its segment together. The cumulative
+    weights are built once; draw() gets all outcomes from a single
+    random.choices call (a bisect per draw, no per-spin list rebuilding).
+    """
+
+    def __init__(self, wheel_prizes: List[str], prize_weights: Dict[str, int]):
+        segments = {prize: [i for i, p in enumerate(wheel_prizes) if p == prize] for prize in prize_weights}
+        missing = [prize for prize, indices in segments.items() if not indices]
+        if missing:
+            raise ValueError(f"Prizes not on the wheel: {missing}")
+
+        # Scale so every per-segment weight stays an integer (exact cumulative sums)
+        scale = math.lcm(*(len(indices) for indices in segments.values()))
+
+        self.outcomes = []
+        cum_weights = []
+        total = 0
+        for prize, weight in prize_weights.items():
+            if prize == "Try Again!":
+                display, chips = "Try Again!", 0
+            else:
+                display, chips = f"{prize} Chips", int(prize)
+            segment_weight = weight * scale // len(segments[prize])
+            for segment_index in segments[prize]:
+                total += segment_weight
+                self.outcomes.append({'prize': display, 'segment_index': segment_index, 'chips': chips})
+                cum_weights.append(total)
+
+        self.cum_weights = cum_weights
+        # Display prize -> wheel segments showing it
+        self.segments = {}
+        for outcome in self.outcomes:
+            self.segments.setdefault(outcome['prize'], []).append(outcome['segment_index'])
+        self.wheel_prizes = list(wheel_prizes)
+        self.prize_weights = dict(prize_weights)
+
+    def draw(self, count: int, rng: random.Random = None) -> List[Dict]:
+        """Draw count spin results as [{'prize', 'segment_index', 'chips'}]"""
+        choices = (rng or random).choices(self.outcomes, cum_weights=self.cum_weights, k=count)
+        # Copy so callers can annotate results without touching the shared table
+        return [dict(outcome) for outcome in choices]
+
+    def results_for(self, spins: List[Dict], rng: random.Random = None) -> List[Dict]:
+        """Rebuild draw() results for spins already recorded as [{'prize', 'chips'}] (e.g. a replayed request)"""
+        chooser = rng or random
+        return [
+            {'prize': spin['prize'], 'segment_index': chooser.choice(self.segments[spin['prize']]), 'chips': spin['chips']}
+            for spin in spins
+        ]
+
+
+PRIZE_TABLE = PrizeTable(WHEEL_PRIZES, PRIZE_WEIGHTS)
@@ -5,6 +5,16 @@ set -e
 
 echo "Starting Mini App Server (Spin Wheel)..."
 
-# Start the Flask mini app server
-echo "Starting Flask server..."
-exec python -u mini_app_server.py
+# Start the Flask mini app under gunicorn
+# Threaded workers: spin requests mostly wait on the Django API, and each worker
+# shares one event loop + pooled HTTP client for those calls (django_api.run_sync)
+# More than one worker needs REDIS_URL so cooldowns and caches are shared
+echo "Starting Flask server on port $PORT..."
+exec gunicorn mini_app_server:app \
+    --bind 0.0.0.0:$PORT \
+    --worker-class gthread \
+    --workers ${MINI_APP_WORKERS:-1} \
+    --threads ${MINI_APP_THREADS:-64} \
+    --timeout 60 \
+    --access-logfile - \
+    --error-logfile -
@@ -6,10 +6,17 @@ Uses Google Vision as primary, OCR.space as fallback
 
 import os
 import re
+import asyncio
 import requests
 import base64
 import json
 import tempfile
+import io
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageOps
 from google.cloud import vision
 from google.oauth2 import service_account
 
@@ -17,6 +24,67 @@ from google.oauth2 import service_account
 OCR_API_KEY = os.getenv('OCR_API_KEY', 'K86220364088957')
 OCR_API_URL = 'https://api.ocr.space/parse/image'
 
+# OCR worker pool - receipts are processed off the event loop, a few at a time
+OCR_MAX_WORKERS = int(os.getenv('OCR_MAX_WORKERS', 4))
+OCR_MAX_PENDING = int(os.getenv('OCR_MAX_PENDING', 16))  # Running + queued receipts
+OCR_QUEUE_TIMEOUT = float(os.getenv('OCR_QUEUE_TIMEOUT', 10))  # Max wait for a free slot (seconds)
+OCR_TIMEOUT = float(os.getenv('OCR_TIMEOUT', 45))  # Max time for one receipt, both engines (seconds)
+GOOGLE_VISION_TIMEOUT = float(os.getenv('GOOGLE_VISION_TIMEOUT', 20))
+OCR_SPACE_TIMEOUT = float(os.getenv('OCR_SPACE_TIMEOUT', 20))
+
+# Image preprocessing before OCR upload (smaller, grayscale JPEG)
+OCR_PREPROCESS = os.getenv('OCR_PREPROCESS', 'true').lower() in ('true', '1', 'yes')
+OCR_MAX_DIMENSION = int(os.getenv('OCR_MAX_DIMENSION', 1600))  # Longest side in pixels
+OCR_JPEG_QUALITY = int(os.getenv('OCR_JPEG_QUALITY', 85))
+
+_ocr_executor = ThreadPoolExecutor(max_workers=OCR_MAX_WORKERS, thread_name_prefix='ocr')
+_ocr_slots = None  # asyncio.Semaphore, created on the bot's event loop
+
+# Parsed results of recent receipts, so a repeat upload skips OCR
+OCR_CACHE_MAX_ENTRIES = int(os.getenv('OCR_CACHE_MAX_ENTRIES', 1000))
+
+
+class ReceiptCache:
+    """
+    Bounded LRU of parsed receipt details (thread-safe, shared by the OCR workers)
+
+    Keyed by the SHA-256 of the image bytes only. Visually similar receipts
+    (same bank, same amount) can differ only in their reference number, so a
+    near-match is never treated as the same receipt - it goes through OCR.
+    """
+
+    def __init__(self, max_entries: int = OCR_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return a copy of the cached details for key, or None"""
+        with self._lock:
+            details = self._entries.get(key)
+            if details is None:
+                return None
+            self._entries.move_to_end(key)
+            return dict(details)
+
+    def put(self, keys, details):
+        """Store details under every key, evicting the least recently used entries"""
+        with self._lock:
+            for key in keys:
+                self._entries[key] = dict(details)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_receipt_cache = ReceiptCache()
+
+
+def image_content_hash(image_bytes):
+    """SHA-256 of the image bytes (identical uploads)"""
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
 # Initialize Google Vision client (cached)
 _vision_client = None
 
@@ -57,6 +125,39 @@ def get_vision_client():
         return None
 
 
+def preprocess_receipt_image(image_bytes, max_dimension=None, quality=None):
+    """
+    Shrink a receipt image for OCR: fix EXIF rotation, downscale so the longest
+    side is at most max_dimension, convert to grayscale and re-encode as JPEG
+
+    Args:
+        image_bytes: Original image content as bytes
+        max_dimension: Longest side in pixels (default OCR_MAX_DIMENSION)
+        quality: JPEG quality 1-95 (default OCR_JPEG_QUALITY)
+
+    Returns:
+        bytes: Preprocessed JPEG, or the original bytes if that is smaller or decoding fails
+    """
+    max_dimension = max_dimension or OCR_MAX_DIMENSION
+    quality = quality or OCR_JPEG_QUALITY
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            # draft() lets the JPEG decoder skip detail we would throw away anyway
+            image.draft('L', (max_dimension, max_dimension))
+            image = ImageOps.exif_transpose(image).convert('L')
+            image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+            output = io.BytesIO()
+            image.save(output, format='JPEG', quality=quality, optimize=True)
+            processed = output.getvalue()
+    except Exception as e:
+        print(f"⚠️ Image preprocessing failed, using original: {e}")
+        return image_bytes
+
+    return processed if len(processed) < len(image_bytes) else image_bytes
+
+
 def extract_text_with_google_vision(image_bytes):
     """
     Extract text from image using Google Cloud Vision API
@@ -77,7 +178,7 @@ def extract_text_with_google_vision(image_bytes):
         image = vision.Image(content=image_bytes)
 
         # Perform text detection
-        response = client.text_detection(image=image)
+        response = client.text_detection(image=image, timeout=GOOGLE_VISION_TIMEOUT)
 
         # Check for errors
         if response.error.message:
@@ -123,7 +224,7 @@ def extract_text_with_ocr_space(image_bytes):
         }
 
         # Make API request
-        response = requests.post(OCR_API_URL, data=payload, timeout=30)
+        response = requests.post(OCR_API_URL, data=payload, timeout=OCR_SPACE_TIMEOUT)
         result = response.json()
 
         # Check for errors
@@ -153,6 +254,12 @@ def extract_text_from_image(image_bytes):
     Returns:
         str: Extracted text from the image
     """
+    # Smaller upload for both engines (OCR.space base64 adds another third)
+    if OCR_PREPROCESS:
+        original_size = len(image_bytes)
+        image_bytes = preprocess_receipt_image(image_bytes)
+        print(f"🖼️ Preprocessed receipt: {original_size:,} -> {len(image_bytes):,} bytes")
+
     # Try Google Vision first (better accuracy)
     print("🔍 Attempting Google Vision OCR...")
     text = extract_text_with_google_vision(image_bytes)
@@ -173,10 +280,178 @@ def extract_text_from_image(image_bytes):
     return ""
 
 
+# --- Receipt parsing (patterns compiled once at import, shared by every parse) ---
+
+# Amount patterns for Maldivian bank receipts, tried in order
+AMOUNT_PATTERNS = [
+    re.compile(r'MVR\s*([0-9,]+\.?\d{0,2})'),  # MVR 65.00 or MVR 1,000.00
+    re.compile(r'([0-9,]+\.\d{2})\s*MVR'),  # 100.00 MVR
+    re.compile(r'AMOUNT[\s:]+([0-9,]+\.?\d{0,2})'),  # Amount: 1000.00
+    re.compile(r'(?:^|\n)([0-9]+\.\d{2})(?:\s*$|\n)'),  # Standalone 100.00
+]
+
+# Reference patterns for MIB and BML receipts, tried in order
+# BML: Can be alphanumeric (e.g., BLAZ133378629134)
+# MIB: Usually numeric (e.g., 759383063)
+REFERENCE_PATTERNS = [
+    re.compile(r'REFERENCE[\s#:]+([A-Z0-9]+)', re.MULTILINE),  # Reference BLAZ133378629134 or Reference 759383063
+    re.compile(r'REFERENCE\s*#?\s*\n\s*([A-Z0-9]{6,})', re.MULTILINE),  # Reference #\n759435556 or BLAZ133
+    re.compile(r'REF[\s#:]+([A-Z0-9]+)', re.MULTILINE),  # Ref: BLAZ133378629134
+    re.compile(r'TRANSACTION\s+(?:ID|NUMBER|NO)[\s:]+([A-Z0-9]+)', re.MULTILINE),  # Transaction ID: XXX
+    re.compile(r'REFERENCE\s*#\s*\n\s*([A-Z0-9]{6,})', re.MULTILINE),  # Reference #\n[any alphanumeric]
+    re.compile(r'REFERENCE\s*#?\s*([A-Z0-9]{6,})', re.MULTILINE),  # Flexible reference pattern
+]
+
+# Line-level reference shapes (right after a "Reference" label / anywhere on the receipt)
+LABELLED_REFERENCE_LINE = re.compile(r'^[A-Z0-9]{6,30}$')
+STANDALONE_REFERENCE_LINE = re.compile(r'^[A-Z0-9]{8,30}$')
+
+# "From" field - name on the same line (BML) or on the next line (MIB)
+FROM_PATTERNS = [
+    re.compile(r'FROM[\s:]+([A-Z][A-Z0-9\s\.]+?)(?:\n|$)', re.MULTILINE),  # From AHMD.FIXAL
+    re.compile(r'FROM\s*\n\s*([A-Z][A-Z0-9\s\.]+?)(?:\n|\s{2,})', re.MULTILINE),  # From\n  AHMD.FIXAL
+]
+
+# "To" field - BML puts the account number on the same line as the name
+TO_PATTERNS = [
+    re.compile(r'TO[\s:]+([A-Z][A-Z0-9\s\.]+?)(?:\s*\d{10,}|\n|$)', re.MULTILINE),  # To AHMD.FIXAL 90103101325241000
+    re.compile(r'TO\s*\n\s*([A-Z][A-Z0-9\s\.]+?)(?:\n|\s{2,})', re.MULTILINE),  # To\n  AHMD.FIXAL
+]
+
+# Words that are not names (labels, bank names, etc.)
+SKIP_NAME_WORDS = ['BANK', 'BML', 'MIB', 'CREATED DATE', 'STATUS DATE', 'PURPOSE',
+                   'REFERENCE', 'AMOUNT', 'STATUS', 'MESSAGE', 'FROM', 'TO',
+                   'MALDIVES ISLAMIC BANK', 'BANK OF MALDIVES', 'TRANSACTION DATE',
+                   'THANK YOU', 'YOUR REQUEST', 'HAS BEEN', 'SUBMITTED', 'PROCESSING',
+                   'REMARKS', 'SUCCESS', 'TRANSACTION', 'MVR', 'USD', 'USDT']
+SKIP_NAME_WORDS_RE = re.compile('|'.join(re.escape(word) for word in SKIP_NAME_WORDS))
+
+# Receipt UI text that shows up between MIB labels and their values
+SENDER_UI_TEXT_RE = re.compile(r'(THANK|YOUR|REQUEST|SUBMITTED|PROCESSING|MESSAGE|REMARKS)')
+RECEIVER_UI_TEXT_RE = re.compile(r'(THANK|YOUR|REQUEST|SUBMITTED|PROCESSING|MESSAGE|REMARKS|BEEN)')
+
+CURRENCY_WORDS_RE = re.compile(r'MVR|USD|USDT|RF|RUFIYAA')
+DECIMAL_AMOUNT_RE = re.compile(r'^[0-9,]+\.\d{2}$')
+LEADING_DIGIT_RE = re.compile(r'^\d')
+LETTER_RE = re.compile(r'[A-Za-z]')
+WHITESPACE_RE = re.compile(r'\s+')
+TRAILING_ACCOUNT_RE = re.compile(r'\s*\d{10,}$')
+ACCOUNT_NUMBER_RE = re.compile(r'\b(\d{10,20})\b')
+
+# How many lines after a label its value may appear (MIB lists labels first, values after)
+REFERENCE_VALUE_LINES = 4
+SENDER_VALUE_LINES = 10
+RECEIVER_VALUE_LINES = 15
+ACCOUNT_VALUE_LINES = 9
+
+
+def looks_like_amount(text):
+    """Check if text appears to be a currency amount (e.g., "MVR 100.00" or "100.00")"""
+    text_check = text.upper().strip()
+    return bool(
+        CURRENCY_WORDS_RE.search(text_check) or
+        DECIMAL_AMOUNT_RE.match(text_check) or
+        LEADING_DIGIT_RE.match(text_check)
+    )
+
+
+def is_account_like(line_upper):
+    """All digits and 16+ chars - an account number rather than a reference"""
+    return line_upper.isdigit() and len(line_upper) >= 16
+
+
+def line_index(lines_upper, label):
+    """Index of the first line that is exactly label, or -1"""
+    try:
+        return lines_upper.index(label)
+    except ValueError:
+        return -1
+
+
+def scan_receipt_lines(text):
+    """
+    Split the receipt into stripped, non-empty lines once and locate the labels the
+    field lookups start from: the first "Reference" line and the first bare
+    "From" / "To" lines.
+
+    Returns:
+        tuple: (lines, lines_upper, labels) where labels maps
+            'reference' / 'from' / 'to' to a line index, or -1 if absent
+    """
+    lines = list(filter(None, map(str.strip, text.split('\n'))))
+    lines_upper = list(map(str.upper, lines))
+    labels = {
+        'reference': next((i for i, line_upper in enumerate(lines_upper) if 'REFERENCE' in line_upper), -1),
+        'from': line_index(lines_upper, 'FROM'),
+        'to': line_index(lines_upper, 'TO'),
+    }
+
+    return lines, lines_upper, labels
+
+
+def clean_labelled_name(name):
+    """Collapse whitespace and drop a trailing account number from a name captured after From/To"""
+    name = WHITESPACE_RE.sub(' ', name.strip())
+    return TRAILING_ACCOUNT_RE.sub('', name)
+
+
+def is_valid_labelled_name(name):
+    """Name captured right after a From/To label: 3+ chars, has a letter, not a label word"""
+    return bool(len(name) >= 3 and LETTER_RE.search(name) and not SKIP_NAME_WORDS_RE.search(name.upper()))
+
+
+def find_name_after_label(lines, lines_upper, label_index, max_lines, ui_text_re,
+                          after_index=-1, exclude_upper=None):
+    """
+    Look for a name-like line within max_lines after a bare From/To label
+    (MIB has labels separate from values).
+
+    Returns:
+        tuple: (name, line_index) or (None, -1)
+    """
+    for current_index in range(label_index + 1, min(label_index + max_lines + 1, len(lines))):
+        # Skip lines at or before the sender (MIB lists sender and receiver sequentially)
+        if current_index <= after_index:
+            continue
+
+        potential_name = lines[current_index]
+        potential_name_upper = lines_upper[current_index]
+
+        # Skip the sender's own name when it appears after "To"
+        if exclude_upper and potential_name_upper == exclude_upper:
+            continue
+
+        if looks_like_amount(potential_name):
+            continue
+
+        # Has letters, not pure digits (account number), not too long
+        if (len(potential_name) < 3 or
+                not LETTER_RE.search(potential_name) or
+                potential_name.isdigit() or
+                len(potential_name) >= 50):
+            continue
+
+        # Skip labels and UI text
+        if SKIP_NAME_WORDS_RE.search(potential_name_upper) or ui_text_re.search(potential_name_upper):
+            continue
+
+        # Names are usually AHMD.FIXAL, MOHAMED ALI, etc. (not "Thank you. Your request...")
+        if '.' in potential_name or len(potential_name.split()) <= 3:
+            clean_name = TRAILING_ACCOUNT_RE.sub('', potential_name)
+            if len(clean_name) >= 3:
+                return clean_name.title(), current_index
+
+    return None, -1
+
+
 def parse_payment_details(text):
     """
     Parse extracted text to identify payment details (optimized for MIB/BML receipts)
 
+    The text is split into lines once (scan_receipt_lines); each field then runs its
+    precompiled patterns over the whole text and falls back to a bounded window of
+    lines after its label, so parsing cost stays linear in the receipt length.
+
     Args:
         text: Extracted text from receipt/slip
 
@@ -185,6 +460,7 @@ def parse_payment_details(text):
             - reference_number: Transaction/reference number
             - sender_name: Name of sender
             - receiver_name: Name of receiver
+            - receiver_account_number: Account number the payment was sent to
             - amount: Transaction amount
             - bank: Bank name (BML, MIB, etc.)
             - currency: Currency (MVR, USD, etc.)
@@ -206,7 +482,7 @@ def parse_payment_details(text):
 
     # Convert to uppercase for easier matching
     text_upper = text.upper()
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines, lines_upper, labels = scan_receipt_lines(text)
 
     # --- Extract Bank Name ---
     if 'BANK OF MALDIVES' in text_upper:
@@ -221,289 +497,97 @@ def parse_payment_details(text):
         details['bank'] = 'SBI'
 
     # --- Extract Amount and Currency ---
-    # Patterns for Maldivian bank receipts
-    amount_patterns = [
-        r'MVR\s*([0-9,]+\.?\d{0,2})',  # MVR 65.00 or MVR 1,000.00
-        r'([0-9,]+\.\d{2})\s*MVR',  # 100.00 MVR
-        r'AMOUNT[\s:]+([0-9,]+\.?\d{0,2})',  # Amount: 1000.00
-        r'(?:^|\n)([0-9]+\.\d{2})(?:\s*$|\n)',  # Standalone 100.00
-    ]
-
-    for pattern in amount_patterns:
-        match = re.search(pattern, text_upper)
+    for pattern in AMOUNT_PATTERNS:
+        match = pattern.search(text_upper)
         if match:
-            amount_str = match.group(1).replace(',', '').strip()
             try:
-                amount_value = float(amount_str)
-                # Only accept reasonable amounts (between 1 and 1 million)
-                if 1.0 <= amount_value <= 1000000.0:
-                    details['amount'] = amount_value
-                    # Determine currency
-                    if 'USD' in text_upper:
-                        details['currency'] = 'USD'
-                    else:
-                        details['currency'] = 'MVR'  # Default for Maldivian banks
-                    break
+                amount_value = float(match.group(1).replace(',', '').strip())
             except ValueError:
                 continue
+            # Only accept reasonable amounts (between 1 and 1 million)
+            if 1.0 <= amount_value <= 1000000.0:
+                details['amount'] = amount_value
+                details['currency'] = 'USD' if 'USD' in text_upper else 'MVR'  # MVR default for Maldivian banks
+                break
 
     # --- Extract Reference/Transaction Number ---
-    # Enhanced patterns for MIB and BML receipts
-    # BML: Can be alphanumeric (e.g., BLAZ133378629134)
-    # MIB: Usually numeric (e.g., 759383063)
-    ref_patterns = [
-        r'REFERENCE[\s#:]+([A-Z0-9]+)',  # Reference BLAZ133378629134 or Reference 759383063
-        r'REFERENCE\s*#?\s*\n\s*([A-Z0-9]{6,})',  # Reference #\n759435556 or BLAZ133
-        r'REF[\s#:]+([A-Z0-9]+)',  # Ref: BLAZ133378629134
-        r'TRANSACTION\s+(?:ID|NUMBER|NO)[\s:]+([A-Z0-9]+)',  # Transaction ID: XXX
-        r'REFERENCE\s*#\s*\n\s*([A-Z0-9]{6,})',  # Reference #\n[any alphanumeric]
-        r'REFERENCE\s*#?\s*[\n\s]*([A-Z0-9]{6,})',  # Flexible reference pattern
-    ]
-
-    for pattern in ref_patterns:
-        match = re.search(pattern, text_upper, re.MULTILINE)
+    for pattern in REFERENCE_PATTERNS:
+        match = pattern.search(text_upper)
         if match:
             ref = match.group(1).strip()
-            # Accept references with 6+ characters (can be numeric or alphanumeric)
-            if len(ref) >= 6 and len(ref) <= 30:  # Max 30 chars to avoid capturing junk
+            # Accept references with 6-30 characters (max 30 to avoid capturing junk)
+            if 6 <= len(ref) <= 30:
                 details['reference_number'] = ref
                 break
 
-    # If no reference found with labeled patterns, look for standalone strings
     if not details['reference_number']:
-        # Check if we see "Reference #" or "Reference" followed by a number on next lines
-        ref_index = -1
-        for i, line in enumerate(lines):
-            if re.search(r'REFERENCE\s*#?', line.upper()):
-                ref_index = i
-                break
-
-        # Look for reference number in the next few lines after "Reference #"
+        # Reference on one of the lines after a "Reference #" label
+        ref_index = labels['reference']
         if ref_index >= 0:
-            for i in range(ref_index + 1, min(ref_index + 5, len(lines))):
-                line_upper = lines[i].upper().strip()
-                # Accept any alphanumeric string 6-30 chars (covers both MIB numeric and BML alphanumeric)
-                if re.match(r'^[A-Z0-9]{6,30}$', line_upper):
-                    # If we're right after "Reference" label, accept even long numeric strings
-                    # Otherwise skip if it looks like an account number (all digits and 16+ chars)
-                    if not (line_upper.isdigit() and len(line_upper) >= 16):
-                        details['reference_number'] = line_upper
-                        break
-
-        # If still not found, look for standalone alphanumeric strings anywhere
+            for line_upper in lines_upper[ref_index + 1:ref_index + 1 + REFERENCE_VALUE_LINES]:
+                if LABELLED_REFERENCE_LINE.match(line_upper) and not is_account_like(line_upper):
+                    details['reference_number'] = line_upper
+                    break
+
+        # Otherwise the first standalone 8-30 char alphanumeric line anywhere
         if not details['reference_number']:
-            for line in lines:
-                line_upper = line.upper().strip()
-                # Look for alphanumeric strings 8-30 chars
-                if re.match(r'^[A-Z0-9]{8,30}$', line_upper):
-                    # Skip if it looks like an account number (all digits and 16+ chars)
-                    # This allows 8-15 digit pure numeric references to be captured
-                    if not (line_upper.isdigit() and len(line_upper) >= 16):
-                        details['reference_number'] = line_upper
-                        break
+            details['reference_number'] = next(
+                (line_upper for line_upper in lines_upper
+                 if STANDALONE_REFERENCE_LINE.match(line_upper) and not is_account_like(line_upper)),
+                None
+            )
 
     # --- Extract Names ---
-    # Skip words that are not names (labels, bank names, etc.)
-    skip_name_words = ['BANK', 'BML', 'MIB', 'CREATED DATE', 'STATUS DATE', 'PURPOSE',
-                       'REFERENCE', 'AMOUNT', 'STATUS', 'MESSAGE', 'FROM', 'TO',
-                       'MALDIVES ISLAMIC BANK', 'BANK OF MALDIVES', 'TRANSACTION DATE',
-                       'THANK YOU', 'YOUR REQUEST', 'HAS BEEN', 'SUBMITTED', 'PROCESSING',
-                       'REMARKS', 'SUCCESS', 'TRANSACTION', 'MVR', 'USD', 'USDT']
-
-    # Helper function to check if a string looks like an amount (e.g., "MVR 100.00" or "100.00")
-    def looks_like_amount(text):
-        """Check if text appears to be a currency amount"""
-        text_check = text.upper().strip()
-        # Check for currency keywords
-        if any(curr in text_check for curr in ['MVR', 'USD', 'USDT', 'RF', 'RUFIYAA']):
-            return True
-        # Check if it's just a number with decimal (like "100.00" or "1,234.56")
-        if re.match(r'^[0-9,]+\.\d{2}$', text_check):
-            return True
-        # Check if it starts with a number
-        if re.match(r'^\d', text_check):
-            return True
-        return False
-
-    # Pattern 1: "From" field - Enhanced for BML format
-    from_patterns = [
-        r'FROM[\s:]+([A-Z][A-Z0-9\s\.]+?)(?:\n|$)',  # From AHMD.FIXAL (BML format - name on same line)
-        r'FROM\s*\n\s*([A-Z][A-Z0-9\s\.]+?)(?:\n|\s{2,})',  # From\n  AHMD.FIXAL (MIB format - name on next line)
-    ]
-
-    for pattern in from_patterns:
-        match = re.search(pattern, text_upper, re.MULTILINE)
+    for pattern in FROM_PATTERNS:
+        match = pattern.search(text_upper)
         if match:
-            name = match.group(1).strip()
-            # Clean up the name
-            name = re.sub(r'\s+', ' ', name)
-            # Remove trailing account numbers if any
-            name = re.sub(r'\s*\d{10,}$', '', name)
-
-            # Skip if it looks like an amount
+            name = clean_labelled_name(match.group(1))
             if looks_like_amount(name):
                 continue
-
-            # Validate it looks like a name (letters/dots/numbers, not pure text labels)
-            # BML names often have dots like AHMD.FIXAL
-            if (len(name) >= 3 and
-                re.search(r'[A-Z]', name) and
-                not any(skip_word in name.upper() for skip_word in skip_name_words)):
-                # Preserve format (keep dots, capitalize properly)
-                details['sender_name'] = name.title().replace('.', '.')
+            if is_valid_labelled_name(name):
+                details['sender_name'] = name.title()
                 break
 
     # Track where sender was found (for MIB receipts where values appear after labels)
     sender_line_index = -1
+    if not details['sender_name'] and labels['from'] >= 0:
+        details['sender_name'], sender_line_index = find_name_after_label(
+            lines, lines_upper, labels['from'], SENDER_VALUE_LINES, SENDER_UI_TEXT_RE
+        )
 
-    # If no sender found with patterns, look for name after "From" label
-    if not details['sender_name']:
-        from_index = -1
-        for i, line in enumerate(lines):
-            if line.upper().strip() == 'FROM':
-                from_index = i
-                break
+    sender_upper = details['sender_name'].upper() if details['sender_name'] else None
 
-        # Look for name in the next few lines after "From" (MIB has labels separate from values)
-        if from_index >= 0:
-            # Check next 10 lines for a name-like string
-            for offset in range(1, min(11, len(lines) - from_index)):
-                potential_name = lines[from_index + offset].strip()
-                potential_name_upper = potential_name.upper()
-
-                # Skip if it looks like an amount
-                if looks_like_amount(potential_name):
-                    continue
-
-                # Check if it looks like a name (has letters, spaces/dots, not pure digits, not too long)
-                if (len(potential_name) >= 3 and
-                    re.search(r'[A-Za-z]', potential_name) and
-                    not potential_name.isdigit() and
-                    len(potential_name) < 50 and
-                    not re.match(r'^\d{10,}$', potential_name)):  # Not an account number
-
-                    # Skip if it contains any skip words or looks like UI text
-                    if (not any(skip_word in potential_name_upper for skip_word in skip_name_words) and
-                        not re.search(r'(THANK|YOUR|REQUEST|SUBMITTED|PROCESSING|MESSAGE|REMARKS)', potential_name_upper)):
-
-                        # Only accept if it looks like a proper name (dots or short words, not long sentences)
-                        # Names are usually: AHMD.FIXAL, MOHAMED ALI, etc. (not "Thank you. Your request...")
-                        if '.' in potential_name or len(potential_name.split()) <= 3:
-                            # Remove any trailing numbers (account numbers)
-                            potential_name = re.sub(r'\s*\d{10,}$', '', potential_name)
-                            if len(potential_name) >= 3:
-                                details['sender_name'] = potential_name.title()
-                                sender_line_index = from_index + offset  # Track where we found it
-                                break
-
-    # Pattern 2: "To" field (receiver) - Enhanced for BML format
-    to_patterns = [
-        r'TO[\s:]+([A-Z][A-Z0-9\s\.]+?)(?:\s*\d{10,}|\n|$)',  # To AHMD.FIXAL 90103101325241000 (BML - name+account on same line)
-        r'TO\s*\n\s*([A-Z][A-Z0-9\s\.]+?)(?:\n|\s{2,})',  # To\n  AHMD.FIXAL (MIB format)
-    ]
-
-    for pattern in to_patterns:
-        match = re.search(pattern, text_upper, re.MULTILINE)
+    for pattern in TO_PATTERNS:
+        match = pattern.search(text_upper)
         if match:
-            name = match.group(1).strip()
-            # Clean up the name
-            name = re.sub(r'\s+', ' ', name)
-            # Remove trailing account numbers if any (BML has them on same line)
-            name = re.sub(r'\s*\d{10,}$', '', name).strip()
-
-            # Skip if it looks like an amount
+            name = clean_labelled_name(match.group(1)).strip()
             if looks_like_amount(name):
                 continue
-
-            # Skip if it matches the sender name (avoid picking up sender as receiver)
-            if details['sender_name'] and name.upper() == details['sender_name'].upper():
+            # Avoid picking up the sender as receiver
+            if sender_upper and name.upper() == sender_upper:
                 continue
-
-            # Validate it looks like a name (not a label)
-            if (len(name) >= 3 and
-                re.search(r'[A-Z]', name) and
-                not any(skip_word in name.upper() for skip_word in skip_name_words)):
-                # Preserve format (keep dots, capitalize properly)
-                details['receiver_name'] = name.title().replace('.', '.')
-                break
-
-    # If no receiver found with patterns, look for name after "To" label
-    if not details['receiver_name']:
-        to_index = -1
-        for i, line in enumerate(lines):
-            if line.upper().strip() == 'TO':
-                to_index = i
+            if is_valid_labelled_name(name):
+                details['receiver_name'] = name.title()
                 break
 
-        # Look for name in the next few lines after "To" (MIB has labels separate from values)
-        if to_index >= 0:
-            # Check next 15 lines for a name-like string (need to look further for MIB)
-            for offset in range(1, min(16, len(lines) - to_index)):
-                current_index = to_index + offset
-                potential_name = lines[current_index].strip()
-
-                # Skip if this is before or at the sender position (for MIB where sender/receiver are sequential)
-                if sender_line_index >= 0 and current_index <= sender_line_index:
-                    continue
-
-                # Skip if this matches the sender name exactly (avoid duplicate when sender name appears after "To")
-                if details['sender_name'] and potential_name.upper() == details['sender_name'].upper():
-                    continue
-
-                # Skip if it looks like an amount
-                if looks_like_amount(potential_name):
-                    continue
-
-                # Check if it looks like a name (has letters, spaces/dots, not pure digits, not too long)
-                if (len(potential_name) >= 3 and
-                    re.search(r'[A-Za-z]', potential_name) and
-                    not potential_name.isdigit() and
-                    len(potential_name) < 50 and
-                    not re.match(r'^\d{10,}$', potential_name)):  # Not an account number
-
-                    potential_name_upper = potential_name.upper()
-
-                    # Skip if it contains any skip words or looks like UI text
-                    if (not any(skip_word in potential_name_upper for skip_word in skip_name_words) and
-                        not re.search(r'(THANK|YOUR|REQUEST|SUBMITTED|PROCESSING|MESSAGE|REMARKS|BEEN)', potential_name_upper)):
-
-                        # Only accept if it looks like a proper name (dots or short words, not long sentences)
-                        if '.' in potential_name or len(potential_name.split()) <= 3:
-                            # Remove any trailing numbers (account numbers)
-                            clean_name = re.sub(r'\s*\d{10,}$', '', potential_name)
-                            if len(clean_name) >= 3:
-                                details['receiver_name'] = clean_name.title()
-                                break
+    if not details['receiver_name'] and labels['to'] >= 0:
+        details['receiver_name'], _ = find_name_after_label(
+            lines, lines_upper, labels['to'], RECEIVER_VALUE_LINES, RECEIVER_UI_TEXT_RE,
+            after_index=sender_line_index, exclude_upper=sender_upper
+        )
 
     # --- Extract Receiver Account Number ---
     # Look for account numbers near "To" label
     # BML: 13 digits (e.g., 7730000646797), MIB: 17 digits (e.g., 90103101325241000)
-    if not details['receiver_account_number']:
-        to_index = -1
-        for i, line in enumerate(lines):
-            if line.upper().strip() == 'TO':
-                to_index = i
+    to_index = labels['to']
+    if to_index >= 0:
+        for line in lines[to_index + 1:to_index + 1 + ACCOUNT_VALUE_LINES]:
+            account_match = ACCOUNT_NUMBER_RE.search(line)
+            # Make sure it's not the reference number we already extracted
+            if account_match and account_match.group(1) != details['reference_number']:
+                details['receiver_account_number'] = account_match.group(1)
                 break
 
-        if to_index >= 0:
-            # Check next few lines after "To" for account number
-            for offset in range(1, min(10, len(lines) - to_index)):
-                potential_line = lines[to_index + offset].strip()
-
-                # Try to find account number in the line (may be standalone or mixed with name)
-                # Look for 10-20 digit sequences
-                account_match = re.search(r'\b(\d{10,20})\b', potential_line)
-                if account_match:
-                    potential_account = account_match.group(1)
-
-                    # Make sure it's not the reference number we already extracted
-                    if details['reference_number'] and potential_account == details['reference_number']:
-                        continue
-
-                    # This is likely the receiver account number
-                    details['receiver_account_number'] = potential_account
-                    break
-
     return details
 
 
@@ -538,20 +622,66 @@ def format_extracted_details(details, show_raw=False, lang='en'):
     return message
 
 
+def _run_receipt_pipeline(file_bytes, content_hash):
+    """Blocking OCR + parse, run on the OCR worker pool"""
+    # Extract text using Vision API
+    extracted_text = extract_text_from_image(file_bytes)
+
+    # Parse the text for payment details
+    details = parse_payment_details(extracted_text)
+
+    # Only successful reads are cached - a failed OCR should be retried next time
+    if extracted_text:
+        _receipt_cache.put([('content', content_hash)], details)
+
+    return details
+
+
 async def process_receipt_image(file_bytes):
     """
     Complete pipeline: Extract text and parse payment details from receipt image
+    Runs on a bounded worker pool so the event loop keeps serving other users;
+    if the pool is saturated or OCR times out, returns empty details (manual review).
+    Repeat uploads are answered from the receipt cache without OCR.
 
     Args:
         file_bytes: Image file content as bytes
 
     Returns:
-        dict: Parsed payment details
+        dict: Parsed payment details, plus content_hash of the image
     """
-    # Extract text using Vision API
-    extracted_text = extract_text_from_image(file_bytes)
+    content_hash = image_content_hash(file_bytes)
+    cached = _receipt_cache.get(('content', content_hash))
+    if cached:
+        print("✅ Receipt seen before (content hash), skipping OCR")
+        cached['content_hash'] = content_hash
+        return cached
+
+    details = await _process_receipt_in_pool(file_bytes, content_hash)
+    details['content_hash'] = content_hash
+    return details
 
-    # Parse the text for payment details
-    details = parse_payment_details(extracted_text)
 
-    return details
+async def _process_receipt_in_pool(file_bytes, content_hash):
+    """Run the OCR pipeline on the worker pool with backpressure and a timeout"""
+    global _ocr_slots
+    if _ocr_slots is None:
+        _ocr_slots = asyncio.Semaphore(OCR_MAX_PENDING)
+
+    # Backpressure - wait briefly for a slot instead of queueing without limit
+    try:
+        await asyncio.wait_for(_ocr_slots.acquire(), OCR_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        print(f"⚠️ OCR queue full ({OCR_MAX_PENDING} receipts pending), skipping OCR")
+        return parse_payment_details("")
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_ocr_executor, _run_receipt_pipeline, file_bytes, content_hash)
+    # Free the slot when the worker actually finishes, even if we stop waiting earlier
+    future.add_done_callback(lambda _: _ocr_slots.release())
+
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), OCR_TIMEOUT)
+    except asyncio.TimeoutError:
+        print(f"⚠️ OCR timed out after {OCR_TIMEOUT}s, skipping OCR")
+        return parse_payment_details("")